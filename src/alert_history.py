@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 import threading
+import time
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Protocol, TypeAlias
+from typing import Any, Callable, Iterator, Protocol, TypeAlias
 from urllib.parse import quote
 
 from src.config import get_global_config, get_logger
+from src.session_summary import SESSION_SUMMARY_ENTRY_TYPE
 
 
 class _HistoryMeasurementConfig(Protocol):
@@ -24,8 +28,14 @@ logger = get_logger('alert_history')
 
 DEFAULT_HISTORY_DIR = Path('data/history')
 HISTORY_FILE_NAME = 'history.json'
+HISTORY_DATABASE_SUFFIX = '.sqlite3'
+HISTORY_STORE_TIMEOUT_SECONDS = 5.0
+HISTORY_COMPACTION_INTERVAL_SECONDS = 30.0
+HISTORY_READ_BATCH_SIZE = 64
 HISTORY_STATIC_ROUTE = '/history'
 MAX_HISTORY_ENTRIES = 100
+# Session-Zusammenfassungen haben ein eigenes Limit und verdrängen keine Alerts
+MAX_HISTORY_SESSION_SUMMARIES = 100
 MAX_HISTORY_IMAGE_FILES = 25
 MAX_HISTORY_FILE_SIZE_BYTES = 10 * 1024 * 1024
 ALERT_IMAGE_PREFIX = 'alert_'
@@ -34,6 +44,34 @@ ALERT_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png'})
 _history_file_lock = threading.Lock()
 _history_revisions: dict[str, int] = {}
 _history_listeners: dict[str, list[Callable[[int], None]]] = {}
+_history_stores_ready: set[str] = set()
+_pending_history_compactions: dict[str, tuple[Path, int]] = {}
+_history_compactor_thread: threading.Thread | None = None
+
+_HISTORY_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+# `timestamp` ist normalisiert und damit lexikografisch sortierbar; NULL (nicht
+# parsebar) sortiert vor allen anderen und gilt damit wie bisher als ältester Eintrag
+_HISTORY_SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS history_entries (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT,
+        type TEXT,
+        session_id TEXT,
+        image_path TEXT NOT NULL DEFAULT '',
+        size_bytes INTEGER NOT NULL,
+        payload TEXT NOT NULL
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history_entries (timestamp, id)',
+    'CREATE INDEX IF NOT EXISTS idx_history_type ON history_entries (type, id)',
+    'CREATE INDEX IF NOT EXISTS idx_history_session ON history_entries (session_id, id)',
+    '''
+    CREATE INDEX IF NOT EXISTS idx_history_images ON history_entries (timestamp, id)
+    WHERE image_path != ''
+    ''',
+    'CREATE TABLE IF NOT EXISTS history_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)',
+)
 
 
 def _history_revision_key(history_file: Path) -> str:
@@ -111,23 +149,70 @@ def get_history_dir(config: HistoryConfig | None = None) -> Path:
 
 
 def get_history_file(config: HistoryConfig | None = None) -> Path:
-    """Return the history.json path for the configured alert history directory."""
+    """
+    Return the history file path for the configured alert history directory.
+
+    The path identifies the history for revisions and listeners; the entries
+    themselves live in the SQLite database next to it (see
+    :func:`get_history_database_file`). A legacy ``history.json`` at this path
+    is imported by :func:`migrate_legacy_history` during startup.
+    """
     return get_history_dir(config) / HISTORY_FILE_NAME
 
 
+def get_history_database_file(history_file: Path | None = None) -> Path:
+    """Return the SQLite database that stores the entries of ``history_file``."""
+    target_file = history_file or get_history_file()
+    return target_file.with_suffix(HISTORY_DATABASE_SUFFIX)
+
+
 def load_history_entries(
     *,
     history_file: Path | None = None,
     entry_type: str | None = None,
+    session_id: str | None = None,
 ) -> list[dict[str, Any]]:
-    """Load alert history entries from disk."""
+    """Load history entries in insertion order, optionally filtered by type and session."""
+    return list(iter_history_entries(history_file=history_file, entry_type=entry_type, session_id=session_id))
+
+
+def iter_history_entries(
+    *,
+    history_file: Path | None = None,
+    entry_type: str | None = None,
+    session_id: str | None = None,
+    since: datetime | None = None,
+    newest_first: bool = False,
+    limit: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream history entries lazily from the store.
+
+    Rows are fetched in batches of :data:`HISTORY_READ_BATCH_SIZE` from an
+    indexed query, so callers that only need the newest few entries or the
+    last hours never decode the whole history. ``since`` filters on the
+    normalised timestamp; ``newest_first`` orders by timestamp instead of
+    insertion order.
+    """
     target_file = history_file or get_history_file()
     with _history_file_lock:
-        entries = _load_history_entries_unlocked(target_file)
+        if not _prepare_history_store_unlocked(target_file, create=False):
+            return
+
+    # WAL: Leser brauchen den Schreib-Lock nicht und sehen einen konsistenten Snapshot
+    yield from _iter_history_entries_unlocked(
+        target_file,
+        entry_type=entry_type,
+        session_id=session_id,
+        since=since,
+        newest_first=newest_first,
+        limit=limit,
+    )
 
-    if entry_type is None:
-        return entries
-    return [entry for entry in entries if entry.get('type') == entry_type]
+
+def export_history_json(*, history_file: Path | None = None) -> str:
+    """Serialize all history entries in the former ``history.json`` layout for download."""
+    return _serialize_history_entries(load_history_entries(history_file=history_file))
 
 
 def parse_history_timestamp(timestamp: Any) -> datetime | None:
@@ -155,13 +240,18 @@ def append_history_entry(
     max_entries: int = MAX_HISTORY_ENTRIES,
     pending_image_filename: str | None = None,
     pending_image_bytes: bytes | None = None,
-) -> list[dict[str, Any]]:
-    """Append a history entry and persist the truncated history atomically."""
+) -> dict[str, Any]:
+    """
+    Insert a single history entry and return it as stored.
+
+    The write is one durable row insert; the entry, image and size limits
+    (using ``max_entries``) are enforced afterwards by the background
+    compactor, see :func:`compact_history`.
+    """
     target_file = history_file or get_history_file()
     target_file.parent.mkdir(parents=True, exist_ok=True)
 
     revision = 0
-    entries_snapshot: list[dict[str, Any]] = []
     entry_to_store = dict(entry)
     created_image_path: Path | None = None
     with _history_file_lock:
@@ -178,17 +268,13 @@ def append_history_entry(
                 )
                 entry_to_store['image_path'] = stored_image_path
 
-            entries = _load_history_entries_unlocked(target_file, repair=True)
-            entries.append(entry_to_store)
-            entries = _prepare_history_entries_for_storage_unlocked(
-                entries,
-                history_file=target_file,
-                max_entries=max_entries,
-            )
-            _write_history_entries_unlocked(target_file, entries)
-            _cleanup_orphaned_history_images_unlocked(target_file.parent, entries)
+            _normalize_history_image_paths_unlocked([entry_to_store], target_file.parent)
+            _prepare_history_store_unlocked(target_file, create=True)
+            with closing(_connect_history_database(target_file)) as connection:
+                with connection:
+                    _insert_history_rows(connection, [entry_to_store])
             revision = _bump_history_revision_unlocked(target_file)
-            entries_snapshot = list(entries)
+            _schedule_history_compaction_unlocked(target_file, max_entries)
         except Exception:
             if created_image_path is not None:
                 try:
@@ -202,7 +288,7 @@ def append_history_entry(
             raise
 
     _notify_history_listeners(target_file, revision)
-    return entries_snapshot
+    return entry_to_store
 
 
 def replace_history_entries(
@@ -210,7 +296,7 @@ def replace_history_entries(
     *,
     history_file: Path | None = None,
 ) -> None:
-    """Replace the history file content atomically."""
+    """Replace all stored history entries in a single transaction."""
     target_file = history_file or get_history_file()
     target_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -221,6 +307,7 @@ def replace_history_entries(
             history_file=target_file,
             max_entries=MAX_HISTORY_ENTRIES,
         )
+        _prepare_history_store_unlocked(target_file, create=True)
         _write_history_entries_unlocked(target_file, sanitized_entries)
         _cleanup_orphaned_history_images_unlocked(target_file.parent, sanitized_entries)
         revision = _bump_history_revision_unlocked(target_file)
@@ -228,6 +315,73 @@ def replace_history_entries(
     _notify_history_listeners(target_file, revision)
 
 
+def compact_history(
+    *,
+    history_file: Path | None = None,
+    max_entries: int = MAX_HISTORY_ENTRIES,
+) -> int:
+    """
+    Enforce the entry, image and size limits on the stored history.
+
+    Evicted rows and cleared image references are handled with indexed
+    queries, and only images no longer referenced are deleted. Listeners are
+    notified when anything changed. Returns the number of affected rows.
+    """
+    target_file = history_file or get_history_file()
+
+    revision = 0
+    affected_rows = 0
+    with _history_file_lock:
+        if not _prepare_history_store_unlocked(target_file, create=False):
+            return 0
+        with closing(_connect_history_database(target_file)) as connection:
+            with connection:
+                affected_rows, released_images = _apply_history_retention_unlocked(
+                    connection,
+                    history_file=target_file,
+                    max_entries=max_entries,
+                )
+            _remove_released_history_images_unlocked(connection, target_file.parent, released_images)
+        if affected_rows > 0:
+            revision = _bump_history_revision_unlocked(target_file)
+
+    if affected_rows > 0:
+        _notify_history_listeners(target_file, revision)
+    return affected_rows
+
+
+def compact_pending_history() -> None:
+    """Compact every history that received appends since the last compaction run."""
+    with _history_file_lock:
+        pending = list(_pending_history_compactions.values())
+        _pending_history_compactions.clear()
+
+    for history_file, max_entries in pending:
+        try:
+            compact_history(history_file=history_file, max_entries=max_entries)
+        except Exception:
+            logger.exception('Failed to compact history store for %s', history_file)
+
+
+def _schedule_history_compaction_unlocked(history_file: Path, max_entries: int) -> None:
+    global _history_compactor_thread
+    _pending_history_compactions[_history_revision_key(history_file)] = (history_file, max_entries)
+    if _history_compactor_thread is None or not _history_compactor_thread.is_alive():
+        _history_compactor_thread = threading.Thread(
+            target=_history_compactor_loop,
+            name='HistoryCompactor',
+            daemon=True,
+        )
+        _history_compactor_thread.start()
+
+
+def _history_compactor_loop() -> None:
+    while True:
+        # Kein Busy-Loop: nur alle paar Sekunden, und nur Stores mit neuen Einträgen
+        time.sleep(HISTORY_COMPACTION_INTERVAL_SECONDS)
+        compact_pending_history()
+
+
 def to_history_image_storage_path(image_file: Path, history_dir: Path | None = None) -> str:
     """Store image references as POSIX-style paths relative to the history directory."""
     base_dir = (history_dir or get_history_dir()).resolve()
@@ -289,7 +443,136 @@ def build_history_image_url(image_path: str | None, history_dir: Path | None = N
     return f"{HISTORY_STATIC_ROUTE}/{'/'.join(encoded_parts)}"
 
 
-def _load_history_entries_unlocked(history_file: Path, *, repair: bool = False) -> list[dict[str, Any]]:
+def _connect_history_database(history_file: Path) -> sqlite3.Connection:
+    connection = sqlite3.connect(
+        str(get_history_database_file(history_file)),
+        timeout=HISTORY_STORE_TIMEOUT_SECONDS,
+    )
+    # WAL ist persistent in der Datei; synchronous=FULL synchronisiert das WAL bei jedem Commit,
+    # ein bestätigter Alarm-Eintrag übersteht damit auch einen Stromausfall
+    connection.execute('PRAGMA journal_mode=WAL')
+    connection.execute('PRAGMA synchronous=FULL')
+    return connection
+
+
+def migrate_legacy_history(*, history_file: Path | None = None) -> bool:
+    """
+    Import a legacy ``history.json`` into the SQLite store and rename it to ``.json.migrated``.
+
+    Runs once from application startup; readers never migrate as a side
+    effect. Returns True when a legacy file was found.
+    """
+    target_file = history_file or get_history_file()
+    with _history_file_lock:
+        if not target_file.exists():
+            return False
+        _prepare_history_store_unlocked(target_file, create=True)
+        with closing(_connect_history_database(target_file)) as connection:
+            _migrate_legacy_history_file_unlocked(connection, target_file)
+        revision = _bump_history_revision_unlocked(target_file)
+
+    _notify_history_listeners(target_file, revision)
+    return True
+
+
+def _prepare_history_store_unlocked(history_file: Path, *, create: bool) -> bool:
+    """Create the schema once; False if nothing is stored yet."""
+    key = _history_revision_key(history_file)
+    database_file = get_history_database_file(history_file)
+    if key in _history_stores_ready and database_file.exists():
+        return True
+    if not create and not database_file.exists():
+        return False
+
+    history_file.parent.mkdir(parents=True, exist_ok=True)
+    with closing(_connect_history_database(history_file)) as connection:
+        for statement in _HISTORY_SCHEMA:
+            connection.execute(statement)
+        connection.commit()
+
+    _history_stores_ready.add(key)
+    return True
+
+
+def _migrate_legacy_history_file_unlocked(connection: sqlite3.Connection, history_file: Path) -> None:
+    if not history_file.exists():
+        return
+
+    migration_key = f'legacy_import:{history_file.name}'
+    already_imported = connection.execute(
+        'SELECT 1 FROM history_meta WHERE key = ?',
+        (migration_key,),
+    ).fetchone() is not None
+    if not already_imported:
+        entries = _load_legacy_history_entries_unlocked(history_file, repair=True)
+        if not history_file.exists():
+            # Ungültige Datei wurde nach .bak verschoben, es gibt nichts zu importieren
+            return
+        entries = _prepare_history_entries_for_storage_unlocked(
+            entries,
+            history_file=history_file,
+            max_entries=MAX_HISTORY_ENTRIES,
+        )
+        # Import und Marker in einer Transaktion: ein Absturz vor dem Umbenennen importiert nicht doppelt
+        with connection:
+            _insert_history_rows(connection, entries)
+            connection.execute(
+                'INSERT INTO history_meta (key, value) VALUES (?, ?)',
+                (migration_key, datetime.now().strftime(_HISTORY_TIMESTAMP_FORMAT)),
+            )
+        logger.info('Migrated %s history entries from %s into SQLite store', len(entries), history_file)
+
+    migrated_file = history_file.with_suffix('.json.migrated')
+    try:
+        history_file.replace(migrated_file)
+    except Exception as exc:
+        logger.error('Failed to rename migrated history file %s: %s', history_file, exc)
+
+
+def _iter_history_entries_unlocked(
+    history_file: Path,
+    *,
+    entry_type: str | None = None,
+    session_id: str | None = None,
+    since: datetime | None = None,
+    newest_first: bool = False,
+    limit: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    conditions: list[str] = []
+    parameters: list[Any] = []
+    if entry_type is not None:
+        conditions.append('type = ?')
+        parameters.append(entry_type)
+    if session_id is not None:
+        conditions.append('session_id = ?')
+        parameters.append(session_id)
+    if since is not None:
+        conditions.append('timestamp >= ?')
+        parameters.append(since.strftime(_HISTORY_TIMESTAMP_FORMAT))
+    where_clause = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+    order_clause = 'timestamp DESC, id DESC' if newest_first else 'id'
+    parameters.append(-1 if limit is None else max(0, int(limit)))
+
+    try:
+        with closing(_connect_history_database(history_file)) as connection:
+            cursor = connection.execute(
+                f'SELECT id, payload FROM history_entries{where_clause} ORDER BY {order_clause} LIMIT ?',
+                parameters,
+            )
+            while rows := cursor.fetchmany(HISTORY_READ_BATCH_SIZE):
+                for row_id, payload in rows:
+                    try:
+                        entry = json.loads(payload)
+                    except json.JSONDecodeError as exc:
+                        logger.error('Skipping corrupt history row %s: %s', row_id, exc)
+                        continue
+                    if isinstance(entry, dict):
+                        yield entry
+    except sqlite3.Error as exc:
+        logger.error('Error loading history store for %s: %s', history_file, exc)
+
+
+def _load_legacy_history_entries_unlocked(history_file: Path, *, repair: bool = False) -> list[dict[str, Any]]:
     if not history_file.exists():
         return []
 
@@ -314,6 +597,176 @@ def _load_history_entries_unlocked(history_file: Path, *, repair: bool = False)
     return [entry for entry in raw_data if isinstance(entry, dict)]
 
 
+def _optional_history_text(value: Any) -> str | None:
+    if value is None:
+        return None
+    text = str(value)
+    return text or None
+
+
+def _history_row(entry: dict[str, Any]) -> tuple[Any, ...]:
+    payload = json.dumps(entry, ensure_ascii=False)
+    parsed_timestamp = parse_history_timestamp(entry.get('timestamp'))
+    return (
+        parsed_timestamp.strftime(_HISTORY_TIMESTAMP_FORMAT) if parsed_timestamp is not None else None,
+        _optional_history_text(entry.get('type')),
+        _optional_history_text(entry.get('session_id')),
+        str(entry.get('image_path') or ''),
+        len(payload.encode('utf-8')),
+        payload,
+    )
+
+
+def _insert_history_rows(connection: sqlite3.Connection, entries: list[dict[str, Any]]) -> None:
+    connection.executemany(
+        'INSERT INTO history_entries (timestamp, type, session_id, image_path, size_bytes, payload) '
+        'VALUES (?, ?, ?, ?, ?, ?)',
+        [_history_row(entry) for entry in entries],
+    )
+
+
+def _apply_history_retention_unlocked(
+    connection: sqlite3.Connection,
+    *,
+    history_file: Path,
+    max_entries: int,
+) -> tuple[int, list[str]]:
+    """Enforce entry, image and size limits with indexed queries; return affected rows and released images."""
+    affected_rows = 0
+    released_images: list[str] = []
+
+    for summaries, limit in ((False, max_entries), (True, MAX_HISTORY_SESSION_SUMMARIES)):
+        if limit <= 0:
+            continue
+        condition = _history_entry_kind_condition(summaries)
+        (entry_count,) = connection.execute(
+            f'SELECT COUNT(*) FROM history_entries WHERE {condition}',
+            (SESSION_SUMMARY_ENTRY_TYPE,),
+        ).fetchone()
+        excess_count = entry_count - limit
+        if excess_count > 0:
+            released_images.extend(
+                _delete_oldest_history_rows(
+                    connection,
+                    excess_count,
+                    condition=condition,
+                    params=(SESSION_SUMMARY_ENTRY_TYPE,),
+                )
+            )
+            affected_rows += excess_count
+            logger.info(
+                'Trimmed %s oldest %s to enforce max entry limit (%s)',
+                excess_count,
+                'session summaries' if summaries else 'history entries',
+                limit,
+            )
+
+    if MAX_HISTORY_IMAGE_FILES >= 0:
+        stale_image_rows = connection.execute(
+            "SELECT id, image_path, payload FROM history_entries WHERE image_path != '' "
+            'ORDER BY timestamp DESC, id DESC LIMIT -1 OFFSET ?',
+            (MAX_HISTORY_IMAGE_FILES,),
+        ).fetchall()
+        for row_id, image_path, payload in stale_image_rows:
+            entry = json.loads(payload)
+            entry['image_path'] = ''
+            updated_payload = json.dumps(entry, ensure_ascii=False)
+            connection.execute(
+                "UPDATE history_entries SET image_path = '', payload = ?, size_bytes = ? WHERE id = ?",
+                (updated_payload, len(updated_payload.encode('utf-8')), row_id),
+            )
+            released_images.append(image_path)
+        if stale_image_rows:
+            affected_rows += len(stale_image_rows)
+            logger.info(
+                'Cleared %s older history image reference(s) to enforce image limit (%s)',
+                len(stale_image_rows),
+                MAX_HISTORY_IMAGE_FILES,
+            )
+
+    if MAX_HISTORY_FILE_SIZE_BYTES > 0:
+        entry_count, total_size = connection.execute(
+            'SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM history_entries'
+        ).fetchone()
+        if total_size > MAX_HISTORY_FILE_SIZE_BYTES and entry_count > 1:
+            removable_count = 0
+            for (size_bytes,) in connection.execute(
+                'SELECT size_bytes FROM history_entries ORDER BY timestamp, id LIMIT ?',
+                (entry_count - 1,),
+            ):
+                if total_size <= MAX_HISTORY_FILE_SIZE_BYTES:
+                    break
+                total_size -= size_bytes
+                removable_count += 1
+            released_images.extend(_delete_oldest_history_rows(connection, removable_count))
+            affected_rows += removable_count
+            logger.info(
+                'Trimmed %s oldest history entries to enforce file size limit (%s bytes)',
+                removable_count,
+                MAX_HISTORY_FILE_SIZE_BYTES,
+            )
+        if total_size > MAX_HISTORY_FILE_SIZE_BYTES:
+            logger.warning(
+                'History store %s exceeds %s bytes even with a single entry; keeping newest entry',
+                history_file,
+                MAX_HISTORY_FILE_SIZE_BYTES,
+            )
+
+    return affected_rows, [image_path for image_path in released_images if image_path]
+
+
+def _history_entry_kind_condition(summaries: bool) -> str:
+    # IS / IS NOT: Einträge ohne Typ zählen zu den Alerts
+    return 'type IS ?' if summaries else 'type IS NOT ?'
+
+
+def _is_session_summary_entry(entry: dict[str, Any]) -> bool:
+    return entry.get('type') == SESSION_SUMMARY_ENTRY_TYPE
+
+
+def _delete_oldest_history_rows(
+    connection: sqlite3.Connection,
+    count: int,
+    *,
+    condition: str = '1',
+    params: tuple[Any, ...] = (),
+) -> list[str]:
+    if count <= 0:
+        return []
+    rows = connection.execute(
+        f'SELECT id, image_path FROM history_entries WHERE {condition} ORDER BY timestamp, id LIMIT ?',
+        (*params, count),
+    ).fetchall()
+    connection.executemany('DELETE FROM history_entries WHERE id = ?', [(row_id,) for row_id, _image in rows])
+    return [image_path for _row_id, image_path in rows]
+
+
+def _remove_released_history_images_unlocked(
+    connection: sqlite3.Connection,
+    history_dir: Path,
+    image_paths: list[str],
+) -> None:
+    removed_count = 0
+    for image_path in dict.fromkeys(image_paths):
+        still_referenced = connection.execute(
+            'SELECT 1 FROM history_entries WHERE image_path = ? LIMIT 1',
+            (image_path,),
+        ).fetchone() is not None
+        if still_referenced:
+            continue
+        resolved_image_path = resolve_history_image_path(image_path, history_dir)
+        if resolved_image_path is None:
+            continue
+        try:
+            resolved_image_path.unlink(missing_ok=True)
+            removed_count += 1
+        except Exception as exc:
+            logger.warning('Failed to remove released history image %s: %s', resolved_image_path, exc)
+
+    if removed_count > 0:
+        logger.info('Removed %s released history image file(s)', removed_count)
+
+
 def _prepare_history_entries_for_storage_unlocked(
     entries: list[dict[str, Any]],
     *,
@@ -324,14 +777,28 @@ def _prepare_history_entries_for_storage_unlocked(
     sanitized_entries = [dict(entry) for entry in entries if isinstance(entry, dict)]
     _normalize_history_image_paths_unlocked(sanitized_entries, history_dir)
 
-    if max_entries > 0 and len(sanitized_entries) > max_entries:
-        trimmed_count = len(sanitized_entries) - max_entries
-        sanitized_entries = _retain_newest_history_entries_unlocked(sanitized_entries, max_entries)
+    keep_indexes: set[int] = set()
+    for summaries, limit in ((False, max_entries), (True, MAX_HISTORY_SESSION_SUMMARIES)):
+        kind_indexes = [
+            index
+            for index, entry in enumerate(sanitized_entries)
+            if _is_session_summary_entry(entry) == summaries
+        ]
+        if limit <= 0 or len(kind_indexes) <= limit:
+            keep_indexes.update(kind_indexes)
+            continue
+        newest = _select_newest_history_entry_indexes_unlocked(
+            [sanitized_entries[index] for index in kind_indexes],
+            limit,
+        )
+        keep_indexes.update(kind_indexes[position] for position in newest)
         logger.info(
-            'Trimmed %s oldest history entries to enforce max entry limit (%s)',
-            trimmed_count,
-            max_entries,
+            'Trimmed %s oldest %s to enforce max entry limit (%s)',
+            len(kind_indexes) - limit,
+            'session summaries' if summaries else 'history entries',
+            limit,
         )
+    sanitized_entries = [entry for index, entry in enumerate(sanitized_entries) if index in keep_indexes]
 
     _enforce_history_image_limit_unlocked(sanitized_entries)
     return _enforce_history_file_size_limit_unlocked(sanitized_entries, history_file=history_file)
@@ -375,18 +842,6 @@ def _select_newest_history_entry_indexes_unlocked(entries: list[dict[str, Any]],
     )
 
 
-def _retain_newest_history_entries_unlocked(
-    entries: list[dict[str, Any]],
-    keep_count: int,
-) -> list[dict[str, Any]]:
-    keep_indexes = _select_newest_history_entry_indexes_unlocked(entries, keep_count)
-    return [
-        entry
-        for index, entry in enumerate(entries)
-        if index in keep_indexes
-    ]
-
-
 def _pop_oldest_history_entry_unlocked(entries: list[dict[str, Any]]) -> bool:
     if not entries:
         return False
@@ -509,7 +964,8 @@ def _serialize_history_entries(entries: list[dict[str, Any]]) -> str:
 
 
 def _serialized_history_entries_size_bytes(entries: list[dict[str, Any]]) -> int:
-    return len(_serialize_history_entries(entries).encode('utf-8'))
+    # Entspricht der Summe von `size_bytes` im Store, damit Liste und SQL dasselbe Limit messen
+    return sum(len(json.dumps(entry, ensure_ascii=False).encode('utf-8')) for entry in entries)
 
 
 def _write_pending_history_image_unlocked(
@@ -545,11 +1001,10 @@ def _write_pending_history_image_unlocked(
 
 
 def _write_history_entries_unlocked(history_file: Path, entries: list[dict[str, Any]]) -> None:
-    temp_file = history_file.with_suffix('.json.tmp')
-    serialized_entries = _serialize_history_entries(entries).encode('utf-8')
-    with temp_file.open('wb') as file:
-        file.write(serialized_entries)
-    temp_file.replace(history_file)
+    with closing(_connect_history_database(history_file)) as connection:
+        with connection:
+            connection.execute('DELETE FROM history_entries')
+            _insert_history_rows(connection, entries)
 
 
 def _backup_invalid_history_file(history_file: Path) -> None:
@@ -0,0 +1,281 @@
+"""
+Sensitivity auto-calibration against a labelled clip.
+
+A label file marks time ranges of a recording as ``motion`` or
+``no_motion``. Every combination of ``sensitivity``,
+``background_learning_rate`` and ``processing_max_width`` from the grid is run
+over the whole clip in its own worker process (see
+:func:`~src.cam.reanalysis.map_in_pool`). Each candidate is written into the
+config and scored by a fresh ``MotionDetector(config)``, i.e. exactly as the
+detector starts after ``--write-config``.
+
+Each candidate reports its false-alarm rate (flagged frames inside
+``no_motion`` ranges), its recall (flagged frames inside ``motion`` ranges) and
+its CPU time per analysed frame. The winner is the cheapest candidate that meets
+the false-alarm target and the minimum recall; it can be written into the
+config file.
+
+Label files are CSV (``start_s,end_s,label``) or JSON
+(``[{"start_s": 0, "end_s": 30, "label": "no_motion"}, ...]``).
+
+Usage::
+
+    python -m src.cam.calibration clip.mp4 clip.labels.csv --max-false-alarm 0.01 --write-config
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import dataclasses
+import itertools
+import json
+import logging
+import sys
+import time
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..config import MotionDetectionConfig, load_config, save_config
+from .motion import MotionDetector
+from .reanalysis import SourceInfo, iter_frames, map_in_pool, probe_source
+
+LABELS = ("motion", "no_motion")
+DEFAULT_SENSITIVITIES = (0.05, 0.1, 0.2, 0.4, 0.7)
+DEFAULT_LEARNING_RATES = (0.001, 0.005, 0.02)
+DEFAULT_PROCESSING_WIDTHS = (320, 480, 800)
+
+
+@dataclass(frozen=True)
+class LabelSegment:
+    start_s: float
+    end_s: float
+    label: str
+
+
+@dataclass(frozen=True)
+class CalibrationCandidate:
+    sensitivity: float
+    background_learning_rate: float
+    processing_max_width: int
+
+    def as_params(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclass
+class CalibrationScore:
+    candidate: CalibrationCandidate
+    motion_frames: int = 0
+    detected_motion_frames: int = 0
+    quiet_frames: int = 0
+    false_alarm_frames: int = 0
+    analysed_frames: int = 0
+    cpu_seconds: float = 0.0
+
+    @property
+    def false_alarm_rate(self) -> float:
+        return self.false_alarm_frames / self.quiet_frames if self.quiet_frames else 0.0
+
+    @property
+    def recall(self) -> float:
+        return self.detected_motion_frames / self.motion_frames if self.motion_frames else 1.0
+
+    @property
+    def cpu_ms_per_frame(self) -> float:
+        return 1000.0 * self.cpu_seconds / self.analysed_frames if self.analysed_frames else 0.0
+
+    def meets(self, max_false_alarm: float, min_recall: float) -> bool:
+        return self.false_alarm_rate <= max_false_alarm and self.recall >= min_recall
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            **self.candidate.as_params(),
+            "false_alarm_rate": round(self.false_alarm_rate, 4),
+            "recall": round(self.recall, 4),
+            "cpu_ms_per_frame": round(self.cpu_ms_per_frame, 3),
+            "motion_frames": self.motion_frames,
+            "quiet_frames": self.quiet_frames,
+        }
+
+
+def load_labels(path: str) -> List[LabelSegment]:
+    """Read labelled time ranges from a CSV or JSON file, sorted by start."""
+    label_path = Path(path)
+    with open(label_path, "r", encoding="utf-8") as handle:
+        if label_path.suffix.lower() == ".json":
+            entries = json.load(handle)
+        else:
+            entries = list(csv.DictReader(handle))
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"Label file '{path}' contains no segments")
+
+    segments: List[LabelSegment] = []
+    for entry in entries:
+        try:
+            segment = LabelSegment(float(entry["start_s"]), float(entry["end_s"]), str(entry["label"]).strip().lower())
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid label entry {entry!r}: expected start_s, end_s and label") from exc
+        if segment.label not in LABELS:
+            raise ValueError(f"Label must be one of {list(LABELS)}, got '{segment.label}'")
+        if segment.end_s <= segment.start_s:
+            raise ValueError(f"Label segment ends before it starts: {entry!r}")
+        segments.append(segment)
+    return sorted(segments, key=lambda segment: segment.start_s)
+
+
+def label_at(segments: Sequence[LabelSegment], seconds: float) -> Optional[str]:
+    for segment in segments:
+        if segment.start_s <= seconds < segment.end_s:
+            return segment.label
+    return None
+
+
+def build_grid(
+    sensitivities: Sequence[float] = DEFAULT_SENSITIVITIES,
+    learning_rates: Sequence[float] = DEFAULT_LEARNING_RATES,
+    processing_widths: Sequence[int] = DEFAULT_PROCESSING_WIDTHS,
+) -> List[CalibrationCandidate]:
+    return [
+        CalibrationCandidate(float(sensitivity), float(rate), int(width))
+        for sensitivity, rate, width in itertools.product(sensitivities, learning_rates, processing_widths)
+    ]
+
+
+def evaluate_candidate(
+    candidate: CalibrationCandidate,
+    *,
+    source: SourceInfo,
+    labels: Sequence[LabelSegment],
+    base_config: MotionDetectionConfig,
+) -> CalibrationScore:
+    """Run one grid point over the whole clip; module-level so it can be pickled into pool workers."""
+    config = dataclasses.replace(base_config, **candidate.as_params())
+    detector = MotionDetector(config, logger=logging.getLogger("calibration"))
+    frame_skip = max(1, int(config.frame_skip or 1))
+    score = CalibrationScore(candidate)
+    try:
+        cpu_started = time.process_time()
+        for index, frame in iter_frames(source, 0, source.frame_count, frame_skip):
+            motion = detector.detect_motion(frame).motion_detected
+            score.analysed_frames += 1
+            # Lernphase des Hintergrundmodells zählt nicht zur Bewertung
+            if detector.is_learning:
+                continue
+            label = label_at(labels, index / source.fps)
+            if label == "motion":
+                score.motion_frames += 1
+                score.detected_motion_frames += int(motion)
+            elif label == "no_motion":
+                score.quiet_frames += 1
+                score.false_alarm_frames += int(motion)
+        score.cpu_seconds = time.process_time() - cpu_started
+    finally:
+        detector.cleanup()
+    return score
+
+
+def run_calibration(
+    source: SourceInfo,
+    labels: Sequence[LabelSegment],
+    base_config: MotionDetectionConfig,
+    grid: Sequence[CalibrationCandidate],
+    *,
+    workers: Optional[int] = None,
+) -> List[CalibrationScore]:
+    evaluate = partial(evaluate_candidate, source=source, labels=list(labels), base_config=base_config)
+    return map_in_pool(evaluate, list(grid), workers=workers)
+
+
+def select_best(
+    scores: Sequence[CalibrationScore],
+    *,
+    max_false_alarm: float,
+    min_recall: float,
+) -> Optional[CalibrationScore]:
+    """Cheapest candidate meeting both targets; ties go to the better recall."""
+    eligible = [score for score in scores if score.meets(max_false_alarm, min_recall)]
+    if not eligible:
+        return None
+    return min(eligible, key=lambda score: (score.cpu_ms_per_frame, -score.recall, score.false_alarm_rate))
+
+
+def _float_list(text: str) -> List[float]:
+    return [float(part) for part in text.split(",") if part.strip()]
+
+
+def _int_list(text: str) -> List[int]:
+    return [int(part) for part in text.split(",") if part.strip()]
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Find motion_detection settings for a labelled clip")
+    parser.add_argument("source", help="Video file or image directory")
+    parser.add_argument("labels", help="CSV/JSON with start_s, end_s and label (motion/no_motion)")
+    parser.add_argument("--config", default="config/config.yaml", help="Config file providing the remaining settings")
+    parser.add_argument("--sensitivity", type=_float_list, default=list(DEFAULT_SENSITIVITIES), help="Comma-separated grid")
+    parser.add_argument("--learning-rate", type=_float_list, default=list(DEFAULT_LEARNING_RATES), help="Comma-separated grid")
+    parser.add_argument("--processing-width", type=_int_list, default=list(DEFAULT_PROCESSING_WIDTHS), help="Comma-separated grid")
+    parser.add_argument("--max-false-alarm", type=float, default=0.01, help="Allowed share of flagged no_motion frames")
+    parser.add_argument("--min-recall", type=float, default=0.9, help="Required share of flagged motion frames")
+    parser.add_argument("--fps", type=float, default=None, help="Frame rate of image directories (default: webcam.fps)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--report", default=None, help="Write all scores as JSON to this file")
+    parser.add_argument("--write-config", action="store_true", help="Store the winning settings in --config")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    try:
+        config = load_config(args.config)
+        labels = load_labels(args.labels)
+        source = probe_source(args.source, fallback_fps=float(args.fps or getattr(config.webcam, "fps", 30) or 30))
+        grid = build_grid(args.sensitivity, args.learning_rate, args.processing_width)
+        for candidate in grid:
+            errors = dataclasses.replace(config.motion_detection, **candidate.as_params()).validate()
+            if errors:
+                raise ValueError(f"Invalid grid point {candidate.as_params()}: {'; '.join(errors)}")
+    except (OSError, ValueError, RuntimeError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    started = time.perf_counter()
+    scores = run_calibration(source, labels, config.motion_detection, grid, workers=args.workers)
+    best = select_best(scores, max_false_alarm=args.max_false_alarm, min_recall=args.min_recall)
+
+    print(f"{'sens':>6} {'lr':>7} {'width':>5} {'false':>7} {'recall':>7} {'cpu ms':>7}")
+    for score in sorted(scores, key=lambda item: (item.false_alarm_rate, item.cpu_ms_per_frame)):
+        marker = " *" if score is best else ""
+        print(
+            f"{score.candidate.sensitivity:>6.3f} {score.candidate.background_learning_rate:>7.4f} "
+            f"{score.candidate.processing_max_width:>5d} {score.false_alarm_rate:>7.2%} {score.recall:>7.2%} "
+            f"{score.cpu_ms_per_frame:>7.2f}{marker}"
+        )
+    print(f"{len(grid)} candidates in {time.perf_counter() - started:.1f} s")
+
+    if args.report:
+        report = {
+            "source": source.path,
+            "max_false_alarm": args.max_false_alarm,
+            "min_recall": args.min_recall,
+            "best": best.as_dict() if best else None,
+            "scores": [score.as_dict() for score in scores],
+        }
+        Path(args.report).write_text(json.dumps(report, indent=1), encoding="utf-8")
+
+    if best is None:
+        print("No candidate meets the false-alarm and recall targets", file=sys.stderr)
+        return 1
+    if args.write_config:
+        for key, value in best.candidate.as_params().items():
+            setattr(config.motion_detection, key, value)
+        save_config(config, args.config)
+        print(f"Wrote {best.candidate.as_params()} to {args.config}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,30 +7,59 @@ import threading
 import asyncio
 import concurrent.futures
 import collections
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext, suppress
+import json
 from functools import lru_cache
 import time
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Callable, Optional, Iterator, Dict, Any, Protocol
+from typing import TYPE_CHECKING, Annotated, AsyncIterator, Callable, Optional, Iterator, Dict, Any, List, Protocol, cast
 
+import anyio
 import cv2
 import numpy as np
-from fastapi import Response
-from fastapi.responses import StreamingResponse
+from fastapi import Header, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import JSONResponse, StreamingResponse
 from nicegui import Client, app, core, run, ui
 import logging
 
 from src.config import get_global_config, get_logger, load_config, save_config, save_global_config
 from .motion import MotionResult, MotionDetector
+from .detection_worker import MotionDetectionWorker
+from .frame_ring import FrameHandle, FrameRing
+from .governor import DetectionRateGovernor, min_fps_for_alert_delay
+from .heatmap import ActivityHeatmap
+from .latency import LatencyRecorder
+from .mjpeg import (
+    EncodedFrame,
+    as_encoded_jpeg_frame,
+    choose_reduction,
+    decode_for_detection,
+    decode_for_preview,
+    decode_full,
+)
+from .sources import VideoSourceCapture, create_video_source
+from .streaming import (
+    AckWindow,
+    FrameSequenceNotifier,
+    PreviewBroadcaster,
+    PreviewFrameMeta,
+    PreviewRung,
+    build_multipart_chunk,
+    build_ws_frame_message,
+)
 
 if TYPE_CHECKING:
-    from src.config import AppConfig, WebcamConfig, UVCConfig
+    from src.config import AppConfig, MotionDetectionConfig, WebcamConfig, UVCConfig
 
 
 class CameraInitializationCancelled(RuntimeError):
     """Raised when camera initialization is cancelled before completion."""
 
 
+# OpenCV-Kamera oder hardwarefreie Quelle aus src.cam.sources (gleiche Capture-Oberfläche)
+CaptureSource = cv2.VideoCapture | VideoSourceCapture
+
+
 _DEFAULT_VIDEO_PLACEHOLDER_BASE64 = (
     "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAAAXNSR0IArs4c6QAA"
     "AANJREFUGFdjYGBg+A8AAQQBAHAgZQsAAAAASUVORK5CYII="
@@ -40,7 +69,14 @@ _VIDEO_ROUTE_LOCK = threading.Lock()
 _VIDEO_ROUTES_REGISTERED = False
 _VIDEO_ROUTE_APP: Any | None = None
 _ACTIVE_VIDEO_CAMERA: "_ActiveVideoSource | None" = None
+# Alle Kameras mit eigener Route (/video_feed/<camera_id>), inklusive der aktiven
+_VIDEO_CAMERAS: Dict[str, "_ActiveVideoSource"] = {}
 _VIDEO_ROUTE_LOGGER = logging.getLogger(__name__)
+# Obergrenze für /video/frame?after=<seq>; danach 204, der Client fragt erneut
+_VIDEO_FRAME_LONG_POLL_SECONDS = 10.0
+# /video_ws: unbestätigte Frames pro Client (?window=), danach wird übersprungen
+_VIDEO_WS_DEFAULT_WINDOW = 2
+_VIDEO_WS_MAX_WINDOW = 8
 
 
 class _ActiveVideoSource(Protocol):
@@ -67,7 +103,7 @@ def _get_video_placeholder_body(camera: "_ActiveVideoSource | None" = None) -> b
     return _DEFAULT_VIDEO_PLACEHOLDER_BODY
 
 
-def _get_cached_video_frame_bytes(camera: "_ActiveVideoSource | None") -> bytes | None:
+def _get_cached_video_frame_bytes(camera: "_ActiveVideoSource | None", width: int | None = None) -> bytes | None:
     if camera is None:
         return None
 
@@ -76,7 +112,7 @@ def _get_cached_video_frame_bytes(camera: "_ActiveVideoSource | None") -> bytes
         return None
 
     try:
-        cached_frame = get_current_jpeg_frame()
+        cached_frame = get_current_jpeg_frame() if width is None else get_current_jpeg_frame(width)
     except Exception as exc:
         _get_video_route_logger(camera).debug("Error reading cached jpeg frame: %s", exc, exc_info=True)
         return None
@@ -86,7 +122,7 @@ def _get_cached_video_frame_bytes(camera: "_ActiveVideoSource | None") -> bytes
     return None
 
 
-def _build_preview_frame_bytes(camera: "_ActiveVideoSource | None") -> bytes | None:
+def _build_preview_frame_bytes(camera: "_ActiveVideoSource | None", width: int | None = None) -> bytes | None:
     if camera is None:
         return None
 
@@ -95,7 +131,7 @@ def _build_preview_frame_bytes(camera: "_ActiveVideoSource | None") -> bytes | N
         return None
 
     try:
-        preview_frame = build_preview_frame()
+        preview_frame = build_preview_frame() if width is None else build_preview_frame(width)
     except Exception as exc:
         _get_video_route_logger(camera).debug("Error building preview jpeg frame: %s", exc, exc_info=True)
         return None
@@ -105,24 +141,32 @@ def _build_preview_frame_bytes(camera: "_ActiveVideoSource | None") -> bytes | N
     return None
 
 
-def _register_video_preview_consumer(camera: "_ActiveVideoSource | None") -> None:
+def _register_video_preview_consumer(camera: "_ActiveVideoSource | None", width: int | None = None) -> None:
     if camera is None:
         return
     register_consumer = getattr(camera, "register_preview_consumer", None)
     if callable(register_consumer):
         try:
-            register_consumer()
+            register_consumer() if width is None else register_consumer(width)
         except Exception:
             _get_video_route_logger(camera).debug("Failed to register preview consumer", exc_info=True)
 
 
-def _unregister_video_preview_consumer(camera: "_ActiveVideoSource | None") -> None:
+def _note_video_capture_demand(camera: "_ActiveVideoSource | None") -> None:
+    if camera is None:
+        return
+    note_demand = getattr(camera, "note_capture_demand", None)
+    if callable(note_demand):
+        note_demand()
+
+
+def _unregister_video_preview_consumer(camera: "_ActiveVideoSource | None", width: int | None = None) -> None:
     if camera is None:
         return
     unregister_consumer = getattr(camera, "unregister_preview_consumer", None)
     if callable(unregister_consumer):
         try:
-            unregister_consumer()
+            unregister_consumer() if width is None else unregister_consumer(width)
         except Exception:
             _get_video_route_logger(camera).debug("Failed to unregister preview consumer", exc_info=True)
 
@@ -154,7 +198,73 @@ def _clear_active_video_camera(camera: "_ActiveVideoSource | None" = None, *, fo
     global _ACTIVE_VIDEO_CAMERA
     with _VIDEO_ROUTE_LOCK:
         if force or _ACTIVE_VIDEO_CAMERA is camera:
+            if _ACTIVE_VIDEO_CAMERA is not None:
+                _unregister_video_camera_locked(_ACTIVE_VIDEO_CAMERA)
             _ACTIVE_VIDEO_CAMERA = None
+        if camera is not None:
+            _unregister_video_camera_locked(camera)
+
+
+def _get_video_camera_id(camera: "_ActiveVideoSource | None") -> str | None:
+    camera_id = getattr(camera, "camera_id", None)
+    return camera_id if isinstance(camera_id, str) and camera_id else None
+
+
+def _register_video_camera_locked(camera: "_ActiveVideoSource") -> None:
+    camera_id = _get_video_camera_id(camera)
+    if camera_id is not None:
+        _VIDEO_CAMERAS[camera_id] = camera
+
+
+def _unregister_video_camera_locked(camera: "_ActiveVideoSource") -> None:
+    for camera_id, registered in list(_VIDEO_CAMERAS.items()):
+        if registered is camera:
+            del _VIDEO_CAMERAS[camera_id]
+
+
+def _register_video_camera(camera: "_ActiveVideoSource", target_app: Any | None = None) -> None:
+    """Make a camera reachable under /video_feed/<camera_id> without changing the active camera."""
+    route_app = app if target_app is None else target_app
+    with _VIDEO_ROUTE_LOCK:
+        _ensure_video_routes_registered_locked(route_app)
+        _register_video_camera_locked(camera)
+
+
+def _unregister_video_camera(camera: "_ActiveVideoSource") -> None:
+    with _VIDEO_ROUTE_LOCK:
+        _unregister_video_camera_locked(camera)
+
+
+def _get_video_camera_ids() -> List[str]:
+    with _VIDEO_ROUTE_LOCK:
+        return list(_VIDEO_CAMERAS)
+
+
+def _resolve_video_camera(camera_id: str | None = None) -> "_ActiveVideoSource | None":
+    """Active camera for ``None``, otherwise the camera registered under ``camera_id``."""
+    with _VIDEO_ROUTE_LOCK:
+        if camera_id is None:
+            return _ACTIVE_VIDEO_CAMERA
+        camera = _VIDEO_CAMERAS.get(camera_id)
+        if camera is None and _get_video_camera_id(_ACTIVE_VIDEO_CAMERA) == camera_id:
+            camera = _ACTIVE_VIDEO_CAMERA
+        return camera
+
+
+def _is_known_video_camera_id(camera_id: str) -> bool:
+    return _resolve_video_camera(camera_id) is not None
+
+
+_VIDEO_ROUTE_PATHS = (
+    "/video_feed",
+    "/video/frame",
+    "/video_feed/{camera_id}",
+    "/video/frame/{camera_id}",
+    "/api/latency",
+    "/api/latency/{camera_id}",
+    "/api/motion/heatmap",
+    "/api/motion/heatmap/{camera_id}",
+)
 
 
 def _video_routes_exist_in_app(target_app: Any | None = None) -> bool:
@@ -165,22 +275,28 @@ def _video_routes_exist_in_app(target_app: Any | None = None) -> bool:
         return False
 
     registered_paths = {getattr(route, "path", None) for route in routes}
-    return "/video_feed" in registered_paths and "/video/frame" in registered_paths
+    return all(path in registered_paths for path in _VIDEO_ROUTE_PATHS)
 
 
-def _build_video_frame_response(camera: "_ActiveVideoSource | None") -> Response:
+def _build_video_frame_response(camera: "_ActiveVideoSource | None", width: int | None = None) -> Response:
     if camera is None:
         return Response(content=_get_video_placeholder_body(), media_type="image/png")
 
     try:
-        frame = camera.get_current_frame(copy_frame=False)
+        has_frame = _has_current_video_frame(camera, raise_errors=True)
     except Exception as exc:
         _get_video_route_logger(camera).error("Error reading current frame: %s", exc)
         return Response(content=_get_video_placeholder_body(camera), media_type="image/png")
 
-    if frame is None:
+    if not has_frame:
         return Response(content=_get_video_placeholder_body(camera), media_type="image/png")
 
+    if width is not None:
+        # Ladder rungs are built on demand and cached per captured frame
+        rung_frame = _build_preview_frame_bytes(camera, width)
+        if rung_frame is not None:
+            return Response(content=rung_frame, media_type="image/jpeg")
+
     cached_frame = _get_cached_video_frame_bytes(camera)
     if cached_frame is not None:
         return Response(content=cached_frame, media_type="image/jpeg")
@@ -190,43 +306,425 @@ def _build_video_frame_response(camera: "_ActiveVideoSource | None") -> Response
         return Response(content=preview_frame, media_type="image/jpeg")
 
     try:
-        ret, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
-        if not ret:
+        jpeg_bytes = _encode_current_video_frame(camera)
+        if jpeg_bytes is None:
             return Response(content=_get_video_placeholder_body(camera), media_type="image/png")
-        return Response(content=buffer.tobytes(), media_type="image/jpeg")
+        return Response(content=jpeg_bytes, media_type="image/jpeg")
     except Exception as exc:
         _get_video_route_logger(camera).error("Error encoding frame: %s", exc)
         return Response(content=_get_video_placeholder_body(camera), media_type="image/png")
 
 
-def _build_video_stream_chunk(camera: "_ActiveVideoSource | None") -> bytes:
-    response = _build_video_frame_response(camera)
-    media_type = response.media_type or "image/png"
-    return (
-        b"--frame\r\nContent-Type: "
-        + media_type.encode("ascii", errors="ignore")
-        + b"\r\n\r\n"
-        + bytes(response.body)
-        + b"\r\n"
-    )
+def _encode_current_video_frame(camera: "_ActiveVideoSource") -> bytes | None:
+    """JPEG of the current frame; ring-backed frames are encoded under a handle so the slot is not recycled."""
+    acquire_handle = getattr(camera, "acquire_frame_handle", None)
+    if callable(acquire_handle):
+        handle = acquire_handle()
+        if handle is None:
+            return None
+        with handle:
+            return _encode_video_jpeg(handle.frame)
+    frame = camera.get_current_frame(copy_frame=False)
+    return None if frame is None else _encode_video_jpeg(frame)
+
+
+def _encode_video_jpeg(frame: np.ndarray) -> bytes | None:
+    ret, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
+    return buffer.tobytes() if ret else None
 
 
-def _generate_active_video_frames() -> Iterator[bytes]:
+def _build_video_stream_chunk(camera: "_ActiveVideoSource | None", width: int | None = None) -> bytes:
+    response = _build_video_frame_response(camera, width)
+    return build_multipart_chunk(bytes(response.body), response.media_type or "image/png")
+
+
+def _get_video_broadcaster(camera: "_ActiveVideoSource | None", width: int | None = None) -> PreviewBroadcaster | None:
+    if camera is None:
+        return None
+    get_broadcaster = getattr(camera, "get_preview_broadcaster", None)
+    if not callable(get_broadcaster):
+        return None
+    try:
+        broadcaster = get_broadcaster() if width is None else get_broadcaster(width)
+    except Exception:
+        _get_video_route_logger(camera).debug("Failed to resolve preview broadcaster", exc_info=True)
+        return None
+    return broadcaster if isinstance(broadcaster, PreviewBroadcaster) else None
+
+
+def _has_current_video_frame(camera: "_ActiveVideoSource", *, raise_errors: bool = False) -> bool:
+    try:
+        has_current_frame = getattr(camera, "has_current_frame", None)
+        if callable(has_current_frame):
+            # Avoids decoding MJPEG passthrough frames just to test for presence
+            return bool(has_current_frame())
+        return camera.get_current_frame(copy_frame=False) is not None
+    except Exception:
+        if raise_errors:
+            raise
+        return False
+
+
+async def _stream_active_video_frames(
+    camera_id: str | None = None,
+    width: int | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Async per-client MJPEG stream fed by a camera's preview broadcaster.
+
+    Without ``camera_id`` the active camera is streamed; otherwise the camera
+    registered under that id (re-resolved each frame, so a restarted camera is
+    picked up again). ``width`` subscribes to a preview ladder rung (``?w=``).
+    """
     registered_camera: "_ActiveVideoSource | None" = None
+    registered_broadcaster: PreviewBroadcaster | None = None
+    last_sequence = 0
     try:
         while True:
-            current_camera = _get_active_video_camera()
+            current_camera = _resolve_video_camera(camera_id)
             if current_camera is not registered_camera:
-                _unregister_video_preview_consumer(registered_camera)
-                _register_video_preview_consumer(current_camera)
+                _unregister_video_preview_consumer(registered_camera, width)
+                if registered_broadcaster is not None:
+                    registered_broadcaster.remove_subscriber()
+                _register_video_preview_consumer(current_camera, width)
+                registered_camera = current_camera
+                registered_broadcaster = _get_video_broadcaster(current_camera, width)
+                if registered_broadcaster is not None:
+                    registered_broadcaster.add_subscriber()
+                last_sequence = 0
+
+            interval = _get_video_stream_sleep_seconds(current_camera)
+            if registered_broadcaster is None or current_camera is None:
+                # Legacy sources without a broadcaster (and the placeholder) are polled.
+                yield _build_video_stream_chunk(current_camera, width)
+                await asyncio.sleep(interval)
+                continue
+
+            sequence, chunk = await registered_broadcaster.wait_for_chunk(
+                last_sequence,
+                timeout=max(1.0, interval * 4),
+            )
+            if chunk is not None and sequence > last_sequence:
+                last_sequence = sequence
+                yield chunk
+                continue
+
+            if not _has_current_video_frame(current_camera):
+                yield build_multipart_chunk(_get_video_placeholder_body(current_camera), "image/png")
+                await asyncio.sleep(interval)
+            elif chunk is None:
+                # A frame exists but nothing was published yet; build one off the event loop.
+                yield await asyncio.to_thread(_build_video_stream_chunk, current_camera, width)
+    finally:
+        if registered_broadcaster is not None:
+            registered_broadcaster.remove_subscriber()
+        _unregister_video_preview_consumer(registered_camera, width)
+        _get_video_route_logger(registered_camera).debug("Video stream closed")
+
+
+def _get_video_frame_sequence(camera: "_ActiveVideoSource | None") -> int | None:
+    get_sequence = getattr(camera, "get_frame_sequence", None)
+    if not callable(get_sequence):
+        return None
+    try:
+        sequence = get_sequence()
+    except Exception:
+        _get_video_route_logger(camera).debug("Failed to read frame sequence", exc_info=True)
+        return None
+    return int(sequence) if sequence is not None else None
+
+
+def _build_video_frame_etag(camera: "_ActiveVideoSource", sequence: int, width: int | None) -> str:
+    rung: int | None = None
+    resolve_width = getattr(camera, "resolve_preview_width", None)
+    if width is not None and callable(resolve_width):
+        rung = resolve_width(width)
+    get_epoch = getattr(camera, "get_frame_epoch", None)
+    epoch = get_epoch() if callable(get_epoch) else "0"
+    return f'"{epoch}-{sequence}-{rung if rung is not None else "d"}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    # Weak comparison as required for If-None-Match (RFC 9110 13.1.2)
+    return any(candidate == "*" or candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def _video_frame_headers(etag: str, sequence: int) -> Dict[str, str]:
+    # Clients and proxies may keep the frame but must revalidate it via If-None-Match
+    return {"ETag": etag, "Cache-Control": "no-cache", "X-Frame-Sequence": str(sequence)}
+
+
+async def _wait_for_video_frame_after(
+    camera: "_ActiveVideoSource | None",
+    after_sequence: int,
+    *,
+    timeout: float = _VIDEO_FRAME_LONG_POLL_SECONDS,
+) -> None:
+    get_notifier = getattr(camera, "get_frame_notifier", None)
+    notifier = get_notifier() if callable(get_notifier) else None
+    if not isinstance(notifier, FrameSequenceNotifier):
+        return
+    await notifier.wait_for_sequence(after_sequence, timeout=timeout)
+
+
+def _build_sequenced_video_frame(
+    camera: "_ActiveVideoSource",
+    width: int | None,
+) -> tuple[bytes, int] | None:
+    build_sequenced = getattr(camera, "build_sequenced_preview_jpeg", None)
+    if not callable(build_sequenced):
+        return None
+    try:
+        return cast(Optional[tuple[bytes, int]], build_sequenced(width))
+    except Exception as exc:
+        _get_video_route_logger(camera).debug("Error building sequenced preview frame: %s", exc, exc_info=True)
+        return None
+
+
+async def _serve_video_frame(
+    camera: "_ActiveVideoSource | None",
+    *,
+    width: int | None = None,
+    after: int | None = None,
+    if_none_match: str | None = None,
+) -> Response:
+    """
+    Single-frame endpoint with conditional GET.
+
+    Frames carry an ETag derived from the capture sequence; a matching
+    ``If-None-Match`` gets 304 without encoding anything. ``after`` long-polls
+    until a frame other than ``after`` exists (204 after the timeout). Sources
+    without sequence numbers (placeholder, stubs) are served uncached.
+    Every request counts as capture demand, so an idling capture resumes.
+    """
+    _note_video_capture_demand(camera)
+    if after is not None:
+        # Wartender Long-Poll zählt als Preview-Consumer, sonst liefert grab_only nie ein neues Bild
+        _register_video_preview_consumer(camera, width)
+        try:
+            await _wait_for_video_frame_after(camera, after)
+        finally:
+            _unregister_video_preview_consumer(camera, width)
+            _note_video_capture_demand(camera)
+
+    sequence = _get_video_frame_sequence(camera) if camera is not None else None
+    if camera is None or sequence is None:
+        response = await asyncio.to_thread(_build_video_frame_response, camera, width)
+        response.headers["Cache-Control"] = "no-store"
+        return response
+
+    etag = _build_video_frame_etag(camera, sequence, width)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=_video_frame_headers(etag, sequence))
+    if after is not None and sequence == after:
+        return Response(status_code=204, headers=_video_frame_headers(etag, sequence))
+
+    result = await asyncio.to_thread(_build_sequenced_video_frame, camera, width)
+    if result is None:
+        response = await asyncio.to_thread(_build_video_frame_response, camera, width)
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    jpeg_bytes, jpeg_sequence = result
+    etag = _build_video_frame_etag(camera, jpeg_sequence, width)
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=_video_frame_headers(etag, jpeg_sequence))
+    return Response(content=jpeg_bytes, media_type="image/jpeg", headers=_video_frame_headers(etag, jpeg_sequence))
+
+
+class _VideoWebSocketSession:
+    """Per-connection state of /video_ws shared by its sender and receiver tasks."""
+
+    def __init__(self, width: int | None, window: int) -> None:
+        self.width = width
+        self.window = AckWindow(window)
+        self.latency: LatencyRecorder | None = None
+        # Capture time per sent frame sequence, until the client acknowledges it
+        self.pending_captures: Dict[int, float] = {}
+
+    def on_sent(self, sequence: int, captured_at: float, sent_at: float) -> None:
+        self.window.on_sent()
+        if captured_at <= 0:
+            return
+        self.pending_captures[sequence] = captured_at
+        while len(self.pending_captures) > self.window.size * 4:
+            self.pending_captures.pop(next(iter(self.pending_captures)))
+        if self.latency is not None:
+            self.latency.record("stream.ws_send_age", max(0.0, sent_at - captured_at))
+
+    def on_ack(self, sequence: Any) -> None:
+        self.window.on_ack()
+        try:
+            captured_at = self.pending_captures.pop(int(sequence), None)
+        except (TypeError, ValueError):
+            return
+        if captured_at is not None and self.latency is not None:
+            # Capture bis gerendert im Browser plus Rückweg des Acks, komplett mit Serveruhr gemessen
+            self.latency.record("stream.ws_ack_age", max(0.0, time.time() - captured_at))
+
+
+def _normalize_video_ws_window(window: Any) -> int:
+    try:
+        value = int(window)
+    except (TypeError, ValueError):
+        return _VIDEO_WS_DEFAULT_WINDOW
+    return min(max(value, 1), _VIDEO_WS_MAX_WINDOW)
+
+
+def _parse_video_ws_message(text: str) -> Dict[str, Any]:
+    """Client messages: ``{"ack": <seq>}`` per rendered frame, ``{"w": <px>}`` to switch the rung."""
+    try:
+        message = json.loads(text)
+    except (TypeError, ValueError):
+        return {"ack": None} if str(text).strip() == "ack" else {}
+    return message if isinstance(message, dict) else {}
+
+
+async def _receive_video_ws_messages(websocket: WebSocket, session: _VideoWebSocketSession) -> None:
+    while True:
+        message = _parse_video_ws_message(await websocket.receive_text())
+        if "ack" in message:
+            session.on_ack(message["ack"])
+        if "w" in message:
+            session.width = _normalize_preview_width_param(message["w"])
+
+
+async def _send_video_ws_frames(
+    websocket: WebSocket,
+    session: _VideoWebSocketSession,
+    camera_id: str | None = None,
+) -> None:
+    """
+    Push preview JPEGs with :func:`build_ws_frame_message` headers.
+
+    Same consumer/broadcaster bookkeeping as the MJPEG stream, but a frame is
+    only sent while the client's ack window has room; frames published in the
+    meantime are skipped, the newest one is sent once an ack arrives.
+    """
+    registered_camera: "_ActiveVideoSource | None" = None
+    registered_width: int | None = None
+    registered_broadcaster: PreviewBroadcaster | None = None
+    last_sequence = 0
+    try:
+        while True:
+            current_camera = _resolve_video_camera(camera_id)
+            width = session.width
+            if current_camera is not registered_camera or width != registered_width:
+                _unregister_video_preview_consumer(registered_camera, registered_width)
+                if registered_broadcaster is not None:
+                    registered_broadcaster.remove_subscriber()
+                _register_video_preview_consumer(current_camera, width)
                 registered_camera = current_camera
-            yield _build_video_stream_chunk(current_camera)
-            time.sleep(_get_video_stream_sleep_seconds(current_camera))
-    except GeneratorExit:
-        _get_video_route_logger(_get_active_video_camera()).debug("Video stream generator closed")
-        raise
+                registered_width = width
+                registered_broadcaster = _get_video_broadcaster(current_camera, width)
+                if registered_broadcaster is not None:
+                    registered_broadcaster.add_subscriber()
+                session.latency = _get_video_latency_recorder(current_camera)
+                last_sequence = 0
+
+            interval = _get_video_stream_sleep_seconds(current_camera)
+            wait_timeout = max(1.0, interval * 4)
+            if not await session.window.wait_for_capacity(wait_timeout):
+                continue
+            if registered_broadcaster is None or current_camera is None:
+                # Ohne Broadcaster gibt es keine Metadaten; der Client bleibt bei "Connecting"
+                await asyncio.sleep(interval)
+                continue
+
+            sequence, jpeg_bytes, meta = await registered_broadcaster.wait_for_frame(last_sequence, timeout=wait_timeout)
+            if jpeg_bytes is not None and sequence > last_sequence:
+                last_sequence = sequence
+                sent_at = time.time()
+                await websocket.send_bytes(build_ws_frame_message(jpeg_bytes, meta, sent_at=sent_at))
+                if meta is None:
+                    session.window.on_sent()
+                else:
+                    session.on_sent(meta.sequence & 0xFFFFFFFF, meta.captured_at, sent_at)
+            elif jpeg_bytes is None and _has_current_video_frame(current_camera):
+                # Publishes into the broadcaster, picked up by the next wait
+                await asyncio.to_thread(_build_preview_frame_bytes, current_camera, registered_width)
     finally:
-        _unregister_video_preview_consumer(registered_camera)
+        if registered_broadcaster is not None:
+            registered_broadcaster.remove_subscriber()
+        _unregister_video_preview_consumer(registered_camera, registered_width)
+
+
+async def _serve_video_websocket(
+    websocket: WebSocket,
+    camera_id: str | None = None,
+    *,
+    width: int | None = None,
+    window: int | None = None,
+) -> None:
+    if camera_id is not None and not _is_known_video_camera_id(camera_id):
+        # Vor accept() geschlossen: der Handshake wird mit 403 abgelehnt
+        await websocket.close(code=1008)
+        return
+    await websocket.accept()
+    session = _VideoWebSocketSession(width, _normalize_video_ws_window(window))
+    logger = _get_video_route_logger(_resolve_video_camera(camera_id))
+
+    # anyio statt loser asyncio-Tasks: die Cancellation des Servers erreicht beide Hälften
+    async with anyio.create_task_group() as task_group:
+
+        async def _run_until_closed(half: Callable[..., Any], *args: Any) -> None:
+            try:
+                await half(*args)
+            except WebSocketDisconnect:
+                pass
+            except Exception as exc:
+                logger.debug("Video WebSocket closed: %s", exc, exc_info=True)
+            finally:
+                task_group.cancel_scope.cancel()
+
+        task_group.start_soon(_run_until_closed, _receive_video_ws_messages, websocket, session)
+        task_group.start_soon(_run_until_closed, _send_video_ws_frames, websocket, session, camera_id)
+
+    with suppress(Exception):
+        await websocket.close()
+    logger.debug("Video WebSocket closed")
+
+
+def _get_video_latency_recorder(camera: "_ActiveVideoSource | None") -> LatencyRecorder | None:
+    get_recorder = getattr(camera, "get_latency_recorder", None)
+    if not callable(get_recorder):
+        return None
+    recorder = get_recorder()
+    return recorder if isinstance(recorder, LatencyRecorder) else None
+
+
+def _build_latency_response(camera: "_ActiveVideoSource | None", *, reset: bool = False) -> Response:
+    recorder = _get_video_latency_recorder(camera)
+    if recorder is None:
+        return JSONResponse({"camera_id": _get_video_camera_id(camera), "stages": {}}, headers={"Cache-Control": "no-store"})
+    payload = recorder.get_snapshot()
+    payload["camera_id"] = _get_video_camera_id(camera)
+    if reset:
+        recorder.reset()
+    return JSONResponse(payload, headers={"Cache-Control": "no-store"})
+
+
+def _build_heatmap_response(camera: "_ActiveVideoSource | None", *, fmt: str = "png") -> Response:
+    get_heatmap = getattr(camera, "get_motion_heatmap", None)
+    heatmap = get_heatmap() if callable(get_heatmap) else None
+    if heatmap is None:
+        return JSONResponse({"error": "Motion heatmap is disabled"}, status_code=404)
+    if fmt == "json":
+        payload = heatmap.to_dict()
+        payload["camera_id"] = _get_video_camera_id(camera)
+        return JSONResponse(payload, headers={"Cache-Control": "no-store"})
+    return Response(content=heatmap.render_png(), media_type="image/png", headers={"Cache-Control": "no-store"})
+
+
+def _normalize_preview_width_param(width: Any) -> int | None:
+    """``?w=`` value as a positive int, None when absent or invalid."""
+    try:
+        value = int(width)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
 
 
 def _ensure_video_routes_registered_locked(route_app: Any) -> None:
@@ -239,16 +737,104 @@ def _ensure_video_routes_registered_locked(route_app: Any) -> None:
         _VIDEO_ROUTES_REGISTERED = True
         return
 
+    # ``w`` selects a preview ladder rung (webcam.preview_widths) by viewport width
     @route_app.get("/video_feed")
-    def video_feed() -> StreamingResponse:
+    def video_feed(w: int | None = None) -> StreamingResponse:
         return StreamingResponse(
-            _generate_active_video_frames(),
+            _stream_active_video_frames(width=_normalize_preview_width_param(w)),
             media_type="multipart/x-mixed-replace; boundary=frame",
+            headers={"Cache-Control": "no-store"},
         )
 
     @route_app.get("/video/frame")
-    def video_frame() -> Response:
-        return _build_video_frame_response(_get_active_video_camera())
+    async def video_frame(
+        w: int | None = None,
+        after: int | None = None,
+        if_none_match: Annotated[str | None, Header()] = None,
+    ) -> Response:
+        return await _serve_video_frame(
+            _get_active_video_camera(),
+            width=_normalize_preview_width_param(w),
+            after=after,
+            if_none_match=if_none_match,
+        )
+
+    @route_app.get("/video_feed/{camera_id}")
+    def camera_video_feed(camera_id: str, w: int | None = None) -> Response:
+        if not _is_known_video_camera_id(camera_id):
+            return Response(content=f"Unknown camera '{camera_id}'", status_code=404, media_type="text/plain")
+        return StreamingResponse(
+            _stream_active_video_frames(camera_id, _normalize_preview_width_param(w)),
+            media_type="multipart/x-mixed-replace; boundary=frame",
+            headers={"Cache-Control": "no-store"},
+        )
+
+    @route_app.get("/video/frame/{camera_id}")
+    async def camera_video_frame(
+        camera_id: str,
+        w: int | None = None,
+        after: int | None = None,
+        if_none_match: Annotated[str | None, Header()] = None,
+    ) -> Response:
+        camera = _resolve_video_camera(camera_id)
+        if camera is None:
+            return Response(content=f"Unknown camera '{camera_id}'", status_code=404, media_type="text/plain")
+        return await _serve_video_frame(
+            camera,
+            width=_normalize_preview_width_param(w),
+            after=after,
+            if_none_match=if_none_match,
+        )
+
+    # Stage-Latenzen als JSON; ?reset=true startet ein neues Messfenster
+    @route_app.get("/api/latency")
+    def video_latency(reset: bool = False) -> Response:
+        return _build_latency_response(_get_active_video_camera(), reset=reset)
+
+    @route_app.get("/api/latency/{camera_id}")
+    def camera_video_latency(camera_id: str, reset: bool = False) -> Response:
+        camera = _resolve_video_camera(camera_id)
+        if camera is None:
+            return JSONResponse({"error": f"Unknown camera '{camera_id}'"}, status_code=404)
+        return _build_latency_response(camera, reset=reset)
+
+    # Aktivitäts-Heatmap der laufenden Session als RGBA-Overlay; ?format=json liefert die Rohwerte
+    @route_app.get("/api/motion/heatmap")
+    def motion_heatmap(format: str = "png") -> Response:
+        return _build_heatmap_response(_get_active_video_camera(), fmt=format)
+
+    @route_app.get("/api/motion/heatmap/{camera_id}")
+    def camera_motion_heatmap(camera_id: str, format: str = "png") -> Response:
+        camera = _resolve_video_camera(camera_id)
+        if camera is None:
+            return JSONResponse({"error": f"Unknown camera '{camera_id}'"}, status_code=404)
+        return _build_heatmap_response(camera, fmt=format)
+
+    # Binary push with per-frame metadata and ack flow control (see streaming.build_ws_frame_message)
+    register_websocket = getattr(route_app, "websocket", None)
+    if callable(register_websocket):
+
+        @register_websocket("/video_ws")
+        async def video_ws(websocket: WebSocket, w: int | None = None, window: int | None = None) -> None:
+            await _serve_video_websocket(
+                websocket,
+                width=_normalize_preview_width_param(w),
+                window=window,
+            )
+
+        @register_websocket("/video_ws/{camera_id}")
+        async def camera_video_ws(
+            websocket: WebSocket,
+            camera_id: str,
+            w: int | None = None,
+            window: int | None = None,
+        ) -> None:
+            await _serve_video_websocket(
+                websocket,
+                camera_id,
+                width=_normalize_preview_width_param(w),
+                window=window,
+            )
 
     _VIDEO_ROUTE_APP = route_app
     _VIDEO_ROUTES_REGISTERED = True
@@ -265,6 +851,12 @@ def _activate_video_camera(camera: "_ActiveVideoSource", target_app: Any | None
     with _VIDEO_ROUTE_LOCK:
         _ensure_video_routes_registered_locked(route_app)
         _set_active_video_camera_locked(camera)
+        _register_video_camera_locked(camera)
+
+
+def _configured_motion_skip_frames(motion_config: Any) -> int:
+    """``frame_skip`` of the config; missing or 0 falls back to every second frame."""
+    return max(1, int(getattr(motion_config, "frame_skip", 2) or 2))
 
 
 class Camera:
@@ -304,10 +896,13 @@ class Camera:
         *,
         async_init: bool = False,
         initialize: bool = True,
+        webcam_config: Optional["WebcamConfig"] = None,
     ) -> None:
         # -- Config & Logger --
         self.app_config: "AppConfig" = config
-        self.webcam_config: "WebcamConfig" = self.app_config.webcam
+        # Zusätzliche Kameras bekommen ihre abgeleitete WebcamConfig (siehe WebcamConfig.get_camera_configs)
+        self.webcam_config: "WebcamConfig" = webcam_config or self.app_config.webcam
+        self.camera_id: str = str(getattr(self.webcam_config, "camera_id", "main") or "main")
         self.uvc_config: "UVCConfig" = self.app_config.uvc_controls
         self.logger = logger or get_logger('camera')
         self.logger.info("Initializing Camera")
@@ -321,9 +916,15 @@ class Camera:
             self.measurement_config.ensure_save_path()
 
         # -- Interne State‑Variablen --
-        self.video_capture: Optional[cv2.VideoCapture] = None
+        self.video_capture: Optional[CaptureSource] = None
         self.current_frame: Optional[np.ndarray] = None
+        # Handle auf den Ring-Slot hinter current_frame (hält den Slot fest)
+        self._current_frame_handle: Optional[FrameHandle] = None
         self._current_jpeg_frame: Optional[bytes] = None
+        # MJPEG-Passthrough: rohe Kamera-JPEGs, BGR wird nur bei Bedarf dekodiert
+        self._current_encoded_frame: Optional[EncodedFrame] = None
+        self._decoded_frame_cache: Optional[tuple[int, np.ndarray]] = None
+        self._passthrough_fallback_logged = False
         self.frame_lock = threading.Lock()
         self._preview_consumers_lock = threading.Lock()
         self.capture_lock = threading.RLock()  # Protects video_capture access
@@ -352,6 +953,8 @@ class Camera:
         self.motion_detector: Optional[MotionDetector] = None
         self.motion_enabled = False
         self.frame_count = 0
+        # Detection runs off the capture thread on the newest published frame
+        self._motion_worker: Optional[MotionDetectionWorker[FrameHandle | EncodedFrame | np.ndarray]] = None
 
         # Letztes Bewegungsergebnis für Metrics
         self.last_motion_result: Optional[MotionResult] = None
@@ -362,18 +965,41 @@ class Camera:
         self._reconnect_attempts = 0
         
         # Performance optimization
-        self.motion_skip_frames = max(1, int(getattr(self.app_config.motion_detection, "frame_skip", 2) or 2))
+        self.motion_skip_frames = _configured_motion_skip_frames(self.app_config.motion_detection)
+        self._detection_governor: Optional[DetectionRateGovernor] = None
+        self.configure_detection_governor()
+        self._motion_heatmap: Optional[ActivityHeatmap] = None
+        self.configure_motion_heatmap()
+        # Bedarfsgesteuerte Aufnahme: ohne Session/Zuschauer nur reduziert dekodieren (webcam.idle_capture)
+        self._capture_demand: set[str] = set()
+        self._capture_demand_lock = threading.Lock()
+        self._last_capture_demand_monotonic = time.monotonic()
+        self._idle_last_retrieve_monotonic = 0.0
+        self._capture_idle = False
+        self._idle_grabbed_frames = 0
         self._preview_consumer_count = 0
         self._preview_frame_resolution: Optional[Dict[str, int]] = None
         self._preview_frame_timestamp: Optional[float] = None
         self._last_preview_publish_monotonic = 0.0
         self._preview_publish_in_progress = False
+        # Encoded previews are fanned out once to all /video_feed clients
+        self._preview_broadcaster = PreviewBroadcaster()
+        # Capture-Sequenz, aus der _current_jpeg_frame kodiert wurde (ETag von /video/frame)
+        self._preview_frame_sequence: Optional[int] = None
+        # Weckt /video/frame?after= Long-Polls bei jedem neuen Frame
+        self._frame_notifier = FrameSequenceNotifier()
+        self._latency = LatencyRecorder()
+        # Unterscheidet ETags verschiedener Camera-Instanzen (frame_count beginnt je Instanz bei 0)
+        self._frame_epoch = f"{time.time_ns() & 0xFFFFFFFF:08x}"
+        # Weitere Stufen der Vorschau-Leiter (webcam.preview_widths), nach Breite; nur abonnierte werden kodiert
+        self._preview_rungs: Dict[int, PreviewRung] = {}
         
         # -- Platzhalterbild für fehlende Kamera --
         self._uvc_cache_time: float = 0.0
 
-        self._max_pool_size = 3
-        self._frame_pool: collections.deque = collections.deque(maxlen=self._max_pool_size)
+        # Vorallokierte Frame-Puffer: read() schreibt direkt hinein, Konsumenten teilen read-only Handles
+        self._max_pool_size = 4
+        self._frame_pool: FrameRing = FrameRing(self._max_pool_size)
 
         self.cleaned = False
         self._cleanup_lock = threading.Lock()
@@ -643,6 +1269,9 @@ class Camera:
             self._mark_initialization_failure(exc)
 
     def _initialize_camera(self) -> None:
+        if getattr(self.webcam_config, "source", "device") != "device":
+            self._initialize_video_source()
+            return
         video_capture: Optional[cv2.VideoCapture] = None
         try:
             self._check_init_cancelled()
@@ -742,6 +1371,30 @@ class Camera:
             raise
 
 
+    def _initialize_video_source(self) -> None:
+        """Datei-, Bildordner- oder synthetische Quelle statt Kamera öffnen (ohne Backend-Fallbacks/UVC)."""
+        self._check_init_cancelled()
+        video_source = create_video_source(self.webcam_config, logger=self.logger)
+        if video_source is None:
+            raise RuntimeError("webcam.source 'device' has no file, image or synthetic video source")
+        try:
+            ret, _ = video_source.read()
+            if not ret:
+                raise RuntimeError(f"No frame received from {video_source.kind} video source")
+            self._check_init_cancelled()
+            with self.capture_lock:
+                if self.video_capture:
+                    try:
+                        self.video_capture.release()
+                    except Exception:
+                        pass
+                self.video_capture = video_source
+        except Exception as exc:
+            self.logger.error(f"Initialization failed: {exc}")
+            video_source.release()
+            raise
+        self.logger.info("Video source successfully initialized")
+
     def wait_for_init(self, timeout: float = 10.0) -> bool:
         """
         Wartet bis die Kamera-Initialisierung abgeschlossen ist.
@@ -798,10 +1451,17 @@ class Camera:
         # BUT _safe_set_for_capture is used which is generic.
         
         res = self.webcam_config.get_default_resolution()
+        if self._is_mjpeg_passthrough_requested():
+            # FOURCC muss vor der Auflösung gesetzt werden (V4L2 wählt sonst YUYV-Modi)
+            self._safe_set_for_capture(capture, cv2.CAP_PROP_FOURCC, cv2.VideoWriter.fourcc(*"MJPG"))
         self._safe_set_for_capture(capture, cv2.CAP_PROP_FRAME_WIDTH, res.width)
         self._safe_set_for_capture(capture, cv2.CAP_PROP_FRAME_HEIGHT, res.height)
         self._safe_set_for_capture(capture, cv2.CAP_PROP_FPS, self.webcam_config.fps)
         self._safe_set_for_capture(capture, cv2.CAP_PROP_BUFFERSIZE, 1)
+        if self._is_mjpeg_passthrough_requested():
+            # read() liefert damit die komprimierten JPEG-Bytes statt eines BGR-Bildes
+            if not self._safe_set_for_capture(capture, cv2.CAP_PROP_CONVERT_RGB, 0):
+                self.logger.warning("Backend ignored CONVERT_RGB=0; MJPEG passthrough falls back to BGR frames")
 
         self.logger.info(
             "current camera status: %dx%d @ %.1f FPS",
@@ -810,6 +1470,10 @@ class Camera:
             capture.get(cv2.CAP_PROP_FPS),
         )
 
+    def _is_mjpeg_passthrough_requested(self) -> bool:
+        webcam_config = getattr(self, "webcam_config", None)
+        return getattr(webcam_config, "capture_mode", "bgr") == "mjpeg_passthrough"
+
     # --------------------- Low‑Level‑Hilfsfunktionen ------------------- #
 
     def _safe_set(self, prop: int, value: float) -> bool:
@@ -1130,9 +1794,31 @@ class Camera:
         self._capture_ready.clear()
         self._capture_runtime_error = None
         self.is_running = True
+        self._start_motion_worker()
         self.frame_thread = threading.Thread(target=self._capture_loop, daemon=True)
         self.frame_thread.start()
 
+    def _start_motion_worker(self) -> None:
+        worker = getattr(self, "_motion_worker", None)
+        if worker is None:
+            worker = MotionDetectionWorker(
+                self._process_motion_detection,
+                name="CameraMotionDetection",
+                logger=self.logger,
+                on_drop=self._release_motion_frame,
+            )
+            self._motion_worker = worker
+        worker.start()
+
+    def _stop_motion_worker(self, timeout: float = 2.0) -> bool:
+        worker: Optional[MotionDetectionWorker] = getattr(self, "_motion_worker", None)
+        if worker is None:
+            return True
+        stopped = worker.stop(timeout=timeout)
+        if not stopped:
+            self.logger.warning("Motion detection worker did not stop within %.1fs", timeout)
+        return stopped
+
     def _stop_frame_capture_and_wait(self, timeout: float = 2.0) -> bool:
         """Request frame capture stop and return whether the thread fully stopped."""
         self.is_running = False
@@ -1144,6 +1830,7 @@ class Camera:
             join = getattr(frame_thread, "join", None)
             if callable(join):
                 join(timeout=max(0.0, float(timeout)))
+        self._stop_motion_worker(timeout=timeout)
         if self.frame_thread is not None and not self.frame_thread.is_alive():
             self.frame_thread = None
             return True
@@ -1172,9 +1859,14 @@ class Camera:
                     time.sleep(0.1)
                     continue
 
+                if self._idle_capture_step(video_capture_ref):
+                    continue
+
                 # Frame lesen ausserhalb des capture_lock, damit UVC-Operationen nicht blockieren
+                frame_slot = self._reserve_frame_slot()
+                stage_started = time.perf_counter()
                 try:
-                    ret, frame = video_capture_ref.read()
+                    ret, frame = self._read_frame(video_capture_ref, frame_slot)
                 except cv2.error as e:
                     self.logger.error(f"OpenCV error reading frame: {e}")
                     ret, frame = False, None
@@ -1183,6 +1875,8 @@ class Camera:
                     ret, frame = False, None
 
                 if not ret or frame is None:
+                    if frame_slot is not None:
+                        self._frame_pool.abort(frame_slot)
                     consecutive_failures += 1
                     if consecutive_failures >= max_consecutive_failures:
                         self.logger.debug(f'Framegrab failed {consecutive_failures} times in a row')
@@ -1201,15 +1895,34 @@ class Camera:
                 # Erfolgreicher Frame
                 consecutive_failures = 0
                 self._reconnect_attempts = 0
-
-                self._publish_current_frame(frame)
-                self._maybe_publish_preview_frame(frame)
+                stage_started = self._record_stage("capture.read", stage_started)
+
+                encoded_frame = self._as_passthrough_frame(frame)
+                if encoded_frame is not None:
+                    if frame_slot is not None:
+                        self._frame_pool.abort(frame_slot)
+                    # Kamera-JPEG direkt weiterreichen, kein Decode/Re-Encode im Capture-Thread
+                    self._publish_encoded_frame(encoded_frame)
+                    stage_started = self._record_stage("capture.publish", stage_started)
+                    self._maybe_publish_encoded_preview(encoded_frame)
+                    captured: FrameHandle | EncodedFrame = encoded_frame
+                else:
+                    captured = self._commit_frame(frame_slot, frame)
+                    self._publish_frame_handle(captured)
+                    stage_started = self._record_stage("capture.publish", stage_started)
+                    self._maybe_publish_preview_frame(
+                        captured.frame,
+                        sequence=captured.sequence,
+                        captured_at=captured.timestamp,
+                    )
+                stage_started = self._record_stage("capture.preview", stage_started)
 
                 self._capture_runtime_error = None
                 self._capture_ready.set()
 
-                # Motion Detection
-                self._process_motion_detection(frame)
+                # Motion Detection (asynchron im Detection-Worker)
+                self._submit_motion_frame(captured)
+                self._record_stage("capture.submit", stage_started)
         except Exception as exc:
             capture_error = exc
             self.logger.error("Unhandled error in frame capture loop: %s", exc, exc_info=True)
@@ -1223,16 +1936,144 @@ class Camera:
                 self.frame_thread = None
             self.logger.info("Frame capture loop stopped")
     
-    def _process_motion_detection(self, frame: np.ndarray) -> None:
+    def set_capture_demand(self, reason: str, active: bool) -> None:
+        """Keep full-rate capture while ``reason`` (e.g. ``"measurement"``) is active."""
+        with self._capture_demand_lock:
+            if active:
+                self._capture_demand.add(str(reason))
+            else:
+                self._capture_demand.discard(str(reason))
+            self._last_capture_demand_monotonic = time.monotonic()
+
+    def note_capture_demand(self) -> None:
+        """Restart the idle grace period, e.g. for a client polling ``/video/frame``."""
+        self._last_capture_demand_monotonic = time.monotonic()
+
+    def has_capture_demand(self) -> bool:
+        """True while a session or preview consumer needs frames, plus ``idle_grace_seconds`` afterwards."""
+        now = time.monotonic()
+        if getattr(self, "_capture_demand", None) or self.get_preview_consumer_count() > 0:
+            self._last_capture_demand_monotonic = now
+            return True
+        grace = float(getattr(getattr(self, "webcam_config", None), "idle_grace_seconds", 10.0) or 0.0)
+        return now - getattr(self, "_last_capture_demand_monotonic", now) < grace
+
+    def _idle_capture_step(self, video_capture: Any) -> bool:
+        """
+        Idle handling before a regular read.
+
+        Returns True when the frame was only grabbed (no decode, nothing published),
+        False when the capture loop should read and process the next frame normally.
+        """
+        webcam_config = getattr(self, "webcam_config", None)
+        mode = getattr(webcam_config, "idle_capture", "off")
+        if mode == "off" or not hasattr(video_capture, "grab") or self.has_capture_demand():
+            if getattr(self, "_capture_idle", False):
+                self._capture_idle = False
+                self.logger.info("Capture demand returned, resuming full frame rate")
+            return False
+        if not getattr(self, "_capture_idle", False):
+            self._capture_idle = True
+            self.logger.info("No session or preview consumer, capture idles (%s)", mode)
+        if mode == "low_fps":
+            now = time.monotonic()
+            idle_fps = max(0.1, float(getattr(webcam_config, "idle_fps", 2.0) or 2.0))
+            if now - getattr(self, "_idle_last_retrieve_monotonic", 0.0) >= 1.0 / idle_fps:
+                self._idle_last_retrieve_monotonic = now
+                return False
+        # grab() leert den Kamerapuffer ohne Decode; Fehler behandelt der normale read()-Pfad
+        if not video_capture.grab():
+            return False
+        self._idle_grabbed_frames = getattr(self, "_idle_grabbed_frames", 0) + 1
+        return True
+
+    def get_capture_idle_stats(self) -> Dict[str, Any]:
+        with getattr(self, "_capture_demand_lock", None) or nullcontext():
+            demand = sorted(getattr(self, "_capture_demand", None) or ())
+        return {
+            "mode": getattr(getattr(self, "webcam_config", None), "idle_capture", "off"),
+            "idle": bool(getattr(self, "_capture_idle", False)),
+            "demand": demand,
+            "grabbed_only_frames": int(getattr(self, "_idle_grabbed_frames", 0)),
+        }
+
+    def _reserve_frame_slot(self) -> Any:
+        if self._is_mjpeg_passthrough_requested():
+            # JPEG-Bytes haben variable Länge, dafür lohnen keine festen Puffer
+            return None
+        frame_pool = getattr(self, "_frame_pool", None)
+        if not isinstance(frame_pool, FrameRing):
+            return None
+        return frame_pool.reserve()
+
+    def _read_frame(self, video_capture: CaptureSource, frame_slot: Any) -> tuple[bool, Optional[np.ndarray]]:
+        buffer = None if frame_slot is None else self._frame_pool.get_buffer(frame_slot)
+        if buffer is None:
+            return video_capture.read()
+        # Dekodiert direkt in den Ring-Slot; bei geänderter Auflösung allokiert OpenCV neu
+        return video_capture.read(buffer)
+
+    def _commit_frame(self, frame_slot: Any, frame: np.ndarray) -> FrameHandle:
+        sequence = self.frame_count + 1
+        timestamp = time.time()
+        if frame_slot is None:
+            return FrameRing.wrap(frame, sequence, timestamp)
+        return self._frame_pool.commit(frame_slot, frame, sequence, timestamp)
+
+    def _as_passthrough_frame(self, frame: np.ndarray) -> Optional[EncodedFrame]:
+        if not self._is_mjpeg_passthrough_requested():
+            return None
+        encoded_frame = as_encoded_jpeg_frame(frame, self.frame_count + 1, time.time())
+        if encoded_frame is None and not getattr(self, "_passthrough_fallback_logged", False):
+            self._passthrough_fallback_logged = True
+            self.logger.warning("Camera did not deliver raw MJPEG data; using decoded BGR frames")
+        return encoded_frame
+
+    def _submit_motion_frame(self, frame: FrameHandle | EncodedFrame | np.ndarray) -> None:
+        """Hand a captured frame to the detection stage without blocking the capture loop."""
         # Frame skipping optimization
         if self.frame_count % self.motion_skip_frames != 0:
             return
+        if not (self.motion_enabled or self._has_motion_callbacks()):
+            return
+
+        worker = getattr(self, "_motion_worker", None)
+        if worker is None or not worker.is_alive():
+            self._process_motion_detection(frame.frame if isinstance(frame, FrameHandle) else frame)
+            return
+        # Eigene Referenz für den Worker; wird nach der Analyse bzw. beim Verwerfen freigegeben
+        worker.submit(frame.share() if isinstance(frame, FrameHandle) else frame)
+
+    @staticmethod
+    def _release_motion_frame(frame: Any) -> None:
+        if isinstance(frame, FrameHandle):
+            frame.release()
+
+    def _process_motion_detection(self, frame: Optional[np.ndarray] | FrameHandle | EncodedFrame) -> None:
+        if isinstance(frame, FrameHandle):
+            with frame:
+                cpu_started = time.thread_time()
+                self._record_latency("motion.frame_age", time.time() - frame.timestamp)
+                self._process_motion_detection(frame.frame)
+                self._observe_detection(frame.timestamp, cpu_started)
+            return
+        if isinstance(frame, EncodedFrame):
+            cpu_started = time.thread_time()
+            self._record_latency("motion.frame_age", time.time() - frame.timestamp)
+            self._process_encoded_motion_detection(frame)
+            self._observe_detection(frame.timestamp, cpu_started)
+            return
+        if frame is None:
+            return
 
         if self.motion_detector and self.motion_enabled:
             try:
+                stage_started = time.perf_counter()
                 motion_result = self.motion_detector.detect_motion(frame)
+                stage_started = self._record_stage("motion.detect", stage_started)
                 self.last_motion_result = motion_result
                 self._dispatch_motion_callbacks(frame, motion_result)
+                self._record_stage("motion.callbacks", stage_started)
             except Exception as exc:
                 self.logger.error(f"Motion-Detection-Error: {exc}")
 
@@ -1251,6 +2092,100 @@ class Camera:
                 self.logger.debug("Motion callback called with dummy result")
             except Exception as exc:
                 self.logger.error(f"Dummy-Motion-Callback-Error: {exc}")
+
+    def configure_detection_governor(self) -> None:
+        """(Re)create the frame-skip governor from ``motion_detection.governor_*``; disabled restores ``frame_skip``."""
+        app_config = getattr(self, "app_config", None)
+        motion_config: Optional["MotionDetectionConfig"] = getattr(app_config, "motion_detection", None)
+        if motion_config is None or not getattr(motion_config, "governor_enabled", False):
+            if getattr(self, "_detection_governor", None) is not None:
+                self.motion_skip_frames = _configured_motion_skip_frames(motion_config)
+            self._detection_governor = None
+            return
+        measurement = getattr(app_config, "measurement", None)
+        self._detection_governor = DetectionRateGovernor(
+            cpu_budget=motion_config.governor_cpu_budget,
+            latency_budget=motion_config.governor_latency_budget_ms / 1000.0,
+            min_fps=min_fps_for_alert_delay(getattr(measurement, "alert_delay_seconds", 0)),
+            max_fps=motion_config.governor_max_fps,
+            initial_skip=getattr(self, "motion_skip_frames", 1),
+        )
+
+    def configure_motion_heatmap(self) -> None:
+        """(Re)create the session activity heatmap from ``motion_detection.heatmap_width`` (0 = off)."""
+        motion_config = getattr(getattr(self, "app_config", None), "motion_detection", None)
+        width = int(getattr(motion_config, "heatmap_width", 0) or 0)
+        current = getattr(self, "_motion_heatmap", None)
+        if width <= 0:
+            heatmap = None
+        elif current is not None and current.width == width:
+            heatmap = current
+        else:
+            heatmap = ActivityHeatmap(width)
+        self._motion_heatmap = heatmap
+        detector = getattr(self, "motion_detector", None)
+        if detector is not None:
+            detector.heatmap = heatmap
+
+    def get_motion_heatmap(self) -> Optional[ActivityHeatmap]:
+        return getattr(self, "_motion_heatmap", None)
+
+    def reset_motion_heatmap(self) -> None:
+        """Start a new accumulation, e.g. when a measurement session starts."""
+        heatmap = self.get_motion_heatmap()
+        if heatmap is not None:
+            heatmap.reset()
+
+    def _observe_detection(self, captured_at: float, cpu_started: float) -> None:
+        """Feed one finished analysis into the governor and apply a changed frame skip."""
+        governor = getattr(self, "_detection_governor", None)
+        if governor is None:
+            return
+        new_skip = governor.record(
+            cpu_seconds=time.thread_time() - cpu_started,
+            latency_seconds=time.time() - captured_at if captured_at else None,
+            frame_count=getattr(self, "frame_count", 0),
+        )
+        if new_skip is not None:
+            self.logger.debug("Detection governor: frame skip %s -> %s", self.motion_skip_frames, new_skip)
+            self.motion_skip_frames = new_skip
+
+    def get_detection_governor_state(self) -> Optional[dict]:
+        """Current skip and recent decisions of the frame-skip governor (None when disabled)."""
+        governor = getattr(self, "_detection_governor", None)
+        return None if governor is None else governor.get_state()
+
+    def _process_encoded_motion_detection(self, encoded_frame: EncodedFrame) -> None:
+        """Detection on an MJPEG frame: decode grayscale at the smallest scale the detector needs."""
+        legacy_frame: Optional[np.ndarray] = None
+        if self._has_legacy_motion_callbacks():
+            # Legacy-Callbacks erwarten weiterhin ein volles BGR-Bild
+            legacy_frame = self._decode_encoded_frame(encoded_frame)
+
+        detector = self.motion_detector
+        if not (detector and self.motion_enabled):
+            # Kein aktiver Detector: gleicher Dummy-Pfad wie bei BGR-Frames
+            self._process_motion_detection(legacy_frame)
+            return
+
+        try:
+            target_width = max(1, int(getattr(detector.config, "processing_max_width", 640) or 640))
+            analysed_width = detector.get_processing_width(encoded_frame.width, encoded_frame.height)
+            # Reduktion bezogen auf die ROI-Breite, damit kleine ROIs nicht an Auflösung verlieren
+            reduction = choose_reduction(analysed_width, target_width)
+            stage_started = time.perf_counter()
+            gray_frame, frame_scale = decode_for_detection(encoded_frame, reduction)
+            stage_started = self._record_stage("motion.decode", stage_started)
+            if gray_frame is None:
+                self.logger.debug("Skipping undecodable MJPEG frame %s", encoded_frame.sequence)
+                return
+            motion_result = detector.detect_motion(gray_frame, frame_scale=frame_scale)
+            stage_started = self._record_stage("motion.detect", stage_started)
+            self.last_motion_result = motion_result
+            self._dispatch_motion_callbacks(legacy_frame, motion_result)
+            self._record_stage("motion.callbacks", stage_started)
+        except Exception as exc:
+            self.logger.error(f"Motion-Detection-Error: {exc}")
     
     def _handle_cam_disconnect(self) -> bool:
         """Handle camera disconnection gracefully."""
@@ -1319,18 +2254,20 @@ class Camera:
 
     # ---------------- Motion-Detection Steuerung --------------------- #
     def _has_motion_callbacks(self) -> bool:
-        with self._motion_callbacks_lock:
-            return bool(self._motion_callbacks or self._motion_result_callbacks)
+        with getattr(self, "_motion_callbacks_lock", None) or nullcontext():
+            return bool(getattr(self, "_motion_callbacks", None) or getattr(self, "_motion_result_callbacks", None))
 
     def _has_legacy_motion_callbacks(self) -> bool:
-        with self._motion_callbacks_lock:
-            return bool(self._motion_callbacks)
+        with getattr(self, "_motion_callbacks_lock", None) or nullcontext():
+            return bool(getattr(self, "_motion_callbacks", None))
 
     def _ensure_motion_detector(self) -> bool:
         if self.motion_detector is not None:
             return True
         try:
             self.motion_detector = MotionDetector(self.app_config.motion_detection)
+            self.motion_detector.latency = getattr(self, "_latency", None)
+            self.motion_detector.heatmap = self.get_motion_heatmap()
             self.logger.info("Motion detector initialized")
             return True
         except Exception as e:
@@ -1356,11 +2293,15 @@ class Camera:
 
         shared_frame: Optional[np.ndarray] = None
         if isinstance(frame, np.ndarray):
-            try:
-                shared_frame = frame.copy()
-                shared_frame.setflags(write=False)
-            except Exception:
+            if not frame.flags.writeable:
+                # Read-only Ring-Frame: ohne Kopie teilen, gültig für die Dauer des Callbacks
                 shared_frame = frame
+            else:
+                try:
+                    shared_frame = frame.copy()
+                    shared_frame.setflags(write=False)
+                except Exception:
+                    shared_frame = frame
 
         for callback in callbacks:
             try:
@@ -1462,14 +2403,67 @@ class Camera:
 
     def get_motion_metrics(self) -> dict:
         """Gibt Metriken zur Bewegungserkennung zurück."""
+        heatmap = self.get_motion_heatmap()
         return {
             "frame_count": self.frame_count,
             "last_timestamp": self.last_motion_result.timestamp if self.last_motion_result else None,
             "last_contour_area": self.last_motion_result.contour_area if self.last_motion_result else None,
             "roi_used": self.last_motion_result.roi_used if self.last_motion_result else None,
-            "motion_enabled": self.motion_enabled
+            "zones": {
+                name: {"motion_detected": zone.motion_detected, "contour_area": zone.contour_area}
+                for name, zone in (getattr(self.last_motion_result, "zones", None) or {}).items()
+            },
+            "motion_enabled": self.motion_enabled,
+            "detection": self.get_detection_stats(),
+            "static_gate": self.get_static_gate_stats(),
+            "coarse_to_fine": self.get_coarse_stats(),
+            "governor": self.get_detection_governor_state(),
+            "heatmap": None if heatmap is None else heatmap.get_stats(),
+            "frame_ring": self.get_frame_ring_stats(),
+            "latency": self.get_latency_stats(),
         }
 
+    def get_latency_recorder(self) -> Optional[LatencyRecorder]:
+        return getattr(self, "_latency", None)
+
+    def get_latency_stats(self) -> Optional[dict]:
+        """Per-stage latency histograms (capture.*, preview.*, motion.*, stream.*) in milliseconds."""
+        recorder = self.get_latency_recorder()
+        return None if recorder is None else recorder.get_snapshot()
+
+    def _record_latency(self, stage: str, seconds: float) -> None:
+        recorder = getattr(self, "_latency", None)
+        if recorder is not None:
+            recorder.record(stage, seconds)
+
+    def _record_stage(self, stage: str, started: float) -> float:
+        """Record ``perf_counter() - started`` for ``stage`` and return the start of the next stage."""
+        recorder: Optional[LatencyRecorder] = getattr(self, "_latency", None)
+        if recorder is None:
+            return time.perf_counter()
+        return recorder.record_since(stage, started)
+
+    def get_coarse_stats(self) -> Optional[dict]:
+        """Counters of the detector's coarse-to-fine mode (None before detection started)."""
+        detector: Optional[MotionDetector] = getattr(self, "motion_detector", None)
+        if detector is None or not hasattr(detector, "get_coarse_stats"):
+            return None
+        return detector.get_coarse_stats()
+
+    def get_static_gate_stats(self) -> Optional[dict]:
+        """Hit rate of the detector's static-scene gate (None before detection started)."""
+        detector: Optional[MotionDetector] = getattr(self, "motion_detector", None)
+        if detector is None or not hasattr(detector, "get_static_gate_stats"):
+            return None
+        return detector.get_static_gate_stats()
+
+    def get_detection_stats(self) -> Optional[dict]:
+        """Return throughput and drop counters of the detection worker."""
+        worker: Optional[MotionDetectionWorker] = getattr(self, "_motion_worker", None)
+        if worker is None:
+            return None
+        return worker.get_stats()
+
     def is_camera_available(self) -> bool:
         """Returns True if the camera is connected and operational."""
         with self.capture_lock:
@@ -1521,6 +2515,8 @@ class Camera:
                 "preview_resolution": self.get_preview_resolution(),
                 "preview_fps": int(getattr(self.webcam_config, "preview_fps", 15) or 15),
                 "preview_active_consumers": self.get_preview_consumer_count(),
+                "preview_ladder": self.get_preview_ladder_stats(),
+                "capture_idle": self.get_capture_idle_stats(),
                 "reconnect_attempts": self._reconnect_attempts,
                 "error_status": self._reconnect_attempts >= self.max_reconnect_attempts
             }
@@ -1699,22 +2695,41 @@ class Camera:
     # ----------------- Snapshot & Cleanup ----------------------- #
 
     def _clear_published_frame(self) -> None:
+        broadcaster = getattr(self, '_preview_broadcaster', None)
+        if broadcaster is not None:
+            broadcaster.clear()
+        for rung in list(getattr(self, '_preview_rungs', {}).values()):
+            rung.clear()
         frame_lock = getattr(self, 'frame_lock', None)
+        previous_handle = getattr(self, '_current_frame_handle', None)
         if frame_lock is None:
             self.current_frame = None
+            self._current_frame_handle = None
             self._current_jpeg_frame = None
+            self._current_encoded_frame = None
+            self._decoded_frame_cache = None
             self._preview_frame_resolution = None
             self._preview_frame_timestamp = None
+            self._preview_frame_sequence = None
             self._last_preview_publish_monotonic = 0.0
             self._preview_publish_in_progress = False
+            if previous_handle is not None:
+                previous_handle.release()
             return
         with frame_lock:
+            previous_handle = getattr(self, '_current_frame_handle', None)
             self.current_frame = None
+            self._current_frame_handle = None
             self._current_jpeg_frame = None
+            self._current_encoded_frame = None
+            self._decoded_frame_cache = None
             self._preview_frame_resolution = None
             self._preview_frame_timestamp = None
+            self._preview_frame_sequence = None
             self._last_preview_publish_monotonic = 0.0
             self._preview_publish_in_progress = False
+        if previous_handle is not None:
+            previous_handle.release()
 
     def _encode_frame_to_jpeg_bytes(
         self,
@@ -1732,10 +2747,16 @@ class Camera:
             return None
         return buffer.tobytes()
 
-    def _build_preview_frame(self, frame: np.ndarray) -> tuple[np.ndarray, Dict[str, int]]:
+    def _build_preview_frame(
+        self,
+        frame: np.ndarray,
+        target_width: Optional[int] = None,
+    ) -> tuple[np.ndarray, Dict[str, int]]:
         preview_frame = frame
         frame_height, frame_width = frame.shape[:2]
-        target_width = max(1, int(getattr(self.webcam_config, "preview_max_width", frame_width) or frame_width))
+        if target_width is None:
+            target_width = int(getattr(self.webcam_config, "preview_max_width", frame_width) or frame_width)
+        target_width = max(1, int(target_width))
 
         if frame_width > target_width:
             scale = target_width / float(frame_width)
@@ -1746,8 +2767,12 @@ class Camera:
 
         return preview_frame, {"width": int(frame_width), "height": int(frame_height)}
 
-    def _encode_preview_frame(self, frame: np.ndarray) -> tuple[Optional[bytes], Optional[Dict[str, int]]]:
-        preview_frame, preview_resolution = self._build_preview_frame(frame)
+    def _encode_preview_frame(
+        self,
+        frame: np.ndarray,
+        target_width: Optional[int] = None,
+    ) -> tuple[Optional[bytes], Optional[Dict[str, int]]]:
+        preview_frame, preview_resolution = self._build_preview_frame(frame, target_width)
         jpeg_bytes = self._encode_frame_to_jpeg_bytes(
             preview_frame,
             quality=int(getattr(self.webcam_config, "preview_jpeg_quality", 75) or 75),
@@ -1756,21 +2781,123 @@ class Camera:
             return None, None
         return jpeg_bytes, preview_resolution
 
-    def register_preview_consumer(self) -> None:
+    def _encode_passthrough_preview(
+        self,
+        encoded_frame: EncodedFrame,
+        target_width: int,
+    ) -> tuple[Optional[bytes], Optional[Dict[str, int]]]:
+        """Preview rung from a camera JPEG: passed through if small enough, else reduced decode + encode."""
+        if encoded_frame.width <= target_width:
+            return encoded_frame.data, encoded_frame.resolution
+        image = decode_for_preview(encoded_frame, target_width)
+        if image is None:
+            return None, None
+        jpeg_bytes = self._encode_frame_to_jpeg_bytes(
+            image,
+            quality=int(getattr(self.webcam_config, "preview_jpeg_quality", 75) or 75),
+        )
+        if jpeg_bytes is None:
+            return None, None
+        return jpeg_bytes, {"width": int(image.shape[1]), "height": int(image.shape[0])}
+
+    # ----------------- Vorschau-Leiter ----------------------- #
+
+    def get_preview_widths(self) -> list[int]:
+        webcam_config = getattr(self, "webcam_config", None)
+        get_widths = getattr(webcam_config, "get_preview_widths", None)
+        if callable(get_widths):
+            return list(get_widths())
+        return [int(getattr(webcam_config, "preview_max_width", 1280) or 1280)]
+
+    def resolve_preview_width(self, requested_width: Optional[int]) -> Optional[int]:
+        """
+        Map a client's ``?w=`` to a ladder rung.
+
+        Picks the smallest rung at least ``requested_width`` wide (the largest
+        rung if none is). Returns None for the default rung (``preview_max_width``),
+        which is served by the regular preview path.
+        """
+        if requested_width is None:
+            return None
+        widths = self.get_preview_widths()
+        if not widths:
+            return None
+        requested = max(1, int(requested_width))
+        width = next((candidate for candidate in widths if candidate >= requested), widths[-1])
+        default_width = int(getattr(self.webcam_config, "preview_max_width", widths[-1]) or widths[-1])
+        return None if width == default_width else width
+
+    def _get_preview_rung(self, width: int) -> PreviewRung:
+        with self._preview_consumers_lock:
+            rung = self._preview_rungs.get(width)
+            if rung is None:
+                rung = self._preview_rungs[width] = PreviewRung(width)
+            return rung
+
+    def _get_active_preview_rungs(self) -> list[PreviewRung]:
+        rungs = getattr(self, "_preview_rungs", None)
+        if not rungs:
+            return []
+        with self._preview_consumers_lock:
+            return [rung for rung in rungs.values() if rung.consumers > 0]
+
+    def get_preview_ladder_stats(self) -> list[Dict[str, Any]]:
+        rungs = getattr(self, "_preview_rungs", None) or {}
+        default_width = int(getattr(getattr(self, "webcam_config", None), "preview_max_width", 0) or 0)
+        with getattr(self, "_preview_consumers_lock", None) or nullcontext():
+            stats = [rung.get_stats() for rung in rungs.values()]
+            default_consumers = int(getattr(self, "_preview_consumer_count", 0) or 0)
+        stats.append(
+            {
+                "width": default_width,
+                "consumers": default_consumers,
+                "resolution": self.get_preview_resolution(),
+                "default": True,
+            }
+        )
+        return sorted(stats, key=lambda item: int(item["width"]))
+
+    def register_preview_consumer(self, width: Optional[int] = None) -> None:
+        rung_width = self.resolve_preview_width(width)
+        if rung_width is not None:
+            rung = self._get_preview_rung(rung_width)
+            with self._preview_consumers_lock:
+                rung.consumers += 1
+            return
         with self._preview_consumers_lock:
             self._preview_consumer_count += 1
 
-    def unregister_preview_consumer(self) -> None:
+    def unregister_preview_consumer(self, width: Optional[int] = None) -> None:
+        rung_width = self.resolve_preview_width(width)
         with self._preview_consumers_lock:
+            if rung_width is not None:
+                rung = self._preview_rungs.get(rung_width)
+                if rung is not None and rung.consumers > 0:
+                    rung.consumers -= 1
+                return
             if self._preview_consumer_count > 0:
                 self._preview_consumer_count -= 1
 
+    def _get_default_preview_consumer_count(self) -> int:
+        """Consumers of the default rung (``preview_max_width``) only."""
+        preview_consumers_lock = getattr(self, "_preview_consumers_lock", None)
+        with preview_consumers_lock or nullcontext():
+            return int(getattr(self, "_preview_consumer_count", 0) or 0)
+
     def get_preview_consumer_count(self) -> int:
+        """Consumers of all preview rungs together."""
         preview_consumers_lock = getattr(self, "_preview_consumers_lock", None)
         if preview_consumers_lock is None:
             return int(getattr(self, "_preview_consumer_count", 0) or 0)
         with preview_consumers_lock:
-            return int(getattr(self, "_preview_consumer_count", 0) or 0)
+            rung_consumers = sum(int(rung.consumers) for rung in (getattr(self, "_preview_rungs", None) or {}).values())
+            return int(getattr(self, "_preview_consumer_count", 0) or 0) + rung_consumers
+
+    def get_preview_broadcaster(self, width: Optional[int] = None) -> PreviewBroadcaster:
+        rung_width = self.resolve_preview_width(width)
+        if rung_width is None:
+            return self._preview_broadcaster
+        return self._get_preview_rung(rung_width).broadcaster
 
     def get_preview_stream_interval_seconds(self) -> float:
         preview_fps = max(1, int(getattr(self.webcam_config, "preview_fps", 15) or 15))
@@ -1789,11 +2916,111 @@ class Camera:
                 return dict(resolution)
         return None
 
-    def _maybe_publish_preview_frame(self, frame: np.ndarray, *, force: bool = False) -> Optional[bytes]:
+    def _maybe_publish_preview_frame(
+        self,
+        frame: np.ndarray,
+        *,
+        force: bool = False,
+        sequence: Optional[int] = None,
+        captured_at: Optional[float] = None,
+    ) -> Optional[bytes]:
         if frame is None or frame.size == 0:
             return None
-        if not force and self.get_preview_consumer_count() <= 0:
+        self._maybe_publish_preview_rungs(
+            lambda width: self._encode_preview_frame(frame, width),
+            sequence=sequence,
+            captured_at=captured_at,
+        )
+        return self._maybe_publish_preview(
+            lambda: self._encode_preview_frame(frame),
+            force=force,
+            sequence=sequence,
+            captured_at=captured_at,
+        )
+
+    def _maybe_publish_encoded_preview(self, encoded_frame: EncodedFrame, *, force: bool = False) -> Optional[bytes]:
+        """Publish the camera's own JPEG as preview (MJPEG passthrough, no re-encode)."""
+        self._maybe_publish_preview_rungs(
+            lambda width: self._encode_passthrough_preview(encoded_frame, width),
+            sequence=encoded_frame.sequence,
+            captured_at=encoded_frame.timestamp,
+        )
+        return self._maybe_publish_preview(
+            lambda: (encoded_frame.data, encoded_frame.resolution),
+            force=force,
+            sequence=encoded_frame.sequence,
+            captured_at=encoded_frame.timestamp,
+        )
+
+    def _build_preview_frame_meta(
+        self,
+        sequence: int,
+        resolution: Dict[str, int],
+        captured_at: Optional[float],
+    ) -> PreviewFrameMeta:
+        """Metadata pushed with each preview JPEG; motion is the latest detection state."""
+        last_result = getattr(self, "last_motion_result", None)
+        return PreviewFrameMeta(
+            sequence=int(sequence),
+            captured_at=float(captured_at) if captured_at is not None else time.time(),
+            width=int(resolution.get("width", 0) or 0),
+            height=int(resolution.get("height", 0) or 0),
+            motion=bool(getattr(last_result, "motion_detected", False)),
+        )
+
+    def _maybe_publish_preview_rungs(
+        self,
+        encode: Callable[[int], tuple[Optional[bytes], Optional[Dict[str, int]]]],
+        *,
+        sequence: Optional[int] = None,
+        force_rung: Optional[PreviewRung] = None,
+        captured_at: Optional[float] = None,
+    ) -> None:
+        """Encode every subscribed ladder rung (each with its own preview_fps budget)."""
+        rungs = [force_rung] if force_rung is not None else self._get_active_preview_rungs()
+        if not rungs:
+            return
+        if sequence is None:
+            sequence = int(getattr(self, "frame_count", 0) or 0)
+        preview_interval = self.get_preview_stream_interval_seconds()
+        for rung in rungs:
+            now_monotonic = time.monotonic()
+            with self.frame_lock:
+                if rung.publish_in_progress:
+                    continue
+                if rung.jpeg is not None and (
+                    rung.source_sequence == sequence
+                    or (force_rung is None and now_monotonic - rung.last_publish_monotonic < preview_interval)
+                ):
+                    continue
+                rung.publish_in_progress = True
+            encode_started = time.perf_counter()
+            jpeg_bytes, resolution = encode(rung.width)
+            self._record_stage("preview.encode_rung", encode_started)
+            with self.frame_lock:
+                rung.publish_in_progress = False
+                if jpeg_bytes is None or resolution is None:
+                    rung.last_publish_monotonic = 0.0
+                    continue
+                rung.jpeg = jpeg_bytes
+                rung.resolution = dict(resolution)
+                rung.source_sequence = sequence
+                rung.last_publish_monotonic = now_monotonic
+                rung.encodes += 1
+            rung.broadcaster.publish(jpeg_bytes, meta=self._build_preview_frame_meta(sequence, resolution, captured_at))
+
+    def _maybe_publish_preview(
+        self,
+        encode: Callable[[], tuple[Optional[bytes], Optional[Dict[str, int]]]],
+        *,
+        force: bool = False,
+        sequence: Optional[int] = None,
+        captured_at: Optional[float] = None,
+    ) -> Optional[bytes]:
+        if not force and self._get_default_preview_consumer_count() <= 0:
             return None
+        if sequence is None:
+            sequence = int(getattr(self, "frame_count", 0) or 0)
 
         now_monotonic = time.monotonic()
         preview_interval = self.get_preview_stream_interval_seconds()
@@ -1812,7 +3039,9 @@ class Camera:
                 return None
             self._preview_publish_in_progress = True
 
-        jpeg_bytes, preview_resolution = self._encode_preview_frame(frame)
+        encode_started = time.perf_counter()
+        jpeg_bytes, preview_resolution = encode()
+        self._record_stage("preview.encode", encode_started)
         if jpeg_bytes is None or preview_resolution is None:
             with self.frame_lock:
                 self._preview_publish_in_progress = False
@@ -1823,34 +3052,202 @@ class Camera:
             self._current_jpeg_frame = jpeg_bytes
             self._preview_frame_resolution = dict(preview_resolution)
             self._preview_frame_timestamp = time.time()
+            self._preview_frame_sequence = sequence
             self._last_preview_publish_monotonic = now_monotonic
             self._preview_publish_in_progress = False
-            return bytes(self._current_jpeg_frame)
+
+        broadcaster = getattr(self, "_preview_broadcaster", None)
+        if broadcaster is not None:
+            broadcaster.publish(
+                jpeg_bytes,
+                meta=self._build_preview_frame_meta(sequence, preview_resolution, captured_at),
+            )
+        return jpeg_bytes
 
     def _publish_current_frame(self, frame: np.ndarray) -> None:
+        self._publish_frame_handle(FrameRing.wrap(frame, self.frame_count + 1, time.time()))
+
+    def _publish_frame_handle(self, handle: FrameHandle) -> None:
+        """Make ``handle`` the current frame; the camera keeps this reference until the next frame."""
         with self.frame_lock:
-            self.current_frame = frame
+            previous_handle = getattr(self, "_current_frame_handle", None)
+            self._current_frame_handle = handle
+            self.current_frame = handle.frame
+            self._current_encoded_frame = None
             self.frame_count += 1
+            sequence = self.frame_count
+        if previous_handle is not None:
+            previous_handle.release()
+        self._notify_frame_published(sequence)
 
-    def take_snapshot(self) -> Optional[np.ndarray]:
-        """Erstellt einen Snapshot (Thread-sicher)."""
+    def _publish_encoded_frame(self, encoded_frame: EncodedFrame) -> None:
+        with self.frame_lock:
+            previous_handle = getattr(self, "_current_frame_handle", None)
+            self._current_frame_handle = None
+            self.current_frame = None
+            self._current_encoded_frame = encoded_frame
+            self.frame_count += 1
+            sequence = self.frame_count
+        if previous_handle is not None:
+            previous_handle.release()
+        self._notify_frame_published(sequence)
+
+    def _notify_frame_published(self, sequence: int) -> None:
+        notifier = getattr(self, "_frame_notifier", None)
+        if notifier is not None:
+            notifier.notify(sequence)
+
+    def get_frame_notifier(self) -> Optional[FrameSequenceNotifier]:
+        return getattr(self, "_frame_notifier", None)
+
+    def get_frame_sequence(self) -> Optional[int]:
+        """Sequence number of the current frame (``frame_count``), None while no frame is published."""
+        with self.frame_lock:
+            if self.current_frame is None and getattr(self, "_current_encoded_frame", None) is None:
+                return None
+            return int(self.frame_count)
+
+    def get_frame_epoch(self) -> str:
+        return str(getattr(self, "_frame_epoch", "0"))
+
+    def acquire_frame_handle(self) -> Optional[FrameHandle]:
+        """
+        Zero-copy-Zugriff auf den aktuellen Frame.
+
+        Der Handle liefert einen read-only Frame, der bis ``release()`` unverändert
+        bleibt (Ring-Slot wird solange nicht überschrieben). Aufrufer müssen den
+        Handle freigeben, z.B. per ``with camera.acquire_frame_handle() as handle``.
+        """
         with self.frame_lock:
+            handle: Optional[FrameHandle] = getattr(self, "_current_frame_handle", None)
+            if handle is not None:
+                return handle.share()
             if self.current_frame is not None:
-                return self.current_frame.copy()
-        return None
+                # Direkt gesetzter Frame (ohne Ring), z.B. durch Tests oder Legacy-Code
+                return FrameRing.wrap(self.current_frame, self.frame_count, time.time())
+            encoded_frame = getattr(self, "_current_encoded_frame", None)
+        if encoded_frame is None:
+            return None
+        decoded = self._decode_encoded_frame(encoded_frame)
+        if decoded is None:
+            return None
+        return FrameRing.wrap(decoded, encoded_frame.sequence, encoded_frame.timestamp)
 
-    def get_current_jpeg_frame(self) -> Optional[bytes]:
+    def get_frame_ring_stats(self) -> Optional[dict]:
+        frame_pool = getattr(self, "_frame_pool", None)
+        if not isinstance(frame_pool, FrameRing):
+            return None
+        return frame_pool.get_stats()
+
+    def _decode_encoded_frame(self, encoded_frame: EncodedFrame) -> Optional[np.ndarray]:
+        """Full BGR decode of a passthrough frame, cached per sequence number."""
         with self.frame_lock:
+            cached: Optional[tuple[int, np.ndarray]] = getattr(self, "_decoded_frame_cache", None)
+            if cached is not None and cached[0] == encoded_frame.sequence:
+                return cached[1]
+        decoded = decode_full(encoded_frame)
+        if decoded is None:
+            return None
+        # Geteilte Referenz: Aufrufer dürfen den Frame nicht verändern
+        decoded.setflags(write=False)
+        with self.frame_lock:
+            if getattr(self, "_current_encoded_frame", None) is encoded_frame:
+                self._decoded_frame_cache = (encoded_frame.sequence, decoded)
+        return decoded
+
+    def has_current_frame(self) -> bool:
+        """True if a frame is available, without decoding a passthrough frame."""
+        with self.frame_lock:
+            return self.current_frame is not None or getattr(self, "_current_encoded_frame", None) is not None
+
+    def take_snapshot(self) -> Optional[np.ndarray]:
+        """Erstellt einen Snapshot als eigene Kopie (Thread-sicher); ohne Kopie siehe acquire_frame_handle()."""
+        return self.get_current_frame(copy_frame=True)
+
+    def get_current_jpeg_frame(self, width: Optional[int] = None) -> Optional[bytes]:
+        rung_width = self.resolve_preview_width(width)
+        with self.frame_lock:
+            if rung_width is not None:
+                rung = getattr(self, "_preview_rungs", {}).get(rung_width)
+                return None if rung is None or rung.jpeg is None else bytes(rung.jpeg)
             current_jpeg_frame = getattr(self, '_current_jpeg_frame', None)
             if current_jpeg_frame is not None:
                 return bytes(current_jpeg_frame)
         return None
 
-    def build_preview_jpeg_frame(self) -> Optional[bytes]:
-        frame = self.get_current_frame(copy_frame=False)
-        if frame is None:
+    def build_preview_jpeg_frame(self, width: Optional[int] = None) -> Optional[bytes]:
+        rung_width = self.resolve_preview_width(width)
+        if rung_width is not None:
+            return self._build_preview_rung_jpeg(self._get_preview_rung(rung_width))
+        with self.frame_lock:
+            encoded_frame = getattr(self, "_current_encoded_frame", None)
+        if encoded_frame is not None:
+            return self._maybe_publish_encoded_preview(encoded_frame, force=True)
+        handle = self.acquire_frame_handle()
+        if handle is None:
             return None
-        return self._maybe_publish_preview_frame(frame, force=True)
+        with handle:
+            return self._maybe_publish_preview_frame(
+                handle.frame,
+                force=True,
+                sequence=handle.sequence,
+                captured_at=handle.timestamp,
+            )
+
+    def build_sequenced_preview_jpeg(self, width: Optional[int] = None) -> Optional[tuple[bytes, int]]:
+        """
+        Preview JPEG of the current frame together with the capture sequence it shows.
+
+        Reuses the published preview when it already belongs to the current
+        frame and encodes otherwise. Used for ETags on /video/frame.
+        """
+        rung_width = self.resolve_preview_width(width)
+        if rung_width is not None:
+            rung = self._get_preview_rung(rung_width)
+            self._build_preview_rung_jpeg(rung)
+            with self.frame_lock:
+                if rung.jpeg is None or rung.source_sequence is None:
+                    return None
+                return bytes(rung.jpeg), int(rung.source_sequence)
+
+        current_sequence = self.get_frame_sequence()
+        with self.frame_lock:
+            cached = getattr(self, "_current_jpeg_frame", None)
+            cached_sequence = getattr(self, "_preview_frame_sequence", None)
+        if cached is None or cached_sequence is None or cached_sequence != current_sequence:
+            self.build_preview_jpeg_frame()
+        with self.frame_lock:
+            cached = getattr(self, "_current_jpeg_frame", None)
+            cached_sequence = getattr(self, "_preview_frame_sequence", None)
+        if cached is None or cached_sequence is None:
+            return None
+        return bytes(cached), int(cached_sequence)
+
+    def _build_preview_rung_jpeg(self, rung: PreviewRung) -> Optional[bytes]:
+        """JPEG of the current frame at a rung width; re-encoded only when the frame changed."""
+        with self.frame_lock:
+            encoded_frame = getattr(self, "_current_encoded_frame", None)
+        if encoded_frame is not None:
+            self._maybe_publish_preview_rungs(
+                lambda width: self._encode_passthrough_preview(encoded_frame, width),
+                sequence=encoded_frame.sequence,
+                force_rung=rung,
+                captured_at=encoded_frame.timestamp,
+            )
+        else:
+            handle = self.acquire_frame_handle()
+            if handle is None:
+                return None
+            with handle:
+                frame = handle.frame
+                self._maybe_publish_preview_rungs(
+                    lambda width: self._encode_preview_frame(frame, width),
+                    sequence=handle.sequence,
+                    force_rung=rung,
+                    captured_at=handle.timestamp,
+                )
+        with self.frame_lock:
+            return None if rung.jpeg is None else bytes(rung.jpeg)
     
     def get_current_frame(self, copy_frame: bool = True) -> Optional[np.ndarray]:
         """
@@ -1858,12 +3255,21 @@ class Camera:
         
         Args:
             copy_frame: Wenn True (Default), wird eine Kopie zurückgegeben (sicher).
-                       Wenn False, wird eine Referenz zurückgegeben (schneller, aber Mutation vermeiden!).
+                       Wenn False, wird eine read-only Referenz auf den Ring-Slot zurückgegeben, die der
+                       Ring nach wenigen Frames überschreibt; nur für Prüfungen ohne Weiterverarbeitung.
+                       Zum Encodieren/Auswerten acquire_frame_handle() verwenden.
         """
         with self.frame_lock:
             if self.current_frame is not None:
                 return self.current_frame.copy() if copy_frame else self.current_frame
+            encoded_frame = getattr(self, "_current_encoded_frame", None)
+        if encoded_frame is None:
             return None
+        # MJPEG-Passthrough: erst bei Bedarf dekodieren
+        decoded = self._decode_encoded_frame(encoded_frame)
+        if decoded is None:
+            return None
+        return decoded.copy() if copy_frame else decoded
 
     def initialize_routes(self) -> None:
         """Initialize the API routes for the video stream."""
@@ -1875,9 +3281,9 @@ class Camera:
         """Deprecated legacy instance stream helper; the route stack uses global video streaming now."""
         """Generator für den Videostream."""
         while True:
-            # Für Streaming keine Kopie nötig, da Encoding nicht mutiert
-            frame = self.get_current_frame(copy_frame=False)
-            if frame is None:
+            # Für Streaming keine Kopie nötig; der Handle hält den Ring-Slot bis nach dem Encoding
+            handle = self.acquire_frame_handle()
+            if handle is None:
                 # Platzhalter senden wenn kein Frame verfügbar
                 yield (b'--frame\r\n'
                        b'Content-Type: image/png\r\n\r\n' + self.placeholder.body + b'\r\n')
@@ -1885,7 +3291,8 @@ class Camera:
                 continue
                 
             try:
-                ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
+                with handle:
+                    ret, buffer = cv2.imencode('.jpg', handle.frame, [cv2.IMWRITE_JPEG_QUALITY, 70])
                 if not ret:
                     continue
                 frame_bytes = buffer.tobytes()
@@ -1937,6 +3344,8 @@ class Camera:
                     self.logger.error("Frame capture thread did not stop during runtime suspension")
                     return False
 
+            self._stop_motion_worker(timeout=2.0)
+
             if frame_thread_stopped and not self._try_release_video_capture(timeout=0.05):
                 self.logger.error("Failed to release video capture during runtime suspension")
                 return False
@@ -1995,6 +3404,7 @@ class Camera:
                     cleanup_complete = False
             
             if frame_thread_stopped:
+                self._stop_motion_worker(timeout=2.0)
                 # Cleanup motion detector
                 if self.motion_detector is not None:
                     try:
@@ -2017,6 +3427,8 @@ class Camera:
 
                 with self._preview_consumers_lock:
                     self._preview_consumer_count = 0
+                    for rung in getattr(self, "_preview_rungs", {}).values():
+                        rung.consumers = 0
                  
                 # Release camera
                 if not self._try_release_video_capture(timeout=0.05):
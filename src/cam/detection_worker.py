@@ -0,0 +1,177 @@
+"""
+Latest-frame-wins worker for motion detection.
+
+The capture thread hands every frame that should be analysed to
+:class:`MotionDetectionWorker`. The worker keeps only the newest pending frame:
+when detection is slower than capture, older pending frames are replaced and
+counted as dropped instead of queueing up behind the detector. An optional
+``on_drop`` hook receives every frame that is discarded without being
+processed, e.g. to release a ring-buffer handle.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Generic, Optional, TypeVar
+
+FrameT = TypeVar("FrameT")
+
+
+class MotionDetectionWorker(Generic[FrameT]):
+    """Runs a frame processor in a dedicated thread on the newest submitted frame."""
+
+    THROUGHPUT_WINDOW = 32
+
+    def __init__(
+        self,
+        process: Callable[[FrameT], None],
+        *,
+        name: str = "MotionDetection",
+        logger: Optional[logging.Logger] = None,
+        on_drop: Optional[Callable[[FrameT], None]] = None,
+    ) -> None:
+        self._process = process
+        self._on_drop = on_drop
+        self._name = name
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._condition = threading.Condition(threading.Lock())
+        self._pending: Optional[FrameT] = None
+        self._has_pending = False
+        self._stop_requested = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._submitted = 0
+        self._processed = 0
+        self._dropped = 0
+        self._errors = 0
+        self._busy = False
+        self._last_duration: Optional[float] = None
+        self._avg_duration: Optional[float] = None
+        self._completions: Deque[float] = collections.deque(maxlen=self.THROUGHPUT_WINDOW)
+
+    # ------------------------------------------------------------------ #
+
+    def start(self) -> None:
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_requested = False
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> bool:
+        """Stop the worker, discard any pending frame and return whether the thread ended."""
+        with self._condition:
+            self._stop_requested = True
+            had_pending = self._has_pending
+            discarded = self._take_pending_locked()
+            self._condition.notify_all()
+            thread = self._thread
+        if had_pending:
+            self._drop(discarded)  # type: ignore[arg-type]
+        if thread is None:
+            return True
+        if thread is not threading.current_thread():
+            thread.join(timeout=max(0.0, float(timeout)))
+        stopped = not thread.is_alive()
+        if stopped:
+            with self._condition:
+                if self._thread is thread:
+                    self._thread = None
+        return stopped
+
+    def is_alive(self) -> bool:
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def submit(self, frame: FrameT) -> None:
+        """Publish a frame for analysis, replacing any frame the worker has not picked up yet."""
+        replaced: Optional[FrameT] = None
+        has_replaced = False
+        with self._condition:
+            if self._stop_requested:
+                has_replaced, replaced = True, frame
+            else:
+                if self._has_pending:
+                    self._dropped += 1
+                    has_replaced, replaced = True, self._pending
+                self._pending = frame
+                self._has_pending = True
+                self._submitted += 1
+                self._condition.notify()
+        if has_replaced:
+            self._drop(replaced)  # type: ignore[arg-type]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._condition:
+            completions = list(self._completions)
+            stats: Dict[str, Any] = {
+                "running": self.is_alive(),
+                "busy": self._busy,
+                "pending": self._has_pending,
+                "submitted": self._submitted,
+                "processed": self._processed,
+                "dropped": self._dropped,
+                "errors": self._errors,
+                "last_duration_ms": None if self._last_duration is None else self._last_duration * 1000.0,
+                "avg_duration_ms": None if self._avg_duration is None else self._avg_duration * 1000.0,
+            }
+        throughput = 0.0
+        if len(completions) >= 2:
+            span = completions[-1] - completions[0]
+            if span > 0:
+                throughput = (len(completions) - 1) / span
+        stats["throughput_fps"] = throughput
+        stats["drop_ratio"] = (stats["dropped"] / stats["submitted"]) if stats["submitted"] else 0.0
+        return stats
+
+    # ------------------------------------------------------------------ #
+
+    def _drop(self, frame: FrameT) -> None:
+        if self._on_drop is None:
+            return
+        try:
+            self._on_drop(frame)
+        except Exception as exc:
+            self.logger.debug("Motion detection worker drop hook failed: %s", exc, exc_info=True)
+
+    def _take_pending_locked(self) -> Optional[FrameT]:
+        pending = self._pending if self._has_pending else None
+        self._pending = None
+        self._has_pending = False
+        return pending
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._has_pending and not self._stop_requested:
+                    self._condition.wait()
+                if self._stop_requested:
+                    return
+                frame = self._take_pending_locked()
+                self._busy = True
+
+            started = time.perf_counter()
+            failed = False
+            try:
+                self._process(frame)  # type: ignore[arg-type]
+            except Exception as exc:
+                failed = True
+                self.logger.error("Motion detection worker error: %s", exc, exc_info=True)
+            duration = time.perf_counter() - started
+
+            with self._condition:
+                self._busy = False
+                self._processed += 1
+                if failed:
+                    self._errors += 1
+                self._last_duration = duration
+                if self._avg_duration is None:
+                    self._avg_duration = duration
+                else:
+                    self._avg_duration += 0.1 * (duration - self._avg_duration)
+                self._completions.append(time.monotonic())
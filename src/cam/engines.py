@@ -0,0 +1,131 @@
+"""
+Background models ("engines") for :class:`~src.cam.motion.MotionDetector`.
+
+An engine turns a blurred grayscale frame into a binary foreground mask
+(0/255, same size). Everything around it (ROI/zones, downscaling, blur,
+morphology, components and the resulting :class:`~src.cam.motion.MotionResult`)
+is shared, so engines are interchangeable per installation:
+
+- ``mog2``: OpenCV's Gaussian-mixture subtractor, most robust against
+  flicker, noise and slow lighting changes, but the heaviest per-frame cost
+- ``running_average``: one float32 background image updated with the learning
+  rate plus a fixed difference threshold, a few vectorized NumPy passes per
+  frame and a fraction of MOG2's CPU time on a Pi Zero/3
+
+Further engines can be added with :func:`register_detector_engine`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Protocol, Tuple
+
+import cv2
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.config import MotionDetectionConfig
+
+DEFAULT_ENGINE = "mog2"
+
+
+class DetectorEngine(Protocol):
+    """Background model with the call shape of an OpenCV ``BackgroundSubtractor``."""
+
+    name: str
+
+    def apply(self, frame: np.ndarray, learningRate: float = -1) -> np.ndarray:  # noqa: N803 - OpenCV API
+        ...
+
+    def clear(self) -> None:
+        ...
+
+
+EngineFactory = Callable[["MotionDetectionConfig"], DetectorEngine]
+_ENGINES: Dict[str, EngineFactory] = {}
+
+
+def register_detector_engine(name: str, factory: EngineFactory) -> None:
+    """Make an engine selectable via ``motion_detection.engine``."""
+    _ENGINES[str(name)] = factory
+
+
+def get_detector_engine_names() -> List[str]:
+    return sorted(_ENGINES)
+
+
+def create_detector_engine(name: Optional[str], config: "MotionDetectionConfig") -> DetectorEngine:
+    factory = _ENGINES.get(str(name or DEFAULT_ENGINE))
+    if factory is None:
+        raise ValueError(f"Unknown detector engine '{name}', expected one of {get_detector_engine_names()}")
+    return factory(config)
+
+
+class MOG2Engine:
+    """OpenCV MOG2 without shadow detection; mask values below 200 are dropped."""
+
+    name = "mog2"
+
+    def __init__(self, history: int = 512, var_threshold: float = 6) -> None:
+        self._subtractor = cv2.createBackgroundSubtractorMOG2(
+            detectShadows=False,
+            varThreshold=var_threshold,
+            history=history,
+        )
+
+    def apply(self, frame: np.ndarray, learningRate: float = -1) -> np.ndarray:  # noqa: N803 - OpenCV API
+        fg_mask = self._subtractor.apply(frame, learningRate=learningRate)
+        # Schatten entfernen
+        cv2.threshold(fg_mask, 200, 255, cv2.THRESH_BINARY, dst=fg_mask)
+        return fg_mask
+
+    def clear(self) -> None:
+        self._subtractor.clear()
+
+
+class RunningAverageEngine:
+    """
+    Exponential running average of the background with a fixed difference threshold.
+
+    Per frame: ``diff = frame - background``, ``mask = |diff| > threshold`` and
+    ``background += rate * diff``, all in preallocated float32 buffers. Unlike
+    MOG2 there is no per-pixel variance model, so flickering light or sensor
+    noise above ``threshold`` shows up as motion (morphology and
+    ``min_contour_area`` filter most of it).
+    """
+
+    name = "running_average"
+
+    def __init__(self, threshold: int = 25) -> None:
+        self.threshold = float(threshold)
+        # (Hintergrund, Differenz, Betrag) als float32, gemeinsam angelegt und verworfen
+        self._buffers: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def apply(self, frame: np.ndarray, learningRate: float = -1) -> np.ndarray:  # noqa: N803 - OpenCV API
+        buffers = self._buffers
+        if buffers is None or buffers[0].shape != frame.shape:
+            # Erster Frame bzw. neue Größe: Frame wird zum Hintergrund, noch keine Bewegung
+            background = frame.astype(np.float32)
+            self._buffers = (background, np.empty_like(background), np.empty_like(background))
+            return np.zeros(frame.shape, dtype=np.uint8)
+
+        background, diff, magnitude = buffers
+        np.subtract(frame, background, out=diff, dtype=np.float32)
+        np.abs(diff, out=magnitude)
+        fg_mask: np.ndarray = np.greater(magnitude, self.threshold).view(np.uint8)
+        fg_mask *= 255
+
+        rate = 0.05 if learningRate is None or learningRate < 0 else min(1.0, float(learningRate))
+        if rate > 0:
+            np.multiply(diff, rate, out=diff)
+            np.add(background, diff, out=background)
+        return fg_mask
+
+    def clear(self) -> None:
+        self._buffers = None
+
+
+register_detector_engine(MOG2Engine.name, lambda config: MOG2Engine())
+register_detector_engine(
+    RunningAverageEngine.name,
+    lambda config: RunningAverageEngine(threshold=getattr(config, "difference_threshold", 25)),
+)
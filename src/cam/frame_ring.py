@@ -0,0 +1,193 @@
+"""
+Preallocated frame ring with reference-counted, read-only frame handles.
+
+The capture thread asks :class:`FrameRing` for a free slot, lets
+``VideoCapture.read(buffer)`` decode straight into the slot's buffer and then
+commits it as a :class:`FrameHandle`. Consumers (preview, detection worker,
+snapshots, alerts, legacy callbacks) receive read-only views and share the
+same memory; a slot is only reused for writing once every handle on it has
+been released. When all slots are pinned the writer falls back to a fresh
+allocation instead of blocking, so slow consumers never stall capture.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+class _Slot:
+    __slots__ = ("index", "buffer", "refs", "writing")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.buffer: Optional[np.ndarray] = None
+        self.refs = 0
+        self.writing = False
+
+
+class FrameHandle:
+    """
+    One reference to a captured frame.
+
+    ``frame`` is a read-only view that stays valid (and unchanged) until
+    :meth:`release` is called. Use :meth:`share` to hand an additional
+    reference to another consumer; every handle must be released exactly once
+    (repeated calls are ignored). Handles are context managers.
+    """
+
+    __slots__ = ("frame", "sequence", "timestamp", "_ring", "_slot", "_released")
+
+    def __init__(
+        self,
+        frame: np.ndarray,
+        sequence: int,
+        timestamp: float,
+        ring: Optional["FrameRing"] = None,
+        slot: Optional[_Slot] = None,
+    ) -> None:
+        self.frame = frame
+        self.sequence = sequence
+        self.timestamp = timestamp
+        self._ring = ring
+        self._slot = slot
+        self._released = False
+
+    @property
+    def released(self) -> bool:
+        return self._released
+
+    def share(self) -> "FrameHandle":
+        """Return a new handle on the same frame; raises if this handle was released."""
+        if self._released:
+            raise RuntimeError(f"Frame handle {self.sequence} already released")
+        if self._ring is not None and self._slot is not None:
+            self._ring._retain(self._slot)
+        return FrameHandle(self.frame, self.sequence, self.timestamp, self._ring, self._slot)
+
+    def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        if self._ring is not None and self._slot is not None:
+            self._ring._release(self._slot)
+
+    def __enter__(self) -> "FrameHandle":
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        slot = None if self._slot is None else self._slot.index
+        return f"FrameHandle(sequence={self.sequence}, slot={slot}, released={self._released})"
+
+
+def _read_only_view(frame: np.ndarray) -> np.ndarray:
+    view = frame.view()
+    view.setflags(write=False)
+    return view
+
+
+class FrameRing:
+    """Fixed number of reusable frame buffers for the capture thread."""
+
+    def __init__(self, size: int = 4) -> None:
+        self._lock = threading.Lock()
+        self._slots: List[_Slot] = [_Slot(index) for index in range(max(1, int(size)))]
+        self._next_index = 0
+        self._commits = 0
+        self._reuses = 0
+        self._allocations = 0
+        self._overflows = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    # ------------------------------------------------------------------ #
+
+    def reserve(self) -> Optional[_Slot]:
+        """
+        Reserve the next unreferenced slot for writing.
+
+        Returns None when every slot is still referenced; the caller should then
+        read into a fresh array and use :meth:`wrap`.
+        """
+        with self._lock:
+            count = len(self._slots)
+            for offset in range(count):
+                slot = self._slots[(self._next_index + offset) % count]
+                if slot.refs == 0 and not slot.writing:
+                    slot.writing = True
+                    self._next_index = (slot.index + 1) % count
+                    return slot
+            self._overflows += 1
+            return None
+
+    def get_buffer(self, slot: _Slot) -> Optional[np.ndarray]:
+        """Writable target buffer of a reserved slot (None until the first frame sized it)."""
+        return slot.buffer
+
+    def commit(self, slot: _Slot, frame: np.ndarray, sequence: int, timestamp: float) -> FrameHandle:
+        """
+        Publish the frame written into ``slot`` and return the first handle on it.
+
+        ``frame`` is what ``read()`` returned: the slot buffer itself, or a new
+        array when OpenCV had to allocate (first frame, resolution change), which
+        the slot then adopts for subsequent writes.
+        """
+        with self._lock:
+            slot.writing = False
+            if slot.buffer is not None and frame is slot.buffer:
+                self._reuses += 1
+            else:
+                slot.buffer = frame
+                self._allocations += 1
+            slot.refs = 1
+            self._commits += 1
+        return FrameHandle(_read_only_view(frame), sequence, timestamp, self, slot)
+
+    def abort(self, slot: _Slot) -> None:
+        """Give a reserved slot back after a failed read."""
+        with self._lock:
+            slot.writing = False
+
+    @staticmethod
+    def wrap(frame: np.ndarray, sequence: int, timestamp: float) -> FrameHandle:
+        """Handle for a frame that does not live in the ring (overflow, decoded MJPEG, tests)."""
+        return FrameHandle(_read_only_view(frame), sequence, timestamp)
+
+    def clear(self) -> None:
+        """Drop all idle buffers; buffers still referenced by handles stay alive until released."""
+        with self._lock:
+            for slot in self._slots:
+                if slot.refs == 0 and not slot.writing:
+                    slot.buffer = None
+            self._next_index = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "size": len(self._slots),
+                "in_use": sum(1 for slot in self._slots if slot.refs > 0),
+                "references": sum(slot.refs for slot in self._slots),
+                "commits": self._commits,
+                "reuses": self._reuses,
+                "allocations": self._allocations,
+                "overflows": self._overflows,
+            }
+
+    # ------------------------------------------------------------------ #
+
+    def _retain(self, slot: _Slot) -> None:
+        with self._lock:
+            if slot.refs <= 0:
+                raise RuntimeError(f"Cannot share released frame slot {slot.index}")
+            slot.refs += 1
+
+    def _release(self, slot: _Slot) -> None:
+        with self._lock:
+            if slot.refs > 0:
+                slot.refs -= 1
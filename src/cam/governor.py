@@ -0,0 +1,162 @@
+"""
+Adaptive frame-skip governor for motion detection.
+
+Instead of a fixed ``frame_skip``, :class:`DetectionRateGovernor` chooses how
+many captured frames to skip between two analyses so that detection stays
+within a budget:
+
+- ``cpu_budget``: CPU time of the detection thread per wall-clock second
+  (0.3 = 30% of one core)
+- ``latency_budget``: age of a frame when its detection result is ready
+
+Every ``window_seconds`` the measured load is compared with the budget. Over
+budget the skip grows proportionally to the overshoot; with clear headroom it
+shrinks by one (fast back-off, slow recovery). The skip never exceeds what
+``min_fps`` allows, so alerts keep enough samples, and never falls below
+what ``max_fps`` allows. The last decisions are kept for the status API.
+"""
+
+from __future__ import annotations
+
+import collections
+import math
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+# Mindestens so viele Analysen innerhalb von alert_delay_seconds
+MIN_ANALYSES_PER_ALERT_DELAY = 30
+MIN_ANALYSIS_FPS_FLOOR = 0.5
+# Unterhalb dieses Anteils am Budget wird die Rate wieder erhöht
+HEADROOM_RATIO = 0.6
+
+
+def min_fps_for_alert_delay(alert_delay_seconds: float) -> float:
+    """Lowest analysis rate that still gives ``MIN_ANALYSES_PER_ALERT_DELAY`` samples per alert delay."""
+    delay = max(1.0, float(alert_delay_seconds or 0))
+    return max(MIN_ANALYSIS_FPS_FLOOR, MIN_ANALYSES_PER_ALERT_DELAY / delay)
+
+
+class DetectionRateGovernor:
+    """Adjusts the detection frame skip against a CPU share and result-latency budget."""
+
+    DECISION_HISTORY = 20
+
+    def __init__(
+        self,
+        *,
+        cpu_budget: float,
+        latency_budget: float,
+        min_fps: float,
+        max_fps: float = 0.0,
+        initial_skip: int = 1,
+        window_seconds: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.cpu_budget = max(0.01, float(cpu_budget))
+        self.latency_budget = max(0.001, float(latency_budget))
+        self.min_fps = max(0.01, float(min_fps))
+        self.max_fps = max(0.0, float(max_fps))
+        self.window_seconds = max(0.1, float(window_seconds))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.skip = max(1, int(initial_skip))
+
+        self._window_started: Optional[float] = None
+        self._window_frame_count = 0
+        self._cpu_seconds = 0.0
+        self._samples = 0
+        self._latencies: List[float] = []
+        self._decisions: Deque[Dict[str, Any]] = collections.deque(maxlen=self.DECISION_HISTORY)
+
+    def record(self, *, cpu_seconds: float, latency_seconds: Optional[float], frame_count: int) -> Optional[int]:
+        """
+        Account one finished analysis (called from the detection thread).
+
+        Returns:
+            The new skip when this call closed a window and the skip changed, else None.
+        """
+        with self._lock:
+            now = self._clock()
+            if self._window_started is None:
+                self._start_window_locked(now, frame_count)
+                return None
+            self._cpu_seconds += max(0.0, float(cpu_seconds))
+            self._samples += 1
+            if latency_seconds is not None:
+                self._latencies.append(max(0.0, float(latency_seconds)))
+            elapsed = now - self._window_started
+            if elapsed < self.window_seconds:
+                return None
+            previous = self.skip
+            self._decide_locked(elapsed, frame_count)
+            self._start_window_locked(now, frame_count)
+            return self.skip if self.skip != previous else None
+
+    def _start_window_locked(self, now: float, frame_count: int) -> None:
+        self._window_started = now
+        self._window_frame_count = frame_count
+        self._cpu_seconds = 0.0
+        self._samples = 0
+        self._latencies = []
+
+    def _decide_locked(self, elapsed: float, frame_count: int) -> None:
+        capture_fps = max(0.0, (frame_count - self._window_frame_count) / elapsed)
+        analysis_fps = self._samples / elapsed
+        cpu_share = self._cpu_seconds / elapsed
+        latency = self._percentile(self._latencies, 0.9)
+        cpu_pressure = cpu_share / self.cpu_budget
+        latency_pressure = (latency / self.latency_budget) if latency is not None else 0.0
+        # Gerundet, damit z. B. exakt 3x Budget nicht durch Float-Rauschen zu Skip 4 wird
+        pressure = round(max(cpu_pressure, latency_pressure), 3)
+
+        skip = self.skip
+        if pressure > 1.0:
+            skip = max(skip + 1, int(math.ceil(skip * pressure)))
+            reason = "cpu" if cpu_pressure >= latency_pressure else "latency"
+        elif pressure < HEADROOM_RATIO:
+            skip -= 1
+            reason = "headroom"
+        else:
+            reason = "steady"
+
+        # Grenzen aus der Capture-Rate: max_fps begrenzt nach oben, min_fps hat Vorrang
+        lowest_skip = int(math.ceil(round(capture_fps / self.max_fps, 3))) if self.max_fps > 0 and capture_fps > 0 else 1
+        highest_skip = max(1, int(capture_fps / self.min_fps)) if capture_fps > 0 else self.skip
+        if skip < lowest_skip:
+            skip, reason = lowest_skip, "max_fps"
+        if skip > highest_skip:
+            skip, reason = highest_skip, "min_fps"
+        self.skip = max(1, skip)
+
+        self._decisions.append(
+            {
+                "at": time.time(),
+                "skip": self.skip,
+                "reason": reason,
+                "capture_fps": round(capture_fps, 2),
+                "analysis_fps": round(analysis_fps, 2),
+                "cpu_share": round(cpu_share, 3),
+                "latency_p90_ms": None if latency is None else round(latency * 1000.0, 1),
+            }
+        )
+
+    @staticmethod
+    def _percentile(values: List[float], fraction: float) -> Optional[float]:
+        if not values:
+            return None
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def get_state(self) -> Dict[str, Any]:
+        with self._lock:
+            decisions = list(self._decisions)
+            return {
+                "skip": self.skip,
+                "cpu_budget": self.cpu_budget,
+                "latency_budget_ms": round(self.latency_budget * 1000.0, 1),
+                "min_fps": round(self.min_fps, 3),
+                "max_fps": self.max_fps,
+                "last_decision": decisions[-1] if decisions else None,
+                "decisions": decisions,
+            }
@@ -0,0 +1,114 @@
+"""
+Per-session motion activity heatmap.
+
+:class:`ActivityHeatmap` keeps a small float32 grid over the full camera frame
+(``motion_detection.heatmap_width`` cells wide, height by aspect ratio). The
+detector hands over the foreground mask it already computed together with the
+analysed region; the mask is area-resized onto the region's cells and added in
+one vectorised step. The grid therefore shows where motion actually happens and
+where the ROI could be tightened.
+
+Rendering produces a colour-mapped RGBA PNG whose alpha follows the activity,
+so it can be laid over the camera feed as-is.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+MIN_HEATMAP_WIDTH = 8
+MAX_HEATMAP_WIDTH = 320
+# Deckkraft der aktivsten Zelle im Overlay
+_MAX_ALPHA = 200
+
+# x, y, width, height als Anteil des Vollbilds
+Region = Tuple[float, float, float, float]
+
+
+class ActivityHeatmap:
+    """Accumulates foreground masks of one session on a coarse grid; thread-safe."""
+
+    def __init__(self, width: int = 64) -> None:
+        self.width = max(MIN_HEATMAP_WIDTH, min(MAX_HEATMAP_WIDTH, int(width)))
+        self._lock = threading.Lock()
+        self._grid: Optional[np.ndarray] = None
+        self._aspect: Optional[float] = None
+        self._frames = 0
+        self._started_at = time.time()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._grid = None
+            self._aspect = None
+            self._frames = 0
+            self._started_at = time.time()
+
+    def add(self, mask: np.ndarray, region: Region, frame_size: Tuple[int, int]) -> None:
+        """
+        Add a 0/255 foreground ``mask`` covering ``region`` of a ``frame_size`` (w, h) frame.
+
+        The mask may have any resolution (processing or coarse width); only its
+        extent relative to the frame matters.
+        """
+        frame_w, frame_h = frame_size
+        if mask is None or mask.size == 0 or frame_w <= 0 or frame_h <= 0:
+            return
+        aspect = frame_h / frame_w
+        with self._lock:
+            if self._grid is None or self._aspect != aspect:
+                # Neue Auflösung: alte Zellen passen nicht mehr zum Bild
+                self._grid = np.zeros((max(1, round(self.width * aspect)), self.width), dtype=np.float32)
+                self._aspect = aspect
+                self._frames = 0
+            grid = self._grid
+            rows, cols = grid.shape
+            x, y, w, h = region
+            x0, y0 = min(cols - 1, int(x * cols)), min(rows - 1, int(y * rows))
+            x1, y1 = max(x0 + 1, min(cols, round((x + w) * cols))), max(y0 + 1, min(rows, round((y + h) * rows)))
+            cells = cv2.resize(mask, (x1 - x0, y1 - y0), interpolation=cv2.INTER_AREA)
+            grid[y0:y1, x0:x1] += cells
+            self._frames += 1
+
+    def snapshot(self) -> Tuple[Optional[np.ndarray], int]:
+        """Activity share per cell (0..1 = fraction of analysed frames with motion) and frame count."""
+        with self._lock:
+            if self._grid is None or self._frames == 0:
+                return None, self._frames
+            return self._grid / (255.0 * self._frames), self._frames
+
+    def get_stats(self) -> Dict[str, Any]:
+        activity, frames = self.snapshot()
+        return {
+            "width": self.width,
+            "height": None if activity is None else int(activity.shape[0]),
+            "frames": frames,
+            "peak_activity": 0.0 if activity is None else round(float(activity.max()), 4),
+            "started_at": self._started_at,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        activity, _frames = self.snapshot()
+        payload = self.get_stats()
+        payload["activity"] = [] if activity is None else np.round(activity, 4).tolist()
+        return payload
+
+    def render_png(self) -> bytes:
+        """Colour-mapped RGBA overlay, normalised to the most active cell; transparent without data."""
+        activity, _frames = self.snapshot()
+        if activity is None:
+            overlay = np.zeros((1, 1, 4), dtype=np.uint8)
+        else:
+            peak = float(activity.max())
+            normalized = (activity * (255.0 / peak) if peak > 0 else activity).astype(np.uint8)
+            colors = cv2.applyColorMap(normalized, cv2.COLORMAP_JET)
+            alpha = (normalized.astype(np.uint16) * _MAX_ALPHA // 255).astype(np.uint8)
+            overlay = np.dstack((colors, alpha))
+        ok, encoded = cv2.imencode(".png", overlay)
+        if not ok:
+            raise RuntimeError("Heatmap PNG encoding failed")
+        return encoded.tobytes()
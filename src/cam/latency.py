@@ -0,0 +1,127 @@
+"""
+Per-stage latency histograms for the capture pipeline.
+
+:class:`LatencyRecorder` keeps one :class:`LatencyHistogram` per stage name
+(``capture.read``, ``motion.background``, ``stream.ws_ack_age`` ...). Recording is a
+``perf_counter`` difference plus a bisect into fixed, roughly logarithmic
+bucket bounds under one lock, cheap enough to stay enabled on a Raspberry Pi.
+
+Reading the numbers: a slow ``capture.read`` with idle ``motion.*`` stages
+points at USB/driver limits, high ``motion.*`` times or a growing
+``motion.frame_age`` at CPU saturation, and a ``capture.publish`` or
+``preview.encode`` that is much slower than its median at lock contention.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# Obere Bucket-Grenzen in Millisekunden; der letzte Bucket nimmt alles darüber auf
+LATENCY_BUCKET_BOUNDS_MS = (
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0,
+    100.0, 200.0, 500.0, 1000.0, 2000.0, 5000.0, 10000.0,
+)
+_PERCENTILES = (("p50", 0.5), ("p90", 0.9), ("p99", 0.99))
+
+
+class LatencyHistogram:
+    """Bucketed latency distribution of one stage (values in milliseconds)."""
+
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(LATENCY_BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+
+    def add(self, value_ms: float) -> None:
+        value_ms = max(0.0, float(value_ms))
+        self.counts[bisect_left(LATENCY_BUCKET_BOUNDS_MS, value_ms)] += 1
+        self.count += 1
+        self.total += value_ms
+        if self.minimum is None or value_ms < self.minimum:
+            self.minimum = value_ms
+        if self.maximum is None or value_ms > self.maximum:
+            self.maximum = value_ms
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Estimate by linear interpolation inside the bucket holding the rank."""
+        if self.count == 0 or self.minimum is None or self.maximum is None:
+            return None
+        rank = max(0.0, min(1.0, fraction)) * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count == 0 or cumulative + bucket_count < rank:
+                cumulative += bucket_count
+                continue
+            lower = LATENCY_BUCKET_BOUNDS_MS[index - 1] if index > 0 else 0.0
+            upper = LATENCY_BUCKET_BOUNDS_MS[index] if index < len(LATENCY_BUCKET_BOUNDS_MS) else self.maximum
+            lower = max(lower, self.minimum)
+            upper = min(upper, self.maximum)
+            position = (rank - cumulative) / bucket_count
+            return lower + (upper - lower) * position
+        return self.maximum
+
+    def to_dict(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else None,
+            "min_ms": None if self.minimum is None else round(self.minimum, 3),
+            "max_ms": None if self.maximum is None else round(self.maximum, 3),
+        }
+        for name, fraction in _PERCENTILES:
+            value = self.percentile(fraction)
+            stats[f"{name}_ms"] = None if value is None else round(value, 3)
+        stats["buckets"] = self.counts[:]
+        return stats
+
+
+class LatencyRecorder:
+    """Thread-safe collection of stage histograms, shared by capture thread, detection worker and routes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stages: Dict[str, LatencyHistogram] = {}
+        self._since = time.time()
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = LatencyHistogram()
+            histogram.add(seconds * 1000.0)
+
+    def record_since(self, stage: str, started: float) -> float:
+        """Record ``perf_counter() - started`` and return the new ``perf_counter()`` for chaining."""
+        now = time.perf_counter()
+        self.record(stage, now - started)
+        return now
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_since(stage, started)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._since = time.time()
+
+    def get_snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {name: histogram.to_dict() for name, histogram in sorted(self._stages.items())}
+            since = self._since
+        return {
+            "since": since,
+            "bucket_bounds_ms": list(LATENCY_BUCKET_BOUNDS_MS),
+            "stages": stages,
+        }
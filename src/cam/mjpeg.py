@@ -0,0 +1,165 @@
+"""
+Helpers for the MJPEG passthrough capture mode.
+
+With ``webcam.capture_mode: mjpeg_passthrough`` the camera is asked for MJPG and
+OpenCV's RGB conversion is disabled, so ``VideoCapture.read()`` returns the
+compressed JPEG bytes instead of a decoded BGR image. Those bytes are served to
+the preview routes unchanged; frames are only decoded when someone actually
+needs pixels, and motion detection decodes directly at a reduced scale.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+_JPEG_SOI = b"\xff\xd8"
+# Start-of-frame markers carrying the image size (SOF0..SOF15 without DHT/JPG/DAC)
+_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+# Markers without a length field
+_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}
+
+_REDUCED_GRAYSCALE_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+    (4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+    (2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+)
+_REDUCED_COLOR_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+
+@dataclass(frozen=True)
+class EncodedFrame:
+    """A captured frame as delivered by the camera (JPEG bytes)."""
+
+    data: bytes
+    sequence: int
+    width: int
+    height: int
+    timestamp: float
+
+    @property
+    def resolution(self) -> dict:
+        return {"width": int(self.width), "height": int(self.height)}
+
+
+def read_jpeg_dimensions(data: bytes) -> Optional[Tuple[int, int]]:
+    """Return ``(width, height)`` from the SOF segment of a JPEG or None if not found."""
+    length = len(data)
+    if length < 4 or not data.startswith(_JPEG_SOI):
+        return None
+    index = 2
+    while index + 4 <= length:
+        if data[index] != 0xFF:
+            return None
+        marker = data[index + 1]
+        if marker == 0xFF:
+            # Fill byte
+            index += 1
+            continue
+        if marker in _STANDALONE_MARKERS:
+            index += 2
+            continue
+        segment_length = (data[index + 2] << 8) | data[index + 3]
+        if marker in _SOF_MARKERS:
+            if index + 9 > length:
+                return None
+            height = (data[index + 5] << 8) | data[index + 6]
+            width = (data[index + 7] << 8) | data[index + 8]
+            if width <= 0 or height <= 0:
+                return None
+            return width, height
+        if marker == 0xDA or segment_length < 2:
+            # Start of scan reached without a SOF segment
+            return None
+        index += 2 + segment_length
+    return None
+
+
+def as_encoded_jpeg_frame(frame: object, sequence: int, timestamp: float) -> Optional[EncodedFrame]:
+    """
+    Interpret a ``VideoCapture.read()`` result as raw MJPEG data.
+
+    Returns None when the backend delivered a decoded image instead (e.g. it
+    ignored ``CAP_PROP_CONVERT_RGB``), so callers can fall back to the BGR path.
+    """
+    if not isinstance(frame, np.ndarray) or frame.dtype != np.uint8 or frame.size < 4:
+        return None
+    if frame.ndim == 2 and frame.shape[0] != 1:
+        return None
+    if frame.ndim > 2:
+        return None
+    data = frame.tobytes()
+    dimensions = read_jpeg_dimensions(data)
+    if dimensions is None:
+        return None
+    width, height = dimensions
+    return EncodedFrame(data=data, sequence=sequence, width=width, height=height, timestamp=timestamp)
+
+
+def choose_reduction(source_width: int, target_width: int) -> int:
+    """Largest libjpeg reduction (8/4/2/1) that still keeps at least ``target_width`` pixels."""
+    source_width = max(1, int(source_width))
+    target_width = max(1, int(target_width))
+    for reduction, _flag in _REDUCED_GRAYSCALE_FLAGS:
+        if source_width // reduction >= target_width:
+            return reduction
+    return 1
+
+
+def decode_for_detection(encoded: EncodedFrame, reduction: int) -> Tuple[Optional[np.ndarray], float]:
+    """
+    Decode a grayscale image for motion detection using libjpeg's DCT scaling.
+
+    Returns ``(gray, scale)`` where ``scale`` maps full-resolution coordinates to
+    the decoded image (``0.25`` for a 1/4 decode).
+    """
+    flag = cv2.IMREAD_GRAYSCALE
+    for candidate, reduced_flag in _REDUCED_GRAYSCALE_FLAGS:
+        if candidate == reduction:
+            flag = reduced_flag
+            break
+    buffer = np.frombuffer(encoded.data, dtype=np.uint8)
+    gray = cv2.imdecode(buffer, flag)
+    if gray is None or gray.size == 0:
+        return None, 1.0
+    scale = gray.shape[1] / float(encoded.width) if encoded.width > 0 else 1.0
+    return gray, scale
+
+
+def decode_full(encoded: EncodedFrame) -> Optional[np.ndarray]:
+    """Decode the frame to a full-resolution BGR image."""
+    buffer = np.frombuffer(encoded.data, dtype=np.uint8)
+    image = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+    if image is None or image.size == 0:
+        return None
+    return image
+
+
+def decode_for_preview(encoded: EncodedFrame, target_width: int) -> Optional[np.ndarray]:
+    """
+    Decode a BGR image ``target_width`` pixels wide for a smaller preview rung.
+
+    libjpeg decodes at the largest 1/2, 1/4 or 1/8 scale that still covers the
+    target width; only the remaining difference is resized.
+    """
+    reduction = choose_reduction(encoded.width, target_width)
+    flag = cv2.IMREAD_COLOR
+    for candidate, reduced_flag in _REDUCED_COLOR_FLAGS:
+        if candidate == reduction:
+            flag = reduced_flag
+            break
+    image = cv2.imdecode(np.frombuffer(encoded.data, dtype=np.uint8), flag)
+    if image is None or image.size == 0:
+        return None
+    height, width = image.shape[:2]
+    if width > target_width:
+        target_height = max(1, int(height * target_width / float(width)))
+        image = cv2.resize(image, (int(target_width), target_height), interpolation=cv2.INTER_AREA)
+    return image
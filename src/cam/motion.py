@@ -5,18 +5,45 @@ Dieses Modul implementiert eine minimalistische Bewegungserkennung mit OpenCV
 für das Webcam-Überwachungssystem. Es bietet die grundlegenden Features:
 - Bewegungserkennung mit konfigurierbarer Sensitivität
 - ROI (Region of Interest) Support
+- Benannte Zonen mit eigener Sensitivität (ein Durchlauf für alle Zonen)
+- Austauschbare Hintergrundmodelle (MOG2, Running Average), siehe ``engines``
+- Static-Scene-Gate: unveränderte Frames überspringen die volle Pipeline
+- Optional Coarse-to-fine: Grob-Erkennung, Bestätigung von Grenzfällen in hoher Auflösung
+- Optional Aktivitäts-Heatmap aus der Vordergrundmaske (siehe ``heatmap``)
 - Integration mit Alert-System
 
 """
 
 import cv2
+import math
 import numpy as np
 import time
 import logging
-from dataclasses import dataclass
-from typing import Optional, Tuple, Dict, Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional, Tuple, Dict, Any, List
+
+from ..config import MotionDetectionConfig, MotionZone, ROI, get_logger
+from .engines import DEFAULT_ENGINE, DetectorEngine, create_detector_engine
+
+if TYPE_CHECKING:
+    from .heatmap import ActivityHeatmap
+    from .latency import LatencyRecorder
+
+# Kleinste Ausschnittsgröße, die noch sinnvoll analysiert wird
+_MIN_REGION_SIZE = 10
+# Anzahl gecachter Masken-Pläne (Framegröße x Skalierung x ROI/Zonen-Stand)
+_MAX_REGION_PLANS = 4
+# Breite des Graustufen-Thumbnails für den Static-Scene-Gate
+_GATE_THUMBNAIL_WIDTH = 64
+
+
+@dataclass
+class ZoneMotionResult:
+    """Ergebnis einer benannten Zone; ``contour_area`` zählt nur Pixel innerhalb der Zone."""
+    name: str
+    motion_detected: bool
+    contour_area: float
 
-from ..config import MotionDetectionConfig, ROI, get_logger
 
 @dataclass
 class MotionResult:
@@ -28,11 +55,59 @@ class MotionResult:
         contour_area: Größe der erkannten Bewegung in Pixeln
         timestamp: Zeitstempel der Erkennung
         roi_used: True wenn ROI verwendet wurde
+        zones: Ergebnis je konfigurierter Zone (leer ohne Zonen)
     """
     motion_detected: bool
     contour_area: float
     timestamp: float
     roi_used: bool = False
+    zones: Dict[str, ZoneMotionResult] = field(default_factory=dict)
+
+
+class _RegionPlan:
+    """
+    Vorberechneter Analyse-Ausschnitt: Bounding-Box aus ROI und Zonen, Maske für
+    Polygone und je Zone die Pixelmaske. Gilt für eine Framegröße und einen ROI/Zonen-Stand.
+    """
+
+    __slots__ = ("x", "y", "width", "height", "cropped", "mask", "zone_masks", "_zone_indices")
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        *,
+        cropped: bool,
+        mask: Optional[np.ndarray] = None,
+        zone_masks: Optional[List[np.ndarray]] = None,
+    ) -> None:
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.cropped = cropped
+        self.mask = mask
+        self.zone_masks = zone_masks or []
+        self._zone_indices: Dict[Tuple[int, int], List[np.ndarray]] = {}
+
+    def crop(self, frame: np.ndarray) -> np.ndarray:
+        if not self.cropped:
+            return frame
+        return frame[self.y:self.y + self.height, self.x:self.x + self.width]
+
+    def zone_indices(self, shape: Tuple[int, int]) -> List[np.ndarray]:
+        """Flache Pixelindizes jeder Zone in der (ggf. verkleinerten) Verarbeitungsauflösung."""
+        indices = self._zone_indices.get(shape)
+        if indices is None:
+            indices = []
+            for zone_mask in self.zone_masks:
+                if zone_mask.shape != shape:
+                    zone_mask = cv2.resize(zone_mask, (shape[1], shape[0]), interpolation=cv2.INTER_NEAREST)
+                indices.append(np.flatnonzero(zone_mask))
+            self._zone_indices[shape] = indices
+        return indices
 
 
 class MotionDetector:
@@ -40,7 +115,7 @@ class MotionDetector:
     Einfache Bewegungserkennung mit OpenCV Background Subtraction.
     
     Features:
-    - MOG2 Background Subtractor für Bewegungserkennung
+    - Hintergrundmodell per ``motion_detection.engine`` (Standard: MOG2)
     - Konfigurierbare Sensitivität
     - ROI (Region of Interest) Support
     - Einfache API für GUI-Integration
@@ -71,12 +146,14 @@ class MotionDetector:
         if not hasattr(config, 'background_learning_rate') or not 0.001 <= config.background_learning_rate <= 1.0:
             raise ValueError("Invalid background_learning_rate in config")
         
-        # OpenCV Background Subtractor
-        self.background_subtractor = cv2.createBackgroundSubtractorMOG2(
-            detectShadows=False,
-            varThreshold=6,
-            history=512
-        )
+        # Hintergrundmodell (Engine); unbekannte Namen fallen auf MOG2 zurück
+        self.engine_name = str(getattr(config, 'engine', DEFAULT_ENGINE) or DEFAULT_ENGINE)
+        try:
+            self.background_subtractor: DetectorEngine = create_detector_engine(self.engine_name, config)
+        except ValueError as exc:
+            self.logger.warning(f"{exc}; using {DEFAULT_ENGINE}")
+            self.engine_name = DEFAULT_ENGINE
+            self.background_subtractor = create_detector_engine(DEFAULT_ENGINE, config)
         
         # Bewegungsparameter
         self.sensitivity = config.sensitivity
@@ -90,6 +167,15 @@ class MotionDetector:
             self.logger.warning(f"ROI-Setup failed: {exc}, using fallback ROI")
             # Fallback: ROI deaktiviert
             self.roi = ROI(enabled=False, x=0, y=0, width=0, height=0)
+
+        # Benannte Zonen; Masken werden pro Framegröße und ROI/Zonen-Stand einmal berechnet
+        self.zones: List[MotionZone] = []
+        self._zones_revision = 0
+        self._region_plans: Dict[Tuple[Any, ...], _RegionPlan] = {}
+        try:
+            self.zones = config.get_zones() if hasattr(config, 'get_zones') else []
+        except (ValueError, TypeError) as exc:
+            self.logger.warning(f"Zone setup failed: {exc}, zones disabled")
         
         # Learning-Phase für Background-Model
         self.is_learning = True
@@ -106,10 +192,31 @@ class MotionDetector:
 
         # Tracking für Alert-System
         self.last_motion_time: Optional[float] = None
+
+        # Static-Scene-Gate: Thumbnail des zuletzt voll analysierten Frames als Referenz
+        self.static_gate_enabled = bool(getattr(config, 'static_gate_enabled', True))
+        self.static_gate_threshold = float(getattr(config, 'static_gate_threshold', 6.0))
+        self.static_gate_refresh_frames = max(1, int(getattr(config, 'static_gate_refresh_frames', 10)))
+        self._gate_reference: Optional[np.ndarray] = None
+        self._gate_plan: Optional[_RegionPlan] = None
+        self._gate_streak = 0
+        self._gate_last_foreground = False
+        self._gate_stats = {"checked": 0, "skipped": 0, "refreshes": 0}
+
+        # Coarse-to-fine (coarse_width 0 = aus): Referenz ist der letzte ruhige Frame in voller Auflösung
+        self.coarse_width = max(0, int(getattr(config, 'coarse_width', 0) or 0))
+        self.coarse_confirm_margin = float(getattr(config, 'coarse_confirm_margin', 1.0))
+        self._coarse_reference: Optional[np.ndarray] = None
+        self._coarse_stats = {"frames": 0, "candidates": 0, "confirmed": 0, "rejected": 0}
+
+        # Optional: Stage-Latenzen (motion.roi, motion.background, ...), von der Kamera gesetzt
+        self.latency: Optional['LatencyRecorder'] = None
+        # Optional: Aktivitäts-Heatmap der Session (motion_detection.heatmap_width), von der Kamera gesetzt
+        self.heatmap: Optional['ActivityHeatmap'] = None
         if self.roi.enabled:
-            self.logger.info(f"MotionDetector initialized - Sensitivity: {self.sensitivity}, ROI enabled: {self.roi.x}, {self.roi.y}, {self.roi.width}, {self.roi.height}")
+            self.logger.info(f"MotionDetector initialized - Engine: {self.engine_name}, Sensitivity: {self.sensitivity}, ROI enabled: {self.roi.x}, {self.roi.y}, {self.roi.width}, {self.roi.height}")
         else:
-            self.logger.info(f"MotionDetector initialized - Sensitivity: {self.sensitivity}, ROI disabled or using fallback")
+            self.logger.info(f"MotionDetector initialized - Engine: {self.engine_name}, Sensitivity: {self.sensitivity}, ROI disabled or using fallback")
 
     # -----------------------------
     # Public ROI utility functions
@@ -211,26 +318,62 @@ class MotionDetector:
             # Weiter mit geclamptem Wert - KEIN return False mehr
         
         self.sensitivity = new_sensitivity
-        # Sensitivität beeinflusst minimale Konturgröße
-        scale = 20.0                      # 20-fach Spielraum
-        self.min_contour_area = int(
-            self.config.min_contour_area * (1 + (scale - 1) * (1 - new_sensitivity))
-        )
+        self.min_contour_area = self._min_area_for_sensitivity(new_sensitivity)
 
         self.logger.info(f"Sensitivity changed to {new_sensitivity}")
         return True  # Immer True wenn die Änderung angewendet wurde
     
+    def _min_area_for_sensitivity(self, sensitivity: float) -> int:
+        """Sensitivität beeinflusst minimale Konturgröße (20-fach Spielraum)."""
+        scale = 20.0
+        return int(self.config.min_contour_area * (1 + (scale - 1) * (1 - sensitivity)))
+
+    def set_zones(self, zones: List[MotionZone]) -> None:
+        """Ersetzt die Zonen zur Laufzeit; Masken werden beim nächsten Frame neu berechnet."""
+        self.zones = list(zones)
+        self._zones_revision += 1
+        self._region_plans.clear()
+        self.logger.info(f"Motion zones updated: {[zone.name for zone in self.zones]}")
+
+    def set_engine(self, name: str) -> bool:
+        """
+        Wechselt das Hintergrundmodell zur Laufzeit (startet die Lernphase neu).
+
+        Returns:
+            False bei unbekanntem Engine-Namen (aktuelle Engine bleibt aktiv)
+        """
+        try:
+            engine = create_detector_engine(name, self.config)
+        except ValueError as exc:
+            self.logger.warning(str(exc))
+            return False
+        self.background_subtractor = engine
+        self.engine_name = engine.name
+        self.is_learning = True
+        self.learning_frame_count = 0
+        self.logger.info(f"Detector engine changed to {engine.name}")
+        return True
+
     def reset_background_model(self) -> None:
         """Setzt das Background-Model zurück (z.B. bei Lichtwechsel)."""
         self.background_subtractor.clear()
         self.is_learning = True
         self.learning_frame_count = 0
+        self._gate_reference = None
+        self._coarse_reference = None
         self.logger.info("Background model reset")
 
     def get_last_motion_time(self) -> Optional[float]:
         """Gibt Zeitstempel der letzten Bewegung zurück (für Alert-System)."""
         return self.last_motion_time
     
+    def _mark_stage(self, stage: str, started: float) -> float:
+        """Record the time since ``started`` for ``stage``; returns the start of the next stage."""
+        latency = self.latency
+        if latency is None:
+            return started
+        return latency.record_since(stage, started)
+
     def _get_working_array(
         self,
         shape: Tuple[int, int],
@@ -261,12 +404,15 @@ class MotionDetector:
             array.fill(0)
         return array
     
-    def detect_motion(self, frame: np.ndarray) -> MotionResult:
+    def detect_motion(self, frame: np.ndarray, *, frame_scale: float = 1.0) -> MotionResult:
         """
         Erkennt Bewegung in einem Frame.
         
         Args:
             frame: Eingabe-Frame (BGR oder Graustufen)
+            frame_scale: Verhältnis zwischen ``frame`` und der Kameraauflösung, z.B. 0.25
+                für einen reduziert dekodierten MJPEG-Frame. ROI und ``min_contour_area``
+                beziehen sich weiterhin auf die volle Auflösung.
             
         Returns:
             MotionResult mit Bewegungsinformationen
@@ -281,52 +427,72 @@ class MotionDetector:
         if len(frame.shape) < 2 or frame.shape[0] < 10 or frame.shape[1] < 10:
             self.logger.warning("received Frame too small for processing")
             return MotionResult(False, 0.0, timestamp, False)
+
+        frame_scale = float(frame_scale) if frame_scale and frame_scale > 0 else 1.0
+        stage_started = time.perf_counter()
         
         try:
-            # Apply ROI on the original frame before expensive grayscale conversion.
-            roi_used = False
-            roi_frame = self._apply_roi(frame)
-            if roi_frame is not frame:
-                roi_used = True
-
-            # Validate final ROI frame size
-            if roi_frame.shape[0] < 10 or roi_frame.shape[1] < 10:
-                self.logger.warning("ROI too small for processing, using full frame")
-                roi_frame = frame
-                roi_used = False
-
-            if len(roi_frame.shape) == 3:
-                gray_frame = self._get_working_array(roi_frame.shape[:2], np.uint8, zero_fill=False)
-                cv2.cvtColor(roi_frame, cv2.COLOR_BGR2GRAY, dst=gray_frame)
+            # Apply ROI/zones on the original frame before expensive grayscale conversion.
+            plan = self._get_region_plan(frame.shape[0], frame.shape[1], frame_scale)
+            roi_frame = self._apply_region_plan(frame, plan)
+            roi_used = plan.cropped
+            stage_started = self._mark_stage("motion.roi", stage_started)
+
+            if self.static_gate_enabled:
+                scene_static = self._check_static_gate(roi_frame, plan)
+                stage_started = self._mark_stage("motion.gate", stage_started)
+                if scene_static:
+                    return MotionResult(
+                        motion_detected=False,
+                        contour_area=0.0,
+                        timestamp=timestamp,
+                        roi_used=roi_used,
+                        zones={
+                            zone.name: ZoneMotionResult(zone.name, False, 0.0)
+                            for zone in (self.zones if plan.zone_masks else [])
+                        },
+                    )
+
+            # Coarse-to-fine: Erkennung auf sehr kleiner Auflösung, Bestätigung nur bei Grenzfällen
+            coarse_width = self._get_coarse_width(roi_frame.shape[1])
+            if coarse_width:
+                processing_frame, scale_factor = self._make_coarse_frame(roi_frame, coarse_width)
             else:
-                gray_frame = roi_frame.copy()
-
-            # --- Downscaling Optimization ---
-            # Process on a smaller frame if the ROI is large (e.g. > 640px width)
-            # This significantly reduces CPU usage on Raspberry Pi
-            target_width = max(1, int(getattr(self.config, 'processing_max_width', 640) or 640))
-            scale_factor = 1.0
-            processing_frame = gray_frame
+                if len(roi_frame.shape) == 3:
+                    gray_frame = self._get_working_array(roi_frame.shape[:2], np.uint8, zero_fill=False)
+                    cv2.cvtColor(roi_frame, cv2.COLOR_BGR2GRAY, dst=gray_frame)
+                else:
+                    gray_frame = roi_frame.copy()
+                stage_started = self._mark_stage("motion.gray", stage_started)
+
+                # --- Downscaling Optimization ---
+                # Process on a smaller frame if the ROI is large (e.g. > 640px width)
+                # This significantly reduces CPU usage on Raspberry Pi
+                target_width = max(1, int(getattr(self.config, 'processing_max_width', 640) or 640))
+                scale_factor = 1.0
+                processing_frame = gray_frame
             
-            # Guard against division by zero
-            roi_width = gray_frame.shape[1]
-            if roi_width > target_width and roi_width > 0:
-                scale_factor = target_width / roi_width
-                # Keep aspect ratio
-                new_width = target_width
-                new_height = max(1, int(gray_frame.shape[0] * scale_factor))  # Ensure >= 1
+                # Guard against division by zero
+                roi_width = gray_frame.shape[1]
+                if roi_width > target_width and roi_width > 0:
+                    scale_factor = target_width / roi_width
+                    # Keep aspect ratio
+                    new_width = target_width
+                    new_height = max(1, int(gray_frame.shape[0] * scale_factor))  # Ensure >= 1
                 
-                # Zusätzliche Sicherheitsprüfung
-                if new_width < 1 or new_height < 1:
-                    self.logger.warning(f"Invalid scaled dimensions: {new_width}x{new_height}, using original")
-                    processing_frame = gray_frame
-                    scale_factor = 1.0
-                else:
-                    processing_frame = cv2.resize(gray_frame, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
+                    # Zusätzliche Sicherheitsprüfung
+                    if new_width < 1 or new_height < 1:
+                        self.logger.warning(f"Invalid scaled dimensions: {new_width}x{new_height}, using original")
+                        processing_frame = gray_frame
+                        scale_factor = 1.0
+                    else:
+                        processing_frame = cv2.resize(gray_frame, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
+            stage_started = self._mark_stage("motion.resize", stage_started)
             
             # Adjust min_contour_area for the scaled frame
             # Area scales with square of linear scale
-            effective_min_area = self.min_contour_area * (scale_factor * scale_factor)
+            total_scale = scale_factor * frame_scale
+            effective_min_area = self.min_contour_area * (total_scale * total_scale)
 
             # Adaptive Gaussian blur kernel size (based on processing frame)
             kernel_size = min(5, processing_frame.shape[0]//3, processing_frame.shape[1]//3)
@@ -334,7 +500,12 @@ class MotionDetector:
             if kernel_size % 2 == 0:
                 kernel_size += 1  # Ensure odd number
 
-            blurred = cv2.GaussianBlur(processing_frame, (kernel_size, kernel_size), 0)
+            if coarse_width:
+                # INTER_AREA hat bereits geglättet; Blur würde kleine Objekte nur aufblähen
+                blurred = processing_frame
+            else:
+                blurred = cv2.GaussianBlur(processing_frame, (kernel_size, kernel_size), 0)
+            stage_started = self._mark_stage("motion.blur", stage_started)
 
             # Learning-Phase verwalten
             if self.is_learning:
@@ -343,19 +514,34 @@ class MotionDetector:
                     self.is_learning = False
                     self.logger.info("Background learning completed")
 
-            # Background Subtraction
+            # Background Subtraction (binäre Maske 0/255 von der Engine)
             learning_rate = self.learning_rate if self.is_learning else (self.learning_rate * 0.1)
             fg_mask = self.background_subtractor.apply(blurred, learningRate=learning_rate)
-            
-            # Schatten entfernen
-            _, fg_mask = cv2.threshold(fg_mask, 200, 255, cv2.THRESH_BINARY)
+            stage_started = self._mark_stage("motion.background", stage_started)
             
             # Morphological Operations für Rauschunterdrückung
-            fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, self.noise_kernel)
-            fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_CLOSE, self.cleanup_kernel)
+            # (nicht in der Grob-Stufe: dort sind kleine Objekte nur 1-2 Pixel groß)
+            if not coarse_width:
+                fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, self.noise_kernel)
+                fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_CLOSE, self.cleanup_kernel)
+            stage_started = self._mark_stage("motion.morphology", stage_started)
+
+            if self.heatmap is not None and not self.is_learning:
+                frame_h, frame_w = frame.shape[:2]
+                self.heatmap.add(
+                    fg_mask,
+                    (plan.x / frame_w, plan.y / frame_h, plan.width / frame_w, plan.height / frame_h),
+                    (frame_w, frame_h),
+                )
+                stage_started = self._mark_stage("motion.heatmap", stage_started)
             
             # Verbundene Komponenten finden
             num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(fg_mask)
+            if coarse_width:
+                stats = self._confirm_coarse_candidates(
+                    roi_frame, stats, num_labels, scale_factor, frame_scale, effective_min_area
+                )
+                stage_started = self._mark_stage("motion.confirm", stage_started)
 
             # Gesamtfläche berechnen basierend auf Komponentenstats
             total_area_scaled = 0.0
@@ -364,22 +550,33 @@ class MotionDetector:
                 # Filter with scaled threshold
                 valid_areas = areas[areas >= effective_min_area]
                 total_area_scaled = float(np.sum(valid_areas))
+            stage_started = self._mark_stage("motion.components", stage_started)
             
             # Scale area back to original resolution for consistency
-            total_area = total_area_scaled / (scale_factor * scale_factor)
+            total_area = total_area_scaled / (total_scale * total_scale)
             
             # Bewegungsentscheidung
             motion_detected = not self.is_learning and total_area > 0
+
+            zone_results: Dict[str, ZoneMotionResult] = {}
+            if plan.zone_masks:
+                zone_results = self._evaluate_zones(plan, labels, stats, num_labels, total_scale)
+                # Mit Zonen entscheidet jede Zone mit ihrer eigenen Sensitivität
+                motion_detected = any(zone.motion_detected for zone in zone_results.values())
+                self._mark_stage("motion.zones", stage_started)
             
             # Zeitstempel der letzten Bewegung aktualisieren
             if motion_detected:
                 self.last_motion_time = timestamp
+            # Solange noch Vordergrund da ist, darf der Gate nicht abkürzen
+            self._gate_last_foreground = total_area_scaled > 0
             
             return MotionResult(
                 motion_detected=motion_detected,
                 contour_area=total_area,
                 timestamp=timestamp,
-                roi_used=roi_used
+                roi_used=roi_used,
+                zones=zone_results,
             )
         
         except cv2.error as exc:
@@ -389,79 +586,358 @@ class MotionDetector:
             self.logger.error(f"Unexpected error detecting motion: {exc}")
             return MotionResult(False, 0.0, timestamp, False)
 
-    def _apply_roi(self, gray_frame: np.ndarray) -> np.ndarray:
+    def _check_static_gate(self, roi_frame: np.ndarray, plan: _RegionPlan) -> bool:
+        """
+        True if ``roi_frame`` may skip blur/background/morphology/components.
+
+        Compares a small grayscale thumbnail with the one of the last fully
+        analysed frame (max. absolute difference, so a small object is not
+        averaged away). Never skips while learning, while the last analysis
+        still saw foreground, or after ``static_gate_refresh_frames`` skips in
+        a row, which keeps the background model fed at a reduced rate.
+        """
+        height, width = roi_frame.shape[:2]
+        if width > _GATE_THUMBNAIL_WIDTH:
+            thumb_size = (_GATE_THUMBNAIL_WIDTH, max(1, int(round(height * _GATE_THUMBNAIL_WIDTH / width))))
+            thumbnail = cv2.resize(roi_frame, thumb_size, interpolation=cv2.INTER_AREA)
+        else:
+            thumbnail = roi_frame
+        if thumbnail.ndim == 3:
+            thumbnail = cv2.cvtColor(thumbnail, cv2.COLOR_BGR2GRAY)
+        elif thumbnail is roi_frame:
+            thumbnail = thumbnail.copy()
+
+        stats = self._gate_stats
+        stats["checked"] += 1
+        reference = self._gate_reference
+        comparable = (
+            not self.is_learning
+            and not self._gate_last_foreground
+            and reference is not None
+            and self._gate_plan is plan
+            and reference.shape == thumbnail.shape
+        )
+        if comparable and reference is not None and self._gate_streak < self.static_gate_refresh_frames:
+            if float(cv2.absdiff(thumbnail, reference).max()) <= self.static_gate_threshold:
+                self._gate_streak += 1
+                stats["skipped"] += 1
+                return True
+        elif comparable:
+            stats["refreshes"] += 1
+
+        self._gate_reference = thumbnail
+        self._gate_plan = plan
+        self._gate_streak = 0
+        return False
+
+    def get_static_gate_stats(self) -> Dict[str, Any]:
+        """Hit rate of the static-scene gate (share of checked frames that skipped the pipeline)."""
+        stats: Dict[str, Any] = dict(self._gate_stats)
+        checked = stats["checked"]
+        stats.update(
+            enabled=self.static_gate_enabled,
+            threshold=self.static_gate_threshold,
+            refresh_frames=self.static_gate_refresh_frames,
+            hit_rate=round(stats["skipped"] / checked, 4) if checked else None,
+        )
+        return stats
+
+    def _get_coarse_width(self, roi_width: int) -> int:
+        """Coarse processing width, or 0 when the two-level mode does not apply to this region."""
+        coarse_width = getattr(self, 'coarse_width', 0)
+        target_width = max(1, int(getattr(self.config, 'processing_max_width', 640) or 640))
+        if coarse_width <= 0 or roi_width <= coarse_width or coarse_width >= target_width:
+            return 0
+        return coarse_width
+
+    def _make_coarse_frame(self, roi_frame: np.ndarray, coarse_width: int) -> Tuple[np.ndarray, float]:
+        # Farbbild zuerst verkleinern, Graustufen dann nur noch auf wenigen Pixeln
+        scale_factor = coarse_width / roi_frame.shape[1]
+        size = (coarse_width, max(1, int(round(roi_frame.shape[0] * scale_factor))))
+        coarse = cv2.resize(roi_frame, size, interpolation=cv2.INTER_AREA)
+        if coarse.ndim == 3:
+            coarse = cv2.cvtColor(coarse, cv2.COLOR_BGR2GRAY)
+        return coarse, scale_factor
+
+    def _confirm_coarse_candidates(
+        self,
+        roi_frame: np.ndarray,
+        stats: np.ndarray,
+        num_labels: int,
+        scale_factor: float,
+        frame_scale: float,
+        effective_min_area: float,
+    ) -> np.ndarray:
+        """
+        Settle coarse components near the area threshold at high resolution.
+
+        Components clearly above ``effective_min_area * (1 + margin)`` count as
+        they are, those below ``/ (1 + margin)`` are dropped. Components in
+        between are re-measured as difference against the last quiet frame
+        inside their bounding box, at ``processing_max_width`` resolution; the
+        returned stats carry the confirmed area (in coarse pixels) or 0.
+        """
+        counters = self._coarse_stats
+        counters["frames"] += 1
+        margin = max(0.0, self.coarse_confirm_margin)
+        lower = effective_min_area / (1.0 + margin)
+        upper = effective_min_area * (1.0 + margin)
+        areas = stats[1:, cv2.CC_STAT_AREA]
+        relevant = areas >= lower
+        if not relevant.any():
+            # Ruhiger Frame: wird Referenz für spätere Bestätigungen
+            reference = self._coarse_reference
+            if reference is None or reference.shape != roi_frame.shape:
+                self._coarse_reference = roi_frame.copy()
+            else:
+                np.copyto(reference, roi_frame)
+        candidates = np.flatnonzero(relevant & (areas < upper)) + 1
+        if num_labels <= 1 or (relevant.all() and candidates.size == 0):
+            return stats
+
+        stats = stats.copy()
+        stats[1:, cv2.CC_STAT_AREA][~relevant] = 0
+        reference = self._coarse_reference
+        if candidates.size == 0 or reference is None or reference.shape != roi_frame.shape:
+            # Ohne Referenz entscheidet die Grob-Fläche allein (wie einstufig)
+            return stats
+
+        frame_h, frame_w = roi_frame.shape[:2]
+        target_width = max(1, int(getattr(self.config, 'processing_max_width', 640) or 640))
+        fine_scale = min(1.0, target_width / frame_w)
+        fine_total = fine_scale * frame_scale
+        coarse_total = scale_factor * frame_scale
+        fine_min_area = self.min_contour_area * fine_total * fine_total
+        pad = 2  # Grob-Pixel Rand um die Bounding-Box
+        for label in candidates:
+            x, y, w, h = (int(value) for value in stats[label, :4])
+            x0 = max(0, int((x - pad) / scale_factor))
+            y0 = max(0, int((y - pad) / scale_factor))
+            x1 = min(frame_w, int(math.ceil((x + w + pad) / scale_factor)))
+            y1 = min(frame_h, int(math.ceil((y + h + pad) / scale_factor)))
+            fine_area = self._measure_fine_difference(
+                roi_frame[y0:y1, x0:x1], reference[y0:y1, x0:x1], fine_scale, fine_min_area
+            )
+            counters["candidates"] += 1
+            if fine_area > 0:
+                counters["confirmed"] += 1
+                full_area = fine_area / (fine_total * fine_total)
+                stats[label, cv2.CC_STAT_AREA] = max(
+                    int(math.ceil(effective_min_area)), int(round(full_area * coarse_total * coarse_total))
+                )
+            else:
+                counters["rejected"] += 1
+                stats[label, cv2.CC_STAT_AREA] = 0
+        return stats
+
+    def _measure_fine_difference(
+        self,
+        current: np.ndarray,
+        reference: np.ndarray,
+        fine_scale: float,
+        min_area: float,
+    ) -> float:
+        """Changed area (processing pixels) between two crops of the same region."""
+        if current.ndim == 3:
+            current = cv2.cvtColor(current, cv2.COLOR_BGR2GRAY)
+            reference = cv2.cvtColor(reference, cv2.COLOR_BGR2GRAY)
+        if fine_scale < 1.0:
+            size = (
+                max(1, int(round(current.shape[1] * fine_scale))),
+                max(1, int(round(current.shape[0] * fine_scale))),
+            )
+            current = cv2.resize(current, size, interpolation=cv2.INTER_AREA)
+            reference = cv2.resize(reference, size, interpolation=cv2.INTER_AREA)
+        if current.shape[0] < 3 or current.shape[1] < 3:
+            return 0.0
+        difference = cv2.absdiff(cv2.GaussianBlur(current, (3, 3), 0), cv2.GaussianBlur(reference, (3, 3), 0))
+        threshold = float(getattr(self.config, 'difference_threshold', 25))
+        _, mask = cv2.threshold(difference, threshold, 255, cv2.THRESH_BINARY)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self.noise_kernel)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self.cleanup_kernel)
+        num_labels, _, stats, _ = cv2.connectedComponentsWithStats(mask)
+        if num_labels <= 1:
+            return 0.0
+        areas = stats[1:, cv2.CC_STAT_AREA]
+        return float(np.sum(areas[areas >= min_area]))
+
+    def get_coarse_stats(self) -> Dict[str, Any]:
+        """Counters of the coarse-to-fine mode (candidates sent to and settled by the fine pass)."""
+        stats = dict(self._coarse_stats)
+        stats.update(enabled=self.coarse_width > 0, coarse_width=self.coarse_width)
+        return stats
+
+    def _evaluate_zones(
+        self,
+        plan: _RegionPlan,
+        labels: np.ndarray,
+        stats: np.ndarray,
+        num_labels: int,
+        total_scale: float,
+    ) -> Dict[str, ZoneMotionResult]:
+        """Per-zone area from the shared component labels: in-zone pixels of components above the zone's threshold."""
+        areas = stats[:, cv2.CC_STAT_AREA]
+        flat_labels = labels.ravel()
+        area_scale = total_scale * total_scale
+        results: Dict[str, ZoneMotionResult] = {}
+        for zone, indices in zip(self.zones, plan.zone_indices(labels.shape[:2])):
+            if zone.sensitivity is None:
+                min_area = self.min_contour_area
+            else:
+                min_area = self._min_area_for_sensitivity(zone.sensitivity)
+            zone_area = 0.0
+            if num_labels > 1 and indices.size:
+                in_zone = np.bincount(flat_labels[indices], minlength=num_labels)
+                in_zone[0] = 0
+                zone_area = float(np.sum(in_zone[areas >= min_area * area_scale])) / area_scale
+            results[zone.name] = ZoneMotionResult(
+                name=zone.name,
+                motion_detected=not self.is_learning and zone_area > 0,
+                contour_area=zone_area,
+            )
+        return results
+
+    def get_processing_width(self, frame_width: int, frame_height: int) -> int:
+        """Width of the region detect_motion analyses for a full-resolution frame."""
+        return int(self._get_region_plan(int(frame_height), int(frame_width), 1.0).width)
+
+    def _region_key(self, frame_h: int, frame_w: int, frame_scale: float) -> Tuple[Any, ...]:
+        roi_key = None
+        roi = self.roi
+        if getattr(roi, 'enabled', False):
+            # Werte statt Identität: die GUI ändert self.roi auch in-place
+            points = tuple(tuple(point) for point in (getattr(roi, 'points', None) or ()))
+            roi_key = (roi.x, roi.y, roi.width, roi.height, points)
+        return (frame_h, frame_w, frame_scale, roi_key, getattr(self, '_zones_revision', 0))
+
+    def _get_region_plan(self, frame_h: int, frame_w: int, frame_scale: float = 1.0) -> _RegionPlan:
+        plans = getattr(self, '_region_plans', None)
+        if plans is None:
+            plans = self._region_plans = {}
+        key = self._region_key(frame_h, frame_w, frame_scale)
+        plan = plans.get(key)
+        if plan is None:
+            if len(plans) >= _MAX_REGION_PLANS:
+                plans.pop(next(iter(plans)))
+            plan = plans[key] = self._build_region_plan(frame_h, frame_w, frame_scale)
+        return plan
+
+    @staticmethod
+    def _scaled_points(points: Any, frame_scale: float) -> np.ndarray:
+        if frame_scale != 1.0:
+            return np.round(np.array(points, dtype=np.float64) * frame_scale).astype(np.int32)
+        return np.array(points, dtype=np.int32)
+
+    def _zone_polygon(self, zone: MotionZone, frame_scale: float) -> np.ndarray:
+        if zone.points and len(zone.points) >= 3:
+            return self._scaled_points(zone.points, frame_scale)
+        x2 = zone.x + max(1, zone.width) - 1
+        y2 = zone.y + max(1, zone.height) - 1
+        return self._scaled_points([[zone.x, zone.y], [x2, zone.y], [x2, y2], [zone.x, y2]], frame_scale)
+
+    def _build_region_plan(self, frame_h: int, frame_w: int, frame_scale: float) -> _RegionPlan:
+        """
+        Builds crop box and masks once per frame size and ROI/zone state.
+
+        The analysed box is the ROI bounding box, or with zones the union of the
+        zone boxes (clipped to the ROI), so all zones share one background pass.
         """
-        Applies ROI to frame with safe bounds checking.
+        full = _RegionPlan(0, 0, frame_w, frame_h, cropped=False)
+        roi_polygon: Optional[np.ndarray] = None
+        box: Optional[Tuple[int, int, int, int]] = None
+        roi_enabled = bool(getattr(self.roi, 'enabled', False))
+        try:
+            if roi_enabled:
+                if getattr(self.roi, 'points', None) and len(self.roi.points) >= 3:
+                    roi_polygon = self._scaled_points(self.roi.points, frame_scale)
+                    bx, by, bw, bh = cv2.boundingRect(roi_polygon)
+                    box = (bx, by, bw, bh)
+                else:
+                    rx, ry, rw, rh = self.roi.x, self.roi.y, self.roi.width, self.roi.height
+                    if frame_scale != 1.0:
+                        rx, ry = int(round(rx * frame_scale)), int(round(ry * frame_scale))
+                        rw, rh = max(1, int(round(rw * frame_scale))), max(1, int(round(rh * frame_scale)))
+                    box = MotionDetector.normalize_roi(rx, ry, rw, rh, frame_w, frame_h, min_size=1)
+
+            zone_polygons = [self._zone_polygon(zone, frame_scale) for zone in getattr(self, 'zones', [])]
+            if zone_polygons:
+                zone_boxes = [cv2.boundingRect(polygon) for polygon in zone_polygons]
+                zx = min(b[0] for b in zone_boxes)
+                zy = min(b[1] for b in zone_boxes)
+                zx2 = max(b[0] + b[2] for b in zone_boxes)
+                zy2 = max(b[1] + b[3] for b in zone_boxes)
+                if box is not None:
+                    zx, zy = max(zx, box[0]), max(zy, box[1])
+                    zx2, zy2 = min(zx2, box[0] + box[2]), min(zy2, box[1] + box[3])
+                box = (zx, zy, zx2 - zx, zy2 - zy)
+
+            if box is None:
+                return full
+
+            # Clamp bounding box to frame
+            x = max(0, min(int(box[0]), frame_w - 1))
+            y = max(0, min(int(box[1]), frame_h - 1))
+            width = min(int(box[0]) + int(box[2]), frame_w) - x
+            height = min(int(box[1]) + int(box[3]), frame_h) - y
+            cropped = True
+            if width < _MIN_REGION_SIZE or height < _MIN_REGION_SIZE:
+                self.logger.warning("ROI too small for processing, using full frame")
+                x, y, width, height = 0, 0, frame_w, frame_h
+                roi_polygon = None
+                cropped = False
+                if not zone_polygons:
+                    return full
+
+            offset = np.array([x, y], dtype=np.int32)
+            mask: Optional[np.ndarray] = None
+            if roi_polygon is not None:
+                mask = np.zeros((height, width), dtype=np.uint8)
+                cv2.fillPoly(mask, [roi_polygon - offset], 255)
+            zone_masks: List[np.ndarray] = []
+            if zone_polygons:
+                union = np.zeros((height, width), dtype=np.uint8)
+                for polygon in zone_polygons:
+                    zone_mask = np.zeros((height, width), dtype=np.uint8)
+                    cv2.fillPoly(zone_mask, [polygon - offset], 255)
+                    if mask is not None:
+                        cv2.bitwise_and(zone_mask, mask, dst=zone_mask)
+                    cv2.bitwise_or(union, zone_mask, dst=union)
+                    zone_masks.append(zone_mask)
+                mask = union
+            return _RegionPlan(x, y, width, height, cropped=cropped, mask=mask, zone_masks=zone_masks)
+        except Exception as e:
+            self.logger.error(f"Error building ROI/zone masks: {e}")
+            return full
+
+    def _apply_region_plan(self, frame: np.ndarray, plan: _RegionPlan) -> np.ndarray:
+        cropped = plan.crop(frame)
+        if plan.mask is None:
+            return cropped
+        # Ausgabe in wiederverwendeten Puffer; bitwise_and mit 0/255 schreibt jedes Pixel neu
+        masked = self._get_working_array(cropped.shape, cropped.dtype, zero_fill=False)
+        mask = plan.mask if cropped.ndim == 2 else plan.mask[:, :, None]
+        np.bitwise_and(cropped, mask, out=masked)
+        return masked
+
+    def _apply_roi(self, gray_frame: np.ndarray, *, frame_scale: float = 1.0) -> np.ndarray:
+        """
+        Applies ROI (and zone union) to frame using the cached region plan.
         
         Args:
-            gray_frame: Input grayscale frame
+            gray_frame: Input frame
+            frame_scale: Scale of ``gray_frame`` relative to the ROI coordinates
             
         Returns:
-            ROI frame or original frame if ROI invalid
+            Cropped/masked frame or original frame if no ROI applies
         """
-        if not (hasattr(self.roi, 'enabled') and self.roi.enabled):
-            return gray_frame
-        
-        h, w = gray_frame.shape[:2]
-
-        # --- Polygon ROI Support ---
-        if hasattr(self.roi, 'points') and self.roi.points and len(self.roi.points) >= 3:
-            try:
-                pts = np.array(self.roi.points, dtype=np.int32)
-                
-                # 1. Compute bounding box for cropping (Performance optimization)
-                x, y, w_rect, h_rect = cv2.boundingRect(pts)
-                
-                # Clamp bounding box to frame
-                x = max(0, min(x, w - 1))
-                y = max(0, min(y, h - 1))
-                w_rect = max(1, min(w_rect, w - x))
-                h_rect = max(1, min(h_rect, h - y))
-                
-                # 2. Create mask on the cropped area
-                # We create a mask of the size of the bounding rect to save memory/cpu
-                mask = np.zeros((h_rect, w_rect), dtype=np.uint8)
-                
-                # Offset points to be relative to the bounding rect
-                pts_offset = pts - np.array([x, y])
-                
-                cv2.fillPoly(mask, [pts_offset], 255)
-                
-                # 3. Crop the frame
-                cropped_frame = gray_frame[y:y+h_rect, x:x+w_rect]
-                
-                # 4. Apply mask
-                masked_frame = cv2.bitwise_and(cropped_frame, cropped_frame, mask=mask)
-                
-                return masked_frame
-                
-            except Exception as e:
-                self.logger.error(f"Error applying Polygon ROI: {e}")
-                # Fallback to full frame or rectangle if possible
-                return gray_frame
-
-        # --- Rectangle ROI Fallback ---
-        # Normalize ROI to frame bounds (min size 1 pixel)
-        nx, ny, nw, nh = MotionDetector.normalize_roi(self.roi.x, self.roi.y, self.roi.width, self.roi.height, w, h, min_size=1)
-
-        # If ROI degenerates to extremely small area, fall back handled by caller
-        if nw <= 0 or nh <= 0:
-            self.logger.warning("ROI normalization produced non-positive size; using full frame")
-            return gray_frame
-
-        x2 = nx + nw
-        y2 = ny + nh
-        # Extra safety (should be guaranteed by normalize)
-        if nx < 0 or ny < 0 or x2 > w or y2 > h or nx >= w or ny >= h:
-            self.logger.warning(f"Invalid ROI after normalization: ({nx}, {ny}) to ({x2}, {y2})")
-            return gray_frame
-
-        return gray_frame[ny:y2, nx:x2]
+        plan = self._get_region_plan(gray_frame.shape[0], gray_frame.shape[1], frame_scale)
+        return self._apply_region_plan(gray_frame, plan)
     
     def cleanup(self) -> None:
         """Clean up resources when detector is no longer needed."""
         self.background_subtractor.clear()
         self._frame_pool.clear()
+        self._region_plans.clear()
         self.logger.info("MotionDetector cleaned up")
 
 def create_motion_detector_from_config(config_path: Optional[str] = None) -> MotionDetector:
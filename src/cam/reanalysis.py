@@ -0,0 +1,400 @@
+"""
+Offline re-analysis of recorded footage.
+
+Runs :class:`~src.cam.motion.MotionDetector` over video files or image
+directories as fast as the machine allows and writes one motion timeline
+(CSV or JSON) per file and parameter set, so ``sensitivity``,
+``min_contour_area``, ROI and zones can be compared over hours of footage
+instead of watching the live feed.
+
+Work fans out over a process pool. A task is one segment of one file with one
+parameter set; video segments start ``warmup`` analysed frames early so the
+background model has settled before the first reported frame. Like the live
+capture loop only every ``frame_skip``-th frame is analysed (skipped frames are
+only grabbed, not decoded).
+
+Usage::
+
+    python -m src.cam.reanalysis recordings/*.mp4 --segments 4 \\
+        --set sensitivity=0.05 --set sensitivity=0.2,min_contour_area=800
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import dataclasses
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+import cv2
+import numpy as np
+
+from ..config import MotionDetectionConfig, load_config
+from .motion import MotionDetector
+from .sources import IMAGE_EXTENSIONS
+
+# Analysierte Frames vor jedem Segment, damit das Hintergrundmodell eingeschwungen ist
+DEFAULT_WARMUP_FRAMES = 100
+OUTPUT_FORMATS = ("csv", "json")
+
+# frame, time_s, motion, contour_area, zones (Tupel statt Objekte: billiger zu picklen)
+TimelineRow = Tuple[int, float, bool, float, Dict[str, bool]]
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+@dataclass(frozen=True)
+class SourceInfo:
+    path: str
+    kind: str
+    frame_count: int
+    fps: float
+
+
+@dataclass(frozen=True)
+class ReanalysisTask:
+    """One segment ``[start, stop)`` of one source, analysed with one parameter set."""
+
+    source: SourceInfo
+    start: int
+    stop: int
+    params: Dict[str, Any] = field(default_factory=dict)
+    label: str = "default"
+    warmup: int = DEFAULT_WARMUP_FRAMES
+
+
+@dataclass
+class ReanalysisResult:
+    source: SourceInfo
+    label: str
+    params: Dict[str, Any]
+    frame_skip: int
+    rows: List[TimelineRow] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        motion_frames = sum(1 for row in self.rows if row[2])
+        # Bewegungs-Ereignisse = Übergänge ruhig -> Bewegung
+        events = sum(1 for previous, row in zip([None, *self.rows], self.rows) if row[2] and not (previous and previous[2]))
+        return {
+            "analysed_frames": len(self.rows),
+            "motion_frames": motion_frames,
+            "motion_ratio": round(motion_frames / len(self.rows), 4) if self.rows else 0.0,
+            "motion_events": events,
+            "processing_seconds": round(self.seconds, 3),
+        }
+
+
+def parse_param_set(text: str) -> Dict[str, Any]:
+    """Parse ``"sensitivity=0.1,min_contour_area=500"`` using the types of ``MotionDetectionConfig``."""
+    known = {item.name: item for item in dataclasses.fields(MotionDetectionConfig)}
+    params: Dict[str, Any] = {}
+    for part in filter(None, (chunk.strip() for chunk in text.split(","))):
+        key, separator, raw_value = part.partition("=")
+        key = key.strip()
+        if not separator or not key:
+            raise ValueError(f"Parameter '{part}' must have the form key=value")
+        if key not in known or key in ("region_of_interest", "zones"):
+            raise ValueError(f"Unknown motion_detection parameter '{key}'")
+        params[key] = _coerce_param(key, known[key].type, raw_value.strip())
+    return params
+
+
+def _coerce_param(key: str, annotation: Any, raw_value: str) -> Any:
+    # Ohne "from __future__ import annotations" sind Feldtypen Klassen statt Strings
+    type_name = annotation if isinstance(annotation, str) else getattr(annotation, "__name__", str(annotation))
+    try:
+        if type_name == "bool":
+            if raw_value.lower() not in ("1", "0", "true", "false", "yes", "no", "on", "off"):
+                raise ValueError(raw_value)
+            return raw_value.lower() in ("1", "true", "yes", "on")
+        if type_name == "int":
+            return int(raw_value)
+        if type_name == "float":
+            return float(raw_value)
+    except ValueError as exc:
+        raise ValueError(f"Invalid value '{raw_value}' for {key} ({type_name})") from exc
+    return raw_value
+
+
+def param_label(params: Dict[str, Any]) -> str:
+    """Stable, file-name safe label for a parameter set."""
+    if not params:
+        return "default"
+    label = "_".join(f"{key}-{value}" for key, value in sorted(params.items()))
+    return re.sub(r"[^A-Za-z0-9_.-]+", "-", label)
+
+
+def build_motion_config(base: MotionDetectionConfig, params: Dict[str, Any]) -> MotionDetectionConfig:
+    config = dataclasses.replace(base, **params)
+    errors = config.validate()
+    if errors:
+        raise ValueError(f"Invalid parameter set {params}: {'; '.join(errors)}")
+    return config
+
+
+def _list_images(path: Path) -> List[Path]:
+    return sorted(entry for entry in path.iterdir() if entry.is_file() and entry.suffix.lower() in IMAGE_EXTENSIONS)
+
+
+def probe_source(path: str, *, fallback_fps: float = 30.0) -> SourceInfo:
+    """Frame count and FPS of a video file or image directory (images play at ``fallback_fps``)."""
+    source_path = Path(path)
+    if source_path.is_dir():
+        files = _list_images(source_path)
+        if not files:
+            raise RuntimeError(f"Image directory '{path}' contains no {list(IMAGE_EXTENSIONS)} files")
+        return SourceInfo(str(source_path), "images", len(files), float(fallback_fps))
+    capture = cv2.VideoCapture(str(source_path))
+    try:
+        if not capture.isOpened():
+            raise RuntimeError(f"Video file '{path}' could not be opened")
+        frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+        fps = float(capture.get(cv2.CAP_PROP_FPS) or 0.0)
+    finally:
+        capture.release()
+    if frame_count <= 0:
+        raise RuntimeError(f"Video file '{path}' reports no frame count")
+    return SourceInfo(str(source_path), "file", frame_count, fps if fps > 0 else float(fallback_fps))
+
+
+def plan_tasks(
+    sources: Sequence[SourceInfo],
+    param_sets: Sequence[Dict[str, Any]],
+    *,
+    segments: int = 1,
+    warmup: int = DEFAULT_WARMUP_FRAMES,
+) -> List[ReanalysisTask]:
+    """Split every source into ``segments`` equal ranges, crossed with every parameter set."""
+    tasks: List[ReanalysisTask] = []
+    for params in param_sets or [{}]:
+        label = param_label(params)
+        for source in sources:
+            parts = max(1, min(int(segments), source.frame_count))
+            bounds = np.linspace(0, source.frame_count, parts + 1).astype(int)
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                if stop > start:
+                    tasks.append(ReanalysisTask(source, int(start), int(stop), dict(params), label, max(0, int(warmup))))
+    return tasks
+
+
+def iter_frames(source: SourceInfo, start: int, stop: int, frame_skip: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """Decoded frames ``start <= index < stop`` with ``index % frame_skip == 0``."""
+    if source.kind == "images":
+        files = _list_images(Path(source.path))
+        size: Optional[Tuple[int, int]] = None
+        for index in range(start, min(stop, len(files))):
+            if index % frame_skip:
+                continue
+            frame = cv2.imread(os.fspath(files[index]), cv2.IMREAD_COLOR)
+            if frame is None:
+                continue
+            if size is None:
+                size = (int(frame.shape[1]), int(frame.shape[0]))
+            elif (frame.shape[1], frame.shape[0]) != size:
+                frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+            yield index, frame
+        return
+
+    capture = cv2.VideoCapture(source.path)
+    try:
+        if start > 0:
+            capture.set(cv2.CAP_PROP_POS_FRAMES, start)
+        for index in range(start, stop):
+            if index % frame_skip:
+                if not capture.grab():
+                    return
+                continue
+            ok, frame = capture.read()
+            if not ok or frame is None:
+                return
+            yield index, frame
+    finally:
+        capture.release()
+
+
+def analyze_task(task: ReanalysisTask, base_config: MotionDetectionConfig) -> ReanalysisResult:
+    """Run one task; module-level so it can be pickled into pool workers."""
+    config = build_motion_config(base_config, task.params)
+    frame_skip = max(1, int(config.frame_skip or 1))
+    detector = MotionDetector(config, logger=logging.getLogger("reanalysis"))
+    result = ReanalysisResult(task.source, task.label, dict(task.params), frame_skip)
+    first = max(0, task.start - task.warmup * frame_skip)
+    started = time.perf_counter()
+    try:
+        for index, frame in iter_frames(task.source, first, task.stop, frame_skip):
+            motion = detector.detect_motion(frame)
+            if index < task.start:
+                continue
+            result.rows.append((
+                index,
+                round(index / task.source.fps, 3),
+                bool(motion.motion_detected),
+                float(motion.contour_area),
+                {name: zone.motion_detected for name, zone in motion.zones.items()},
+            ))
+    finally:
+        detector.cleanup()
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+def _init_worker() -> None:
+    # Ein Thread pro Prozess: Parallelität kommt aus dem Pool, nicht aus OpenCV
+    cv2.setNumThreads(1)
+    logging.getLogger("reanalysis").setLevel(logging.WARNING)
+
+
+def map_in_pool(function: Callable[[_T], _R], items: Sequence[_T], *, workers: Optional[int] = None) -> List[_R]:
+    """
+    ``[function(item) for item in items]`` on a process pool, in input order.
+
+    ``function`` must be picklable (module level or ``functools.partial``); with a
+    single worker everything runs inline, which keeps tests and debugging simple.
+    """
+    worker_count = max(1, min(int(workers or os.cpu_count() or 1), len(items) or 1))
+    if worker_count == 1:
+        return [function(item) for item in items]
+    # spawn: keine geerbten OpenCV-/Logging-Threads aus dem Elternprozess
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=worker_count, mp_context=context, initializer=_init_worker) as pool:
+        return list(pool.map(function, items))
+
+
+def run_reanalysis(
+    tasks: Sequence[ReanalysisTask],
+    base_config: MotionDetectionConfig,
+    *,
+    workers: Optional[int] = None,
+) -> List[ReanalysisResult]:
+    """Analyse all tasks and merge segments into one result per (source, parameter set)."""
+    segments = map_in_pool(partial(analyze_task, base_config=base_config), tasks, workers=workers)
+
+    merged: Dict[Tuple[str, str], ReanalysisResult] = {}
+    for task, segment in zip(tasks, segments):
+        key = (task.source.path, task.label)
+        target = merged.get(key)
+        if target is None:
+            merged[key] = segment
+            continue
+        target.rows.extend(segment.rows)
+        target.seconds += segment.seconds
+    for result in merged.values():
+        result.rows.sort(key=lambda row: row[0])
+    return list(merged.values())
+
+
+def timeline_stems(sources: Sequence[SourceInfo]) -> Dict[str, str]:
+    """Output name per source path; file names that occur more than once get a short hash of their path."""
+    counts = Counter(Path(source.path).stem for source in sources)
+    stems: Dict[str, str] = {}
+    for source in sources:
+        stem = Path(source.path).stem
+        if counts[stem] > 1:
+            digest = hashlib.sha1(os.path.abspath(source.path).encode("utf-8")).hexdigest()[:8]
+            stem = f"{stem}-{digest}"
+        stems[source.path] = stem
+    return stems
+
+
+def timeline_path(output_dir: Path, result: ReanalysisResult, fmt: str, stem: Optional[str] = None) -> Path:
+    return output_dir / f"{stem or Path(result.source.path).stem}.{result.label}.motion.{fmt}"
+
+
+def write_timeline(result: ReanalysisResult, path: Path, fmt: str = "csv") -> Path:
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"Output format must be one of {list(OUTPUT_FORMATS)}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    zone_names = sorted({name for row in result.rows for name in row[4]})
+    if fmt == "csv":
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["frame", "time_s", "motion", "contour_area", *(f"zone:{name}" for name in zone_names)])
+            for index, seconds, motion, area, zones in result.rows:
+                writer.writerow([index, seconds, int(motion), round(area, 1), *(int(zones.get(name, False)) for name in zone_names)])
+        return path
+    payload = {
+        "source": result.source.path,
+        "kind": result.source.kind,
+        "fps": result.source.fps,
+        "frame_skip": result.frame_skip,
+        "params": result.params,
+        "summary": result.summary(),
+        "frames": [
+            {"frame": index, "time_s": seconds, "motion": motion, "contour_area": round(area, 1), **({"zones": zones} if zones else {})}
+            for index, seconds, motion, area, zones in result.rows
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=1)
+    return path
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-run motion detection over recorded footage")
+    parser.add_argument("sources", nargs="+", help="Video files and/or directories of images")
+    parser.add_argument("--config", default="config/config.yaml", help="Config file providing motion_detection defaults")
+    parser.add_argument(
+        "--set",
+        dest="param_sets",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE[,KEY=VALUE]",
+        help="motion_detection overrides; repeat for several parameter sets to compare",
+    )
+    parser.add_argument("--segments", type=int, default=1, help="Split each file into this many parallel segments")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP_FRAMES, help="Analysed frames before each segment")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--fps", type=float, default=None, help="Frame rate of image directories (default: webcam.fps)")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="csv", help="Timeline format")
+    parser.add_argument("--output-dir", default="data/reanalysis", help="Directory for the timelines")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    try:
+        config = load_config(args.config)
+        param_sets = [parse_param_set(text) for text in args.param_sets] or [{}]
+        for params in param_sets:
+            build_motion_config(config.motion_detection, params)
+        fallback_fps = float(args.fps or getattr(config.webcam, "fps", 30) or 30)
+        sources = [probe_source(path, fallback_fps=fallback_fps) for path in args.sources]
+    except (ValueError, RuntimeError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    tasks = plan_tasks(sources, param_sets, segments=args.segments, warmup=args.warmup)
+    started = time.perf_counter()
+    results = run_reanalysis(tasks, config.motion_detection, workers=args.workers)
+    output_dir = Path(args.output_dir)
+    # Gleiche Dateinamen aus verschiedenen Ordnern dürfen sich nicht überschreiben
+    stems = timeline_stems(sources)
+    for result in results:
+        stem = stems.get(result.source.path)
+        path = write_timeline(result, timeline_path(output_dir, result, args.format, stem), args.format)
+        summary = result.summary()
+        print(
+            f"{path}: {summary['analysed_frames']} frames, {summary['motion_events']} events, "
+            f"motion {summary['motion_ratio']:.1%}"
+        )
+    print(f"{len(tasks)} tasks in {time.perf_counter() - started:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
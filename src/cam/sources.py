@@ -0,0 +1,319 @@
+"""
+Hardware-free frame sources for load tests and benchmarks.
+
+Each source mimics the small part of ``cv2.VideoCapture`` that
+:class:`~src.cam.camera.Camera` uses (``isOpened``, ``read(image)``, ``get``,
+``set``, ``release``), so frames run through the unchanged capture loop, frame
+ring, preview broadcaster and motion worker:
+
+- :class:`FileVideoSource` replays a video file in a loop
+- :class:`ImageDirectorySource` replays a sorted directory of still images
+- :class:`SyntheticVideoSource` renders moving objects on a noisy background
+
+With ``realtime=True`` reads are paced to the source FPS like a camera; with
+``realtime=False`` frames are returned as fast as the pipeline consumes them,
+which makes throughput measurements reproducible. Synthetic frames are
+deterministic for a given seed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+if TYPE_CHECKING:
+    from src.config import WebcamConfig
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+# Anzahl vorab erzeugter Rauschbilder, zyklisch verwendet (RNG pro Frame wäre teurer als der Rest)
+_NOISE_TILES = 8
+
+
+class _FramePacer:
+    """Sleeps until the next frame slot in realtime mode; no-op at maximum speed."""
+
+    def __init__(self, fps: float, realtime: bool) -> None:
+        self.interval = 1.0 / fps if fps > 0 else 0.0
+        self.realtime = bool(realtime) and self.interval > 0
+        self._next_deadline: Optional[float] = None
+
+    def wait(self) -> None:
+        if not self.realtime:
+            return
+        now = time.monotonic()
+        if self._next_deadline is None or now - self._next_deadline > self.interval:
+            # Erster Frame oder Verbraucher hinkt hinterher: Takt neu ausrichten statt aufholen
+            self._next_deadline = now
+        elif self._next_deadline > now:
+            time.sleep(self._next_deadline - now)
+        self._next_deadline += self.interval
+
+
+def _copy_into(frame: np.ndarray, image: Optional[np.ndarray]) -> np.ndarray:
+    """Write into the caller's (ring) buffer when it fits, like ``VideoCapture.read(image)``."""
+    if image is not None and image.shape == frame.shape and image.dtype == frame.dtype:
+        np.copyto(image, frame)
+        return image
+    return frame.copy()
+
+
+class VideoSourceCapture(ABC):
+    """Base class: VideoCapture-compatible surface with frame counting and pacing."""
+
+    kind = "source"
+
+    def __init__(self, *, fps: float, realtime: bool) -> None:
+        self._pacer = _FramePacer(fps, realtime)
+        self._fps = float(fps)
+        self._opened = True
+        self._grabbed: Optional[np.ndarray] = None
+        self.frames_read = 0
+
+    def isOpened(self) -> bool:  # noqa: N802 - VideoCapture API
+        return self._opened
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        if not self._opened:
+            return False, None
+        self._pacer.wait()
+        frame = self._next_frame(image)
+        if frame is None:
+            return False, None
+        self.frames_read += 1
+        return True, frame
+
+    def grab(self) -> bool:
+        ok, frame = self.read()
+        self._grabbed = frame if ok else None
+        return ok
+
+    def retrieve(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        frame, self._grabbed = self._grabbed, None
+        if frame is None:
+            return False, None
+        return True, frame if image is None else _copy_into(frame, image)
+
+    @abstractmethod
+    def _next_frame(self, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Return the next frame (written into ``image`` when possible) or None when exhausted."""
+
+    @abstractmethod
+    def _frame_size(self) -> Tuple[int, int]:
+        """Return the ``(width, height)`` of the frames this source produces."""
+
+    def get(self, prop: int) -> float:
+        if prop == cv2.CAP_PROP_FRAME_WIDTH:
+            return float(self._frame_size()[0])
+        if prop == cv2.CAP_PROP_FRAME_HEIGHT:
+            return float(self._frame_size()[1])
+        if prop == cv2.CAP_PROP_FPS:
+            return self._fps
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.frames_read)
+        return 0.0
+
+    def set(self, prop: int, value: float) -> bool:
+        # Auflösung/FPS legt die Quelle selbst fest; UVC-Regler gibt es nicht
+        return False
+
+    def release(self) -> None:
+        self._opened = False
+
+
+class FileVideoSource(VideoSourceCapture):
+    """Loops a video file decoded by OpenCV; realtime pacing follows the file's FPS."""
+
+    kind = "file"
+
+    def __init__(self, path: str, *, realtime: bool = True, fallback_fps: float = 30.0) -> None:
+        capture = cv2.VideoCapture(str(path))
+        if not capture.isOpened():
+            capture.release()
+            raise RuntimeError(f"Video file '{path}' could not be opened")
+        fps = capture.get(cv2.CAP_PROP_FPS)
+        super().__init__(fps=fps if fps and fps > 0 else fallback_fps, realtime=realtime)
+        self.path = str(path)
+        self._capture = capture
+        self.loops = 0
+
+    def _frame_size(self) -> Tuple[int, int]:
+        return int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    def _next_frame(self, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        ret, frame = self._capture.read(image) if image is not None else self._capture.read()
+        if ret:
+            return frame
+        # Dateiende: von vorn beginnen
+        self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self.loops += 1
+        ret, frame = self._capture.read(image) if image is not None else self._capture.read()
+        return frame if ret else None
+
+    def release(self) -> None:
+        super().release()
+        self._capture.release()
+
+
+class ImageDirectorySource(VideoSourceCapture):
+    """Loops the images of a directory in name order; each image is decoded once and cached."""
+
+    kind = "images"
+
+    def __init__(self, path: str, *, fps: float, realtime: bool = True) -> None:
+        directory = Path(path)
+        if not directory.is_dir():
+            raise RuntimeError(f"Image directory '{path}' does not exist")
+        files = sorted(
+            entry for entry in directory.iterdir() if entry.is_file() and entry.suffix.lower() in IMAGE_EXTENSIONS
+        )
+        if not files:
+            raise RuntimeError(f"Image directory '{path}' contains no {list(IMAGE_EXTENSIONS)} files")
+        super().__init__(fps=fps, realtime=realtime)
+        self.path = str(directory)
+        self._files: List[Path] = files
+        self._cache: List[Optional[np.ndarray]] = [None] * len(files)
+        self._index = 0
+        first = self._load(0)
+        if first is None:
+            raise RuntimeError(f"Image '{files[0]}' could not be decoded")
+        self._size = (int(first.shape[1]), int(first.shape[0]))
+
+    def _load(self, index: int) -> Optional[np.ndarray]:
+        cached = self._cache[index]
+        if cached is None:
+            cached = cv2.imread(os.fspath(self._files[index]), cv2.IMREAD_COLOR)
+            if cached is not None and (cached.shape[1], cached.shape[0]) != getattr(self, "_size", cached.shape[1::-1]):
+                # Alle Frames in der Größe des ersten Bildes, sonst allokiert der Frame-Ring ständig neu
+                cached = cv2.resize(cached, self._size, interpolation=cv2.INTER_AREA)
+            self._cache[index] = cached
+        return cached
+
+    def _frame_size(self) -> Tuple[int, int]:
+        return self._size
+
+    def _next_frame(self, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        for _ in range(len(self._files)):
+            index = self._index
+            self._index = (self._index + 1) % len(self._files)
+            frame = self._load(index)
+            if frame is not None:
+                return _copy_into(frame, image)
+        return None
+
+
+class SyntheticVideoSource(VideoSourceCapture):
+    """
+    Deterministic test pattern: gradient background, bouncing filled shapes and noise.
+
+    ``objects=0`` yields a static (noise-only) scene, useful to benchmark the
+    no-motion path.
+    """
+
+    kind = "synthetic"
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        *,
+        fps: float = 30.0,
+        realtime: bool = True,
+        objects: int = 2,
+        noise: int = 4,
+        seed: int = 0,
+    ) -> None:
+        super().__init__(fps=fps, realtime=realtime)
+        self.width = max(16, int(width))
+        self.height = max(16, int(height))
+        self.noise = max(0, int(noise))
+        rng = np.random.default_rng(seed)
+
+        gradient = np.linspace(40, 160, self.width, dtype=np.float32)
+        background = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        background[:] = gradient[None, :, None].astype(np.uint8)
+        background[:, :, 0] = np.linspace(60, 120, self.height, dtype=np.float32)[:, None].astype(np.uint8)
+        self._background = background
+        self._noise_tiles = [
+            rng.integers(0, self.noise + 1, size=background.shape, dtype=np.uint8) for _ in range(_NOISE_TILES)
+        ] if self.noise else []
+
+        size = max(8, min(self.width, self.height) // 8)
+        self._objects = [
+            {
+                "position": rng.uniform([0, 0], [self.width - size, self.height - size]),
+                "velocity": rng.uniform(2.0, 6.0, size=2) * rng.choice([-1.0, 1.0], size=2),
+                "size": size,
+                "color": tuple(int(channel) for channel in rng.integers(180, 256, size=3)),
+            }
+            for _ in range(max(0, int(objects)))
+        ]
+
+    def _frame_size(self) -> Tuple[int, int]:
+        return self.width, self.height
+
+    def _next_frame(self, image: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        if image is None or image.shape != self._background.shape or image.dtype != np.uint8:
+            image = np.empty_like(self._background)
+        if self._noise_tiles:
+            cv2.add(self._background, self._noise_tiles[self.frames_read % len(self._noise_tiles)], dst=image)
+        else:
+            np.copyto(image, self._background)
+        for obj in self._objects:
+            position, velocity, size = obj["position"], obj["velocity"], obj["size"]
+            position += velocity
+            for axis, limit in ((0, self.width - size), (1, self.height - size)):
+                if position[axis] < 0 or position[axis] > limit:
+                    velocity[axis] = -velocity[axis]
+                    position[axis] = min(max(position[axis], 0), limit)
+            x, y = int(position[0]), int(position[1])
+            cv2.rectangle(image, (x, y), (x + size, y + size), obj["color"], thickness=-1)
+        return image
+
+
+def create_video_source(
+    webcam_config: "WebcamConfig",
+    *,
+    logger: Optional[logging.Logger] = None,
+) -> Optional[VideoSourceCapture]:
+    """Source configured by ``webcam.source``; None for ``device`` (real camera via OpenCV)."""
+    source = str(getattr(webcam_config, "source", "device") or "device")
+    if source == "device":
+        return None
+    realtime = bool(getattr(webcam_config, "source_realtime", True))
+    fps = float(max(1, int(getattr(webcam_config, "fps", 30) or 30)))
+    path = str(getattr(webcam_config, "source_path", "") or "")
+    if source == "file":
+        capture: VideoSourceCapture = FileVideoSource(path, realtime=realtime, fallback_fps=fps)
+    elif source == "images":
+        capture = ImageDirectorySource(path, fps=fps, realtime=realtime)
+    elif source == "synthetic":
+        resolution = webcam_config.get_default_resolution()
+        capture = SyntheticVideoSource(
+            resolution.width,
+            resolution.height,
+            fps=fps,
+            realtime=realtime,
+            objects=int(getattr(webcam_config, "synthetic_objects", 2)),
+            noise=int(getattr(webcam_config, "synthetic_noise", 4)),
+        )
+    else:
+        raise ValueError(f"Unknown video source '{source}'")
+    if logger is not None:
+        width, height = capture._frame_size()
+        logger.info(
+            "Using %s video source %s(%dx%d @ %.1f FPS, %s)",
+            source,
+            f"'{path}' " if path else "",
+            width,
+            height,
+            capture.get(cv2.CAP_PROP_FPS),
+            "realtime" if realtime else "max speed",
+        )
+    return capture
@@ -0,0 +1,357 @@
+"""
+Single-encoder fan-out for the MJPEG preview stream.
+
+The camera encodes each preview frame once and hands it to
+:class:`PreviewBroadcaster`, which wraps it into a multipart chunk exactly once
+and keeps only the newest chunk. Async subscribers wait for a sequence number
+newer than the one they sent last; slow clients therefore skip frames instead
+of building up a queue, and every client receives the same immutable buffer.
+
+Additional preview widths (``webcam.preview_widths``) are kept as
+:class:`PreviewRung` objects, each with its own broadcaster and subscriber
+count, so a rung is only encoded while someone watches it.
+
+:class:`FrameSequenceNotifier` wakes ``/video/frame?after=`` long-polls when
+the capture thread publishes a newer frame.
+
+``/video_ws`` pushes the same JPEGs as binary WebSocket messages: a fixed
+little-endian header (see :func:`build_ws_frame_message`) followed by the
+JPEG. The client acknowledges every rendered frame; :class:`AckWindow` stops
+sending while too many frames are unacknowledged, so a slow browser or proxy
+skips frames instead of queueing them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set, Tuple
+
+_logger = logging.getLogger(__name__)
+
+
+def build_multipart_chunk(body: bytes, media_type: str = "image/jpeg") -> bytes:
+    """Wrap an encoded image into one ``multipart/x-mixed-replace`` part."""
+    return (
+        b"--frame\r\nContent-Type: "
+        + media_type.encode("ascii", errors="ignore")
+        + b"\r\n\r\n"
+        + body
+        + b"\r\n"
+    )
+
+
+@dataclass(frozen=True)
+class PreviewFrameMeta:
+    """Per-frame metadata published next to a preview JPEG."""
+
+    sequence: int
+    captured_at: float
+    width: int
+    height: int
+    motion: bool = False
+
+
+class PreviewBroadcaster:
+    """Latest-chunk broadcaster bridging the capture thread and asyncio subscribers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._chunk: Optional[bytes] = None
+        self._jpeg: Optional[bytes] = None
+        self._meta: Optional[PreviewFrameMeta] = None
+        self._published_at: Optional[float] = None
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self._subscribers = 0
+
+    def publish(
+        self,
+        jpeg_bytes: bytes,
+        *,
+        media_type: str = "image/jpeg",
+        meta: Optional[PreviewFrameMeta] = None,
+    ) -> int:
+        """Store a new encoded frame and wake all waiting subscribers. Thread-safe."""
+        chunk = build_multipart_chunk(jpeg_bytes, media_type)
+        with self._lock:
+            self._sequence += 1
+            self._chunk = chunk
+            self._jpeg = jpeg_bytes
+            self._meta = meta
+            self._published_at = time.time()
+            sequence = self._sequence
+            waiters = list(self._waiters)
+        self._wake(waiters)
+        return sequence
+
+    def clear(self) -> None:
+        """Forget the current chunk, e.g. when the capture runtime stops."""
+        with self._lock:
+            self._chunk = None
+            self._jpeg = None
+            self._meta = None
+            self._published_at = None
+            waiters = list(self._waiters)
+        self._wake(waiters)
+
+    def get_latest(self) -> Tuple[int, Optional[bytes]]:
+        with self._lock:
+            return self._sequence, self._chunk
+
+    def get_latest_frame(self) -> Tuple[int, Optional[bytes], Optional[PreviewFrameMeta]]:
+        """Newest raw JPEG with its metadata (for the WebSocket push)."""
+        with self._lock:
+            return self._sequence, self._jpeg, self._meta
+
+    def get_subscriber_count(self) -> int:
+        with self._lock:
+            return self._subscribers
+
+    def add_subscriber(self) -> None:
+        with self._lock:
+            self._subscribers += 1
+
+    def remove_subscriber(self) -> None:
+        with self._lock:
+            if self._subscribers > 0:
+                self._subscribers -= 1
+
+    async def wait_for_chunk(
+        self,
+        after_sequence: int,
+        *,
+        timeout: float,
+    ) -> Tuple[int, Optional[bytes]]:
+        """Return the newest chunk once its sequence is greater than ``after_sequence``.
+
+        Returns the current (possibly unchanged) state when ``timeout`` expires.
+        """
+        await self._wait_for_publish(after_sequence, timeout)
+        return self.get_latest()
+
+    async def wait_for_frame(
+        self,
+        after_sequence: int,
+        *,
+        timeout: float,
+    ) -> Tuple[int, Optional[bytes], Optional[PreviewFrameMeta]]:
+        """Like :meth:`wait_for_chunk`, but returns the raw JPEG and its metadata."""
+        await self._wait_for_publish(after_sequence, timeout)
+        return self.get_latest_frame()
+
+    async def _wait_for_publish(self, after_sequence: int, timeout: float) -> None:
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        waiter = (loop, event)
+        with self._lock:
+            if self._chunk is not None and self._sequence > after_sequence:
+                return
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(event.wait(), timeout=max(0.0, float(timeout)))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+    @staticmethod
+    def _wake(waiters: list[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]) -> None:
+        _wake_waiters(waiters)
+
+
+def _wake_waiters(waiters: list[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]) -> None:
+    for loop, event in waiters:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # Event loop already closed; the waiter is discarded by its own finally block.
+            _logger.debug("Skipping preview waiter on closed event loop")
+
+
+class FrameSequenceNotifier:
+    """Latest captured frame sequence with asyncio waiters; ``notify`` is cheap without waiters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @property
+    def sequence(self) -> int:
+        with self._lock:
+            return self._sequence
+
+    def notify(self, sequence: int) -> None:
+        """Record a newly published frame. Thread-safe."""
+        with self._lock:
+            self._sequence = int(sequence)
+            if not self._waiters:
+                return
+            waiters = list(self._waiters)
+        _wake_waiters(waiters)
+
+    async def wait_for_sequence(self, after_sequence: int, *, timeout: float) -> int:
+        """Return the current sequence once it differs from ``after_sequence`` or ``timeout`` expires.
+
+        Any different sequence counts, so clients holding a sequence from a
+        previous capture run (counter restarted) are answered immediately.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, float(timeout))
+        while True:
+            event = asyncio.Event()
+            waiter = (loop, event)
+            with self._lock:
+                if self._sequence != after_sequence:
+                    return self._sequence
+                self._waiters.add(waiter)
+            try:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    with self._lock:
+                        return self._sequence
+                await asyncio.wait_for(event.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                with self._lock:
+                    self._waiters.discard(waiter)
+
+
+class PreviewRung:
+    """State of one extra preview width: subscribers, newest JPEG and its broadcaster."""
+
+    def __init__(self, width: int) -> None:
+        self.width = int(width)
+        self.broadcaster = PreviewBroadcaster()
+        self.consumers = 0
+        self.jpeg: Optional[bytes] = None
+        self.resolution: Optional[Dict[str, int]] = None
+        # Capture sequence the JPEG was encoded from (None if unknown)
+        self.source_sequence: Optional[int] = None
+        self.last_publish_monotonic = 0.0
+        self.publish_in_progress = False
+        self.encodes = 0
+
+    def clear(self) -> None:
+        self.jpeg = None
+        self.resolution = None
+        self.source_sequence = None
+        self.last_publish_monotonic = 0.0
+        self.publish_in_progress = False
+        self.broadcaster.clear()
+
+    def get_stats(self) -> Dict[str, object]:
+        return {
+            "width": self.width,
+            "consumers": self.consumers,
+            "resolution": None if self.resolution is None else dict(self.resolution),
+            "encodes": self.encodes,
+        }
+
+
+# magic, version, flags, header size, frame sequence, captured_at, sent_at, width, height
+_WS_FRAME_HEADER = struct.Struct("<4sBBHIddHH")
+WS_FRAME_MAGIC = b"CVDF"
+WS_FRAME_VERSION = 1
+WS_FLAG_MOTION = 0x01
+
+
+def build_ws_frame_message(
+    jpeg_bytes: bytes,
+    meta: Optional[PreviewFrameMeta],
+    *,
+    sent_at: Optional[float] = None,
+) -> bytes:
+    """
+    Binary WebSocket message: 32-byte header followed by the JPEG.
+
+    Header (little-endian): ``b"CVDF"``, version (u8), flags (u8, bit 0 =
+    motion), header size (u16), frame sequence (u32, wraps), capture time and
+    send time (f64 epoch seconds), width and height (u16). Clients must skip
+    ``header size`` bytes so fields can be appended in later versions.
+    """
+    if sent_at is None:
+        sent_at = time.time()
+    if meta is None:
+        meta = PreviewFrameMeta(sequence=0, captured_at=0.0, width=0, height=0)
+    header = _WS_FRAME_HEADER.pack(
+        WS_FRAME_MAGIC,
+        WS_FRAME_VERSION,
+        WS_FLAG_MOTION if meta.motion else 0,
+        _WS_FRAME_HEADER.size,
+        int(meta.sequence) & 0xFFFFFFFF,
+        float(meta.captured_at),
+        float(sent_at),
+        min(max(int(meta.width), 0), 0xFFFF),
+        min(max(int(meta.height), 0), 0xFFFF),
+    )
+    return header + jpeg_bytes
+
+
+def parse_ws_frame_message(message: bytes) -> Tuple[Dict[str, Any], bytes]:
+    """Inverse of :func:`build_ws_frame_message`; raises ValueError for foreign data."""
+    if len(message) < _WS_FRAME_HEADER.size:
+        raise ValueError("WebSocket frame message shorter than its header")
+    magic, version, flags, header_size, sequence, captured_at, sent_at, width, height = _WS_FRAME_HEADER.unpack_from(
+        message
+    )
+    if magic != WS_FRAME_MAGIC or header_size < _WS_FRAME_HEADER.size:
+        raise ValueError("Not a preview frame message")
+    header = {
+        "version": version,
+        "motion": bool(flags & WS_FLAG_MOTION),
+        "sequence": sequence,
+        "captured_at": captured_at,
+        "sent_at": sent_at,
+        "width": width,
+        "height": height,
+    }
+    return header, bytes(message[header_size:])
+
+
+class AckWindow:
+    """
+    Client-driven flow control for pushed frames (one event loop, no locking).
+
+    At most ``size`` frames may be unacknowledged; :meth:`wait_for_capacity`
+    blocks the sender until the client acknowledged enough of them.
+    """
+
+    def __init__(self, size: int = 2) -> None:
+        self.size = max(1, int(size))
+        self.sent = 0
+        self.acked = 0
+        self._event = asyncio.Event()
+
+    @property
+    def in_flight(self) -> int:
+        return self.sent - self.acked
+
+    def can_send(self) -> bool:
+        return self.in_flight < self.size
+
+    def on_sent(self) -> None:
+        self.sent += 1
+        self._event.clear()
+
+    def on_ack(self, count: int = 1) -> None:
+        self.acked = min(self.sent, self.acked + max(0, int(count)))
+        self._event.set()
+
+    async def wait_for_capacity(self, timeout: float) -> bool:
+        """True once another frame may be sent, False if ``timeout`` expired first."""
+        if self.can_send():
+            return True
+        self._event.clear()
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=max(0.0, float(timeout)))
+        except asyncio.TimeoutError:
+            pass
+        return self.can_send()
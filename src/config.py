@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from contextlib import contextmanager
 from copy import deepcopy
-from dataclasses import dataclass, asdict, field, fields, is_dataclass
+from dataclasses import dataclass, asdict, field, fields, is_dataclass, replace
 from pathlib import Path
 from typing import Iterator, List, Dict, Any, Tuple, Optional, Callable, cast
 import re
@@ -327,10 +327,64 @@ class WebcamConfig:
     preview_fps: int = 15
     preview_max_width: int = 1280
     preview_jpeg_quality: int = 65
+    # Vorschau-Leiter: Clients wählen per ?w= eine Breite; leer = nur preview_max_width
+    preview_widths: List[int] = field(default_factory=list)
+    # "bgr" decodes every frame; "mjpeg_passthrough" requests MJPG and serves the camera's JPEG bytes
+    capture_mode: str = "bgr"
+    # Kennung der Kamera in Routen (/video_feed/<camera_id>) und im Dashboard
+    camera_id: str = "main"
+    # Weitere Kameras: je Eintrag camera_id + camera_index, optional eigene Capture-Einstellungen
+    additional_cameras: List[Dict[str, Any]] = field(default_factory=list)
+    # Bildquelle: "device" (Kamera), "file" (Video), "images" (Bildordner) oder "synthetic" (Testbild)
+    source: str = "device"
+    source_path: str = ""
+    # False = Wiedergabe so schnell wie möglich (Benchmarks), True = im Takt von fps bzw. der Videodatei
+    source_realtime: bool = True
+    synthetic_objects: int = 2
+    synthetic_noise: int = 4
+    # Ohne Mess-Session und ohne Vorschau-Zuschauer: "low_fps" dekodiert nur idle_fps Frames/s,
+    # "grab_only" holt Frames nur noch ab (kein Decode), "off" nimmt immer mit voller Rate auf
+    idle_capture: str = "low_fps"
+    idle_fps: float = 2.0
+    # Wartezeit nach dem letzten Bedarf, bevor gedrosselt wird (z.B. Neuladen der Seite)
+    idle_grace_seconds: float = 10.0
+
+    CAPTURE_MODES = ("bgr", "mjpeg_passthrough")
+    IDLE_CAPTURE_MODES = ("off", "low_fps", "grab_only")
+    SOURCES = ("device", "file", "images", "synthetic")
+    MAX_SYNTHETIC_OBJECTS = 32
+    MAX_SYNTHETIC_NOISE = 64
+    ADDITIONAL_CAMERA_KEYS = (
+        "camera_id",
+        "camera_index",
+        "default_resolution",
+        "fps",
+        "preview_fps",
+        "preview_max_width",
+        "preview_jpeg_quality",
+        "preview_widths",
+        "capture_mode",
+        "source",
+        "source_path",
+        "source_realtime",
+    )
+    MAX_PREVIEW_WIDTHS = 8
 
     def get_default_resolution(self) -> Resolution:
         return Resolution(**self.default_resolution)
 
+    def get_preview_widths(self) -> List[int]:
+        """Sortierte Vorschau-Breiten; preview_max_width ist immer enthalten (Standard ohne ?w=)."""
+        return sorted({int(width) for width in self.preview_widths} | {int(self.preview_max_width)})
+
+    def get_camera_configs(self) -> List["WebcamConfig"]:
+        """Primäre Kamera plus abgeleitete Configs der zusätzlichen Kameras (ohne deren Unterliste)."""
+        configs: List[WebcamConfig] = [self]
+        for entry in self.additional_cameras:
+            overrides = {key: deepcopy(value) for key, value in entry.items() if key in self.ADDITIONAL_CAMERA_KEYS}
+            configs.append(replace(self, **overrides, additional_cameras=[]))
+        return configs
+
     def validate(self) -> List[str]:
         errors: List[str] = []
         if self.camera_index < 0:
@@ -343,6 +397,32 @@ class WebcamConfig:
             errors.append("preview_max_width must be >= 1")
         if not 1 <= self.preview_jpeg_quality <= 100:
             errors.append("preview_jpeg_quality must be within [1, 100]")
+        try:
+            _normalize_preview_widths(self.preview_widths)
+        except ValueError as exc:
+            errors.append(str(exc))
+        if self.capture_mode not in self.CAPTURE_MODES:
+            errors.append(f"capture_mode must be one of {list(self.CAPTURE_MODES)}")
+        if not _CAMERA_ID_PATTERN.fullmatch(str(self.camera_id)):
+            errors.append("camera_id must consist of letters, digits, '-' or '_'")
+        if self.source not in self.SOURCES:
+            errors.append(f"source must be one of {list(self.SOURCES)}")
+        elif self.source in ("file", "images") and not str(self.source_path).strip():
+            errors.append(f"source_path is required for source '{self.source}'")
+        if not 0 <= self.synthetic_objects <= self.MAX_SYNTHETIC_OBJECTS:
+            errors.append(f"synthetic_objects must be within [0, {self.MAX_SYNTHETIC_OBJECTS}]")
+        if not 0 <= self.synthetic_noise <= self.MAX_SYNTHETIC_NOISE:
+            errors.append(f"synthetic_noise must be within [0, {self.MAX_SYNTHETIC_NOISE}]")
+        if self.idle_capture not in self.IDLE_CAPTURE_MODES:
+            errors.append(f"idle_capture must be one of {list(self.IDLE_CAPTURE_MODES)}")
+        if not 0.1 <= self.idle_fps <= 30:
+            errors.append("idle_fps must be within [0.1, 30]")
+        if self.idle_grace_seconds < 0:
+            errors.append("idle_grace_seconds must be >= 0")
+        try:
+            _normalize_additional_cameras(self.additional_cameras, primary_camera_id=self.camera_id)
+        except ValueError as exc:
+            errors.append(str(exc))
         return errors
 
 # ---------------------------------------------------------------------------
@@ -390,6 +470,18 @@ class ROI:
                 errors.append("ROI exceeds frame height")
         return errors
 
+@dataclass
+class MotionZone:
+    """Benannte Erkennungszone: Polygon (``points``) oder Rechteck, optional mit eigener Sensitivität."""
+    name: str
+    x: int = 0
+    y: int = 0
+    width: int = 0
+    height: int = 0
+    points: List[List[int]] = field(default_factory=list)
+    sensitivity: Optional[float] = None  # None = globale Sensitivität
+    enabled: bool = True
+
 @dataclass
 class MotionDetectionConfig:
     region_of_interest: Dict[str, Any]
@@ -398,10 +490,45 @@ class MotionDetectionConfig:
     min_contour_area: int
     frame_skip: int = 1
     processing_max_width: int = 800
+    # Hintergrundmodell: mog2 (robust) oder running_average (deutlich weniger CPU)
+    engine: str = "mog2"
+    # Nur running_average: Grauwert-Differenz zum Hintergrund, ab der ein Pixel als Bewegung zählt
+    difference_threshold: int = 25
+    # Static-Scene-Gate: Frames ohne Änderung im Thumbnail überspringen die volle Analyse
+    static_gate_enabled: bool = True
+    # Max. absolute Grauwert-Differenz eines Thumbnail-Pixels (kein Mittelwert), die noch als unverändert gilt
+    static_gate_threshold: float = 6.0
+    # Spätestens nach so vielen übersprungenen Frames wird wieder voll analysiert (Hintergrund-Update)
+    static_gate_refresh_frames: int = 10
+    # Coarse-to-fine: Erkennung auf dieser Breite, Grenzfälle in processing_max_width bestätigen (0 = aus)
+    coarse_width: int = 0
+    # Grob-Treffer zwischen min_contour_area / (1 + m) und min_contour_area * (1 + m) werden nachgeprüft
+    coarse_confirm_margin: float = 1.0
+    # Adaptiver Frame-Skip statt festem frame_skip (Startwert), geregelt auf CPU- und Latenz-Budget
+    governor_enabled: bool = False
+    # CPU-Zeit der Erkennung je Sekunde (0.3 = 30 % eines Kerns)
+    governor_cpu_budget: float = 0.3
+    # Alter eines Frames, wenn sein Ergebnis vorliegt
+    governor_latency_budget_ms: int = 200
+    # Obergrenze der Analyse-Rate (0 = keine); Untergrenze folgt aus measurement.alert_delay_seconds
+    governor_max_fps: float = 0.0
+    # Aktivitäts-Heatmap je Session: Breite des Rasters in Zellen (0 = aus)
+    heatmap_width: int = 64
+    # Benannte Zonen, alle in einem Detektionsdurchlauf ausgewertet; leer = nur ROI/Vollbild
+    zones: List[Dict[str, Any]] = field(default_factory=list)
+
+    ZONE_KEYS = ("name", "enabled", "x", "y", "width", "height", "points", "sensitivity")
+    ENGINES = ("mog2", "running_average")
+    MIN_COARSE_WIDTH = 32
+    HEATMAP_WIDTH_RANGE = (8, 320)
 
     def get_roi(self) -> ROI:
         return ROI(**self.region_of_interest)
 
+    def get_zones(self) -> List[MotionZone]:
+        """Aktive Zonen in Konfigurationsreihenfolge."""
+        return [MotionZone(**zone) for zone in _normalize_motion_zones(self.zones) if zone.get("enabled", True)]
+
     def validate(self) -> List[str]:
         errors: List[str] = []
         if not 0.001 <= self.sensitivity <= 1.0:
@@ -414,6 +541,31 @@ class MotionDetectionConfig:
             errors.append("processing_max_width must be >= 1")
         if self.min_contour_area < 1:
             errors.append("min_contour_area must be ≥1")
+        if self.engine not in self.ENGINES:
+            errors.append(f"engine must be one of {list(self.ENGINES)}")
+        if not 1 <= self.difference_threshold <= 255:
+            errors.append("difference_threshold must be within [1, 255]")
+        if not 0 <= self.static_gate_threshold <= 255:
+            errors.append("static_gate_threshold must be within [0, 255]")
+        if self.static_gate_refresh_frames < 1:
+            errors.append("static_gate_refresh_frames must be >= 1")
+        if self.coarse_width != 0 and self.coarse_width < self.MIN_COARSE_WIDTH:
+            errors.append(f"coarse_width must be 0 (off) or >= {self.MIN_COARSE_WIDTH}")
+        if not 0 <= self.coarse_confirm_margin <= 10:
+            errors.append("coarse_confirm_margin must be within [0, 10]")
+        if not 0.01 <= self.governor_cpu_budget <= 4.0:
+            errors.append("governor_cpu_budget must be within [0.01, 4.0]")
+        if self.governor_latency_budget_ms < 1:
+            errors.append("governor_latency_budget_ms must be >= 1")
+        if self.governor_max_fps < 0:
+            errors.append("governor_max_fps must be >= 0")
+        low, high = self.HEATMAP_WIDTH_RANGE
+        if self.heatmap_width != 0 and not low <= self.heatmap_width <= high:
+            errors.append(f"heatmap_width must be 0 (off) or within [{low}, {high}]")
+        try:
+            _normalize_motion_zones(self.zones)
+        except ValueError as exc:
+            errors.append(str(exc))
         return errors
 
 # ---------------------------------------------------------------------------
@@ -1457,6 +1609,18 @@ _CONFIG_IMPORT_PATHS: Dict[str, List[str]] = {
         "webcam.preview_fps",
         "webcam.preview_max_width",
         "webcam.preview_jpeg_quality",
+        "webcam.preview_widths",
+        "webcam.capture_mode",
+        "webcam.camera_id",
+        "webcam.additional_cameras",
+        "webcam.source",
+        "webcam.source_path",
+        "webcam.source_realtime",
+        "webcam.synthetic_objects",
+        "webcam.synthetic_noise",
+        "webcam.idle_capture",
+        "webcam.idle_fps",
+        "webcam.idle_grace_seconds",
     ],
     "uvc_controls": [
         "uvc_controls.brightness",
@@ -1484,6 +1648,19 @@ _CONFIG_IMPORT_PATHS: Dict[str, List[str]] = {
         "motion_detection.min_contour_area",
         "motion_detection.frame_skip",
         "motion_detection.processing_max_width",
+        "motion_detection.engine",
+        "motion_detection.difference_threshold",
+        "motion_detection.static_gate_enabled",
+        "motion_detection.static_gate_threshold",
+        "motion_detection.static_gate_refresh_frames",
+        "motion_detection.coarse_width",
+        "motion_detection.coarse_confirm_margin",
+        "motion_detection.governor_enabled",
+        "motion_detection.governor_cpu_budget",
+        "motion_detection.governor_latency_budget_ms",
+        "motion_detection.governor_max_fps",
+        "motion_detection.heatmap_width",
+        "motion_detection.zones",
     ],
     "measurement": [
         "measurement.auto_start",
@@ -1938,6 +2115,56 @@ def _normalize_roi_points(value: Any) -> List[List[int]]:
     return normalized
 
 
+def _normalize_detector_engine(value: Any) -> str:
+    engine = _coerce_string(value, allow_empty=False).strip().lower()
+    if engine not in MotionDetectionConfig.ENGINES:
+        raise ValueError(f"engine must be one of {list(MotionDetectionConfig.ENGINES)}")
+    return engine
+
+
+def _normalize_motion_zones(value: Any) -> List[Dict[str, Any]]:
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ValueError("zones must be a list")
+    normalized: List[Dict[str, Any]] = []
+    seen_names: set[str] = set()
+    for index, entry in enumerate(value):
+        label = f"zones[{index}]"
+        if not isinstance(entry, dict):
+            raise ValueError(f"{label} must be a mapping")
+        unknown = sorted(str(key) for key in entry if key not in MotionDetectionConfig.ZONE_KEYS)
+        if unknown:
+            raise ValueError(f"{label} has unsupported keys {unknown}")
+        name = _coerce_string(entry.get("name", ""), allow_empty=True).strip()
+        if not name:
+            raise ValueError(f"{label}.name is required")
+        if name in seen_names:
+            raise ValueError(f"{label}.name '{name}' is not unique")
+        seen_names.add(name)
+        item: Dict[str, Any] = {"name": name, "enabled": _coerce_bool(entry.get("enabled", True))}
+        points = _normalize_roi_points(entry.get("points", []))
+        if points:
+            if len(points) < 3:
+                raise ValueError(f"{label}.points must contain at least 3 points")
+            if any(px < 0 or py < 0 for px, py in points):
+                raise ValueError(f"{label}.points must not be negative")
+            item["points"] = points
+        else:
+            for key in ("x", "y", "width", "height"):
+                item[key] = _coerce_int(entry.get(key, 0))
+            if item["x"] < 0 or item["y"] < 0:
+                raise ValueError(f"{label} coordinates must not be negative")
+            if item["width"] <= 0 or item["height"] <= 0:
+                raise ValueError(f"{label} needs points or a positive width/height")
+        if entry.get("sensitivity") is not None:
+            item["sensitivity"] = _coerce_float(entry["sensitivity"])
+            if not 0.01 <= item["sensitivity"] <= 1.0:
+                raise ValueError(f"{label}.sensitivity must be within [0.01, 1.0]")
+        normalized.append(item)
+    return normalized
+
+
 def _normalize_email_list(value: Any, *, label: str) -> List[str]:
     if not isinstance(value, list):
         raise ValueError(f"{label} must be a list of email addresses")
@@ -2042,6 +2269,102 @@ def _normalize_logging_level(value: Any) -> str:
     return level
 
 
+def _normalize_capture_mode(value: Any) -> str:
+    capture_mode = _coerce_string(value, allow_empty=False).strip().lower()
+    if capture_mode not in WebcamConfig.CAPTURE_MODES:
+        raise ValueError(f"capture_mode must be one of {list(WebcamConfig.CAPTURE_MODES)}")
+    return capture_mode
+
+
+def _normalize_idle_capture(value: Any) -> str:
+    idle_capture = _coerce_string(value, allow_empty=False).strip().lower()
+    if idle_capture not in WebcamConfig.IDLE_CAPTURE_MODES:
+        raise ValueError(f"idle_capture must be one of {list(WebcamConfig.IDLE_CAPTURE_MODES)}")
+    return idle_capture
+
+
+def _normalize_video_source(value: Any) -> str:
+    source = _coerce_string(value, allow_empty=False).strip().lower()
+    if source not in WebcamConfig.SOURCES:
+        raise ValueError(f"source must be one of {list(WebcamConfig.SOURCES)}")
+    return source
+
+
+_CAMERA_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+def _normalize_camera_id(value: Any) -> str:
+    camera_id = _coerce_string(value, allow_empty=False).strip()
+    if not _CAMERA_ID_PATTERN.fullmatch(camera_id):
+        raise ValueError("camera_id must consist of letters, digits, '-' or '_'")
+    return camera_id
+
+
+def _normalize_additional_cameras(value: Any, *, primary_camera_id: str = "main") -> List[Dict[str, Any]]:
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ValueError("additional_cameras must be a list")
+    normalized: List[Dict[str, Any]] = []
+    seen_ids = {str(primary_camera_id)}
+    for index, entry in enumerate(value):
+        label = f"additional_cameras[{index}]"
+        if not isinstance(entry, dict):
+            raise ValueError(f"{label} must be a mapping")
+        unknown = sorted(str(key) for key in entry if key not in WebcamConfig.ADDITIONAL_CAMERA_KEYS)
+        if unknown:
+            raise ValueError(f"{label} has unsupported keys {unknown}")
+        if "camera_id" not in entry or "camera_index" not in entry:
+            raise ValueError(f"{label} requires camera_id and camera_index")
+        item: Dict[str, Any] = {"camera_id": _normalize_camera_id(entry["camera_id"])}
+        if item["camera_id"] in seen_ids:
+            raise ValueError(f"{label}.camera_id '{item['camera_id']}' is not unique")
+        seen_ids.add(item["camera_id"])
+        item["camera_index"] = _coerce_int(entry["camera_index"])
+        if item["camera_index"] < 0:
+            raise ValueError(f"{label}.camera_index must be >= 0")
+        if "default_resolution" in entry:
+            item["default_resolution"] = _normalize_resolution_dict(
+                entry["default_resolution"], label=f"{label}.default_resolution"
+            )
+        for key, minimum in (("fps", 1), ("preview_fps", 1), ("preview_max_width", 1)):
+            if key in entry:
+                item[key] = _coerce_int(entry[key])
+                if item[key] < minimum:
+                    raise ValueError(f"{label}.{key} must be >= {minimum}")
+        if "preview_jpeg_quality" in entry:
+            item["preview_jpeg_quality"] = _coerce_int(entry["preview_jpeg_quality"])
+            if not 1 <= item["preview_jpeg_quality"] <= 100:
+                raise ValueError(f"{label}.preview_jpeg_quality must be within [1, 100]")
+        if "preview_widths" in entry:
+            item["preview_widths"] = _normalize_preview_widths(entry["preview_widths"])
+        if "capture_mode" in entry:
+            item["capture_mode"] = _normalize_capture_mode(entry["capture_mode"])
+        if "source" in entry:
+            item["source"] = _normalize_video_source(entry["source"])
+        if "source_path" in entry:
+            item["source_path"] = _coerce_string(entry["source_path"]).strip()
+        if item.get("source") in ("file", "images") and not item.get("source_path"):
+            raise ValueError(f"{label}.source_path is required for source '{item['source']}'")
+        if "source_realtime" in entry:
+            item["source_realtime"] = _coerce_bool(entry["source_realtime"])
+        normalized.append(item)
+    return normalized
+
+
+def _normalize_preview_widths(value: Any) -> List[int]:
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise ValueError("preview_widths must be a list")
+    widths = sorted({_coerce_int(item) for item in value})
+    if any(width < 1 for width in widths):
+        raise ValueError("preview_widths entries must be >= 1")
+    if len(widths) > WebcamConfig.MAX_PREVIEW_WIDTHS:
+        raise ValueError(f"preview_widths supports at most {WebcamConfig.MAX_PREVIEW_WIDTHS} entries")
+    return widths
+
+
 def _normalize_image_format(value: Any) -> str:
     image_format = _coerce_string(value, allow_empty=False).lower()
     if image_format not in {"jpg", "jpeg", "png"}:
@@ -2188,7 +2511,19 @@ def _analyze_webcam_section(imported_data: Dict[str, Any], collector: _ConfigImp
             "preview_fps",
             "preview_max_width",
             "preview_jpeg_quality",
+            "preview_widths",
+            "capture_mode",
+            "camera_id",
+            "additional_cameras",
             "resolution",
+            "source",
+            "source_path",
+            "source_realtime",
+            "synthetic_objects",
+            "synthetic_noise",
+            "idle_capture",
+            "idle_fps",
+            "idle_grace_seconds",
         }:
             collector.add_unknown(f"webcam.{key}", value)
     _process_scalar_field(
@@ -2247,6 +2582,41 @@ def _analyze_webcam_section(imported_data: Dict[str, Any], collector: _ConfigImp
         converter=_coerce_int,
         validator=lambda value: _validate_range(value, 1, 100, label="preview_jpeg_quality"),
     )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="preview_widths",
+        path="webcam.preview_widths",
+        seen_paths=seen_paths,
+        converter=_normalize_preview_widths,
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="capture_mode",
+        path="webcam.capture_mode",
+        seen_paths=seen_paths,
+        converter=_normalize_capture_mode,
+    )
+    primary_camera_id = _process_scalar_field(
+        collector,
+        section_data,
+        key="camera_id",
+        path="webcam.camera_id",
+        seen_paths=seen_paths,
+        converter=_normalize_camera_id,
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="additional_cameras",
+        path="webcam.additional_cameras",
+        seen_paths=seen_paths,
+        converter=lambda value: _normalize_additional_cameras(
+            value,
+            primary_camera_id=primary_camera_id or collector._current_value("webcam.camera_id") or "main",
+        ),
+    )
     if "resolution" in section_data:
         path = "webcam.resolution"
         seen_paths.add(path)
@@ -2257,6 +2627,76 @@ def _analyze_webcam_section(imported_data: Dict[str, Any], collector: _ConfigImp
             collector.add_invalid(path, raw_value, str(exc))
         else:
             collector.add_valid(path, raw_value, normalized)
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="source",
+        path="webcam.source",
+        seen_paths=seen_paths,
+        converter=_normalize_video_source,
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="source_path",
+        path="webcam.source_path",
+        seen_paths=seen_paths,
+        converter=lambda value: _coerce_string(value).strip(),
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="source_realtime",
+        path="webcam.source_realtime",
+        seen_paths=seen_paths,
+        converter=_coerce_bool,
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="synthetic_objects",
+        path="webcam.synthetic_objects",
+        seen_paths=seen_paths,
+        converter=_coerce_int,
+        validator=lambda value: _validate_range(
+            value, 0, WebcamConfig.MAX_SYNTHETIC_OBJECTS, label="synthetic_objects"
+        ),
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="synthetic_noise",
+        path="webcam.synthetic_noise",
+        seen_paths=seen_paths,
+        converter=_coerce_int,
+        validator=lambda value: _validate_range(value, 0, WebcamConfig.MAX_SYNTHETIC_NOISE, label="synthetic_noise"),
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="idle_capture",
+        path="webcam.idle_capture",
+        seen_paths=seen_paths,
+        converter=_normalize_idle_capture,
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="idle_fps",
+        path="webcam.idle_fps",
+        seen_paths=seen_paths,
+        converter=_coerce_float,
+        validator=lambda value: _validate_range(value, 0.1, 30, label="idle_fps"),
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="idle_grace_seconds",
+        path="webcam.idle_grace_seconds",
+        seen_paths=seen_paths,
+        converter=_coerce_float,
+        validator=lambda value: _validate_min(value, 0, label="idle_grace_seconds"),
+    )
     _mark_missing_paths(collector, _CONFIG_IMPORT_PATHS["webcam"], seen_paths)
 
 
@@ -2372,6 +2812,19 @@ def _analyze_motion_section(imported_data: Dict[str, Any], collector: _ConfigImp
             "min_contour_area",
             "frame_skip",
             "processing_max_width",
+            "engine",
+            "difference_threshold",
+            "static_gate_enabled",
+            "static_gate_threshold",
+            "static_gate_refresh_frames",
+            "coarse_width",
+            "coarse_confirm_margin",
+            "governor_enabled",
+            "governor_cpu_budget",
+            "governor_latency_budget_ms",
+            "governor_max_fps",
+            "heatmap_width",
+            "zones",
         }:
             collector.add_unknown(f"motion_detection.{key}", value)
 
@@ -2491,6 +2944,124 @@ def _analyze_motion_section(imported_data: Dict[str, Any], collector: _ConfigImp
         converter=_coerce_int,
         validator=lambda value: _validate_min(value, 1, label="processing_max_width"),
     )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="engine",
+        path="motion_detection.engine",
+        seen_paths=seen_paths,
+        converter=_normalize_detector_engine,
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="difference_threshold",
+        path="motion_detection.difference_threshold",
+        seen_paths=seen_paths,
+        converter=_coerce_int,
+        validator=lambda value: _validate_range(value, 1, 255, label="difference_threshold"),
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="static_gate_enabled",
+        path="motion_detection.static_gate_enabled",
+        seen_paths=seen_paths,
+        converter=_coerce_bool,
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="static_gate_threshold",
+        path="motion_detection.static_gate_threshold",
+        seen_paths=seen_paths,
+        converter=_coerce_float,
+        validator=lambda value: _validate_range(value, 0, 255, label="static_gate_threshold"),
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="static_gate_refresh_frames",
+        path="motion_detection.static_gate_refresh_frames",
+        seen_paths=seen_paths,
+        converter=_coerce_int,
+        validator=lambda value: _validate_min(value, 1, label="static_gate_refresh_frames"),
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="coarse_width",
+        path="motion_detection.coarse_width",
+        seen_paths=seen_paths,
+        converter=_coerce_int,
+        validator=lambda value: None
+        if value == 0 or value >= MotionDetectionConfig.MIN_COARSE_WIDTH
+        else f"coarse_width must be 0 (off) or >= {MotionDetectionConfig.MIN_COARSE_WIDTH}",
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="coarse_confirm_margin",
+        path="motion_detection.coarse_confirm_margin",
+        seen_paths=seen_paths,
+        converter=_coerce_float,
+        validator=lambda value: _validate_range(value, 0, 10, label="coarse_confirm_margin"),
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="governor_enabled",
+        path="motion_detection.governor_enabled",
+        seen_paths=seen_paths,
+        converter=_coerce_bool,
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="governor_cpu_budget",
+        path="motion_detection.governor_cpu_budget",
+        seen_paths=seen_paths,
+        converter=_coerce_float,
+        validator=lambda value: _validate_range(value, 0.01, 4.0, label="governor_cpu_budget"),
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="governor_latency_budget_ms",
+        path="motion_detection.governor_latency_budget_ms",
+        seen_paths=seen_paths,
+        converter=_coerce_int,
+        validator=lambda value: _validate_min(value, 1, label="governor_latency_budget_ms"),
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="governor_max_fps",
+        path="motion_detection.governor_max_fps",
+        seen_paths=seen_paths,
+        converter=_coerce_float,
+        validator=lambda value: _validate_min(value, 0, label="governor_max_fps"),
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="heatmap_width",
+        path="motion_detection.heatmap_width",
+        seen_paths=seen_paths,
+        converter=_coerce_int,
+        validator=lambda value: None
+        if value == 0
+        or MotionDetectionConfig.HEATMAP_WIDTH_RANGE[0] <= value <= MotionDetectionConfig.HEATMAP_WIDTH_RANGE[1]
+        else "heatmap_width must be 0 (off) or within [{}, {}]".format(*MotionDetectionConfig.HEATMAP_WIDTH_RANGE),
+    )
+    _process_scalar_field(
+        collector,
+        section_data,
+        key="zones",
+        path="motion_detection.zones",
+        seen_paths=seen_paths,
+        converter=_normalize_motion_zones,
+    )
     _mark_missing_paths(collector, _CONFIG_IMPORT_PATHS["motion_detection"], seen_paths)
 
 
@@ -3101,6 +3672,20 @@ def sync_runtime_config_instances(
                 camera.uvc_config = config.uvc_controls
             if hasattr(camera, "measurement_config"):
                 camera.measurement_config = config.measurement
+            if hasattr(camera, "configure_detection_governor") and _paths_include_prefix(
+                applied_paths,
+                "motion_detection.governor_enabled",
+                "motion_detection.governor_cpu_budget",
+                "motion_detection.governor_latency_budget_ms",
+                "motion_detection.governor_max_fps",
+                "measurement.alert_delay_seconds",
+            ):
+                camera.configure_detection_governor()
+            if hasattr(camera, "configure_motion_heatmap") and _paths_include_prefix(
+                applied_paths,
+                "motion_detection.heatmap_width",
+            ):
+                camera.configure_motion_heatmap()
             result.refreshed_targets.append("camera")
         except Exception as exc:
             result.errors.append(f"camera sync failed: {exc}")
@@ -3126,9 +3711,27 @@ def sync_runtime_config_instances(
                     not full_motion_sync
                     and _paths_include_prefix(applied_paths, "motion_detection.region_of_interest")
                 )
+                zones_changed = (
+                    not full_motion_sync
+                    and _paths_include_prefix(applied_paths, "motion_detection.zones")
+                )
+                engine_changed = (
+                    not full_motion_sync
+                    and (
+                        _paths_include_prefix(applied_paths, "motion_detection.engine")
+                        or _paths_include_prefix(applied_paths, "motion_detection.difference_threshold")
+                    )
+                )
 
                 motion_detector.sensitivity = config.motion_detection.sensitivity
                 motion_detector.learning_rate = config.motion_detection.background_learning_rate
+                if hasattr(motion_detector, "static_gate_enabled"):
+                    motion_detector.static_gate_enabled = config.motion_detection.static_gate_enabled
+                    motion_detector.static_gate_threshold = config.motion_detection.static_gate_threshold
+                    motion_detector.static_gate_refresh_frames = config.motion_detection.static_gate_refresh_frames
+                if hasattr(motion_detector, "coarse_width"):
+                    motion_detector.coarse_width = config.motion_detection.coarse_width
+                    motion_detector.coarse_confirm_margin = config.motion_detection.coarse_confirm_margin
 
                 if full_motion_sync:
                     motion_detector.min_contour_area = config.motion_detection.min_contour_area
@@ -3144,7 +3747,16 @@ def sync_runtime_config_instances(
                     except Exception:
                         motion_detector.roi = ROI(enabled=False, x=0, y=0, width=0, height=0, points=[])
 
-                if roi_changed and hasattr(motion_detector, "reset_background_model"):
+                if hasattr(motion_detector, "set_engine") and (
+                    engine_changed
+                    or (full_motion_sync and getattr(motion_detector, "engine_name", None) != config.motion_detection.engine)
+                ):
+                    motion_detector.set_engine(config.motion_detection.engine)
+
+                if (full_motion_sync or zones_changed) and hasattr(motion_detector, "set_zones"):
+                    motion_detector.set_zones(config.motion_detection.get_zones())
+
+                if (roi_changed or zones_changed) and hasattr(motion_detector, "reset_background_model"):
                     motion_detector.reset_background_model()
                 result.refreshed_targets.append("motion_detector")
             except Exception as exc:
@@ -3408,6 +4020,7 @@ def _create_default_config(*, log_creation: bool = True) -> AppConfig:
             preview_fps=15,
             preview_max_width=1280,
             preview_jpeg_quality=70,
+            preview_widths=[320, 640, 1280],
             resolution=[{"width": 320, "height": 240},
                         {"width": 352, "height": 288},
                         {"width": 640, "height": 480},
@@ -3690,7 +4303,19 @@ def _prepare_for_yaml(cfg_dict: dict) -> dict:
                 "preview_fps",
                 "preview_max_width",
                 "preview_jpeg_quality",
+                "preview_widths",
+                "capture_mode",
+                "camera_id",
+                "source",
+                "source_path",
+                "source_realtime",
+                "synthetic_objects",
+                "synthetic_noise",
+                "idle_capture",
+                "idle_fps",
+                "idle_grace_seconds",
                 "resolution",
+                "additional_cameras",
             ],
         )
         wc = data["webcam"]
@@ -3701,12 +4326,22 @@ def _prepare_for_yaml(cfg_dict: dict) -> dict:
                 _order_map(item, ["width", "height"]) if isinstance(item, dict) else item
                 for item in wc["resolution"]
             ]
+        if isinstance(wc.get("additional_cameras"), list):
+            wc["additional_cameras"] = [
+                _order_map(item, list(WebcamConfig.ADDITIONAL_CAMERA_KEYS)) if isinstance(item, dict) else item
+                for item in wc["additional_cameras"]
+            ]
 
     # motion_detection.region_of_interest: übliche Reihenfolge
     md = data.get("motion_detection", {})
     if isinstance(md.get("region_of_interest"), dict):
         roi = md["region_of_interest"]
         md["region_of_interest"] = _order_map(roi, ["enabled", "x", "y", "width", "height"])
+    if isinstance(md.get("zones"), list):
+        md["zones"] = [
+            _order_map(zone, list(MotionDetectionConfig.ZONE_KEYS)) if isinstance(zone, dict) else zone
+            for zone in md["zones"]
+        ]
 
     # email.templates.alert: subject vor body
     try:
@@ -62,6 +62,21 @@ def cleanup_application_sync() -> None:
         except Exception as e:
             logger.error(f"Error during email cleanup: {e}")
 
+    # Additional cameras (webcam.additional_cameras) and their controllers
+    additional_cameras, additional_measurements = instances.get_additional_instances()
+    instances.set_additional_instances({}, {})
+    for camera_id, additional_measurement in additional_measurements.items():
+        try:
+            additional_measurement.cleanup()
+        except Exception as e:
+            logger.error(f"Error during measurement cleanup for camera '{camera_id}': {e}")
+    for camera_id, additional_camera in additional_cameras.items():
+        try:
+            if not _cleanup_camera_with_retries(additional_camera):
+                logger.warning(f"Camera '{camera_id}' cleanup completed partially after retries")
+        except Exception as e:
+            logger.error(f"Error during camera cleanup for '{camera_id}': {e}")
+
     # Camera (if sync cleanup is available/sufficient)
     if camera:
         try:
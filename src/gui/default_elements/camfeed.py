@@ -1,5 +1,9 @@
+import json
+import time
+
 from nicegui import ui
 
+from src.cam import camera as camera_module
 from src.cam.camera import Camera
 from src.config import get_logger
 from src.gui.easter_egg import create_dashboard_game_layer
@@ -7,8 +11,12 @@ from src.gui.ui_helpers import SECTION_ICONS, create_heading_row
 
 logger = get_logger('gui.camfeed')
 _VIDEO_STREAM_SOURCE = '/video_feed'
+_VIDEO_WS_SOURCE = '/video_ws'
+_HEATMAP_SOURCE = '/api/motion/heatmap'
+_HEATMAP_REFRESH_SECONDS = 5.0
 _DEFAULT_CAMFEED_ID = 'cvd-default-cam'
 _DEFAULT_CAMFEED_STATUS_ID = 'cvd-default-cam-status'
+_DEFAULT_CAMFEED_AGE_ID = 'cvd-default-cam-age'
 _DEFAULT_GOL_CONTROLS_ID = 'cvd-default-gol-controls'
 _DEFAULT_FEED_WIDTH = 1280
 _DEFAULT_FEED_HEIGHT = 720
@@ -49,7 +57,74 @@ def _build_camfeed_surface_style(width: int, height: int) -> str:
         'background:#0f172a;border:1px solid rgba(148, 163, 184, 0.24);'
     )
 
-def _build_camfeed_refresh_script() -> str:
+def _resolve_camfeed_stream_source(camera: Camera | None) -> str:
+    """Active camera streams via /video_feed, additional cameras via /video_feed/<camera_id>."""
+    camera_id = getattr(camera, "camera_id", None)
+    if camera is None or not isinstance(camera_id, str) or camera_module._get_active_video_camera() is camera:
+        return _VIDEO_STREAM_SOURCE
+    return f'{_VIDEO_STREAM_SOURCE}/{camera_id}'
+
+
+def _resolve_camfeed_ws_source(stream_source: str) -> str:
+    """WebSocket push endpoint matching an MJPEG stream source (/video_feed[/<id>] -> /video_ws[/<id>])."""
+    if stream_source.startswith(_VIDEO_STREAM_SOURCE):
+        return _VIDEO_WS_SOURCE + stream_source[len(_VIDEO_STREAM_SOURCE):]
+    return ''
+
+
+def _resolve_camfeed_heatmap_source(camera: Camera | None, stream_source: str) -> str | None:
+    """Heatmap overlay endpoint for the streamed camera, None while the heatmap is disabled."""
+    get_heatmap = getattr(camera, 'get_motion_heatmap', None)
+    if not callable(get_heatmap) or get_heatmap() is None:
+        return None
+    return _HEATMAP_SOURCE + stream_source[len(_VIDEO_STREAM_SOURCE):]
+
+
+def _create_heatmap_overlay(heatmap_source: str) -> None:
+    """Hidden activity heatmap over the feed plus its toggle; refreshed periodically while shown."""
+    overlay = (
+        ui.image('')
+        .classes('absolute inset-0 w-full h-full')
+        .style('pointer-events:none;opacity:0.65;')
+        .props('fit=fill no-spinner no-transition')
+    )
+    overlay.set_visibility(False)
+
+    def refresh() -> None:
+        overlay.set_source(f'{heatmap_source}?t={int(time.time())}')
+
+    timer = ui.timer(_HEATMAP_REFRESH_SECONDS, refresh, active=False)
+
+    def toggle() -> None:
+        visible = not overlay.visible
+        overlay.set_visibility(visible)
+        timer.active = visible
+        if visible:
+            refresh()
+
+    ui.button(icon='whatshot', on_click=toggle).props('flat round dense color=white').classes(
+        'absolute top-2 left-2 bg-slate-900/50'
+    ).tooltip('Show motion activity of this session')
+
+
+def _resolve_camfeed_preview_widths(camera: Camera | None) -> list[int]:
+    get_widths = getattr(camera, 'get_preview_widths', None)
+    if not callable(get_widths):
+        return []
+    try:
+        return sorted(int(width) for width in get_widths())
+    except Exception:
+        logger.debug('Could not resolve preview widths', exc_info=True)
+        return []
+
+
+def _build_camfeed_refresh_script(
+    stream_source: str = _VIDEO_STREAM_SOURCE,
+    preview_widths: list[int] | None = None,
+    ws_source: str | None = None,
+) -> str:
+    if ws_source is None:
+        ws_source = _resolve_camfeed_ws_source(stream_source)
     return (
         """
             <script>
@@ -72,6 +147,22 @@ def _build_camfeed_refresh_script() -> str:
                     if (state.onBeforeUnload) {
                         window.removeEventListener('beforeunload', state.onBeforeUnload);
                     }
+                    if (state.onResize) {
+                        window.removeEventListener('resize', state.onResize);
+                    }
+                    if (state.resizeTimer) {
+                        clearTimeout(state.resizeTimer);
+                        state.resizeTimer = null;
+                    }
+                    if (state.stallTimer) {
+                        clearTimeout(state.stallTimer);
+                        state.stallTimer = null;
+                    }
+                    if (state.socket) {
+                        var previousSocket = state.socket;
+                        state.socket = null;
+                        try { previousSocket.close(); } catch (e) {}
+                    }
 
                     function resolveImage(root) {
                         if (!root) return null;
@@ -81,9 +172,41 @@ def _build_camfeed_refresh_script() -> str:
                         if (qimg) return qimg;
                         return null;
                     }
+                    function resolvePreviewWidth(root) {
+                        // Smallest preview rung covering the rendered width (server: webcam.preview_widths)
+                        var widths = __DEFAULT_CAMFEED_PREVIEW_WIDTHS__;
+                        if (!widths || widths.length < 2 || !root) return null;
+                        var target = Math.round((root.clientWidth || 0) * (window.devicePixelRatio || 1));
+                        if (target <= 0) return null;
+                        for (var i = 0; i < widths.length; i++) {
+                            if (widths[i] >= target) return widths[i];
+                        }
+                        return widths[widths.length - 1];
+                    }
+                    function withPreviewWidth(url, root) {
+                        var width = resolvePreviewWidth(root);
+                        if (width === null) return url;
+                        return url + (url.indexOf('?') >= 0 ? '&' : '?') + 'w=' + width;
+                    }
                     function resolveStatus() {
                         return document.getElementById('__DEFAULT_CAMFEED_STATUS_ID__');
                     }
+                    function showFrameAge(capturedAt, sentAt, motion) {
+                        var label = document.getElementById('__DEFAULT_CAMFEED_AGE_ID__');
+                        if (!label) return;
+                        if (!capturedAt) {
+                            label.style.display = 'none';
+                            return;
+                        }
+                        var age = Date.now() / 1000 - capturedAt;
+                        if (age < 0 || age > 3600) {
+                            // Uhren von Browser und Server weichen ab: nur die serverseitige Verzögerung zeigen
+                            age = Math.max(0, sentAt - capturedAt);
+                        }
+                        label.textContent = Math.round(age * 1000) + ' ms' + (motion ? ' \u2022 motion' : '');
+                        label.dataset.frameAgeMs = String(Math.round(age * 1000));
+                        label.style.display = '';
+                    }
                     function setConwayReady(isReady) {
                         var value = isReady ? 'true' : 'false';
                         var ids = ['__DEFAULT_CAMFEED_ID__-gol-layer', '__DEFAULT_GOL_CONTROLS_ID__'];
@@ -146,6 +269,111 @@ def _build_camfeed_refresh_script() -> str:
                             start(true);
                         }, 900);
                     }
+                    function socketTarget() {
+                        if (state.wsDisabled || !('WebSocket' in window) || !'__DEFAULT_CAMFEED_WS_SOURCE__') return null;
+                        var protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
+                        return protocol + '//' + window.location.host + '__DEFAULT_CAMFEED_WS_SOURCE__';
+                    }
+                    function closeSocket() {
+                        if (state.stallTimer) {
+                            clearTimeout(state.stallTimer);
+                            state.stallTimer = null;
+                        }
+                        var socket = state.socket;
+                        state.socket = null;
+                        if (socket) {
+                            try { socket.close(); } catch (e) {}
+                        }
+                    }
+                    function armStallTimer(socket) {
+                        if (state.stallTimer) clearTimeout(state.stallTimer);
+                        state.stallTimer = window.setTimeout(function() {
+                            state.stallTimer = null;
+                            // Keine Frames mehr (z.B. hängender Proxy): Verbindung neu aufbauen
+                            if (state.socket === socket) {
+                                closeSocket();
+                                start(true);
+                            }
+                        }, 5000);
+                    }
+                    function handleSocketFrame(socket, img, data) {
+                        if (!(data instanceof ArrayBuffer) || data.byteLength < 32) return;
+                        var view = new DataView(data);
+                        // Header of streaming.build_ws_frame_message: 'CVDF', version, flags, size, seq, times, size
+                        if (view.getUint32(0, false) !== 0x43564446) return;
+                        var motion = (view.getUint8(5) & 1) === 1;
+                        var headerSize = view.getUint16(6, true);
+                        var sequence = view.getUint32(8, true);
+                        var capturedAt = view.getFloat64(12, true);
+                        var sentAt = view.getFloat64(20, true);
+                        var previousUrl = state.blobUrl;
+                        var blobUrl = URL.createObjectURL(new Blob([data.slice(headerSize)], { type: 'image/jpeg' }));
+                        state.blobUrl = blobUrl;
+                        state.socketFrames = (state.socketFrames || 0) + 1;
+                        armStallTimer(socket);
+                        var acknowledge = function() {
+                            img.removeEventListener('load', acknowledge);
+                            img.removeEventListener('error', acknowledge);
+                            if (previousUrl) URL.revokeObjectURL(previousUrl);
+                            // Ack nach dem Rendern: der Server schickt erst dann den nächsten Frame
+                            if (state.socket === socket) {
+                                try { socket.send(JSON.stringify({ ack: sequence })); } catch (e) {}
+                            }
+                        };
+                        img.addEventListener('load', acknowledge);
+                        img.addEventListener('error', acknowledge);
+                        try { img.src = blobUrl; } catch (e) {}
+                        showFrameAge(capturedAt, sentAt, motion);
+                    }
+                    function startSocket(root, img, force) {
+                        var target = socketTarget();
+                        if (!target) return false;
+                        var width = resolvePreviewWidth(root);
+                        var socket = state.socket;
+                        if (!force && socket && socket.readyState <= 1) {
+                            if (socket.readyState === 1 && state.socketWidth !== width) {
+                                try { socket.send(JSON.stringify({ w: width })); } catch (e) {}
+                                state.socketWidth = width;
+                            }
+                            return true;
+                        }
+                        closeSocket();
+                        try {
+                            socket = new WebSocket(width === null ? target : target + '?w=' + width);
+                        } catch (e) {
+                            state.wsDisabled = true;
+                            return false;
+                        }
+                        socket.binaryType = 'arraybuffer';
+                        state.socket = socket;
+                        state.socketWidth = width;
+                        state.socketFrames = 0;
+                        state.active = false;
+                        state.connecting = true;
+                        setPhase('loading');
+                        setStatus('Connecting camera...', 'loading');
+                        socket.onmessage = function(event) {
+                            if (state.socket === socket) handleSocketFrame(socket, img, event.data);
+                        };
+                        socket.onclose = function() {
+                            if (state.socket !== socket) return;
+                            state.socket = null;
+                            if (!state.socketFrames) {
+                                // Proxy lässt keine WebSockets durch: für diese Seite beim MJPEG-Stream bleiben
+                                state.wsFailures = (state.wsFailures || 0) + 1;
+                                if (state.wsFailures >= 2) state.wsDisabled = true;
+                            } else {
+                                state.wsFailures = 0;
+                            }
+                            state.active = false;
+                            showFrameAge(0, 0, false);
+                            setPhase('reconnecting');
+                            setStatus('Reconnecting camera...', 'reconnecting');
+                            scheduleReconnect();
+                        };
+                        armStallTimer(socket);
+                        return true;
+                    }
                     function bindImage(img) {
                         if (!img || state.boundImage === img) return;
                         cleanupImageListeners();
@@ -175,8 +403,10 @@ def _build_camfeed_refresh_script() -> str:
                         var img = resolveImage(root);
                         if (!img) return;
                         bindImage(img);
+                        if (startSocket(root, img, force)) return;
 
-                        var url = '/video_feed';
+                        var url = '__DEFAULT_CAMFEED_SOURCE__';
+                        url = withPreviewWidth(url, root);
                         var currentSrc = img.getAttribute('src') || '';
                         if (!force && currentSrc === url) {
                             if (img.complete && img.naturalWidth > 0) {
@@ -203,12 +433,18 @@ def _build_camfeed_refresh_script() -> str:
                     }
                     function stop() {
                         clearRetry();
+                        closeSocket();
                         var root = document.getElementById('__DEFAULT_CAMFEED_ID__');
                         var img = resolveImage(root);
                         if (img) {
                             try { img.removeAttribute('src'); } catch(e) {}
                             try { img.src = ''; } catch(e) {}
                         }
+                        if (state.blobUrl) {
+                            URL.revokeObjectURL(state.blobUrl);
+                            state.blobUrl = null;
+                        }
+                        showFrameAge(0, 0, false);
                         if (root) {
                             try { root.removeAttribute('src'); } catch(e) {}
                         }
@@ -228,11 +464,19 @@ def _build_camfeed_refresh_script() -> str:
                     };
                     state.onPageHide = stop;
                     state.onBeforeUnload = stop;
+                    state.onResize = function() {
+                        if (state.resizeTimer) clearTimeout(state.resizeTimer);
+                        state.resizeTimer = window.setTimeout(function() {
+                            state.resizeTimer = null;
+                            start(false);
+                        }, 400);
+                    };
 
                     document.addEventListener('visibilitychange', state.onVisibilityChange);
                     window.addEventListener('pageshow', state.onPageShow);
                     window.addEventListener('pagehide', state.onPageHide);
                     window.addEventListener('beforeunload', state.onBeforeUnload);
+                    window.addEventListener('resize', state.onResize);
 
                     window.__cvdDefaultCamState = state;
                     setPhase('loading');
@@ -243,8 +487,12 @@ def _build_camfeed_refresh_script() -> str:
             </script>
             """
         .replace('__DEFAULT_CAMFEED_STATUS_ID__', _DEFAULT_CAMFEED_STATUS_ID)
+        .replace('__DEFAULT_CAMFEED_AGE_ID__', _DEFAULT_CAMFEED_AGE_ID)
+        .replace('__DEFAULT_CAMFEED_WS_SOURCE__', ws_source)
         .replace('__DEFAULT_CAMFEED_ID__', _DEFAULT_CAMFEED_ID)
         .replace('__DEFAULT_GOL_CONTROLS_ID__', _DEFAULT_GOL_CONTROLS_ID)
+        .replace('__DEFAULT_CAMFEED_SOURCE__', stream_source)
+        .replace('__DEFAULT_CAMFEED_PREVIEW_WIDTHS__', json.dumps(list(preview_widths or [])))
     )
 
 
@@ -269,6 +517,7 @@ def create_camfeed_content(camera: Camera | None = None, *, camera_available: bo
             return
 
         feed_width, feed_height = _resolve_camfeed_dimensions(camera)
+        stream_source = _resolve_camfeed_stream_source(camera)
         ui.label('Connecting camera...').classes('text-caption font-medium text-slate-400').props(
             f'id={_DEFAULT_CAMFEED_STATUS_ID}'
         )
@@ -276,14 +525,21 @@ def create_camfeed_content(camera: Camera | None = None, *, camera_available: bo
             (
                 # interactive_image keeps its own reactive src state; leaving it empty
                 # makes JS-only img.src changes invisible and fragile on re-renders.
-                ui.interactive_image(_VIDEO_STREAM_SOURCE)
+                ui.interactive_image(stream_source)
                 .classes('w-full rounded-lg block')
                 .style(_build_camfeed_surface_style(feed_width, feed_height))
                 .props(f'id={_DEFAULT_CAMFEED_ID} data-conway-ready=false')
             )
+            # Frame age of the WebSocket push (hidden while the MJPEG fallback is used)
+            ui.label('').classes(
+                'absolute top-2 right-2 rounded bg-slate-900/70 px-2 py-0.5 text-caption text-slate-100'
+            ).style('display:none;pointer-events:none;').props(f'id={_DEFAULT_CAMFEED_AGE_ID}')
+            heatmap_source = _resolve_camfeed_heatmap_source(camera, stream_source)
+            if heatmap_source:
+                _create_heatmap_overlay(heatmap_source)
             game_layer = create_dashboard_game_layer(
                 stream_host_id=_DEFAULT_CAMFEED_ID,
                 controls_host_id=_DEFAULT_GOL_CONTROLS_ID,
             )
         game_layer.build_controls()
-        ui.add_body_html(_build_camfeed_refresh_script())
+        ui.add_body_html(_build_camfeed_refresh_script(stream_source, _resolve_camfeed_preview_widths(camera)))
@@ -1,15 +1,16 @@
-from nicegui import ui, app
+from nicegui import ui
 import hashlib
 import json
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any
 from src.alert_history import (
-    HISTORY_STATIC_ROUTE,
+    HISTORY_FILE_NAME,
     build_history_image_url,
+    export_history_json,
     get_history_dir,
     get_history_file,
     get_history_revision,
-    load_history_entries,
+    iter_history_entries,
     parse_history_timestamp,
     register_history_listener,
     replace_history_entries,
@@ -38,7 +39,7 @@ def _history_row_id(entry: Dict[str, Any], occurrence_index: int) -> str:
     return f'{digest}-{occurrence_index}'
 
 def _build_history_rows(
-    entries: List[Dict[str, Any]],
+    entries: Iterable[Dict[str, Any]],
     *,
     history_dir: Path,
     max_entries: int,
@@ -113,7 +114,13 @@ def create_history_card(*, max_entries: int = 5) -> None:
 
     def load_history() -> List[Dict[str, Any]]:
         try:
-            data = load_history_entries(history_file=history_file, entry_type='alert')
+            # Nur die neuesten Einträge streamen statt die ganze Historie zu laden
+            data = iter_history_entries(
+                history_file=history_file,
+                entry_type='alert',
+                newest_first=True,
+                limit=max(0, int(max_entries)),
+            )
             return _build_history_rows(data, history_dir=history_dir, max_entries=max_entries)
         except Exception as e:
             logger.error(f"Error loading history: {e}")
@@ -206,17 +213,12 @@ def create_history_card(*, max_entries: int = 5) -> None:
 
     def download_history() -> None:
         try:
-            if not history_file.exists():
-                ui.notify("No history file found", type="warning")
+            if next(iter_history_entries(history_file=history_file, limit=1), None) is None:
+                ui.notify("No history entries found", type="warning")
                 return
 
-            history_dir.mkdir(parents=True, exist_ok=True)
-            try:
-                app.add_static_files(HISTORY_STATIC_ROUTE, str(history_dir))
-            except Exception:
-                pass
-
-            ui.download.from_url(f'{HISTORY_STATIC_ROUTE}/{history_file.name}')
+            # Der Store ist SQLite; der Download exportiert weiterhin das gewohnte JSON-Format
+            ui.download.content(export_history_json(history_file=history_file), HISTORY_FILE_NAME)
             ui.notify("history.json downloaded", type="positive")
         except Exception as e:
             logger.error(f"Error downloading history file: {e}")
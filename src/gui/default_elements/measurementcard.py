@@ -25,10 +25,10 @@ from src.gui.duration_utils import (
 )
 from src.gui.ui_helpers import SECTION_ICONS, create_heading_row
 from src.gui.util import notify_user, schedule_bg
-from typing import TYPE_CHECKING, Optional, Any
+from typing import TYPE_CHECKING, Awaitable, Callable, Optional, Any
 
 if TYPE_CHECKING:
-    from src.measurement import MeasurementController
+    from src.measurement import MeasurementController, SessionStatusSnapshot
 
 logger = get_logger('gui.measurement')
 
@@ -63,6 +63,31 @@ def _calculate_session_progress_ratio(elapsed: timedelta, session_max: timedelta
     return max(0.0, min(elapsed.total_seconds() / max_seconds, 1.0))
 
 
+def _format_summary_seconds(seconds: Any) -> str:
+    total = max(0, int(round(float(seconds or 0))))
+    hours, remainder = divmod(total, 3600)
+    minutes, secs = divmod(remainder, 60)
+    return f'{hours}:{minutes:02d}:{secs:02d}' if hours else f'{minutes:02d}:{secs:02d}'
+
+
+def _format_session_summary(summary: Any) -> str:
+    """One-line text for the summary record of the last finished session."""
+    if not isinstance(summary, dict):
+        return '-'
+    parts = [
+        _format_summary_seconds(summary.get('duration_s')),
+        f"motion {float(summary.get('motion_duty_cycle') or 0.0):.0%}",
+        f"longest still {_format_summary_seconds(summary.get('longest_still_s'))}",
+        f"alerts {int(summary.get('alerts') or 0)}",
+        f"mean area {float(summary.get('mean_contour_area') or 0.0):.0f} px",
+        f"{float(summary.get('detector_fps') or 0.0):.1f} fps",
+    ]
+    dropped = summary.get('detector_dropped')
+    if dropped:
+        parts.append(f'{int(dropped)} dropped')
+    return ' · '.join(parts)
+
+
 def _normalize_active_groups_value(raw_value: Any, *, valid_options: Optional[list[str]] = None) -> list[str]:
     if raw_value is None:
         values: list[Any] = []
@@ -497,6 +522,8 @@ def create_measurement_card(
             if last_measurement else '-'
         )
 
+        summary_label.text = _format_session_summary(status.get('last_session_summary'))
+
         alert_counter_view = _derive_alert_counter_view_state(status)
         if alerts_count_label is not None:
             alerts_count_label.text = alert_counter_view['alerts_count_text']
@@ -538,6 +565,7 @@ def create_measurement_card(
         motion_label.update()
         alert_label.update()
         last_label.update()
+        summary_label.update()
 
 
     configured_timeout_seconds = _get_config_session_timeout_seconds()
@@ -793,6 +821,11 @@ def create_measurement_card(
                 ui.label('Last Run:').classes('text-caption font-bold text-grey-7')
             last_label = ui.label('-').classes('text-caption text-grey')
 
+            with ui.row().classes('items-center gap-2'):
+                ui.icon('summarize').classes('text-grey-7 text-sm shrink-0')
+                ui.label('Summary:').classes('text-caption font-bold text-grey-7')
+            summary_label = ui.label('-').classes('text-caption text-grey')
+
         ui.separator().classes('my-4')
 
         with ui.card().classes('w-full p-3 gap-3'):
@@ -1108,6 +1141,35 @@ def create_measurement_card(
         notify_user('Alert counter reset' if reset else 'Alert counter decreased', kind='positive')
 
 
+    get_status_snapshot: Optional[Callable[[], SessionStatusSnapshot]] = getattr(
+        measurement_controller, 'get_status_snapshot', None
+    )
+    wait_for_status_version: Optional[Callable[..., Awaitable[SessionStatusSnapshot]]] = getattr(
+        measurement_controller, 'wait_for_status_version', None
+    )
+    rendered_signature: tuple[int, bool] | None = None
+
+    def _read_changed_status() -> dict[str, Any] | None:
+        """Return the status to render, or None while an idle dashboard has nothing new to show."""
+        nonlocal rendered_signature, status_error_logged
+
+        if not callable(get_status_snapshot):
+            return _safe_get_status()
+        try:
+            snapshot = get_status_snapshot()
+        except Exception:
+            return _safe_get_status()
+        camera_available = bool(runtime_camera.is_camera_available()) if runtime_camera else False
+        signature = (int(snapshot.version), camera_available)
+        # Ohne aktive Session gibt es keine laufenden Zähler: nur bei neuer Version rendern
+        if signature == rendered_signature and not snapshot.is_active:
+            return None
+        rendered_signature = signature
+        if status_error_logged:
+            logger.info('Measurement status retrieval recovered')
+            status_error_logged = False
+        return snapshot.to_status()
+
     def tick() -> None:
         """Per-client UI refresh. Session timeout is checked centrally by the controller."""
         try:
@@ -1115,7 +1177,9 @@ def create_measurement_card(
                 if measurement_refresh_timer is not None:
                     measurement_refresh_timer.cancel()
                 return
-            current_status = _safe_get_status()
+            current_status = _read_changed_status()
+            if current_status is None:
+                return
             _request_view_refresh(current_status)
             style_start_button(current_status)
         except RuntimeError as exc:
@@ -1153,6 +1217,26 @@ def create_measurement_card(
     refresh_interval_seconds = max(0.2, float(raw_refresh_interval_ms or 1000) / 1000.0)
     measurement_refresh_timer = ui.timer(refresh_interval_seconds, tick)
 
+    async def _watch_status_changes() -> None:
+        """Re-render as soon as the controller publishes a new status version."""
+        wait_for_version = wait_for_status_version
+        if not callable(wait_for_version):
+            return
+        seen_version = rendered_signature[0] if rendered_signature is not None else -1
+        while not getattr(start_stop_btn, '_deleted', False):
+            try:
+                snapshot = await wait_for_version(seen_version, timeout=30.0)
+            except Exception:
+                logger.debug('Measurement status watch stopped', exc_info=True)
+                return
+            if snapshot.version == seen_version:
+                continue
+            seen_version = snapshot.version
+            tick()
+
+    if callable(wait_for_status_version):
+        schedule_bg(_watch_status_changes(), name=f'measurement_status_watch_{id(start_stop_btn)}')
+
     sync_duration_controls(bool(initial_status.get('is_active', False)))
     update_duration_ui()
     _request_view_refresh(initial_status)
@@ -21,6 +21,47 @@ if TYPE_CHECKING:
 
 logger = get_logger('gui.motion_status')
 
+_SPARKLINE_WINDOW_SECONDS = 60.0
+_SPARKLINE_BUCKETS = 60
+_SPARKLINE_REFRESH_SECONDS = 2.0
+
+
+def _create_contour_area_sparkline(measurement_controller: Optional['MeasurementController']) -> None:
+    """Small line chart of the peak contour area per second over the last minute."""
+    get_activity = getattr(measurement_controller, 'get_motion_activity', None)
+    if not callable(get_activity):
+        return
+
+    ui.label(f'Contour area (last {int(_SPARKLINE_WINDOW_SECONDS)} s)').classes('text-caption text-grey-7 mt-1')
+    chart = ui.echart({
+        'grid': {'left': 0, 'right': 0, 'top': 4, 'bottom': 0},
+        'tooltip': {'trigger': 'axis'},
+        'xAxis': {'type': 'category', 'show': False, 'data': list(range(_SPARKLINE_BUCKETS))},
+        'yAxis': {'type': 'value', 'show': False, 'min': 0},
+        'series': [{
+            'name': 'Contour area',
+            'type': 'line',
+            'data': [],
+            'showSymbol': False,
+            'connectNulls': False,
+            'areaStyle': {'color': '#19bfd2', 'opacity': 0.3},
+            'lineStyle': {'color': '#19bfd2', 'width': 1},
+        }],
+        'backgroundColor': 'transparent',
+    }).classes('w-full h-16')
+
+    def refresh() -> None:
+        try:
+            activity = get_activity(seconds=_SPARKLINE_WINDOW_SECONDS, buckets=_SPARKLINE_BUCKETS)
+        except Exception as exc:
+            logger.debug(f"Motion activity unavailable: {exc}")
+            return
+        chart.options['series'][0]['data'] = activity.get('contour_area', [])
+        chart.update()
+
+    refresh()
+    ui.timer(_SPARKLINE_REFRESH_SECONDS, refresh)
+
 
 def create_motion_status_element(
     camera: Camera | None,
@@ -29,8 +70,6 @@ def create_motion_status_element(
     header_action: Literal['settings', 'refresh'] = 'settings',
     anchor_id: Optional[str] = None,
 ) -> None:
-    del measurement_controller  # kept for compatibility with existing call sites
-
     _ensure_motion_update_route_registered()
 
     def _render_header_button(*, on_refresh: Optional[Callable[[], None]] = None, enabled: bool = True) -> None:
@@ -144,6 +183,7 @@ def create_motion_status_element(
                                 .classes('text-h6')
             timestamp_label = ui.label('').classes('text-caption') \
                                 .style('white-space: nowrap')
+            _create_contour_area_sparkline(measurement_controller)
             with ui.expansion('Sensitivity', value=False, icon='tune').props('expand-separator').classes('w-full mt-2'):
                 with ui.column().classes('w-full gap-2 pt-2'):
                     create_motion_sensitivity_controls(
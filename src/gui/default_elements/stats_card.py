@@ -5,7 +5,7 @@ from collections import defaultdict
 from src.alert_history import (
     get_history_file,
     get_history_revision,
-    load_history_entries,
+    iter_history_entries,
     parse_history_timestamp,
     register_history_listener,
     unregister_history_listener,
@@ -24,7 +24,12 @@ def create_stats_card() -> None:
     
     def load_history() -> List[Dict[str, Any]]:
         try:
-            return load_history_entries(history_file=history_file, entry_type='alert')
+            # Das Diagramm zeigt nur 24 Stunden; ältere Einträge gar nicht erst dekodieren
+            return list(iter_history_entries(
+                history_file=history_file,
+                entry_type='alert',
+                since=datetime.now() - timedelta(hours=24),
+            ))
         except Exception as e:
             logger.error(f"Error loading history for stats: {e}")
             return []
@@ -6,7 +6,13 @@ from src.gui.default_elements.history_card import create_history_card
 from src.gui.default_elements.measurementcard import create_measurement_card
 from src.gui.default_elements.motion_status_element import create_motion_status_element
 from src.gui.default_elements.stats_card import create_stats_card
-from src.gui.instances import get_camera, get_email_system, get_measurement_controller, get_startup_warnings
+from src.gui.instances import (
+    get_camera_by_id,
+    get_camera_ids,
+    get_email_system,
+    get_measurement_for_camera,
+    get_startup_warnings,
+)
 from src.gui.layout import build_footer, build_header
 
 logger = get_logger('gui.index')
@@ -19,12 +25,25 @@ def _collect_startup_warnings() -> list[str]:
     return get_startup_warnings()
 
 
+def _build_camera_selector(selected_camera_id: str | None) -> None:
+    camera_ids = get_camera_ids()
+    if len(camera_ids) < 2:
+        return
+    with ui.row().classes('w-full items-center gap-2'):
+        ui.label('Camera').classes('text-body2 font-medium')
+        ui.select(
+            camera_ids,
+            value=selected_camera_id if selected_camera_id in camera_ids else camera_ids[0],
+            on_change=lambda event: ui.navigate.to(f'/?camera_id={event.value}'),
+        ).props('dense outlined').classes('min-w-[160px]')
+
+
 @ui.page('/')
-def index_page() -> None:
-    """Main dashboard page."""
-    camera = get_camera()
+def index_page(camera_id: str | None = None) -> None:
+    """Main dashboard page; ``?camera_id=`` selects one of several cameras."""
+    camera = get_camera_by_id(camera_id)
     email_system = get_email_system()
-    measurement_controller = get_measurement_controller()
+    measurement_controller = get_measurement_for_camera(camera)
     startup_warnings = _collect_startup_warnings()
 
     build_header(current_route='/')
@@ -35,6 +54,7 @@ def index_page() -> None:
                 ui.label('Startup Warnings').classes('text-h6 font-semibold')
                 for message in startup_warnings:
                     ui.label(message).classes('text-body2')
+        _build_camera_selector(getattr(camera, 'camera_id', None))
         with ui.row().classes('w-full items-stretch gap-4 flex-col xl:flex-row'):
             with ui.column().classes('w-full flex-[1_1_0%] min-w-0'):
                 create_camfeed_content(camera=camera)
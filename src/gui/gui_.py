@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Callable
 from datetime import datetime
 import json
 import threading
@@ -27,6 +27,7 @@ from .power_actions import get_power_action_spec
 logger = get_logger("gui")
 
 from .layout import build_header, build_footer, compute_gui_title, install_overlay_styles
+from .motion_runtime import subscribe_motion_hub
 from .util import (
     favicon_check_circle_green,
     favicon_radio_button_checked_neutral,
@@ -464,33 +465,35 @@ def register_client_runtime_title_sync(
             schedule_gui_sync=True,
         )
 
-    def _motion_listener(result: Any) -> None:
-        if isinstance(result, dict):
-            raw_motion = result.get('motion_detected')
-        else:
-            raw_motion = getattr(result, 'motion_detected', result if isinstance(result, bool) else None)
+    def _motion_listener(motion: bool, _changed_at: Any = None) -> None:
         sync_runtime_measurement_state(
-            recent_motion_detected=None if raw_motion is None else bool(raw_motion),
+            recent_motion_detected=bool(motion),
             client=client,
             schedule_gui_sync=True,
         )
 
+    unsubscribe_motion: Callable[[], None] | None = None
+
     def _cleanup() -> None:
         try:
             measurement_controller.unregister_session_state_callback(_session_listener)
         except Exception:
             logger.exception('Failed to unregister runtime title listener')
-        unregister_motion_callback = getattr(measurement_controller, 'unregister_motion_callback', None)
-        if callable(unregister_motion_callback):
+        if unsubscribe_motion is not None:
             try:
-                unregister_motion_callback(_motion_listener)
+                unsubscribe_motion()
             except Exception:
                 logger.exception('Failed to unregister runtime motion listener')
 
     measurement_controller.register_session_state_callback(_session_listener)
-    register_motion_callback = getattr(measurement_controller, 'register_motion_callback', None)
-    if callable(register_motion_callback):
-        register_motion_callback(_motion_listener)
+    if callable(getattr(measurement_controller, 'register_motion_callback', None)):
+        # Alle Clients teilen sich einen Controller-Callback über den Motion-Hub
+        unsubscribe_motion = subscribe_motion_hub(
+            measurement_controller,
+            _motion_listener,
+            kind='measurement',
+            logger=logger,
+        )
     setattr(client, cleanup_attr_name, _cleanup)
 
     disconnect_handler = getattr(client, disconnect_attr_name, None)
@@ -14,13 +14,14 @@ from src.config import (
     load_config,
     set_global_config,
 )
+from src.alert_history import get_history_file, migrate_legacy_history
 from src.cam.camera import Camera
 from src.measurement import create_measurement_controller_from_config, MeasurementController
 from src.notify import create_email_system_from_config, EMailSystem
 from src.gui import instances
 
 if TYPE_CHECKING:
-    from src.config import AppConfig
+    from src.config import AppConfig, WebcamConfig
 
 logger = logging.getLogger('cvd_tracker.gui.init')
 def _load_effective_config(config_path: str) -> "AppConfig":
@@ -121,6 +122,73 @@ def _create_camera(config: "AppConfig") -> Camera:
     )
 
 
+def _create_additional_camera(config: "AppConfig", webcam_config: "WebcamConfig") -> Camera:
+    camera_id = getattr(webcam_config, "camera_id", "camera")
+    return Camera(
+        config,
+        logger=get_logger(f'camera.{camera_id}'),
+        async_init=False,
+        initialize=False,
+        webcam_config=webcam_config,
+    )
+
+
+def _cleanup_additional_runtime() -> None:
+    cameras, measurements = instances.get_additional_instances()
+    instances.set_additional_instances({}, {})
+    for camera_id, measurement in measurements.items():
+        _cleanup_optional_component(measurement, label=f"measurement '{camera_id}'")
+    for camera_id, camera in cameras.items():
+        camera_module._unregister_video_camera(camera)
+        _cleanup_optional_component(camera, label=f"camera '{camera_id}'")
+
+
+def _replace_additional_cameras(
+    config: "AppConfig",
+    email: Optional[EMailSystem],
+    report: instances.InitializationReport,
+) -> None:
+    """
+    (Re)start the cameras listed in ``webcam.additional_cameras``.
+
+    Each one gets its own capture/detection threads, its own measurement
+    controller and the routes /video_feed/<camera_id> and /video/frame/<camera_id>.
+    A failing additional camera is reported but never degrades the primary runtime.
+    """
+    _cleanup_additional_runtime()
+    get_camera_configs = getattr(getattr(config, "webcam", None), "get_camera_configs", None)
+    if not callable(get_camera_configs):
+        return
+
+    cameras: dict[str, Camera] = {}
+    measurements: dict[str, MeasurementController] = {}
+    for webcam_config in get_camera_configs()[1:]:
+        camera_id = str(getattr(webcam_config, "camera_id", ""))
+        camera: Optional[Camera] = None
+        try:
+            logger.info("Initializing additional camera '%s'...", camera_id)
+            camera = _create_additional_camera(config, webcam_config)
+            if not camera.initialize_sync():
+                raise camera.initialization_error or RuntimeError("Camera initialization did not reach a ready state")
+            camera_module._register_video_camera(camera)
+            camera.start_frame_capture()
+            measurements[camera_id] = create_measurement_controller_from_config(
+                config=config,
+                # Eigener Alert-Zustand je Kamera, sonst setzen sich die Sessions gegenseitig zurück
+                email_system=email.for_camera(camera_id) if email is not None else None,
+                camera=camera,
+                logger=get_logger(f'measurement.{camera_id}'),
+            )
+            cameras[camera_id] = camera
+        except Exception as exc:
+            report.additional_camera_errors[camera_id] = str(exc)
+            logger.warning("Additional camera '%s' degraded startup: %s", camera_id, exc)
+            if camera is not None:
+                camera_module._unregister_video_camera(camera)
+                _cleanup_optional_component(camera, label=f"camera '{camera_id}'")
+    instances.set_additional_instances(cameras, measurements)
+
+
 def _restore_video_runtime(camera: object | None) -> None:
     if camera is None:
         camera_module._clear_active_video_camera(force=True)
@@ -274,6 +342,16 @@ def _commit_runtime(
         skip=(measurement, email, camera),
         label_prefix="previous",
     )
+    _replace_additional_cameras(config, email, report)
+
+
+def _migrate_legacy_alert_history(config: "AppConfig") -> None:
+    """Import a legacy history.json into the SQLite store once, before any component reads it."""
+    try:
+        if migrate_legacy_history(history_file=get_history_file(config.measurement)):
+            logger.info("Legacy alert history migrated")
+    except Exception:
+        logger.exception("Failed to migrate legacy alert history")
 
 
 def init_application(config_path: str = "config/config.yaml") -> instances.InitializationReport:
@@ -298,6 +376,7 @@ def init_application(config_path: str = "config/config.yaml") -> instances.Initi
         report.config_ok = True
         report.config_warnings = get_global_config_warnings()
         logger.info('Configuration loaded successfully')
+        _migrate_legacy_alert_history(config)
     except ConfigLoadError as exc:
         report.config_error = str(exc)
         logger.error("Failed to load config: %s", exc)
@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from src.cam.camera import Camera
 from src.measurement import MeasurementController
@@ -25,6 +25,12 @@ __all__ = [
     'get_email',
     'get_measurement_controller',
     'get_email_system',
+    'set_additional_instances',
+    'get_additional_instances',
+    'get_cameras',
+    'get_camera_ids',
+    'get_camera_by_id',
+    'get_measurement_for_camera',
 ]
 
 
@@ -39,6 +45,8 @@ class InitializationReport:
     email_error: str | None = None
     measurement_ok: bool = False
     measurement_error: str | None = None
+    # Fehler zusätzlicher Kameras (additional_cameras) je camera_id; die primäre Kamera bleibt maßgeblich
+    additional_camera_errors: dict[str, str] = field(default_factory=dict)
 
     @property
     def degraded(self) -> bool:
@@ -59,6 +67,9 @@ class InitializationReport:
             messages.append(f"E-Mail: {self.email_error}")
         if self.measurement_error:
             messages.append(f"Measurement: {self.measurement_error}")
+        messages.extend(
+            f"Camera '{camera_id}': {error}" for camera_id, error in self.additional_camera_errors.items() if error
+        )
         return messages
 
     def summary(self) -> str:
@@ -74,6 +85,9 @@ _camera: Optional[Camera] = None
 _measurement: Optional[MeasurementController] = None
 _email: Optional[EMailSystem] = None
 _startup_report: Optional[InitializationReport] = None
+# Zusätzliche Kameras und ihre Controller, jeweils nach camera_id
+_additional_cameras: Dict[str, Camera] = {}
+_additional_measurements: Dict[str, MeasurementController] = {}
 
 
 def set_instances(
@@ -146,6 +160,48 @@ def get_email() -> Optional[EMailSystem]:
     return _email
 
 
+def set_additional_instances(
+    cameras: Dict[str, Camera],
+    measurements: Dict[str, MeasurementController],
+) -> None:
+    global _additional_cameras, _additional_measurements
+    _additional_cameras = dict(cameras)
+    _additional_measurements = dict(measurements)
+
+
+def get_additional_instances() -> Tuple[Dict[str, Camera], Dict[str, MeasurementController]]:
+    return dict(_additional_cameras), dict(_additional_measurements)
+
+
+def get_cameras() -> List[Camera]:
+    """All running cameras, primary camera first."""
+    cameras: List[Camera] = [] if _camera is None else [_camera]
+    cameras.extend(camera for camera in _additional_cameras.values() if camera is not _camera)
+    return cameras
+
+
+def get_camera_ids() -> List[str]:
+    return [str(getattr(camera, "camera_id", "main")) for camera in get_cameras()]
+
+
+def get_camera_by_id(camera_id: Optional[str]) -> Optional[Camera]:
+    """Camera for ``camera_id``; ``None`` (or an unknown id) yields the primary camera."""
+    if camera_id:
+        for camera in get_cameras():
+            if getattr(camera, "camera_id", None) == camera_id:
+                return camera
+    return _camera
+
+
+def get_measurement_for_camera(camera: Optional[Camera]) -> Optional[MeasurementController]:
+    if camera is None or camera is _camera:
+        return _measurement
+    for camera_id, candidate in _additional_cameras.items():
+        if candidate is camera:
+            return _additional_measurements.get(camera_id)
+    return None
+
+
 # Aliases for convenience and clearer naming
 get_measurement_controller = get_measurement
 get_email_system = get_email
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 import hmac
 import logging
@@ -12,11 +13,14 @@ from fastapi.responses import JSONResponse
 from nicegui import app
 
 from src.cam.camera import Camera
+from src.config import get_global_config
 from src.gui.util import register_client_disconnect_handler
 
 MotionStateListener = Callable[[bool, Optional[datetime]], None]
 ApiMotionListener = Callable[[bool, datetime], None]
 
+DEFAULT_MOTION_UPDATE_INTERVAL_MS = 100
+
 _api_state_lock = threading.RLock()
 _api_motion_detected = False
 _api_last_changed: Optional[datetime] = None
@@ -184,6 +188,225 @@ def _timestamp_to_datetime(raw_timestamp: Any) -> Optional[datetime]:
     return None
 
 
+def _motion_fields(result: Any) -> tuple[Optional[bool], Optional[datetime]]:
+    if isinstance(result, dict):
+        raw_motion = result.get('motion_detected')
+        raw_timestamp = result.get('timestamp')
+    else:
+        raw_motion = getattr(result, 'motion_detected', result if isinstance(result, bool) else None)
+        raw_timestamp = getattr(result, 'timestamp', None)
+    if raw_motion is None:
+        return None, None
+    return bool(raw_motion), _timestamp_to_datetime(raw_timestamp)
+
+
+def _resolve_motion_update_interval_seconds() -> float:
+    try:
+        gui_config = getattr(get_global_config(), 'gui', None)
+    except Exception:
+        gui_config = None
+    raw_interval = getattr(gui_config, 'update_interval_ms', DEFAULT_MOTION_UPDATE_INTERVAL_MS)
+    try:
+        interval_ms = int(raw_interval)
+    except (TypeError, ValueError):
+        interval_ms = DEFAULT_MOTION_UPDATE_INTERVAL_MS
+    return max(1, interval_ms) / 1000.0
+
+
+class MotionStateHub:
+    """
+    Single fan-out point between one motion source and all GUI subscribers.
+
+    The hub registers exactly one callback with its source (a camera or the
+    measurement controller). On the capture thread that callback only compares
+    the motion flag with the previous one; a transition stores the new state
+    and wakes one asyncio publisher task. The task hands the latest state to
+    every subscriber at most once per ``gui.update_interval_ms``, so per-frame
+    work stays O(1) however many browser tabs are open. Without a running
+    event loop (tests, scripts) transitions are delivered synchronously.
+    """
+
+    def __init__(
+        self,
+        source: Any,
+        *,
+        kind: str,
+        logger: Optional[logging.Logger] = None,
+    ) -> None:
+        self.source = source
+        self.kind = kind
+        self.logger = logger or logging.getLogger('gui.motion_runtime')
+        self._lock = threading.RLock()
+        self._subscribers: list[MotionStateListener] = []
+        self._last_source_motion: Optional[bool] = None
+        self._pending: Optional[tuple[bool, Optional[datetime]]] = None
+        self._publish_scheduled = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._legacy_callback = lambda _frame, result: self.on_motion_result(result)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def on_motion_result(self, result: Any) -> None:
+        """Source callback; runs once per processed frame on the capture thread."""
+        motion, changed_at = _motion_fields(result)
+        if motion is None or motion == self._last_source_motion:
+            return
+        self._last_source_motion = motion
+        self._offer(motion, changed_at)
+
+    def on_api_motion_update(self, motion: bool, changed_at: datetime) -> None:
+        self._offer(bool(motion), changed_at)
+
+    def _offer(self, motion: bool, changed_at: Optional[datetime]) -> None:
+        with self._lock:
+            self._pending = (motion, changed_at)
+            if self._publish_scheduled:
+                return
+            self._publish_scheduled = True
+            loop = self._loop
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._start_publisher)
+                return
+            except RuntimeError:
+                # Event-Loop bereits geschlossen (Shutdown): direkt zustellen
+                pass
+        with self._lock:
+            self._publish_scheduled = False
+        self._flush()
+
+    def _start_publisher(self) -> None:
+        loop = self._loop
+        if loop is None:
+            with self._lock:
+                self._publish_scheduled = False
+            self._flush()
+            return
+        loop.create_task(self._run_publisher())
+
+    async def _run_publisher(self) -> None:
+        while True:
+            self._flush()
+            await asyncio.sleep(_resolve_motion_update_interval_seconds())
+            with self._lock:
+                if self._pending is None:
+                    self._publish_scheduled = False
+                    return
+
+    def _flush(self) -> None:
+        with self._lock:
+            pending = self._pending
+            self._pending = None
+            subscribers = list(self._subscribers)
+        if pending is None:
+            return
+        motion, changed_at = pending
+        for subscriber in subscribers:
+            try:
+                subscriber(motion, changed_at)
+            except Exception:
+                self.logger.exception('Failed to notify motion hub subscriber')
+
+    def _attach(self) -> None:
+        if self.kind == 'measurement':
+            self.source.register_motion_callback(self.on_motion_result)
+            return
+        register_result = getattr(self.source, 'register_motion_result_callback', None)
+        if callable(register_result):
+            register_result(self.on_motion_result)
+        else:
+            self.source.enable_motion_detection(self._legacy_callback)
+        _register_api_motion_listener(self.on_api_motion_update)
+
+    def _detach(self) -> None:
+        if self.kind == 'measurement':
+            unregister_motion_callback = getattr(self.source, 'unregister_motion_callback', None)
+            if callable(unregister_motion_callback):
+                unregister_motion_callback(self.on_motion_result)
+            return
+        try:
+            unregister_result = getattr(self.source, 'unregister_motion_result_callback', None)
+            if callable(unregister_result):
+                unregister_result(self.on_motion_result)
+            else:
+                self.source.disable_motion_detection(self._legacy_callback)
+        finally:
+            _unregister_api_motion_listener(self.on_api_motion_update)
+
+    def subscribe(self, listener: MotionStateListener) -> None:
+        with self._lock:
+            first_subscriber = not self._subscribers
+            if listener not in self._subscribers:
+                self._subscribers.append(listener)
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        if not first_subscriber:
+            return
+        try:
+            self._attach()
+        except Exception:
+            with self._lock:
+                self._subscribers.remove(listener)
+            try:
+                self._detach()
+            except Exception:
+                self.logger.debug('Failed to roll back motion hub registration', exc_info=True)
+            raise
+
+    def unsubscribe(self, listener: MotionStateListener) -> None:
+        """Remove a subscriber; the last one detaches the hub from its source."""
+        with self._lock:
+            if listener not in self._subscribers:
+                return
+            self._subscribers.remove(listener)
+            if self._subscribers:
+                return
+            self._last_source_motion = None
+            self._pending = None
+        self._detach()
+
+
+_motion_hubs: dict[tuple[int, str], MotionStateHub] = {}
+_motion_hubs_lock = threading.RLock()
+
+
+def subscribe_motion_hub(
+    source: Any,
+    listener: MotionStateListener,
+    *,
+    kind: str = 'camera',
+    logger: Optional[logging.Logger] = None,
+) -> Callable[[], None]:
+    """Subscribe to the shared hub of ``source`` and return the matching unsubscribe callable."""
+    key = (id(source), kind)
+    with _motion_hubs_lock:
+        hub = _motion_hubs.get(key)
+        if hub is None or hub.source is not source:
+            hub = MotionStateHub(source, kind=kind, logger=logger)
+            _motion_hubs[key] = hub
+        try:
+            hub.subscribe(listener)
+        except Exception:
+            if hub.subscriber_count == 0:
+                _motion_hubs.pop(key, None)
+            raise
+
+    def _unsubscribe() -> None:
+        with _motion_hubs_lock:
+            try:
+                hub.unsubscribe(listener)
+            finally:
+                if hub.subscriber_count == 0 and _motion_hubs.get(key) is hub:
+                    _motion_hubs.pop(key, None)
+
+    return _unsubscribe
+
+
 def resolve_combined_motion_state(camera: Camera | None) -> tuple[bool, Optional[datetime]]:
     camera_result = camera.get_last_motion_result() if camera is not None else None
     api_motion, api_last_changed = _get_api_motion_state()
@@ -236,54 +459,20 @@ def register_combined_motion_listener(
             last_emitted['changed_at'] = changed_at
         callback(new_motion, changed_at)
 
-    def _camera_motion_callback(result: Any) -> None:
-        _emit_if_changed(
-            bool(getattr(result, 'motion_detected', False)),
-            _timestamp_to_datetime(getattr(result, 'timestamp', None)) or datetime.now(),
-        )
-
-    def _legacy_camera_motion_callback(_: Any, result: Any) -> None:
-        _camera_motion_callback(result)
-
-    def _api_motion_listener(new_motion: bool, changed_at: datetime) -> None:
-        _emit_if_changed(new_motion, changed_at)
+    def _hub_listener(new_motion: bool, changed_at: Optional[datetime]) -> None:
+        _emit_if_changed(new_motion, changed_at or datetime.now())
 
     try:
-        register_result = getattr(camera, 'register_motion_result_callback', None)
-        if callable(register_result):
-            register_result(_camera_motion_callback)
-        else:
-            camera.enable_motion_detection(_legacy_camera_motion_callback)
-        _register_api_motion_listener(_api_motion_listener)
+        unsubscribe = subscribe_motion_hub(camera, _hub_listener, kind='camera', logger=logger)
     except Exception:
         logger.exception('Failed to register combined motion listener')
-        try:
-            unregister_result = getattr(camera, 'unregister_motion_result_callback', None)
-            if callable(unregister_result):
-                unregister_result(_camera_motion_callback)
-            else:
-                camera.disable_motion_detection(_legacy_camera_motion_callback)
-        except Exception:
-            logger.debug('Failed to roll back combined motion listener registration', exc_info=True)
-        try:
-            _unregister_api_motion_listener(_api_motion_listener)
-        except Exception:
-            logger.debug('Failed to roll back API motion listener registration', exc_info=True)
         return False
 
     def _cleanup() -> None:
         try:
-            unregister_result = getattr(camera, 'unregister_motion_result_callback', None)
-            if callable(unregister_result):
-                unregister_result(_camera_motion_callback)
-            else:
-                camera.disable_motion_detection(_legacy_camera_motion_callback)
-        except Exception:
-            logger.exception('Failed to unregister combined camera motion listener')
-        try:
-            _unregister_api_motion_listener(_api_motion_listener)
+            unsubscribe()
         except Exception:
-            logger.exception('Failed to unregister combined API motion listener')
+            logger.exception('Failed to unregister combined motion listener')
 
     setattr(client, cleanup_attr_name, _cleanup)
 
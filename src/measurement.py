@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 import threading
 import time
-from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional, Callable, TYPE_CHECKING, Any
 from concurrent.futures import ThreadPoolExecutor
@@ -19,8 +20,15 @@ if TYPE_CHECKING:
     from src.config import AppConfig, MeasurementConfig
     from src.notify import EMailSystem
 
-from .alert_history import append_history_entry, get_history_file
+from .alert_history import append_history_entry, compact_pending_history, get_history_file
 from .config import get_logger
+from .motion_timeline import MotionTimeline, bucket_values_to_list
+from .session_summary import SessionSummary, detector_counters
+
+
+def _resolve_status_waiter(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
 
 
 def resolve_measurement_stop_event(reason: str | None) -> str:
@@ -70,6 +78,76 @@ def _encode_history_alert_frame(
     return True, buf.tobytes(), img_fmt
 
 
+@dataclass(frozen=True)
+class SessionStatusSnapshot:
+    """
+    Immutable measurement status as of ``version``.
+
+    Only state changes create a new snapshot; time-dependent values (duration,
+    countdowns, cooldown) are derived in :meth:`to_status` from the stored
+    timestamps, so a rendered view can tick without touching the controller.
+    """
+
+    version: int
+    is_active: bool
+    session_id: Optional[str]
+    session_start_time: Optional[datetime]
+    alert_triggered: bool
+    recent_motion_detected: Optional[bool]
+    last_motion_time: Optional[datetime]
+    alert_delay_seconds: float
+    session_timeout_seconds: int
+    session_timeout_minutes: int
+    alerts_sent_count: int
+    max_alerts_per_session: int
+    cooldown_until: Optional[datetime]
+    can_send_alert: bool
+    last_session_summary: Optional[dict[str, Any]] = None
+
+    def to_status(self, now: Optional[datetime] = None) -> dict[str, Any]:
+        """Return the dict layout of :meth:`MeasurementController.get_session_status`."""
+        now = now or datetime.now()
+        duration: timedelta | None = None
+        if self.is_active and self.session_start_time:
+            duration = now - self.session_start_time
+
+        time_since_motion = 0.0
+        # Während laufender Bewegung wird last_motion_time nicht in den Snapshot übernommen
+        if self.last_motion_time and not (self.is_active and self.recent_motion_detected):
+            time_since_motion = (now - self.last_motion_time).total_seconds()
+
+        alert_countdown: float | None = None
+        if self.is_active:
+            alert_countdown = max(0.0, self.alert_delay_seconds - time_since_motion)
+
+        cooldown_remaining: float | None = None
+        can_send_alert = self.can_send_alert
+        if self.cooldown_until is not None:
+            remaining = (self.cooldown_until - now).total_seconds()
+            if remaining > 0:
+                cooldown_remaining = remaining
+            elif self.is_active and self.alerts_sent_count < self.max_alerts_per_session:
+                can_send_alert = True
+
+        return {
+            "is_active": self.is_active,
+            "session_id": self.session_id,
+            "session_start_time": self.session_start_time,
+            "duration": duration,
+            "alert_triggered": self.alert_triggered,
+            "session_timeout_seconds": self.session_timeout_seconds,
+            "session_timeout_minutes": self.session_timeout_minutes,
+            "recent_motion_detected": self.recent_motion_detected,
+            "time_since_motion": time_since_motion,
+            "alert_countdown": alert_countdown,
+            "alerts_sent_count": self.alerts_sent_count,
+            "max_alerts_per_session": self.max_alerts_per_session,
+            "cooldown_remaining": cooldown_remaining,
+            "can_send_alert": can_send_alert,
+            "last_session_summary": self.last_session_summary,
+        }
+
+
 class MeasurementController:
     """
     Steuert den Messablauf, überwacht Bewegung und löst Alerts aus.
@@ -108,13 +186,17 @@ class MeasurementController:
         self._alert_dispatch_in_progress = False
         self._alert_dispatch_generation: Optional[int] = None
         self._last_alert_attempt_monotonic: Optional[float] = None
+
+        # -- Session Summary (laufende Aggregate, O(1) pro Frame) --
+        self._session_summary: Optional[SessionSummary] = None
+        self.last_session_summary: Optional[dict[str, Any]] = None
         
         # -- Async Helpers --
         self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="MeasCtrl")
         self._event_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MeasCtrlEvents")
         
         # -- Motion History for Debouncing --
-        self._motion_history: deque[tuple[float, bool]] = deque()
+        self._motion_timeline = MotionTimeline()
         self._history_lock = threading.Lock()
         self._last_motion_summary_log_monotonic: Optional[float] = None
         self._motion_summary_event_count = 0
@@ -125,6 +207,12 @@ class MeasurementController:
         self._callbacks_lock = threading.Lock()
         self._session_state_callbacks: list[Callable[[dict[str, Any]], None]] = []
         self._session_callbacks_lock = threading.Lock()
+
+        # -- Versionierter Status-Snapshot (None = muss neu gebaut werden) --
+        self._status_version = 0
+        self._status_snapshot: Optional[SessionStatusSnapshot] = None
+        self._status_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+        self._status_waiters_lock = threading.Lock()
         self._camera_lock = threading.RLock()
         self._camera_motion_listener: Optional[Callable[[MotionResult], None]] = None
         self._camera_motion_legacy_listener: Optional[Callable[[np.ndarray, MotionResult], None]] = None
@@ -136,6 +224,17 @@ class MeasurementController:
         )
         self._timeout_thread.start()
 
+        # -- Alert Scheduling --
+        # Eine einzige Frist für "keine Bewegung"; Bewegung schiebt sie nach hinten
+        self._alert_deadline_monotonic: Optional[float] = None
+        self._alert_wakeup = threading.Event()
+        self._alert_thread = threading.Thread(
+            target=self._alert_scheduler_loop,
+            name="MeasCtrl-Alerts",
+            daemon=True,
+        )
+        self._alert_thread.start()
+
         self._camera_motion_listener = self.on_motion_detected
         self._camera_motion_legacy_listener = lambda _frame, result: self.on_motion_detected(result)
         self.set_camera(camera)
@@ -151,6 +250,10 @@ class MeasurementController:
         """Update the measurement config used by the running controller."""
         with self.session_lock:
             self.config = new_config
+            if self.is_session_active:
+                # Geänderte alert_delay_seconds sofort neu bewerten
+                self._schedule_alert_check_locked(0.0)
+            self._mark_status_changed_locked()
         self.logger.debug("Measurement config updated")
 
     def set_camera(self, camera: Optional[Camera]) -> None:
@@ -174,6 +277,10 @@ class MeasurementController:
                     self.logger.debug(f"Failed to unregister camera motion callback: {exc}")
 
             self.camera = camera
+            self._sync_capture_demand(previous_camera, active=False)
+            with self.session_lock:
+                session_active = bool(self.is_session_active)
+            self._sync_capture_demand(camera, active=session_active)
 
             if camera is not None and motion_listener is not None:
                 try:
@@ -189,6 +296,26 @@ class MeasurementController:
                     self.logger.error(f"Failed to register camera motion callback: {exc}")
                     self.camera = None
 
+    def _sync_capture_demand(self, camera: Optional[Camera], *, active: bool) -> None:
+        """Keep the camera at full capture rate while a session is active."""
+        set_demand = getattr(camera, 'set_capture_demand', None)
+        if not callable(set_demand):
+            return
+        try:
+            set_demand("measurement", active)
+        except Exception as exc:
+            self.logger.debug(f"Failed to update camera capture demand: {exc}")
+
+    def _reset_motion_heatmap(self, camera: Optional[Camera]) -> None:
+        """Each session accumulates its own activity heatmap."""
+        reset_heatmap = getattr(camera, 'reset_motion_heatmap', None)
+        if not callable(reset_heatmap):
+            return
+        try:
+            reset_heatmap()
+        except Exception as exc:
+            self.logger.debug(f"Failed to reset motion heatmap: {exc}")
+
     def _get_config_snapshot(self) -> MeasurementConfig:
         """Return a stable config reference for the duration of an operation."""
         with self.session_lock:
@@ -253,6 +380,8 @@ class MeasurementController:
 
     def _reset_alert_tracking_locked(self) -> None:
         self._alert_generation += 1
+        if self.alert_triggered:
+            self._mark_status_changed_locked()
         self.alert_triggered = False
         self.alert_trigger_time = None
         self._alert_dispatch_in_progress = False
@@ -343,14 +472,35 @@ class MeasurementController:
         except RuntimeError as exc:
             self.logger.error(f"Failed to queue measurement event '{event}': {exc}")
 
+    def _read_detector_stats(self) -> Optional[dict[str, Any]]:
+        get_stats: Optional[Callable[[], Optional[dict[str, Any]]]] = getattr(
+            self.camera, 'get_detection_stats', None
+        )
+        if not callable(get_stats):
+            return None
+        try:
+            return get_stats()
+        except Exception:
+            self.logger.debug("Failed to read detector stats", exc_info=True)
+            return None
+
+    def _new_session_id(self) -> str:
+        """Timestamp id, suffixed with the camera id so parallel cameras never share a session."""
+        session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        camera_id = getattr(self.camera, "camera_id", None)
+        if isinstance(camera_id, str) and camera_id:
+            return f"{session_id}_{camera_id}"
+        return session_id
+
     def start_session(self, session_id: Optional[str] = None) -> bool:
         """Startet eine neue Mess-Session."""
+        detector_baseline = detector_counters(self._read_detector_stats())
         with self.session_lock:
             if self.is_session_active:
                 self.logger.warning("Session already active, cannot start new one")
                 return False
             
-            self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.session_id = session_id or self._new_session_id()
             self.is_session_active = True
             self.session_start_time = datetime.now()
             self.recent_motion_detected = None
@@ -358,13 +508,21 @@ class MeasurementController:
             self._motion_summary_event_count = 0
             self._motion_summary_motion_event_count = 0
             
+            self._session_summary = SessionSummary(
+                session_id=self.session_id,
+                started_at=self.session_start_time,
+                started_ts=time.time(),
+                detector_baseline=detector_baseline,
+            )
+
             # Reset Alert State
             self.last_motion_time = datetime.now()
             self._reset_alert_tracking_locked()
+            self._schedule_alert_check_locked(float(self.config.alert_delay_seconds))
             
-            with self._history_lock:
-                self._motion_history.clear()
+            self._motion_timeline.clear()
             
+            self._mark_status_changed_locked()
             self.logger.info(f"Session {self.session_id} started")
             current_session_id = self.session_id
             current_start_time = self.session_start_time
@@ -375,13 +533,19 @@ class MeasurementController:
             )
             session_state_payload = dict(self._build_session_state_payload_locked())
 
+        self._sync_capture_demand(self.camera, active=True)
+        self._reset_motion_heatmap(self.camera)
         self._notify_session_state_callbacks(session_state_payload)
         self._sync_email_alert_state()
+        with self.session_lock:
+            # Alert-Zähler des E-Mail-Systems wurden zurückgesetzt
+            self._mark_status_changed_locked()
          
         return True
 
     def stop_session(self, *, reason: str | None = None) -> bool:
         """Stoppt die aktuelle Session."""
+        detector_stats = self._read_detector_stats()
         with self.session_lock:
             if not self.is_session_active:
                 return False
@@ -401,10 +565,22 @@ class MeasurementController:
             self._motion_summary_motion_event_count = 0
               
             self._reset_alert_tracking_locked()
+            self._alert_deadline_monotonic = None
+            summary_record: Optional[dict[str, Any]] = None
+            if self._session_summary is not None:
+                summary_record = self._session_summary.finish(
+                    ended_at=end_time,
+                    ended_ts=time.time(),
+                    reason=reason,
+                    detector_stats=detector_stats,
+                )
+                self._session_summary = None
+                self.last_session_summary = summary_record
             self.is_session_active = False
             self.session_id = None
             self.session_start_time = None
             self.recent_motion_detected = None
+            self._mark_status_changed_locked()
             self._submit_measurement_event_locked(
                 event=stop_event,
                 session_id=current_session_id,
@@ -414,8 +590,16 @@ class MeasurementController:
             )
             session_state_payload = dict(self._build_session_state_payload_locked())
 
+        self._sync_capture_demand(self.camera, active=False)
+        if summary_record is not None and summary_record["frames_analysed"] > 0:
+            try:
+                self._event_executor.submit(self._save_session_summary, summary_record)
+            except RuntimeError as exc:
+                self.logger.error(f"Failed to queue session summary: {exc}")
         self._notify_session_state_callbacks(session_state_payload)
         self._sync_email_alert_state()
+        with self.session_lock:
+            self._mark_status_changed_locked()
         
         return True
 
@@ -424,15 +608,12 @@ class MeasurementController:
         
         # 1. Update Motion History (immer, auch ohne aktive Session)
         now_ts = time.time()
+        contour_area = float(getattr(result, 'contour_area', 0.0) or 0.0)
+        self._motion_timeline.append(now_ts, bool(result.motion_detected), contour_area)
         with self._history_lock:
-            self._motion_history.append((now_ts, result.motion_detected))
             self._motion_summary_event_count += 1
             if result.motion_detected:
                 self._motion_summary_motion_event_count += 1
-            # Cleanup old history (> 10s)
-            cutoff = now_ts - 10.0
-            while self._motion_history and self._motion_history[0][0] < cutoff:
-                self._motion_history.popleft()
 
         # 2. Check Session Logic and Process Motion within a single lock acquisition
         # to prevent race conditions where session is stopped between checks
@@ -444,16 +625,19 @@ class MeasurementController:
             session_active = self.is_session_active
             current_session_id = self.session_id
             motion_state_changed = previous_motion_state != self.recent_motion_detected
+            if motion_state_changed:
+                self._mark_status_changed_locked()
+            if session_active and self._session_summary is not None:
+                self._session_summary.add_result(now_ts, bool(result.motion_detected), contour_area)
 
             # 3. Process Motion (within lock to ensure consistency)
+            # Frames ohne Bewegung kosten nichts: der Alert-Thread prüft erst zur Frist
             if session_active and current_session_id is not None and result.motion_detected:
                 self.last_motion_time = datetime.now()
                 if self.alert_triggered:
                     self.logger.info("Motion detected - Alert reset")
                 self._reset_alert_tracking_locked()
-            elif session_active and current_session_id is not None:
-                # Check for Alert Condition (pass session state captured under lock)
-                self._check_alert_trigger_locked(current_session_id)
+                self._alert_deadline_monotonic = time.monotonic() + float(self.config.alert_delay_seconds)
 
         # 4. Notify GUI callbacks (outside locks for safety, using snapshot)
         if motion_state_changed:
@@ -538,6 +722,9 @@ class MeasurementController:
                     self.logger.warning(f"ALERT: No motion for {time_since_motion:.1f}s")
                     self.alert_triggered = True
                     self.alert_trigger_time = datetime.now()
+                    if self._session_summary is not None:
+                        self._session_summary.add_alert()
+                    self._mark_status_changed_locked()
 
                 current_generation = self._alert_generation
                 if self._alert_dispatch_in_progress:
@@ -570,20 +757,71 @@ class MeasurementController:
 
     def _confirm_no_motion(self, duration: float) -> bool:
         """Bestätigt Bewegungslosigkeit anhand der Historie."""
+        # Ohne einen einzigen Frame in der Session gibt es nichts zu bestätigen
+        if self._motion_timeline.last_timestamp is None:
+            return False
+        return not self._motion_timeline.any_motion_since(time.time() - duration)
+
+    def _schedule_alert_check_locked(self, delay_seconds: float) -> None:
+        """Set the no-motion deadline and wake the alert thread."""
+        self._alert_deadline_monotonic = time.monotonic() + max(0.0, delay_seconds)
+        self._alert_wakeup.set()
+
+    def _process_alert_deadline(self) -> None:
+        """Evaluate the alert condition once the no-motion deadline has passed."""
+        with self.session_lock:
+            session_id = self.session_id
+            if not self.is_session_active or session_id is None:
+                self._alert_deadline_monotonic = None
+                return
+
+            config = self._get_config_snapshot()
+            remaining = float(config.alert_delay_seconds)
+            if self.last_motion_time is not None:
+                remaining -= (datetime.now() - self.last_motion_time).total_seconds()
+            if remaining > 0:
+                self._alert_deadline_monotonic = time.monotonic() + remaining
+                return
+
+            self._check_alert_trigger_locked(session_id)
+            # Solange keine Bewegung kommt: Wiederholung/Cooldown im Prüfintervall nachfassen
+            check_interval = max(0.1, float(getattr(config, 'alert_check_interval', 5.0)))
+            self._alert_deadline_monotonic = time.monotonic() + check_interval
+
+    def _alert_scheduler_loop(self) -> None:
+        """Background loop sleeping until the no-motion deadline, independent of the frame rate."""
+        while not self._timeout_stop_event.is_set():
+            with self.session_lock:
+                deadline = self._alert_deadline_monotonic
+            delay = None if deadline is None else deadline - time.monotonic()
+            if delay is None or delay > 0:
+                self._alert_wakeup.wait(delay)
+                self._alert_wakeup.clear()
+                continue
+            try:
+                self._process_alert_deadline()
+            except Exception:
+                self.logger.exception("Alert deadline check failed")
+                with self.session_lock:
+                    if self._alert_deadline_monotonic is not None:
+                        self._alert_deadline_monotonic = time.monotonic() + 1.0
+
+    def get_motion_activity(self, *, seconds: float = 60.0, buckets: int = 60) -> dict[str, Any]:
+        """Return bucketed motion ratio and peak contour area for the last ``seconds``."""
+        seconds = max(1.0, float(seconds))
+        buckets = max(1, int(buckets))
         now_ts = time.time()
-        cutoff = now_ts - duration
-        
-        with self._history_lock:
-            if not self._motion_history:
-                return False
-            
-            # Check if ANY motion occurred in the last 'duration' seconds
-            for ts, motion in reversed(self._motion_history):
-                if ts < cutoff:
-                    break
-                if motion:
-                    return False
-        return True
+        return {
+            "window_seconds": seconds,
+            "bucket_seconds": seconds / buckets,
+            "motion_ratio": bucket_values_to_list(
+                self._motion_timeline.motion_ratio_buckets(seconds, buckets, now=now_ts)
+            ),
+            "contour_area": bucket_values_to_list(
+                self._motion_timeline.area_buckets(seconds, buckets, now=now_ts),
+                digits=1,
+            ),
+        }
 
     def trigger_alert_sync(self, session_id: str, alert_generation: int) -> bool:
         """Execute alert side effects if the scheduled alert is still current."""
@@ -597,9 +835,18 @@ class MeasurementController:
             camera = self.camera
 
         frame = None
+        frame_handle = None
         if camera:
             try:
-                if hasattr(camera, 'take_snapshot'):
+                acquire_frame_handle = getattr(camera, 'acquire_frame_handle', None)
+                if callable(acquire_frame_handle):
+                    # Zero-copy: der Ring-Slot bleibt bis zum Ende des Alerts reserviert
+                    frame_handle = acquire_frame_handle()
+                    frame = getattr(frame_handle, 'frame', None)
+                    if frame is not None and not isinstance(frame, np.ndarray):
+                        self.logger.error(f"acquire_frame_handle returned invalid frame type: {type(frame)}")
+                        frame = None
+                elif hasattr(camera, 'take_snapshot'):
                     frame = camera.take_snapshot()
                     if frame is not None and not isinstance(frame, np.ndarray):
                         self.logger.error(f"take_snapshot returned invalid type: {type(frame)}")
@@ -643,10 +890,19 @@ class MeasurementController:
         except Exception as e:
             self.logger.error(f"Failed to save alert history: {e}")
         finally:
+            if frame_handle is not None:
+                release_frame = getattr(frame_handle, 'release', None)
+                if callable(release_frame):
+                    release_frame()
             with self.session_lock:
                 if self._alert_dispatch_generation == alert_generation:
                     self._alert_dispatch_in_progress = False
                     self._alert_dispatch_generation = None
+                summary = self._session_summary
+                if email_sent and summary is not None and summary.session_id == session_id:
+                    summary.add_alert_email()
+                # Zähler und Cooldown des E-Mail-Systems haben sich geändert
+                self._mark_status_changed_locked()
 
         return email_sent
 
@@ -657,7 +913,7 @@ class MeasurementController:
         *,
         email_sent: bool,
     ) -> None:
-        """Saves the alert event to a JSON history file and saves the image."""
+        """Saves the alert event and its image to the alert history store."""
         config = self._get_config_snapshot()
         history_file = get_history_file(config)
         
@@ -688,6 +944,9 @@ class MeasurementController:
             "details": "No motion detected",
             "email_sent": bool(email_sent),
         }
+        camera_id = getattr(self.camera, "camera_id", None)
+        if isinstance(camera_id, str) and camera_id:
+            event_data["camera_id"] = camera_id
 
         append_history_entry(
             event_data,
@@ -696,6 +955,13 @@ class MeasurementController:
             pending_image_bytes=pending_image_bytes,
         )
 
+    def _save_session_summary(self, record: dict[str, Any]) -> None:
+        """Append the summary of a finished session to the alert history store."""
+        try:
+            append_history_entry(record, history_file=get_history_file(self._get_config_snapshot()))
+        except Exception as exc:
+            self.logger.error(f"Failed to save session summary: {exc}")
+
     def check_session_timeout(self) -> None:
         """Prüft ob die maximale Session-Dauer erreicht ist."""
         stop_reason: str | None = None
@@ -737,21 +1003,32 @@ class MeasurementController:
             except Exception:
                 self.logger.exception("Timeout monitoring check failed")
 
-    def get_session_status(self) -> dict:
-        """Gibt den aktuellen Status für die GUI zurück."""
+    def _mark_status_changed_locked(self) -> None:
+        """Invalidate the status snapshot and wake async waiters; caller holds ``session_lock``."""
+        self._status_version += 1
+        self._status_snapshot = None
+        with self._status_waiters_lock:
+            waiters = self._status_waiters
+            self._status_waiters = []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_status_waiter, future)
+            except RuntimeError:
+                # Event-Loop des Wartenden ist bereits geschlossen
+                continue
+
+    def _build_status_snapshot(self) -> SessionStatusSnapshot:
         with self.session_lock:
+            version = self._status_version
             active = self.is_session_active
             start_time = self.session_start_time
             sid = self.session_id
             last_motion_time = self.last_motion_time
             alert_triggered = self.alert_triggered
             recent_motion_detected = self.recent_motion_detected
+            last_session_summary = self.last_session_summary
             config = self.config
 
-        duration: timedelta | None = None
-        if active and start_time:
-            duration = datetime.now() - start_time
-
         session_timeout_seconds = self._get_session_timeout_seconds(config=config)
         session_timeout_minutes = max(
             0,
@@ -760,56 +1037,85 @@ class MeasurementController:
         if session_timeout_seconds > 0 and session_timeout_minutes <= 0:
             session_timeout_minutes = (session_timeout_seconds + 59) // 60
 
-        time_since_motion = 0.0
-        if last_motion_time:
-            time_since_motion = (datetime.now() - last_motion_time).total_seconds()
-
-        alert_countdown: float | None = None
-        if active:
-            alert_countdown = max(
-                0.0,
-                float(getattr(config, 'alert_delay_seconds', 0) or 0) - time_since_motion,
-            )
-
         max_alerts_per_session = max(
             1,
             int(getattr(config, 'max_alerts_per_session', 1) or 1),
         )
-        alert_runtime: dict[str, Any] = {
-            "alerts_sent_count": 0,
-            "max_alerts_per_session": max_alerts_per_session,
-            "cooldown_remaining": None,
-            "can_send_alert": False,
-        }
+        alerts_sent_count = 0
+        cooldown_until: datetime | None = None
+        can_send_alert = False
         if self.email_system is not None and hasattr(self.email_system, "get_alert_status"):
             try:
                 runtime_status = self.email_system.get_alert_status()
-                alert_runtime.update(
-                    {
-                        "alerts_sent_count": int(runtime_status.get("alerts_sent_count", 0) or 0),
-                        "max_alerts_per_session": int(
-                            runtime_status.get("max_alerts_per_session", max_alerts_per_session) or max_alerts_per_session
-                        ),
-                        "cooldown_remaining": runtime_status.get("cooldown_remaining"),
-                        "can_send_alert": bool(runtime_status.get("can_send_alert", False)),
-                    }
+                alerts_sent_count = int(runtime_status.get("alerts_sent_count", 0) or 0)
+                max_alerts_per_session = int(
+                    runtime_status.get("max_alerts_per_session", max_alerts_per_session) or max_alerts_per_session
                 )
+                cooldown_remaining = runtime_status.get("cooldown_remaining")
+                if cooldown_remaining is not None:
+                    cooldown_until = datetime.now() + timedelta(seconds=float(cooldown_remaining))
+                can_send_alert = bool(runtime_status.get("can_send_alert", False))
             except Exception:
                 self.logger.debug("Failed to read email alert runtime state", exc_info=True)
 
-        return {
-            "is_active": active,
-            "session_id": sid,
-            "session_start_time": start_time,
-            "duration": duration,
-            "alert_triggered": alert_triggered,
-            "session_timeout_seconds": session_timeout_seconds,
-            "session_timeout_minutes": session_timeout_minutes,
-            "recent_motion_detected": recent_motion_detected,
-            "time_since_motion": time_since_motion,
-            "alert_countdown": alert_countdown,
-            **alert_runtime,
-        }
+        snapshot = SessionStatusSnapshot(
+            version=version,
+            is_active=active,
+            session_id=sid,
+            session_start_time=start_time,
+            alert_triggered=alert_triggered,
+            recent_motion_detected=recent_motion_detected,
+            last_motion_time=last_motion_time,
+            alert_delay_seconds=float(getattr(config, 'alert_delay_seconds', 0) or 0),
+            session_timeout_seconds=session_timeout_seconds,
+            session_timeout_minutes=session_timeout_minutes,
+            alerts_sent_count=alerts_sent_count,
+            max_alerts_per_session=max_alerts_per_session,
+            cooldown_until=cooldown_until,
+            can_send_alert=can_send_alert,
+            last_session_summary=last_session_summary,
+        )
+        with self.session_lock:
+            # Nur übernehmen, wenn sich der Zustand während des Aufbaus nicht geändert hat
+            if self._status_version == version:
+                self._status_snapshot = snapshot
+        return snapshot
+
+    def get_status_snapshot(self) -> SessionStatusSnapshot:
+        """Return the current status snapshot; rebuilt only after a state change."""
+        snapshot = self._status_snapshot
+        if snapshot is not None:
+            return snapshot
+        return self._build_status_snapshot()
+
+    @property
+    def status_version(self) -> int:
+        return self._status_version
+
+    async def wait_for_status_version(
+        self,
+        version: int,
+        *,
+        timeout: Optional[float] = None,
+    ) -> SessionStatusSnapshot:
+        """Wait until the status version is greater than ``version`` (or ``timeout`` passes)."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+        with self._status_waiters_lock:
+            self._status_waiters.append((loop, future))
+        if self._status_version <= version:
+            try:
+                await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                pass
+        with self._status_waiters_lock:
+            if (loop, future) in self._status_waiters:
+                self._status_waiters.remove((loop, future))
+        return self.get_status_snapshot()
+
+    def get_session_status(self) -> dict:
+        """Gibt den aktuellen Status für die GUI zurück."""
+        return self.get_status_snapshot().to_status()
 
     def decrement_alert_count(self, *, amount: int = 1) -> bool:
         """Decrease the active session alert counter without resetting cooldown."""
@@ -818,10 +1124,14 @@ class MeasurementController:
         if not session_id or self.email_system is None or not hasattr(self.email_system, "decrement_alert_count"):
             return False
         try:
-            return bool(self.email_system.decrement_alert_count(session_id=session_id, amount=amount))
+            changed = bool(self.email_system.decrement_alert_count(session_id=session_id, amount=amount))
         except Exception:
             self.logger.error("Failed to decrement alert count", exc_info=True)
             return False
+        if changed:
+            with self.session_lock:
+                self._mark_status_changed_locked()
+        return changed
 
     def reset_alert_count(self) -> bool:
         """Reset the active session alert counter without resetting cooldown."""
@@ -830,20 +1140,28 @@ class MeasurementController:
         if not session_id or self.email_system is None or not hasattr(self.email_system, "reset_alert_count"):
             return False
         try:
-            return bool(self.email_system.reset_alert_count(session_id=session_id))
+            changed = bool(self.email_system.reset_alert_count(session_id=session_id))
         except Exception:
             self.logger.error("Failed to reset alert count", exc_info=True)
             return False
+        if changed:
+            with self.session_lock:
+                self._mark_status_changed_locked()
+        return changed
 
     def cleanup(self) -> None:
         """Cleanup resources."""
         self.logger.info("Cleaning up MeasurementController")
         self._timeout_stop_event.set()
+        self._alert_wakeup.set()
         self.set_camera(None)
         self.stop_session(reason="shutdown")
         self._timeout_thread.join(timeout=3.0)
+        self._alert_thread.join(timeout=3.0)
         self._event_executor.shutdown(wait=True, cancel_futures=False)
         self._executor.shutdown(wait=False)
+        # Der Compactor ist ein Daemon-Thread: ausstehende Retention vor dem Beenden anwenden
+        compact_pending_history()
 
 
 def create_measurement_controller_from_config(
@@ -13,6 +13,7 @@ Fokus auf einfache, robuste Implementation.
 
 from __future__ import annotations
 from collections.abc import Iterable
+import copy
 import html
 import smtplib
 import logging
@@ -123,10 +124,37 @@ class EMailSystem:
         self._connection_timeout: int = 30
         self._executor = ThreadPoolExecutor(max_workers=2)
         self._alert_system_cleanup = False
+        # Zusatzkameras bekommen eigene Alert-Zustände (siehe for_camera)
+        self._camera_alert_systems: Dict[str, EMailSystem] = {}
+        self._alert_state_parent: Optional[EMailSystem] = None
         self._refresh_alert_runtime_settings_unsafe()
 
         self.logger.info("EMailSystem initialized")
 
+    def for_camera(self, camera_id: str) -> EMailSystem:
+        """
+        Alert channel for an additional camera.
+
+        The channel shares configuration and the executor with this instance
+        but keeps its own session id, alert count and cooldown, so sessions of
+        different cameras never reset or block each other's alerts.
+        """
+        with self._state_lock:
+            channel = self._camera_alert_systems.get(camera_id)
+            if channel is None:
+                channel = copy.copy(self)
+                channel.logger = self.logger.getChild(camera_id)
+                channel.last_alert_time = None
+                channel.alerts_sent_count = 0
+                channel._alert_session_id = None
+                channel._state_lock = threading.RLock()
+                channel._smtp_lock = threading.Lock()
+                channel._smtp_connection = None
+                channel._camera_alert_systems = {}
+                channel._alert_state_parent = self
+                self._camera_alert_systems[camera_id] = channel
+            return channel
+
     # ------------------------------------------------------------------
     # SMTP connection helpers
     # ------------------------------------------------------------------
@@ -233,8 +261,11 @@ class EMailSystem:
             self.webcam_cfg = self.app_cfg.webcam
             self.motion_cfg = self.app_cfg.motion_detection
             self._refresh_alert_runtime_settings_unsafe()
+            camera_alert_systems = list(getattr(self, '_camera_alert_systems', {}).values())
 
             self.logger.info("Alert-Configuration refreshed")
+        for channel in camera_alert_systems:
+            channel.refresh_config()
     
     def _get_current_email_config(self) -> 'EmailConfig':
         """
@@ -1654,9 +1685,12 @@ class EMailSystem:
         """
         try:
             self.logger.info("Starting EMailSystem cleanup...")
+
+            for channel in list(getattr(self, '_camera_alert_systems', {}).values()):
+                channel.cleanup()
             
-            # ThreadPoolExecutor shutdown
-            if hasattr(self, '_executor'):
+            # ThreadPoolExecutor shutdown (Kamera-Kanäle teilen den Executor ihres Besitzers)
+            if hasattr(self, '_executor') and getattr(self, '_alert_state_parent', None) is None:
                 self._executor.shutdown(wait=True)
             
             # SMTP-Verbindung schließen falls vorhanden
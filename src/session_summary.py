@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+SESSION_SUMMARY_ENTRY_TYPE = 'session_summary'
+
+
+@dataclass
+class SessionSummary:
+    """
+    Running aggregates of one measurement session.
+
+    Every method is O(1) so the controller can feed each motion result from the
+    capture callback; :meth:`finish` turns the counters into the compact record
+    stored in the history file. Not thread-safe on its own — the controller
+    updates it under ``session_lock``.
+    """
+
+    session_id: str
+    started_at: datetime
+    started_ts: float
+    detector_baseline: dict[str, int] = field(default_factory=dict)
+    frames: int = 0
+    motion_frames: int = 0
+    motion_seconds: float = 0.0
+    contour_area_sum: float = 0.0
+    longest_still_seconds: float = 0.0
+    alerts: int = 0
+    alert_emails_sent: int = 0
+    _last_ts: Optional[float] = None
+    _last_motion: bool = False
+    _still_since: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        # Bis zur ersten Bewegung gilt die Session als ruhig
+        self._still_since = self.started_ts
+
+    def add_result(self, timestamp: float, motion: bool, contour_area: float) -> None:
+        if self._last_ts is not None and self._last_motion:
+            self.motion_seconds += max(0.0, timestamp - self._last_ts)
+        self._last_ts = timestamp
+        self._last_motion = motion
+        self.frames += 1
+        if motion:
+            self.motion_frames += 1
+            self.contour_area_sum += contour_area
+            if self._still_since is not None:
+                self.longest_still_seconds = max(self.longest_still_seconds, timestamp - self._still_since)
+                self._still_since = None
+        elif self._still_since is None:
+            self._still_since = timestamp
+
+    def add_alert(self) -> None:
+        self.alerts += 1
+
+    def add_alert_email(self) -> None:
+        self.alert_emails_sent += 1
+
+    def finish(
+        self,
+        *,
+        ended_at: datetime,
+        ended_ts: float,
+        reason: Optional[str] = None,
+        detector_stats: Optional[dict[str, Any]] = None,
+    ) -> dict[str, Any]:
+        """Close open intervals and return the summary record."""
+        duration = max(0.0, ended_ts - self.started_ts)
+        motion_seconds = self.motion_seconds
+        if self._last_ts is not None and self._last_motion:
+            motion_seconds += max(0.0, ended_ts - self._last_ts)
+        longest_still = self.longest_still_seconds
+        if self._still_since is not None:
+            longest_still = max(longest_still, ended_ts - self._still_since)
+
+        processed = self.frames
+        dropped: Optional[int] = None
+        if detector_stats and self.detector_baseline:
+            processed = max(0, int(detector_stats.get('processed', 0) or 0) - self.detector_baseline.get('processed', 0))
+            dropped = max(0, int(detector_stats.get('dropped', 0) or 0) - self.detector_baseline.get('dropped', 0))
+
+        return {
+            'timestamp': ended_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'session_id': self.session_id,
+            'type': SESSION_SUMMARY_ENTRY_TYPE,
+            'started': self.started_at.strftime('%Y-%m-%d %H:%M:%S'),
+            'reason': reason or 'stop',
+            'duration_s': round(duration, 1),
+            'motion_duty_cycle': round(min(1.0, motion_seconds / duration), 4) if duration > 0 else 0.0,
+            'longest_still_s': round(longest_still, 1),
+            'alerts': self.alerts,
+            'alert_emails_sent': self.alert_emails_sent,
+            'mean_contour_area': round(self.contour_area_sum / self.motion_frames, 1) if self.motion_frames else 0.0,
+            'frames_analysed': self.frames,
+            'detector_fps': round(processed / duration, 2) if duration > 0 else 0.0,
+            'detector_dropped': dropped,
+        }
+
+
+def detector_counters(stats: Optional[dict[str, Any]]) -> dict[str, int]:
+    """Extract the cumulative worker counters used as a per-session baseline."""
+    if not stats:
+        return {}
+    return {
+        'processed': int(stats.get('processed', 0) or 0),
+        'dropped': int(stats.get('dropped', 0) or 0),
+    }
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import cv2
+import numpy as np
+import pytest
+
+from src import alert_history
+from src.cam.motion import MotionDetector
+from src.config import MotionDetectionConfig, _create_default_config
+
+# (x, y, Breite, Höhe) eines hellen Rechtecks im Testbild
+Blob = tuple[int, int, int, int]
+
+
+class CountingSubtractor:
+    """Wraps a background subtractor and counts ``apply`` calls (frames that ran the full pipeline)."""
+
+    def __init__(self, inner: Any) -> None:
+        self.inner = inner
+        self.calls = 0
+
+    def apply(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls += 1
+        return self.inner.apply(*args, **kwargs)
+
+    def clear(self) -> None:
+        self.inner.clear()
+
+
+@pytest.fixture
+def isolated_history_dir(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Redirect the default alert history (``data/history``) into a temp dir; explicit paths are kept."""
+    history_dir = tmp_path_factory.mktemp("history")
+    resolve_history_dir = alert_history.get_history_dir
+
+    def get_history_dir(config: Any = None) -> Path:
+        resolved = resolve_history_dir(config)
+        return history_dir if resolved == alert_history.DEFAULT_HISTORY_DIR else resolved
+
+    monkeypatch.setattr(alert_history, "get_history_dir", get_history_dir)
+    return history_dir
+
+
+@pytest.fixture
+def motion_config() -> Callable[..., MotionDetectionConfig]:
+    """Factory for default motion configs with the ROI disabled; keyword arguments override attributes."""
+
+    def build(**overrides: Any) -> MotionDetectionConfig:
+        config = _create_default_config().motion_detection
+        config.region_of_interest = {"enabled": False, "x": 0, "y": 0, "width": 0, "height": 0}
+        for key, value in overrides.items():
+            setattr(config, key, value)
+        return config
+
+    return build
+
+
+@pytest.fixture
+def make_frame() -> Callable[..., np.ndarray]:
+    """Factory for uniform BGR frames with optional bright rectangles."""
+
+    def build(
+        height: int,
+        width: int,
+        *,
+        value: int = 80,
+        blobs: Iterable[Blob] = (),
+        blob_value: int = 255,
+    ) -> np.ndarray:
+        frame = np.full((height, width, 3), value, dtype=np.uint8)
+        for x, y, blob_width, blob_height in blobs:
+            frame[y:y + blob_height, x:x + blob_width] = blob_value
+        return frame
+
+    return build
+
+
+@pytest.fixture
+def learn_background() -> Callable[..., MotionDetector]:
+    """Feed ``frame`` until the detector has left its learning phase, plus ``extra_frames``."""
+
+    def learn(detector: MotionDetector, frame: np.ndarray, *, extra_frames: int = 0) -> MotionDetector:
+        for _ in range(detector.learning_frames_required + extra_frames):
+            detector.detect_motion(frame)
+        return detector
+
+    return learn
+
+
+@pytest.fixture
+def count_subtractor_calls() -> Callable[[MotionDetector], CountingSubtractor]:
+    """Install a :class:`CountingSubtractor` on a detector and return it."""
+
+    def install(detector: MotionDetector) -> CountingSubtractor:
+        counter = CountingSubtractor(detector.background_subtractor)
+        detector.background_subtractor = counter
+        return counter
+
+    return install
+
+
+@pytest.fixture
+def write_footage() -> Callable[..., None]:
+    """Write a 120x160 PNG sequence into ``directory``; a bright block moves from frame ``motion_from`` on."""
+
+    def write(directory: Path, *, frames: int = 80, motion_from: int = 50) -> None:
+        directory.mkdir()
+        for index in range(frames):
+            frame = np.full((120, 160, 3), 90, dtype=np.uint8)
+            if index >= motion_from:
+                x = 10 + (index - motion_from) * 4
+                frame[40:80, x:x + 40] = 255
+            assert cv2.imwrite(str(directory / f"frame_{index:04d}.png"), frame)
+
+    return write
@@ -1,17 +1,27 @@
 import json
+from datetime import datetime
 from types import SimpleNamespace
 
 import numpy as np
 
 from src import alert_history
-from src.alert_history import append_history_entry, build_history_image_url, parse_history_timestamp, resolve_history_image_path
+from src.alert_history import (
+    append_history_entry,
+    build_history_image_url,
+    get_history_database_file,
+    load_history_entries,
+    parse_history_timestamp,
+    resolve_history_image_path,
+)
 from src.config import _create_default_config
+from src.gui import init as gui_init
 from src.measurement import MeasurementController
 
 
-def test_append_history_entry_repairs_non_list_history_file(tmp_path):
+def test_legacy_migration_repairs_non_list_history_file(tmp_path):
     history_file = tmp_path / 'history.json'
     history_file.write_text('{}', encoding='utf-8')
+    alert_history.migrate_legacy_history(history_file=history_file)
 
     entry = {
         'timestamp': '2026-03-15 12:00:00',
@@ -23,7 +33,7 @@ def test_append_history_entry_repairs_non_list_history_file(tmp_path):
     append_history_entry(entry, history_file=history_file)
 
     assert (tmp_path / 'history.json.bak').exists()
-    assert json.loads(history_file.read_text(encoding='utf-8')) == [entry]
+    assert load_history_entries(history_file=history_file) == [entry]
 
 
 def test_build_history_image_url_stays_within_history_dir(tmp_path):
@@ -62,9 +72,9 @@ def test_measurement_history_stores_relative_posix_image_path(tmp_path):
     controller._save_alert_to_history('session-1', frame, email_sent=False)
 
     history_file = tmp_path / 'history.json'
-    assert history_file.exists()
+    assert get_history_database_file(history_file).exists()
 
-    entries = json.loads(history_file.read_text(encoding='utf-8'))
+    entries = load_history_entries(history_file=history_file)
     assert len(entries) == 1
 
     entry = entries[0]
@@ -89,7 +99,7 @@ def test_measurement_history_sanitizes_session_id_for_alert_image_filename(tmp_p
 
     controller._save_alert_to_history(session_id, frame, email_sent=False)
 
-    entries = json.loads((tmp_path / 'history.json').read_text(encoding='utf-8'))
+    entries = load_history_entries(history_file=tmp_path / 'history.json')
     assert len(entries) == 1
 
     entry = entries[0]
@@ -116,7 +126,7 @@ def test_measurement_history_sanitizes_windows_style_session_id_for_alert_image_
 
     controller._save_alert_to_history(session_id, frame, email_sent=False)
 
-    entries = json.loads((tmp_path / 'history.json').read_text(encoding='utf-8'))
+    entries = load_history_entries(history_file=tmp_path / 'history.json')
     assert len(entries) == 1
 
     entry = entries[0]
@@ -143,7 +153,7 @@ def test_measurement_history_uses_fallback_when_session_id_sanitizes_to_empty(tm
 
     controller._save_alert_to_history(session_id, frame, email_sent=False)
 
-    entries = json.loads((tmp_path / 'history.json').read_text(encoding='utf-8'))
+    entries = load_history_entries(history_file=tmp_path / 'history.json')
     assert len(entries) == 1
 
     entry = entries[0]
@@ -166,7 +176,7 @@ def test_measurement_history_uses_configured_png_format(tmp_path):
 
     controller._save_alert_to_history('session-png', frame, email_sent=False)
 
-    entries = json.loads((tmp_path / 'history.json').read_text(encoding='utf-8'))
+    entries = load_history_entries(history_file=tmp_path / 'history.json')
     assert len(entries) == 1
 
     entry = entries[0]
@@ -194,9 +204,9 @@ def test_trigger_alert_sync_writes_history_without_email_system(tmp_path):
     assert controller.trigger_alert_sync('session-2', alert_generation) is False
 
     history_file = tmp_path / 'history.json'
-    assert history_file.exists()
+    assert get_history_database_file(history_file).exists()
 
-    entries = json.loads(history_file.read_text(encoding='utf-8'))
+    entries = load_history_entries(history_file=history_file)
     assert len(entries) == 1
 
     entry = entries[0]
@@ -206,3 +216,103 @@ def test_trigger_alert_sync_writes_history_without_email_system(tmp_path):
     assert entry['image_path'] == ''
 
     controller.cleanup()
+
+
+def test_existing_history_json_is_migrated_once_into_sqlite_store(tmp_path):
+    history_file = tmp_path / 'history.json'
+    legacy_entries = [
+        {'timestamp': '2026-03-15 12:00:00', 'session_id': 'session-1', 'type': 'alert', 'image_path': ''},
+        {'timestamp': '2026-03-15 12:05:00', 'session_id': 'session-1', 'type': 'session_summary'},
+    ]
+    history_file.write_text(json.dumps(legacy_entries), encoding='utf-8')
+
+    # Lesen allein migriert nicht
+    assert load_history_entries(history_file=history_file) == []
+    assert history_file.exists()
+
+    assert alert_history.migrate_legacy_history(history_file=history_file) is True
+    assert load_history_entries(history_file=history_file, entry_type='alert') == [legacy_entries[0]]
+    assert not history_file.exists()
+    assert (tmp_path / 'history.json.migrated').exists()
+
+    append_history_entry(
+        {'timestamp': '2026-03-15 12:10:00', 'session_id': 'session-2', 'type': 'alert', 'image_path': ''},
+        history_file=history_file,
+    )
+
+    assert [entry['session_id'] for entry in load_history_entries(history_file=history_file)] == [
+        'session-1',
+        'session-1',
+        'session-2',
+    ]
+    assert len(load_history_entries(history_file=history_file, session_id='session-1')) == 2
+
+
+def test_startup_migrates_the_configured_legacy_history(tmp_path):
+    cfg = _create_default_config()
+    cfg.measurement.history_path = str(tmp_path)
+    (tmp_path / 'history.json').write_text(
+        json.dumps([{'timestamp': '2026-03-15 12:00:00', 'session_id': 'session-1', 'type': 'alert'}]),
+        encoding='utf-8',
+    )
+
+    gui_init._migrate_legacy_alert_history(cfg)
+
+    assert (tmp_path / 'history.json.migrated').exists()
+    assert [entry['session_id'] for entry in load_history_entries(history_file=tmp_path / 'history.json')] == ['session-1']
+
+
+def test_append_history_entry_defers_retention_to_compaction(tmp_path):
+    history_file = tmp_path / 'history.json'
+    for minute in (3, 1, 2):
+        append_history_entry(
+            {'timestamp': f'2026-03-15 12:0{minute}:00', 'session_id': f'session-{minute}', 'type': 'alert'},
+            history_file=history_file,
+            max_entries=2,
+        )
+    assert len(load_history_entries(history_file=history_file)) == 3
+    revision = alert_history.get_history_revision(history_file=history_file)
+
+    alert_history.compact_pending_history()
+
+    assert [entry['session_id'] for entry in load_history_entries(history_file=history_file)] == [
+        'session-3',
+        'session-2',
+    ]
+    assert alert_history.get_history_revision(history_file=history_file) == revision + 1
+    assert alert_history.compact_history(history_file=history_file, max_entries=2) == 0
+
+
+def test_session_summaries_do_not_push_alerts_out_of_the_entry_limit(tmp_path, monkeypatch):
+    history_file = tmp_path / 'history.json'
+    monkeypatch.setattr(alert_history, 'MAX_HISTORY_SESSION_SUMMARIES', 1)
+    for minute, entry_type in ((1, 'alert'), (2, 'session_summary'), (3, 'alert'), (4, 'session_summary')):
+        append_history_entry(
+            {'timestamp': f'2026-03-15 12:0{minute}:00', 'session_id': f'session-{minute}', 'type': entry_type},
+            history_file=history_file,
+            max_entries=2,
+        )
+
+    alert_history.compact_pending_history()
+
+    assert [entry['session_id'] for entry in load_history_entries(history_file=history_file)] == [
+        'session-1',
+        'session-3',
+        'session-4',
+    ]
+
+
+def test_iter_history_entries_streams_newest_entries_since_cutoff(tmp_path):
+    history_file = tmp_path / 'history.json'
+    for minute in (1, 4, 2, 3):
+        append_history_entry(
+            {'timestamp': f'2026-03-15 12:0{minute}:00', 'session_id': f'session-{minute}', 'type': 'alert'},
+            history_file=history_file,
+        )
+
+    newest = alert_history.iter_history_entries(history_file=history_file, newest_first=True, limit=2)
+    recent = alert_history.iter_history_entries(history_file=history_file, since=datetime(2026, 3, 15, 12, 2))
+
+    assert [entry['session_id'] for entry in newest] == ['session-4', 'session-3']
+    assert [entry['session_id'] for entry in recent] == ['session-4', 'session-2', 'session-3']
+    assert list(alert_history.iter_history_entries(history_file=tmp_path / 'missing.json')) == []
@@ -1,10 +1,9 @@
-import json
 from datetime import datetime
 
 import numpy as np
 
 import src.alert_history as alert_history
-from src.alert_history import replace_history_entries
+from src.alert_history import load_history_entries, replace_history_entries
 from src.config import _create_default_config
 from src.measurement import MeasurementController
 from src.notify import EMailSystem
@@ -58,7 +57,7 @@ def test_trigger_alert_sync_persists_image_only_in_history_dir(monkeypatch, tmp_
         assert controller.trigger_alert_sync("session-1", generation) is True
 
         history_file = history_dir / "history.json"
-        entries = json.loads(history_file.read_text(encoding="utf-8"))
+        entries = load_history_entries(history_file=history_file)
         assert len(entries) == 1
         assert entries[0]["image_path"]
         assert (history_dir / entries[0]["image_path"]).exists()
@@ -78,7 +77,7 @@ def test_replace_history_entries_limits_persisted_images_to_latest_25(tmp_path):
 
     replace_history_entries(entries, history_file=history_file)
 
-    stored_entries = json.loads(history_file.read_text(encoding="utf-8"))
+    stored_entries = load_history_entries(history_file=history_file)
     stored_by_session = {entry["session_id"]: entry for entry in stored_entries}
     cleared_count = len(entries) - alert_history.MAX_HISTORY_IMAGE_FILES
     assert len(stored_entries) == len(entries)
@@ -103,7 +102,7 @@ def test_replace_history_entries_max_entry_limit_keeps_newest_entries_when_unsor
 
     replace_history_entries(entries, history_file=history_file)
 
-    stored_entries = json.loads(history_file.read_text(encoding="utf-8"))
+    stored_entries = load_history_entries(history_file=history_file)
     assert {entry["session_id"] for entry in stored_entries} == {"session-2", "session-3"}
     assert not (tmp_path / "alert_max_0.jpg").exists()
     assert not (tmp_path / "alert_max_1.jpg").exists()
@@ -111,6 +110,21 @@ def test_replace_history_entries_max_entry_limit_keeps_newest_entries_when_unsor
     assert (tmp_path / "alert_max_3.jpg").exists()
 
 
+def test_replace_history_entries_limits_session_summaries_separately(tmp_path, monkeypatch):
+    history_file = tmp_path / "history.json"
+    entries = [_alert_entry(index, "") for index in range(2)]
+    for index in (2, 3):
+        entries.append({**_alert_entry(index, ""), "type": "session_summary"})
+
+    monkeypatch.setattr(alert_history, "MAX_HISTORY_ENTRIES", 2)
+    monkeypatch.setattr(alert_history, "MAX_HISTORY_SESSION_SUMMARIES", 1)
+
+    replace_history_entries(entries, history_file=history_file)
+
+    stored_entries = load_history_entries(history_file=history_file)
+    assert [entry["session_id"] for entry in stored_entries] == ["session-0", "session-1", "session-3"]
+
+
 def test_replace_history_entries_trims_oldest_entries_when_size_limit_exceeded(tmp_path, monkeypatch):
     history_file = tmp_path / "history.json"
     entries = []
@@ -124,9 +138,9 @@ def test_replace_history_entries_trims_oldest_entries_when_size_limit_exceeded(t
 
     replace_history_entries(entries, history_file=history_file)
 
-    stored_entries = json.loads(history_file.read_text(encoding="utf-8"))
+    stored_entries = load_history_entries(history_file=history_file)
     assert [entry["session_id"] for entry in stored_entries] == ["session-1", "session-2"]
-    assert history_file.stat().st_size <= size_limit
+    assert alert_history._serialized_history_entries_size_bytes(stored_entries) <= size_limit
     assert not (tmp_path / "alert_size_0.jpg").exists()
     assert (tmp_path / "alert_size_1.jpg").exists()
     assert (tmp_path / "alert_size_2.jpg").exists()
@@ -145,9 +159,9 @@ def test_replace_history_entries_size_limit_removes_oldest_when_entries_are_unso
 
     replace_history_entries(entries, history_file=history_file)
 
-    stored_entries = json.loads(history_file.read_text(encoding="utf-8"))
+    stored_entries = load_history_entries(history_file=history_file)
     assert {entry["session_id"] for entry in stored_entries} == {"session-2", "session-3"}
-    assert history_file.stat().st_size <= size_limit
+    assert alert_history._serialized_history_entries_size_bytes(stored_entries) <= size_limit
     assert not (tmp_path / "alert_unsorted_size_0.jpg").exists()
     assert not (tmp_path / "alert_unsorted_size_1.jpg").exists()
     assert (tmp_path / "alert_unsorted_size_2.jpg").exists()
@@ -165,7 +179,7 @@ def test_replace_history_entries_with_empty_list_removes_alert_images(tmp_path):
     replace_history_entries(entries, history_file=history_file)
     replace_history_entries([], history_file=history_file)
 
-    assert json.loads(history_file.read_text(encoding="utf-8")) == []
+    assert load_history_entries(history_file=history_file) == []
     assert list(tmp_path.glob("alert_*.jpg")) == []
 
 
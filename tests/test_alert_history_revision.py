@@ -1,4 +1,3 @@
-import json
 import shutil
 import uuid
 from pathlib import Path
@@ -7,6 +6,7 @@ from src import alert_history
 from src.alert_history import (
     append_history_entry,
     get_history_revision,
+    load_history_entries,
     register_history_listener,
     replace_history_entries,
     unregister_history_listener,
@@ -22,14 +22,11 @@ def _alert_entry(timestamp: str, session_id: str) -> dict[str, str]:
     }
 
 
-def test_history_revision_increments_on_append_and_replace(monkeypatch) -> None:
-    history_file = Path('data/history/test_history_revision_a.json')
+def test_history_revision_increments_on_append_and_replace(tmp_path) -> None:
+    history_file = tmp_path / 'test_history_revision_a.json'
     revision_key = alert_history._history_revision_key(history_file)
     alert_history._history_revisions.pop(revision_key, None)
 
-    monkeypatch.setattr(alert_history, '_load_history_entries_unlocked', lambda *args, **kwargs: [])
-    monkeypatch.setattr(alert_history, '_write_history_entries_unlocked', lambda *args, **kwargs: None)
-
     initial_revision = get_history_revision(history_file=history_file)
 
     append_history_entry(_alert_entry('2026-03-27 12:00:00', 'session-1'), history_file=history_file)
@@ -41,31 +38,25 @@ def test_history_revision_increments_on_append_and_replace(monkeypatch) -> None:
     assert after_replace == after_append + 1
 
 
-def test_history_revision_is_tracked_per_history_file(monkeypatch) -> None:
-    history_file_a = Path('data/history/test_history_revision_a.json')
-    history_file_b = Path('data/history/test_history_revision_b.json')
+def test_history_revision_is_tracked_per_history_file(tmp_path) -> None:
+    history_file_a = tmp_path / 'test_history_revision_a.json'
+    history_file_b = tmp_path / 'test_history_revision_b.json'
     alert_history._history_revisions.pop(alert_history._history_revision_key(history_file_a), None)
     alert_history._history_revisions.pop(alert_history._history_revision_key(history_file_b), None)
 
-    monkeypatch.setattr(alert_history, '_load_history_entries_unlocked', lambda *args, **kwargs: [])
-    monkeypatch.setattr(alert_history, '_write_history_entries_unlocked', lambda *args, **kwargs: None)
-
     append_history_entry(_alert_entry('2026-03-27 12:00:00', 'session-a'), history_file=history_file_a)
 
     assert get_history_revision(history_file=history_file_a) == 1
     assert get_history_revision(history_file=history_file_b) == 0
 
 
-def test_history_listener_is_called_once_and_can_be_unregistered(monkeypatch) -> None:
-    history_file = Path('data/history/test_history_listener.json')
+def test_history_listener_is_called_once_and_can_be_unregistered(tmp_path) -> None:
+    history_file = tmp_path / 'test_history_listener.json'
     history_key = alert_history._history_revision_key(history_file)
     alert_history._history_revisions.pop(history_key, None)
     alert_history._history_listeners.pop(history_key, None)
     revisions: list[int] = []
 
-    monkeypatch.setattr(alert_history, '_load_history_entries_unlocked', lambda *args, **kwargs: [])
-    monkeypatch.setattr(alert_history, '_write_history_entries_unlocked', lambda *args, **kwargs: None)
-
     def listener(revision: int) -> None:
         revisions.append(revision)
 
@@ -89,7 +80,7 @@ def test_append_history_entry_persists_pending_image_with_entry() -> None:
             pending_image_bytes=b'img-bytes',
         )
 
-        stored_entries = json.loads(history_file.read_text(encoding='utf-8'))
+        stored_entries = load_history_entries(history_file=history_file)
         assert len(stored_entries) == 1
         assert stored_entries[0]['image_path'] == 'alert_test.jpg'
         assert (temp_dir / 'alert_test.jpg').read_bytes() == b'img-bytes'
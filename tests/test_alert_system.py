@@ -1,11 +1,15 @@
 import numpy as np
 import cv2
+import pytest
 from datetime import datetime, timedelta
 
 from src.config import _create_default_config
 from src.measurement import MeasurementController, resolve_measurement_stop_event
 from src.notify import EMailSystem
 
+# Alerts mit Default-Config landen sonst in data/history des Repos
+pytestmark = pytest.mark.usefixtures("isolated_history_dir")
+
 
 def _get_plain_text_parts(msg):
     return [
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+
+import pytest
+
+from src.cam import calibration
+from src.cam.calibration import (
+    CalibrationCandidate,
+    CalibrationScore,
+    build_grid,
+    evaluate_candidate,
+    label_at,
+    load_labels,
+    main,
+    run_calibration,
+    select_best,
+)
+from src.cam.motion import MotionDetector
+from src.cam.reanalysis import probe_source
+from src.config import _create_default_config, load_config, save_config
+
+
+def _write_labels(path) -> None:
+    # 10 FPS: frames 0-49 quiet, 50-79 motion
+    path.write_text("start_s,end_s,label\n0,5,no_motion\n5,8,motion\n", encoding="utf-8")
+
+
+def _score(sensitivity: float, *, false_alarms: int, detected: int, cpu: float) -> CalibrationScore:
+    return CalibrationScore(
+        CalibrationCandidate(sensitivity, 0.005, 320),
+        motion_frames=100,
+        detected_motion_frames=detected,
+        quiet_frames=100,
+        false_alarm_frames=false_alarms,
+        analysed_frames=200,
+        cpu_seconds=cpu,
+    )
+
+
+def test_labels_are_read_from_csv_and_json(tmp_path) -> None:
+    csv_path = tmp_path / "labels.csv"
+    _write_labels(csv_path)
+    json_path = tmp_path / "labels.json"
+    json_path.write_text(json.dumps([{"start_s": 5, "end_s": 8, "label": "Motion"}]), encoding="utf-8")
+
+    segments = load_labels(str(csv_path))
+
+    assert [segment.label for segment in segments] == ["no_motion", "motion"]
+    assert label_at(segments, 4.9) == "no_motion"
+    assert label_at(segments, 9.0) is None
+    assert load_labels(str(json_path))[0].label == "motion"
+
+    bad = tmp_path / "bad.csv"
+    bad.write_text("start_s,end_s,label\n0,5,maybe\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_labels(str(bad))
+
+
+def test_cheapest_candidate_within_targets_wins() -> None:
+    scores = [
+        _score(0.9, false_alarms=5, detected=100, cpu=0.1),
+        _score(0.5, false_alarms=0, detected=95, cpu=0.4),
+        _score(0.2, false_alarms=1, detected=92, cpu=0.2),
+        _score(0.1, false_alarms=0, detected=50, cpu=0.05),
+    ]
+
+    best = select_best(scores, max_false_alarm=0.01, min_recall=0.9)
+
+    assert best is scores[2]
+    assert select_best(scores, max_false_alarm=0.0, min_recall=0.99) is None
+
+
+def test_grid_evaluation_scores_labelled_frames(tmp_path, write_footage) -> None:
+    clip = tmp_path / "clip"
+    write_footage(clip)
+    labels_path = tmp_path / "labels.csv"
+    _write_labels(labels_path)
+    config = _create_default_config().motion_detection
+
+    scores = run_calibration(
+        probe_source(str(clip), fallback_fps=10.0),
+        load_labels(str(labels_path)),
+        config,
+        build_grid([0.9], [0.005], [160, 320]),
+        workers=1,
+    )
+
+    assert len(scores) == 2
+    for score in scores:
+        assert score.analysed_frames == 80
+        assert score.quiet_frames > 0 and score.motion_frames == 30
+        assert score.false_alarm_rate == 0.0
+        assert score.recall > 0.5
+
+
+def test_candidates_are_scored_like_a_detector_built_from_the_written_config(
+    tmp_path, monkeypatch, write_footage
+) -> None:
+    clip = tmp_path / "clip"
+    write_footage(clip, frames=5, motion_from=5)
+    candidate = CalibrationCandidate(0.5, 0.01, 160)
+    base_config = _create_default_config().motion_detection
+    scored = []
+
+    class _RecordingDetector(MotionDetector):
+        def detect_motion(self, frame, *args, **kwargs):
+            scored.append((self.sensitivity, self.min_contour_area))
+            return super().detect_motion(frame, *args, **kwargs)
+
+    monkeypatch.setattr(calibration, "MotionDetector", _RecordingDetector)
+    evaluate_candidate(
+        candidate,
+        source=probe_source(str(clip), fallback_fps=10.0),
+        labels=[],
+        base_config=base_config,
+    )
+
+    written = dataclasses.replace(base_config, **candidate.as_params())
+    assert set(scored) == {(written.sensitivity, MotionDetector(written).min_contour_area)}
+
+
+def test_write_config_stores_the_winner(tmp_path, write_footage) -> None:
+    clip = tmp_path / "clip"
+    write_footage(clip)
+    labels_path = tmp_path / "labels.csv"
+    _write_labels(labels_path)
+    config_path = tmp_path / "config.yaml"
+    save_config(_create_default_config(), str(config_path))
+
+    exit_code = main([
+        str(clip),
+        str(labels_path),
+        "--config", str(config_path),
+        "--fps", "10",
+        "--sensitivity", "0.9",
+        "--learning-rate", "0.01",
+        "--processing-width", "160",
+        "--min-recall", "0.5",
+        "--workers", "1",
+        "--write-config",
+    ])
+
+    assert exit_code == 0
+    stored = load_config(str(config_path)).motion_detection
+    assert (stored.sensitivity, stored.background_learning_rate, stored.processing_max_width) == (0.9, 0.01, 160)
@@ -97,3 +97,74 @@ def test_dispatch_motion_callbacks_supports_result_only_listeners() -> None:
         assert results == [result]
     finally:
         camera.cleanup()
+
+
+def _decode_width(jpeg_bytes: bytes) -> int:
+    import cv2
+
+    image = cv2.imdecode(np.frombuffer(jpeg_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
+    assert image is not None
+    return int(image.shape[1])
+
+
+def test_preview_ladder_maps_requested_width_to_rung() -> None:
+    camera = _build_camera()
+
+    try:
+        assert camera.get_preview_widths() == [320, 640, 1280]
+        assert camera.resolve_preview_width(None) is None
+        assert camera.resolve_preview_width(100) == 320
+        assert camera.resolve_preview_width(500) == 640
+        # The default rung (preview_max_width) and anything larger use the regular preview path
+        assert camera.resolve_preview_width(1280) is None
+        assert camera.resolve_preview_width(4000) is None
+    finally:
+        camera.cleanup()
+
+
+def test_preview_ladder_encodes_only_subscribed_rungs() -> None:
+    camera = _build_camera()
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+    try:
+        camera.register_preview_consumer(320)
+        camera._publish_current_frame(frame)
+
+        assert camera._maybe_publish_preview_frame(frame) is None
+        assert camera.get_current_jpeg_frame() is None
+        small = camera.get_current_jpeg_frame(320)
+        assert small is not None and _decode_width(small) == 320
+        assert camera.get_current_jpeg_frame(640) is None
+        assert camera.get_preview_broadcaster(320).get_latest()[0] == 1
+        assert camera.get_preview_consumer_count() == 1
+
+        camera.unregister_preview_consumer(320)
+        assert camera.get_preview_consumer_count() == 0
+        ladder = {item["width"]: item for item in camera.get_preview_ladder_stats()}
+        assert ladder[320]["encodes"] == 1
+        assert 640 not in ladder
+    finally:
+        camera.cleanup()
+
+
+def test_polled_rung_is_encoded_once_per_captured_frame() -> None:
+    from src.cam import camera as camera_module
+
+    camera = _build_camera()
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+    try:
+        camera._publish_current_frame(frame)
+        first = camera_module._build_video_frame_response(camera, 600)
+        second = camera_module._build_video_frame_response(camera, 600)
+
+        assert first.media_type == "image/jpeg"
+        assert _decode_width(bytes(first.body)) == 640
+        assert bytes(second.body) == bytes(first.body)
+        assert camera._preview_rungs[640].encodes == 1
+
+        camera._publish_current_frame(frame)
+        camera_module._build_video_frame_response(camera, 600)
+        assert camera._preview_rungs[640].encodes == 2
+    finally:
+        camera.cleanup()
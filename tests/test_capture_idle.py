@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.cam import camera as camera_module
+from src.cam.camera import Camera
+from src.config import _create_default_config
+from src.measurement import MeasurementController
+
+
+class _FakeCapture:
+    def __init__(self) -> None:
+        self.grabs = 0
+
+    def grab(self) -> bool:
+        self.grabs += 1
+        return True
+
+
+def _idle_camera(mode: str, *, grace: float = 0.0) -> Camera:
+    config = _create_default_config()
+    config.webcam.idle_capture = mode
+    config.webcam.idle_grace_seconds = grace
+    camera = Camera(config, initialize=False)
+    camera._last_capture_demand_monotonic = 0.0
+    return camera
+
+
+def test_grab_only_mode_skips_decode_without_demand() -> None:
+    camera = _idle_camera("grab_only")
+    capture = _FakeCapture()
+
+    assert all(camera._idle_capture_step(capture) for _ in range(5))
+    assert capture.grabs == 5
+    stats = camera.get_capture_idle_stats()
+    assert stats["idle"] is True
+    assert stats["grabbed_only_frames"] == 5
+
+
+def test_low_fps_mode_retrieves_at_idle_rate(monkeypatch: pytest.MonkeyPatch) -> None:
+    camera = _idle_camera("low_fps")
+    camera.webcam_config.idle_fps = 2.0
+    capture = _FakeCapture()
+    clock = {"now": 100.0}
+    monkeypatch.setattr("src.cam.camera.time.monotonic", lambda: clock["now"])
+
+    decoded = 0
+    for _ in range(40):
+        if not camera._idle_capture_step(capture):
+            decoded += 1
+        clock["now"] += 0.05
+
+    # 2 s at 2 idle fps
+    assert decoded == 4
+    assert capture.grabs == 36
+
+
+def test_preview_consumer_or_session_resumes_full_rate() -> None:
+    camera = _idle_camera("grab_only")
+    capture = _FakeCapture()
+    assert camera._idle_capture_step(capture) is True
+
+    camera._preview_consumer_count = 1
+    assert camera._idle_capture_step(capture) is False
+    assert camera.get_capture_idle_stats()["idle"] is False
+
+    camera._preview_consumer_count = 0
+    camera.set_capture_demand("measurement", True)
+    assert camera._idle_capture_step(capture) is False
+    assert camera.get_capture_idle_stats()["demand"] == ["measurement"]
+
+
+def test_grace_period_delays_idling() -> None:
+    camera = _idle_camera("grab_only", grace=60.0)
+    camera.set_capture_demand("measurement", True)
+    camera.set_capture_demand("measurement", False)
+
+    assert camera._idle_capture_step(_FakeCapture()) is False
+
+
+def test_frame_polling_counts_as_capture_demand() -> None:
+    camera = _idle_camera("grab_only", grace=60.0)
+    camera._publish_current_frame(np.zeros((72, 128, 3), dtype=np.uint8))
+    try:
+        assert camera._idle_capture_step(_FakeCapture()) is True
+
+        response = asyncio.run(camera_module._serve_video_frame(camera))
+
+        assert response.status_code == 200
+        assert camera._idle_capture_step(_FakeCapture()) is False
+    finally:
+        camera.cleanup()
+
+
+def test_waiting_long_poll_keeps_capture_at_full_rate(monkeypatch: pytest.MonkeyPatch) -> None:
+    camera = _idle_camera("grab_only")
+    camera._publish_current_frame(np.zeros((72, 128, 3), dtype=np.uint8))
+    steps_while_waiting = []
+
+    async def _wait(camera_arg, after_sequence):
+        steps_while_waiting.append(camera_arg._idle_capture_step(_FakeCapture()))
+
+    monkeypatch.setattr(camera_module, "_wait_for_video_frame_after", _wait)
+    try:
+        asyncio.run(camera_module._serve_video_frame(camera, after=1))
+
+        assert steps_while_waiting == [False]
+        assert camera.get_preview_consumer_count() == 0
+    finally:
+        camera.cleanup()
+
+
+def test_off_mode_never_idles() -> None:
+    camera = _idle_camera("off")
+
+    assert camera._idle_capture_step(_FakeCapture()) is False
+
+
+def test_measurement_session_sets_capture_demand() -> None:
+    camera = MagicMock()
+    controller = MeasurementController(_create_default_config().measurement, None, camera)
+    try:
+        controller.start_session("idle-test")
+        camera.set_capture_demand.assert_called_with("measurement", True)
+        controller.stop_session(reason="manual")
+        camera.set_capture_demand.assert_called_with("measurement", False)
+    finally:
+        controller.cleanup()
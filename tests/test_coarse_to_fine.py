@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from src.cam.motion import MotionDetector
+from src.config import _create_default_config
+
+
+@pytest.fixture
+def coarse_config(motion_config):
+    return lambda coarse_width=80: motion_config(
+        static_gate_enabled=False,
+        processing_max_width=640,
+        min_contour_area=200,
+        coarse_width=coarse_width,
+    )
+
+
+@pytest.fixture
+def detect(coarse_config, make_frame, learn_background):
+    """Learn a still 640x480 scene, then detect one square of ``size`` pixels."""
+
+    def run(size: int, coarse_width: int = 80):
+        detector = learn_background(MotionDetector(coarse_config(coarse_width)), make_frame(480, 640), extra_frames=5)
+        return detector, detector.detect_motion(make_frame(480, 640, blobs=[(300, 200, size, size)]))
+
+    return run
+
+
+def test_borderline_component_is_confirmed_at_high_resolution(detect) -> None:
+    detector, result = detect(16)
+
+    assert result.motion_detected
+    assert 200 <= result.contour_area <= 400
+    stats = detector.get_coarse_stats()
+    assert (stats["candidates"], stats["confirmed"]) == (1, 1)
+
+
+def test_borderline_component_below_min_area_is_rejected_by_the_fine_pass(detect) -> None:
+    detector, result = detect(12)
+
+    assert not result.motion_detected
+    assert result.contour_area == 0
+    assert detector.get_coarse_stats()["rejected"] == 1
+
+
+def test_large_component_is_accepted_without_a_fine_pass(detect) -> None:
+    detector, result = detect(60)
+
+    assert result.motion_detected
+    assert detector.get_coarse_stats()["candidates"] == 0
+
+
+def test_coarse_mode_is_off_by_default_and_when_not_smaller_than_processing_width(coarse_config, detect) -> None:
+    assert MotionDetector(coarse_config(0)).get_coarse_stats()["enabled"] is False
+    assert _create_default_config().motion_detection.coarse_width == 0
+
+    detector, result = detect(16, coarse_width=640)
+    assert result.motion_detected
+    assert detector.get_coarse_stats()["frames"] == 0
+
+
+def test_coarse_keys_are_validated(coarse_config) -> None:
+    config = coarse_config(16)
+    config.coarse_confirm_margin = -1
+    errors = config.validate()
+
+    assert any("coarse_width" in error for error in errors)
+    assert any("coarse_confirm_margin" in error for error in errors)
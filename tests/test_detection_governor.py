@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from src.cam.camera import Camera
+from src.cam.governor import DetectionRateGovernor, min_fps_for_alert_delay
+from src.cam.mjpeg import EncodedFrame
+from src.config import _create_default_config, analyze_imported_config_text
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _governor(clock: _Clock, **overrides) -> DetectionRateGovernor:
+    options = dict(cpu_budget=0.3, latency_budget=0.2, min_fps=1.0, initial_skip=1, window_seconds=2.0, clock=clock)
+    options.update(overrides)
+    return DetectionRateGovernor(**options)
+
+
+def _run_window(governor, clock, *, capture_fps, skip, cpu_per_analysis, latency=0.01, frame_count=0):
+    """Feed analyses until the 2 s window closes; returns the record() result and the frame count."""
+    while True:
+        clock.now += skip / capture_fps
+        frame_count += skip
+        result = governor.record(cpu_seconds=cpu_per_analysis, latency_seconds=latency, frame_count=frame_count)
+        if not governor._samples:
+            return result, frame_count
+
+
+def test_cpu_overshoot_backs_off_proportionally() -> None:
+    clock = _Clock()
+    governor = _governor(clock)
+    governor.record(cpu_seconds=0, latency_seconds=None, frame_count=0)
+
+    # 30 analyses/s * 30 ms = 0.9 s CPU per second, three times the budget
+    new_skip, _ = _run_window(governor, clock, capture_fps=30, skip=1, cpu_per_analysis=0.03)
+
+    assert new_skip == 3
+    decision = governor.get_state()["last_decision"]
+    assert decision["reason"] == "cpu"
+    assert decision["cpu_share"] == pytest.approx(0.9, abs=0.05)
+
+
+def test_latency_overshoot_backs_off_and_headroom_recovers_slowly() -> None:
+    clock = _Clock()
+    governor = _governor(clock, initial_skip=2)
+    governor.record(cpu_seconds=0, latency_seconds=None, frame_count=0)
+
+    new_skip, frames = _run_window(governor, clock, capture_fps=30, skip=2, cpu_per_analysis=0.001, latency=0.5)
+    assert new_skip == 5
+    assert governor.get_state()["last_decision"]["reason"] == "latency"
+
+    new_skip, frames = _run_window(
+        governor, clock, capture_fps=30, skip=5, cpu_per_analysis=0.001, latency=0.01, frame_count=frames
+    )
+    assert new_skip == 4
+    assert governor.get_state()["last_decision"]["reason"] == "headroom"
+
+
+def test_min_fps_from_alert_delay_caps_the_skip() -> None:
+    assert min_fps_for_alert_delay(10) == 3.0
+    assert min_fps_for_alert_delay(600) == 0.5
+
+    clock = _Clock()
+    governor = _governor(clock, min_fps=min_fps_for_alert_delay(10))
+    governor.record(cpu_seconds=0, latency_seconds=None, frame_count=0)
+
+    # Far over budget, but 30 fps / 3 fps leaves at most every 10th frame
+    new_skip, _ = _run_window(governor, clock, capture_fps=30, skip=1, cpu_per_analysis=0.5)
+
+    assert new_skip == 10
+    assert governor.get_state()["last_decision"]["reason"] == "min_fps"
+
+
+def test_max_fps_keeps_a_minimum_skip() -> None:
+    clock = _Clock()
+    governor = _governor(clock, max_fps=5.0)
+    governor.record(cpu_seconds=0, latency_seconds=None, frame_count=0)
+
+    new_skip, _ = _run_window(governor, clock, capture_fps=30, skip=1, cpu_per_analysis=0.0)
+
+    assert new_skip == 6
+    assert governor.get_state()["last_decision"]["reason"] == "max_fps"
+
+
+def test_camera_applies_governor_decisions_and_reports_them() -> None:
+    config = _create_default_config()
+    config.motion_detection.governor_enabled = True
+    camera = Camera(config, initialize=False)
+
+    try:
+        clock = _Clock()
+        camera._detection_governor = _governor(clock)
+        camera.motion_enabled = False
+        for _ in range(65):
+            clock.now += 1 / 30
+            camera.frame_count += 1
+            frame = EncodedFrame(data=b"", sequence=camera.frame_count, width=8, height=8, timestamp=time.time() - 0.45)
+            camera._process_motion_detection(frame)
+
+        assert camera.motion_skip_frames == 3
+        governor = camera.get_motion_metrics()["governor"]
+        assert governor["skip"] == 3
+        assert governor["last_decision"]["reason"] == "latency"
+
+        config.motion_detection.governor_enabled = False
+        camera.configure_detection_governor()
+        assert camera.motion_skip_frames == config.motion_detection.frame_skip
+        assert camera.get_motion_metrics()["governor"] is None
+    finally:
+        camera.cleanup()
+
+
+def test_disabling_the_governor_restores_the_startup_skip() -> None:
+    config = _create_default_config()
+    config.motion_detection.frame_skip = 0
+    config.motion_detection.governor_enabled = True
+    camera = Camera(config, initialize=False)
+
+    try:
+        startup_skip = camera.motion_skip_frames
+        camera.configure_detection_governor()
+        camera.motion_skip_frames = 5
+
+        config.motion_detection.governor_enabled = False
+        camera.configure_detection_governor()
+
+        assert camera.motion_skip_frames == startup_skip
+    finally:
+        camera.cleanup()
+
+
+def test_governor_keys_are_validated_and_importable() -> None:
+    config = _create_default_config().motion_detection
+    config.governor_cpu_budget = 0
+    config.governor_latency_budget_ms = 0
+    errors = config.validate()
+    assert any("governor_cpu_budget" in error for error in errors)
+    assert any("governor_latency_budget_ms" in error for error in errors)
+
+    preview = analyze_imported_config_text(
+        "motion_detection:\n  governor_enabled: true\n  governor_max_fps: -1\n",
+        current_config=_create_default_config(),
+    )
+    statuses = {entry.path: entry.status for entry in preview.entries}
+    assert statuses["motion_detection.governor_enabled"] == "ready"
+    assert statuses["motion_detection.governor_max_fps"] == "invalid"
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import numpy as np
+
+from src.cam.camera import Camera
+from src.cam.detection_worker import MotionDetectionWorker
+from src.cam.motion import MotionResult
+from src.config import _create_default_config
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_worker_processes_latest_frame_and_counts_dropped_frames() -> None:
+    release = threading.Event()
+    started = threading.Event()
+    processed: list[int] = []
+
+    def _process(value: int) -> None:
+        if value == 0:
+            started.set()
+            release.wait(timeout=2.0)
+        processed.append(value)
+
+    worker: MotionDetectionWorker[int] = MotionDetectionWorker(_process, name="test-worker")
+    worker.start()
+    try:
+        worker.submit(0)
+        assert started.wait(timeout=2.0)
+        for value in range(1, 6):
+            worker.submit(value)
+        release.set()
+
+        assert _wait_for(lambda: worker.get_stats()["processed"] == 2)
+        stats = worker.get_stats()
+
+        assert processed == [0, 5]
+        assert stats["submitted"] == 6
+        assert stats["dropped"] == 4
+        assert stats["pending"] is False
+    finally:
+        release.set()
+        assert worker.stop(timeout=2.0)
+
+
+def test_worker_counts_processing_errors_and_keeps_running() -> None:
+    calls: list[int] = []
+
+    def _process(value: int) -> None:
+        calls.append(value)
+        if value == 1:
+            raise RuntimeError("boom")
+
+    worker: MotionDetectionWorker[int] = MotionDetectionWorker(_process, name="test-worker-errors")
+    worker.start()
+    try:
+        worker.submit(1)
+        assert _wait_for(lambda: worker.get_stats()["processed"] == 1)
+        worker.submit(2)
+        assert _wait_for(lambda: worker.get_stats()["processed"] == 2)
+
+        assert calls == [1, 2]
+        assert worker.get_stats()["errors"] == 1
+    finally:
+        worker.stop(timeout=2.0)
+
+
+def test_camera_submits_frames_to_worker_instead_of_detecting_inline() -> None:
+    camera = Camera(_create_default_config(), initialize=False)
+    results: list[MotionResult] = []
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+
+    try:
+        camera.register_motion_result_callback(results.append)
+        camera._start_motion_worker()
+        capture_thread = threading.current_thread()
+        detection_threads: list[threading.Thread] = []
+        original_detect = camera.motion_detector.detect_motion
+
+        def _detect(current_frame: np.ndarray) -> MotionResult:
+            detection_threads.append(threading.current_thread())
+            return original_detect(current_frame)
+
+        camera.motion_detector.detect_motion = _detect
+        camera._publish_current_frame(frame)
+        camera._submit_motion_frame(frame)
+
+        assert _wait_for(lambda: len(results) == 1)
+        assert detection_threads and detection_threads[0] is not capture_thread
+        assert camera.get_motion_metrics()["detection"]["processed"] == 1
+    finally:
+        camera.cleanup()
+    assert camera.get_detection_stats()["running"] is False
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.cam import engines
+from src.cam.engines import MOG2Engine, RunningAverageEngine, create_detector_engine
+from src.cam.motion import MotionDetector, MotionResult
+from src.config import _create_default_config, analyze_imported_config_text
+
+
+@pytest.fixture
+def frame(make_frame):
+    return lambda blob=False: make_frame(120, 160, value=70, blobs=[(40, 30, 60, 50)] if blob else (), blob_value=230)
+
+
+def test_running_average_masks_large_differences_and_adapts() -> None:
+    engine = RunningAverageEngine(threshold=20)
+    still = np.full((4, 4), 100, dtype=np.uint8)
+    moved = still.copy()
+    moved[0, 0] = 180
+    moved[1, 1] = 110
+
+    assert not engine.apply(still, learningRate=0.5).any()
+    mask = engine.apply(moved, learningRate=0.5)
+
+    assert mask.dtype == np.uint8 and mask.shape == still.shape
+    assert mask[0, 0] == 255 and mask[1, 1] == 0 and int(mask.sum()) == 255
+    # Background moved halfway: 100 + 0.5 * 80
+    assert engine.apply(moved, learningRate=0.0)[0, 0] == 255
+    assert not engine.apply(np.full((4, 4), 140, dtype=np.uint8), learningRate=0.0)[0, 0]
+
+    engine.clear()
+    assert not engine.apply(moved).any()
+
+
+@pytest.mark.parametrize("engine", ["mog2", "running_average"])
+def test_every_engine_produces_the_same_motion_result_shape(engine, motion_config, frame) -> None:
+    detector = MotionDetector(motion_config(engine=engine))
+    for _ in range(detector.learning_frames_required + 5):
+        assert not detector.detect_motion(frame()).motion_detected
+
+    result = detector.detect_motion(frame(blob=True))
+
+    assert isinstance(result, MotionResult)
+    assert detector.engine_name == engine
+    assert result.motion_detected
+    assert 2000 <= result.contour_area <= 3500
+
+
+def test_unknown_engine_falls_back_to_mog2_and_set_engine_switches_at_runtime(motion_config) -> None:
+    detector = MotionDetector(motion_config(engine="optical_flow"))
+    assert isinstance(detector.background_subtractor, MOG2Engine)
+
+    assert detector.set_engine("running_average")
+    assert isinstance(detector.background_subtractor, RunningAverageEngine)
+    assert detector.is_learning
+    assert not detector.set_engine("optical_flow")
+    assert detector.engine_name == "running_average"
+
+
+def test_registered_engines_are_selectable(monkeypatch, motion_config) -> None:
+    monkeypatch.setattr(engines, "_ENGINES", dict(engines._ENGINES))
+    engines.register_detector_engine("custom", lambda config: RunningAverageEngine(threshold=5))
+
+    assert create_detector_engine("custom", motion_config(engine="mog2")).threshold == 5
+    assert "custom" in engines.get_detector_engine_names()
+    with pytest.raises(ValueError):
+        create_detector_engine("missing", motion_config(engine="mog2"))
+
+
+def test_engine_keys_are_validated_and_importable(motion_config) -> None:
+    config = motion_config(engine="optical_flow")
+    config.difference_threshold = 0
+    errors = config.validate()
+    assert any("engine must be one of" in error for error in errors)
+    assert any("difference_threshold" in error for error in errors)
+
+    preview = analyze_imported_config_text(
+        "motion_detection:\n  engine: running_average\n  difference_threshold: 300\n",
+        current_config=_create_default_config(),
+    )
+    statuses = {entry.path: entry.status for entry in preview.entries}
+    assert statuses["motion_detection.engine"] == "ready"
+    assert statuses["motion_detection.difference_threshold"] == "invalid"
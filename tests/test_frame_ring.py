@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from src.cam import camera as camera_module
+from src.cam.camera import Camera
+from src.cam.detection_worker import MotionDetectionWorker
+from src.cam.frame_ring import FrameHandle, FrameRing
+from src.config import _create_default_config
+
+
+class _FakeCapture:
+    """Mimics VideoCapture.read(image): writes into the given buffer when it fits."""
+
+    def __init__(self, shape: tuple[int, int, int] = (24, 32, 3)) -> None:
+        self.shape = shape
+        self.value = 0
+        self.targets: list[np.ndarray | None] = []
+
+    def read(self, image: np.ndarray | None = None) -> tuple[bool, np.ndarray]:
+        self.value += 1
+        self.targets.append(image)
+        if image is None or image.shape != self.shape:
+            image = np.empty(self.shape, dtype=np.uint8)
+        image.fill(self.value)
+        return True, image
+
+
+def _capture(ring: FrameRing, capture: _FakeCapture, sequence: int) -> FrameHandle:
+    slot = ring.reserve()
+    assert slot is not None
+    ret, frame = capture.read(ring.get_buffer(slot))
+    assert ret
+    return ring.commit(slot, frame, sequence, float(sequence))
+
+
+def test_ring_reuses_buffers_after_warmup() -> None:
+    ring = FrameRing(2)
+    capture = _FakeCapture()
+
+    for sequence in range(1, 7):
+        handle = _capture(ring, capture, sequence)
+        assert not handle.frame.flags.writeable
+        assert int(handle.frame[0, 0, 0]) == sequence
+        handle.release()
+
+    stats = ring.get_stats()
+    assert stats["allocations"] == 2
+    assert stats["reuses"] == 4
+    assert stats["in_use"] == 0
+
+
+def test_shared_handle_pins_slot_until_every_reference_is_released() -> None:
+    ring = FrameRing(2)
+    capture = _FakeCapture()
+
+    first = _capture(ring, capture, 1)
+    shared = first.share()
+    first.release()
+    first.release()  # idempotent per handle
+
+    second = _capture(ring, capture, 2)
+    second.release()
+    third = _capture(ring, capture, 3)
+
+    # The pinned slot was skipped, so the shared frame still shows frame 1.
+    assert int(shared.frame[0, 0, 0]) == 1
+    assert ring.get_stats()["references"] == 2
+
+    shared.release()
+    third.release()
+    assert ring.get_stats()["references"] == 0
+    with pytest.raises(RuntimeError):
+        shared.share()
+
+
+def test_ring_reports_overflow_when_all_slots_are_pinned() -> None:
+    ring = FrameRing(1)
+    capture = _FakeCapture()
+    pinned = _capture(ring, capture, 1)
+
+    assert ring.reserve() is None
+    assert ring.get_stats()["overflows"] == 1
+    pinned.release()
+    assert ring.reserve() is not None
+
+
+def test_worker_releases_replaced_handles_through_drop_hook() -> None:
+    ring = FrameRing(4)
+    capture = _FakeCapture()
+    started = threading.Event()
+    release = threading.Event()
+
+    def _process(handle: FrameHandle) -> None:
+        with handle:
+            started.set()
+            release.wait(timeout=2.0)
+
+    worker: MotionDetectionWorker[FrameHandle] = MotionDetectionWorker(
+        _process,
+        name="test-ring-worker",
+        on_drop=lambda handle: handle.release(),
+    )
+    worker.start()
+    try:
+        busy = _capture(ring, capture, 1)
+        worker.submit(busy)
+        assert started.wait(timeout=2.0)
+        for sequence in range(2, 5):
+            worker.submit(_capture(ring, capture, sequence))
+        # One in processing, one pending; the two replaced handles were released.
+        assert ring.get_stats()["references"] == 2
+    finally:
+        release.set()
+        worker.stop(timeout=2.0)
+    assert ring.get_stats()["references"] == 0
+
+
+def test_camera_capture_path_shares_ring_frames_without_copies() -> None:
+    camera = Camera(_create_default_config(), initialize=False)
+    capture = _FakeCapture()
+    received: list[np.ndarray] = []
+
+    try:
+        camera.enable_motion_detection(lambda frame, _result: received.append(frame))
+        for _ in range(6):
+            slot = camera._reserve_frame_slot()
+            ret, frame = camera._read_frame(capture, slot)
+            assert ret
+            handle = camera._commit_frame(slot, frame)
+            camera._publish_frame_handle(handle)
+            camera._process_motion_detection(handle.share())
+
+        current = camera.get_current_frame(copy_frame=False)
+        assert current is not None and not current.flags.writeable
+        assert received and np.shares_memory(received[-1], current)
+
+        with camera.acquire_frame_handle() as snapshot:
+            assert snapshot is not None
+            assert np.shares_memory(snapshot.frame, current)
+            assert camera.get_frame_ring_stats()["references"] == 2
+
+        # After one pass over the ring, read() decodes into preallocated slots.
+        assert all(target is not None for target in capture.targets[4:])
+        assert camera.get_frame_ring_stats()["references"] == 1
+    finally:
+        camera.cleanup()
+    assert camera.get_frame_ring_stats()["references"] == 0
+
+
+def test_frame_route_fallback_encodes_under_a_ring_reference(monkeypatch) -> None:
+    camera = Camera(_create_default_config(), initialize=False)
+    capture = _FakeCapture()
+    encode = camera_module.cv2.imencode
+    references_while_encoding: list[int] = []
+
+    def _spy_encode(*args, **kwargs):
+        references_while_encoding.append(camera.get_frame_ring_stats()["references"])
+        return encode(*args, **kwargs)
+
+    try:
+        slot = camera._reserve_frame_slot()
+        ret, frame = camera._read_frame(capture, slot)
+        assert ret
+        camera._publish_frame_handle(camera._commit_frame(slot, frame))
+        monkeypatch.setattr(camera_module.cv2, "imencode", _spy_encode)
+
+        jpeg_bytes = camera_module._encode_current_video_frame(camera)
+
+        assert jpeg_bytes is not None and jpeg_bytes.startswith(b"\xff\xd8")
+        # Published frame plus the handle held for the encode; released afterwards
+        assert references_while_encoding == [2]
+        assert camera.get_frame_ring_stats()["references"] == 1
+    finally:
+        camera.cleanup()
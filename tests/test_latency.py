@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+import time
+
+import numpy as np
+
+from src.cam import camera as camera_module
+from src.cam.camera import Camera
+from src.cam.frame_ring import FrameRing
+from src.cam.latency import LatencyHistogram, LatencyRecorder
+from src.cam.motion import MotionDetector
+from src.config import _create_default_config
+
+
+def test_histogram_percentiles_stay_within_observed_range() -> None:
+    histogram = LatencyHistogram()
+    for value in [1.5] * 90 + [40.0] * 9 + [900.0]:
+        histogram.add(value)
+
+    stats = histogram.to_dict()
+
+    assert stats["count"] == 100
+    assert stats["min_ms"] == 1.5 and stats["max_ms"] == 900.0
+    assert 1.5 <= stats["p50_ms"] <= stats["p90_ms"] <= 2.0
+    assert 20.0 <= stats["p99_ms"] <= 50.0
+    assert sum(stats["buckets"]) == 100
+
+
+def test_recorder_measures_and_resets_stages() -> None:
+    recorder = LatencyRecorder()
+    with recorder.measure("capture.read"):
+        time.sleep(0.002)
+    recorder.record("capture.publish", 0.0001)
+
+    snapshot = recorder.get_snapshot()
+    assert list(snapshot["stages"]) == ["capture.publish", "capture.read"]
+    assert snapshot["stages"]["capture.read"]["min_ms"] >= 2.0
+
+    recorder.reset()
+    assert recorder.get_snapshot()["stages"] == {}
+
+
+def test_detector_records_sub_stages_only_with_a_recorder() -> None:
+    detector = MotionDetector(_create_default_config().motion_detection)
+    frame = np.zeros((120, 160, 3), dtype=np.uint8)
+    detector.detect_motion(frame)
+
+    detector.latency = LatencyRecorder()
+    detector.detect_motion(frame)
+
+    assert set(detector.latency.get_snapshot()["stages"]) == {
+        "motion.roi",
+        "motion.gate",
+        "motion.gray",
+        "motion.resize",
+        "motion.blur",
+        "motion.background",
+        "motion.morphology",
+        "motion.components",
+    }
+
+
+def test_camera_records_pipeline_stages_and_serves_them_as_json() -> None:
+    camera = Camera(_create_default_config(), initialize=False)
+
+    try:
+        camera.enable_motion_detection(lambda _frame, _result: None)
+        handle = FrameRing.wrap(np.zeros((72, 128, 3), dtype=np.uint8), 1, time.time() - 0.05)
+        camera._publish_frame_handle(handle)
+        camera._maybe_publish_preview_frame(handle.frame, force=True, sequence=1, captured_at=handle.timestamp)
+        camera._process_motion_detection(handle.share())
+
+        stages = camera.get_motion_metrics()["latency"]["stages"]
+        assert {"preview.encode", "motion.frame_age", "motion.detect", "motion.callbacks", "motion.background"} <= set(stages)
+        assert stages["motion.frame_age"]["min_ms"] >= 50.0
+
+        response = camera_module._build_latency_response(camera, reset=True)
+        payload = json.loads(bytes(response.body))
+        assert payload["camera_id"] == "main"
+        assert "motion.detect" in payload["stages"]
+        assert response.headers["Cache-Control"] == "no-store"
+        assert camera.get_latency_stats()["stages"] == {}
+    finally:
+        camera.cleanup()
+
+
+def test_websocket_session_measures_capture_to_browser_age_on_ack() -> None:
+    session = camera_module._VideoWebSocketSession(None, 2)
+    session.latency = LatencyRecorder()
+    captured_at = time.time() - 0.2
+
+    session.on_sent(7, captured_at, captured_at + 0.01)
+    session.on_ack(7)
+    session.on_ack(99)
+
+    stages = session.latency.get_snapshot()["stages"]
+    assert stages["stream.ws_send_age"]["count"] == 1
+    assert stages["stream.ws_ack_age"]["count"] == 1
+    assert stages["stream.ws_ack_age"]["min_ms"] >= 200.0
+    assert session.window.in_flight == 0
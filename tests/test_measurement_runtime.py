@@ -1,3 +1,6 @@
+import asyncio
+from types import SimpleNamespace
+
 from src.config import _create_default_config
 from src.measurement import MeasurementController
 
@@ -111,3 +114,46 @@ def test_measurement_controller_notifies_session_callbacks_before_email_state_sy
         'session_start_time': None,
     }
     assert events[3] == ('reset', None)
+
+
+def test_measurement_status_snapshot_is_reused_until_state_changes() -> None:
+    cfg = _create_default_config()
+    controller = MeasurementController(cfg.measurement, email_system=None, camera=None)
+    try:
+        first = controller.get_status_snapshot()
+        assert controller.get_status_snapshot() is first
+        assert controller.get_session_status()["is_active"] is False
+
+        assert controller.start_session("session-1")
+        started = controller.get_status_snapshot()
+
+        assert started.version > first.version
+        assert started.is_active is True
+        assert controller.get_status_snapshot() is started
+        status = started.to_status()
+        assert status["session_id"] == "session-1"
+        assert status["alert_countdown"] is not None
+    finally:
+        controller.cleanup()
+
+
+def test_measurement_status_waiters_wake_on_new_version(tmp_path) -> None:
+    cfg = _create_default_config()
+    cfg.measurement.history_path = str(tmp_path)
+    controller = MeasurementController(cfg.measurement, email_system=None, camera=None)
+
+    async def _scenario():
+        version = controller.get_status_snapshot().version
+        timed_out = await controller.wait_for_status_version(version, timeout=0.05)
+        waiter = asyncio.ensure_future(controller.wait_for_status_version(version, timeout=5.0))
+        await asyncio.sleep(0)
+        await asyncio.to_thread(controller.on_motion_detected, SimpleNamespace(motion_detected=True, contour_area=1.0))
+        return timed_out, await asyncio.wait_for(waiter, 2.0)
+
+    try:
+        timed_out, changed = asyncio.run(_scenario())
+        assert timed_out.version == changed.version - 1
+        assert changed.recent_motion_detected is True
+        assert controller._status_waiters == []
+    finally:
+        controller.cleanup()
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import cv2
+import numpy as np
+
+from src.cam.camera import Camera
+from src.cam.mjpeg import as_encoded_jpeg_frame, choose_reduction, decode_for_detection, read_jpeg_dimensions
+from src.cam.motion import MotionDetector, MotionResult
+from src.config import _create_default_config
+
+
+def _raw_mjpeg_read(width: int = 640, height: int = 480) -> tuple[np.ndarray, np.ndarray]:
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    cv2.rectangle(image, (100, 100), (200, 180), (255, 255, 255), -1)
+    ok, buffer = cv2.imencode(".jpg", image)
+    assert ok
+    # V4L2 with CONVERT_RGB=0 returns the compressed frame as a 1xN uint8 row
+    return image, buffer.reshape(1, -1)
+
+
+def _passthrough_camera() -> Camera:
+    config = _create_default_config()
+    config.webcam.capture_mode = "mjpeg_passthrough"
+    return Camera(config, initialize=False)
+
+
+def test_raw_capture_buffer_is_recognised_as_jpeg() -> None:
+    _image, raw = _raw_mjpeg_read(320, 240)
+
+    encoded = as_encoded_jpeg_frame(raw, sequence=7, timestamp=1.0)
+
+    assert encoded is not None
+    assert (encoded.width, encoded.height, encoded.sequence) == (320, 240, 7)
+    assert read_jpeg_dimensions(encoded.data) == (320, 240)
+    assert as_encoded_jpeg_frame(np.zeros((240, 320, 3), dtype=np.uint8), sequence=1, timestamp=1.0) is None
+
+
+def test_reduced_decode_reports_scale() -> None:
+    _image, raw = _raw_mjpeg_read(1280, 720)
+    encoded = as_encoded_jpeg_frame(raw, sequence=1, timestamp=1.0)
+    assert encoded is not None
+
+    reduction = choose_reduction(encoded.width, 320)
+    gray, scale = decode_for_detection(encoded, reduction)
+
+    assert reduction == 4
+    assert gray is not None and gray.ndim == 2
+    assert gray.shape == (180, 320)
+    assert scale == 0.25
+
+
+def test_passthrough_serves_camera_jpeg_without_reencoding(monkeypatch) -> None:
+    camera = _passthrough_camera()
+    _image, raw = _raw_mjpeg_read()
+
+    def _fail_encode(_frame: np.ndarray):
+        raise AssertionError("passthrough preview must not re-encode")
+
+    monkeypatch.setattr(camera, "_encode_preview_frame", _fail_encode)
+    try:
+        encoded = camera._as_passthrough_frame(raw)
+        assert encoded is not None
+        camera._publish_encoded_frame(encoded)
+        camera.register_preview_consumer()
+        preview = camera._maybe_publish_encoded_preview(encoded)
+
+        assert preview == encoded.data
+        assert camera.get_current_jpeg_frame() == encoded.data
+        assert camera.get_preview_resolution() == {"width": 640, "height": 480}
+        assert camera.has_current_frame() is True
+        assert camera._decoded_frame_cache is None
+
+        decoded = camera.get_current_frame(copy_frame=False)
+        assert decoded is not None and decoded.shape == (480, 640, 3)
+        assert camera.get_current_frame(copy_frame=False) is decoded
+    finally:
+        camera.cleanup()
+
+
+def test_passthrough_detection_uses_reduced_decode_and_full_resolution_units() -> None:
+    camera = _passthrough_camera()
+    camera.app_config.motion_detection.processing_max_width = 160
+    results: list[MotionResult] = []
+    calls: list[tuple[tuple[int, ...], float]] = []
+    _image, raw = _raw_mjpeg_read()
+
+    try:
+        camera.register_motion_result_callback(results.append)
+        detector = camera.motion_detector
+        assert detector is not None
+        original_detect = detector.detect_motion
+
+        def _detect(frame: np.ndarray, *, frame_scale: float = 1.0) -> MotionResult:
+            calls.append((frame.shape, frame_scale))
+            return original_detect(frame, frame_scale=frame_scale)
+
+        detector.detect_motion = _detect  # type: ignore[method-assign]
+        encoded = camera._as_passthrough_frame(raw)
+        assert encoded is not None
+        camera._process_motion_detection(encoded)
+
+        assert calls == [((120, 160), 0.25)]
+        assert len(results) == 1
+    finally:
+        camera.cleanup()
+
+
+def test_frame_scale_keeps_contour_area_in_full_resolution_pixels() -> None:
+    config = _create_default_config().motion_detection
+    full_detector = MotionDetector(config)
+    reduced_detector = MotionDetector(config)
+    full_detector.is_learning = reduced_detector.is_learning = False
+    background = np.zeros((480, 640), dtype=np.uint8)
+    moving = background.copy()
+    moving[160:320, 160:320] = 255
+
+    for _ in range(5):
+        full_detector.detect_motion(background)
+        reduced_detector.detect_motion(cv2.resize(background, (160, 120)), frame_scale=0.25)
+    full = full_detector.detect_motion(moving)
+    reduced = reduced_detector.detect_motion(cv2.resize(moving, (160, 120)), frame_scale=0.25)
+
+    # Both areas are reported in full-resolution pixels (160x160 square); blur and
+    # morphology widen the blob slightly more at the reduced scale.
+    assert full.motion_detected and reduced.motion_detected
+    assert 160 * 160 * 0.9 < full.contour_area < 160 * 160 * 1.3
+    assert 160 * 160 * 0.9 < reduced.contour_area < 160 * 160 * 1.3
+
+
+def test_passthrough_rung_uses_reduced_decode_for_small_previews() -> None:
+    camera = _passthrough_camera()
+    _image, raw = _raw_mjpeg_read(1280, 720)
+
+    try:
+        encoded = camera._as_passthrough_frame(raw)
+        assert encoded is not None
+        camera._publish_encoded_frame(encoded)
+        camera.register_preview_consumer(320)
+        camera._maybe_publish_encoded_preview(encoded)
+
+        small = camera.get_current_jpeg_frame(320)
+        assert small is not None and small != encoded.data
+        assert read_jpeg_dimensions(small) == (320, 180)
+        # Rungs at least as wide as the camera frame pass the camera JPEG through
+        assert camera._encode_passthrough_preview(encoded, 1920) == (encoded.data, encoded.resolution)
+    finally:
+        camera.cleanup()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+
+from src.cam import camera as camera_module
+from src.cam.camera import Camera
+from src.cam.heatmap import ActivityHeatmap
+from src.cam.motion import MotionDetector
+from src.config import _create_default_config
+
+
+def test_masks_accumulate_into_their_region() -> None:
+    heatmap = ActivityHeatmap(width=32)
+    mask = np.zeros((120, 160), dtype=np.uint8)
+    mask[:, 80:] = 255
+
+    # Right half of the mask = right quarter of the frame (region starts at x = 0.5)
+    for _ in range(4):
+        heatmap.add(mask, (0.5, 0.0, 0.5, 1.0), (320, 240))
+    activity, frames = heatmap.snapshot()
+
+    assert frames == 4
+    assert activity is not None and activity.shape == (24, 32)
+    assert activity[:, :16].max() == 0.0
+    assert activity[:, 24:].min() == 1.0
+    assert heatmap.get_stats()["peak_activity"] == 1.0
+
+    heatmap.reset()
+    assert heatmap.snapshot() == (None, 0)
+
+
+def test_render_png_is_rgba_overlay() -> None:
+    heatmap = ActivityHeatmap(width=16)
+    empty = cv2.imdecode(np.frombuffer(heatmap.render_png(), np.uint8), cv2.IMREAD_UNCHANGED)
+    assert empty.shape == (1, 1, 4) and empty[..., 3].max() == 0
+
+    mask = np.zeros((12, 16), dtype=np.uint8)
+    mask[:6] = 255
+    heatmap.add(mask, (0.0, 0.0, 1.0, 1.0), (16, 12))
+    image = cv2.imdecode(np.frombuffer(heatmap.render_png(), np.uint8), cv2.IMREAD_UNCHANGED)
+
+    assert image.shape == (12, 16, 4)
+    assert image[0, 0, 3] > 0
+    assert image[-1, 0, 3] == 0
+
+
+def test_detector_feeds_heatmap_after_learning(motion_config, make_frame) -> None:
+    detector = MotionDetector(motion_config(static_gate_enabled=False))
+    detector.heatmap = ActivityHeatmap(width=32)
+    still = make_frame(240, 320)
+
+    for _ in range(detector.learning_frames_required - 1):
+        detector.detect_motion(still)
+    assert detector.heatmap.snapshot() == (None, 0)
+    detector.detect_motion(still)
+
+    moving = make_frame(240, 320, blobs=[(200, 100, 40, 40)])
+    for _ in range(5):
+        detector.detect_motion(moving)
+    activity, frames = detector.heatmap.snapshot()
+
+    assert frames == 6
+    assert activity is not None
+    row, column = np.unravel_index(int(np.argmax(activity)), activity.shape)
+    # Blob covers x 200-240 / y 100-140 of 320x240 -> cells 20-24 / 10-14
+    assert 19 <= column <= 24 and 9 <= row <= 14
+
+
+def test_camera_configures_and_resets_heatmap() -> None:
+    config = _create_default_config()
+    config.motion_detection.heatmap_width = 48
+    camera = Camera(config, initialize=False)
+
+    heatmap = camera.get_motion_heatmap()
+    assert heatmap is not None and heatmap.width == 48
+    heatmap.add(np.full((10, 10), 255, dtype=np.uint8), (0.0, 0.0, 1.0, 1.0), (10, 10))
+    camera.reset_motion_heatmap()
+    assert heatmap.snapshot() == (None, 0)
+
+    config.motion_detection.heatmap_width = 0
+    camera.configure_motion_heatmap()
+    assert camera.get_motion_heatmap() is None
+
+
+def test_heatmap_route_serves_png_and_json() -> None:
+    heatmap = ActivityHeatmap(width=16)
+    heatmap.add(np.full((12, 16), 255, dtype=np.uint8), (0.0, 0.0, 1.0, 1.0), (16, 12))
+    camera = SimpleNamespace(camera_id="cam-a", get_motion_heatmap=lambda: heatmap)
+
+    png = camera_module._build_heatmap_response(camera)
+    raw = camera_module._build_heatmap_response(camera, fmt="json")
+    disabled = camera_module._build_heatmap_response(SimpleNamespace(get_motion_heatmap=lambda: None))
+
+    assert png.media_type == "image/png" and bytes(png.body).startswith(b"\x89PNG")
+    payload = json.loads(bytes(raw.body))
+    assert payload["camera_id"] == "cam-a"
+    assert payload["frames"] == 1 and payload["activity"][0][0] == 1.0
+    assert disabled.status_code == 404
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 import logging
 import threading
@@ -185,6 +186,58 @@ def test_register_combined_motion_listener_uses_lock_for_deduped_state(monkeypat
     assert motion_runtime._api_motion_listeners == []
 
 
+def test_motion_hub_shares_one_source_callback_between_clients(monkeypatch) -> None:
+    camera = _ResultCameraStub()
+    first: list[bool] = []
+    second: list[bool] = []
+    monkeypatch.setattr(motion_runtime, '_api_motion_listeners', [])
+
+    unsubscribe_first = motion_runtime.subscribe_motion_hub(camera, lambda motion, _ts: first.append(motion))
+    unsubscribe_second = motion_runtime.subscribe_motion_hub(camera, lambda motion, _ts: second.append(motion))
+
+    assert len(camera.registered_callbacks) == 1
+    source_callback = camera.registered_callbacks[0]
+    for motion in (False, False, True, True, True, False):
+        source_callback(SimpleNamespace(motion_detected=motion, timestamp=None))
+
+    assert first == second == [False, True, False]
+
+    unsubscribe_first()
+    assert camera.unregistered_callbacks == []
+    unsubscribe_second()
+    assert camera.unregistered_callbacks == [source_callback]
+    assert motion_runtime._api_motion_listeners == []
+
+
+def test_motion_hub_publishes_latest_state_from_event_loop(monkeypatch) -> None:
+    camera = _ResultCameraStub()
+    received: list[tuple[bool, int]] = []
+    monkeypatch.setattr(motion_runtime, '_api_motion_listeners', [])
+    monkeypatch.setattr(motion_runtime, '_resolve_motion_update_interval_seconds', lambda: 0.05)
+
+    async def _scenario() -> int:
+        unsubscribe = motion_runtime.subscribe_motion_hub(
+            camera,
+            lambda motion, _ts: received.append((motion, threading.get_ident())),
+        )
+        source_callback = camera.registered_callbacks[0]
+
+        def _capture_burst() -> None:
+            for motion in (True, False, True, False, True):
+                source_callback(SimpleNamespace(motion_detected=motion, timestamp=None))
+
+        await asyncio.to_thread(_capture_burst)
+        await asyncio.sleep(0.2)
+        unsubscribe()
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(_scenario())
+
+    assert 1 <= len(received) <= 2
+    assert received[-1][0] is True
+    assert all(thread_id == loop_thread for _motion, thread_id in received)
+
+
 def test_motion_update_authorization_accepts_valid_bearer_and_api_key(monkeypatch) -> None:
     monkeypatch.setenv('CVD_API_TOKEN', 'secret-bearer')
     monkeypatch.setenv('CVD_API_KEY', 'secret-key')
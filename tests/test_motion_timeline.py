@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+
+from src.cam.motion import MotionResult
+from src.config import _create_default_config
+from src.measurement import MeasurementController
+from src.motion_timeline import MotionTimeline, bucket_values_to_list
+
+
+def test_ring_overwrites_oldest_samples_and_tracks_last_motion() -> None:
+    timeline = MotionTimeline(capacity=4)
+    for second in range(6):
+        timeline.append(float(second), second == 1, float(second * 10))
+
+    assert len(timeline) == 4
+    assert timeline.last_timestamp == 5.0
+    assert timeline.last_motion_timestamp == 1.0
+    assert timeline.any_motion_since(1.0)
+    assert not timeline.any_motion_since(1.5)
+    timestamps, _motion, areas = timeline.window(10.0, now=5.0)
+    assert sorted(timestamps.tolist()) == [2.0, 3.0, 4.0, 5.0]
+    assert sorted(areas.tolist()) == [20.0, 30.0, 40.0, 50.0]
+
+    timeline.clear()
+    assert len(timeline) == 0 and timeline.last_motion_timestamp is None
+
+
+def test_buckets_report_motion_ratio_and_peak_area() -> None:
+    timeline = MotionTimeline(capacity=16)
+    samples = [(0.1, True, 5.0), (0.6, False, 1.0), (1.2, True, 9.0), (1.7, True, 3.0), (3.5, False, 0.0)]
+    for timestamp, motion, area in samples:
+        timeline.append(timestamp, motion, area)
+
+    ratios = timeline.motion_ratio_buckets(4.0, 4, now=4.0)
+    peaks = timeline.area_buckets(4.0, 4, now=4.0)
+
+    assert ratios[0] == 0.5 and ratios[1] == 1.0 and ratios[3] == 0.0
+    assert math.isnan(ratios[2])
+    assert bucket_values_to_list(peaks) == [5.0, 9.0, None, 0.0]
+
+
+def test_alert_fires_at_deadline_even_without_further_frames(tmp_path) -> None:
+    cfg = _create_default_config()
+    cfg.measurement.history_path = str(tmp_path)
+    cfg.measurement.alert_delay_seconds = 0.3
+    controller = MeasurementController(cfg.measurement, email_system=None, camera=None)
+    fired = threading.Event()
+    controller.trigger_alert_sync = lambda session_id, generation: fired.set()
+    try:
+        assert controller.start_session("session-1")
+        # Ein einziger Frame ohne Bewegung, danach liefert die Kamera nichts mehr
+        controller.on_motion_detected(MotionResult(False, 0.0, time.time()))
+
+        assert fired.wait(3.0)
+        assert controller.alert_triggered is True
+    finally:
+        controller.cleanup()
+
+
+def test_motion_moves_the_deadline_and_feeds_activity(tmp_path) -> None:
+    cfg = _create_default_config()
+    cfg.measurement.history_path = str(tmp_path)
+    cfg.measurement.alert_delay_seconds = 60
+    controller = MeasurementController(cfg.measurement, email_system=None, camera=None)
+    try:
+        assert controller.start_session("session-1")
+        first_deadline = controller._alert_deadline_monotonic
+        controller.on_motion_detected(MotionResult(True, 250.0, time.time()))
+
+        assert controller._alert_deadline_monotonic > first_deadline
+        activity = controller.get_motion_activity(seconds=10, buckets=5)
+        assert activity["contour_area"][-1] == 250.0
+        assert activity["motion_ratio"][-1] == 1.0
+        assert controller.stop_session()
+        assert controller._alert_deadline_monotonic is None
+    finally:
+        controller.cleanup()
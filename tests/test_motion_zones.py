@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import pytest
+
+from src.cam.motion import MotionDetector
+from src.config import _create_default_config, analyze_imported_config_text
+
+
+@pytest.fixture
+def frame(make_frame):
+    return lambda *blobs: make_frame(160, 240, value=60, blobs=[(x, y, size, size) for x, y, size in blobs])
+
+
+@pytest.fixture
+def learned(frame, learn_background):
+    return lambda detector: learn_background(detector, frame(), extra_frames=5)
+
+
+def test_polygon_mask_is_built_once_and_rebuilt_when_the_roi_changes(monkeypatch, motion_config, frame) -> None:
+    detector = MotionDetector(
+        motion_config(region_of_interest={"enabled": True, "x": 0, "y": 0, "width": 0, "height": 0,
+                                    "points": [[20, 20], [120, 20], [20, 120]]})
+    )
+    builds = []
+    original = detector._build_region_plan
+    monkeypatch.setattr(detector, "_build_region_plan", lambda *args: builds.append(args) or original(*args))
+
+    first = detector._apply_roi(frame())
+    detector.detect_motion(frame())
+    detector.detect_motion(frame())
+    assert len(builds) == 1
+    assert first.shape == (101, 101, 3)
+    assert first[5, 5].tolist() == [60, 60, 60] and first[95, 95].tolist() == [0, 0, 0]
+
+    detector.roi.points[1] = [140, 20]
+    assert detector._apply_roi(frame()).shape == (101, 121, 3)
+    assert len(builds) == 2
+
+
+def test_zones_report_per_zone_motion_from_a_single_background_pass(
+    motion_config,
+    frame,
+    learned,
+    count_subtractor_calls,
+) -> None:
+    detector = MotionDetector(
+        motion_config(zones=[
+            {"name": "left", "x": 0, "y": 0, "width": 100, "height": 160},
+            {"name": "right", "points": [[140, 0], [239, 0], [239, 159], [140, 159]]},
+        ])
+    )
+    learned(detector)
+    counter = count_subtractor_calls(detector)
+
+    result = detector.detect_motion(frame((30, 40, 40)))
+
+    assert counter.calls == 1
+    assert result.motion_detected and result.roi_used
+    assert set(result.zones) == {"left", "right"}
+    assert result.zones["left"].motion_detected
+    assert result.zones["left"].contour_area > 1000
+    assert not result.zones["right"].motion_detected
+    assert detector.get_processing_width(240, 160) == 240
+
+
+def test_zone_sensitivity_overrides_the_global_threshold(motion_config, frame, learned) -> None:
+    area = {"x": 0, "y": 0, "width": 240, "height": 160}
+    detector = learned(MotionDetector(
+        motion_config(min_contour_area=200, zones=[
+            {"name": "strict", "sensitivity": 0.01, **area},
+            {"name": "loose", "sensitivity": 1.0, **area},
+        ])
+    ))
+
+    result = detector.detect_motion(frame((100, 60, 30)))
+
+    assert result.zones["loose"].motion_detected
+    assert not result.zones["strict"].motion_detected
+    assert result.motion_detected
+
+
+def test_set_zones_replaces_zones_at_runtime(motion_config, frame) -> None:
+    detector = MotionDetector(motion_config(zones=[{"name": "door", "x": 0, "y": 0, "width": 50, "height": 50}]))
+    assert detector.get_processing_width(240, 160) == 50
+
+    detector.set_zones([])
+
+    assert detector.get_processing_width(240, 160) == 240
+    assert detector.detect_motion(frame()).zones == {}
+
+
+@pytest.mark.parametrize(
+    ("zones", "message"),
+    [
+        ([{"name": "a", "x": 0, "y": 0, "width": 10, "height": 10}] * 2, "not unique"),
+        ([{"name": "a", "points": [[0, 0], [5, 5]]}], "at least 3 points"),
+        ([{"name": "a", "x": 0, "y": 0, "width": 10, "height": 10, "sensitivity": 2}], "sensitivity"),
+        ([{"x": 0, "y": 0, "width": 10, "height": 10}], "name is required"),
+    ],
+)
+def test_invalid_zones_fail_validation(zones, message, motion_config) -> None:
+    errors = motion_config(zones=zones).validate()
+    assert any(message in error for error in errors)
+
+
+def test_zones_are_importable() -> None:
+    preview = analyze_imported_config_text(
+        "motion_detection:\n  zones:\n    - name: door\n      x: 0\n      y: 0\n      width: 40\n      height: 30\n",
+        current_config=_create_default_config(),
+    )
+
+    entry = next(entry for entry in preview.entries if entry.path == "motion_detection.zones")
+    assert entry.status == "ready"
+    assert preview.ready_updates["motion_detection.zones"] == [
+        {"name": "door", "enabled": True, "x": 0, "y": 0, "width": 40, "height": 30}
+    ]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import yaml
+
+from src.cam import camera as camera_module
+from src.cam.camera import Camera
+from src.config import _create_default_config, analyze_imported_config_text
+from src.gui import instances
+from src.measurement import MeasurementController
+from src.notify import EMailSystem
+
+
+class _FakeRouteApp:
+    def __init__(self) -> None:
+        self.routes: list[SimpleNamespace] = []
+
+    def get(self, path: str):
+        def decorator(func):
+            self.routes.append(SimpleNamespace(path=path, endpoint=func))
+            return func
+
+        return decorator
+
+
+def _video_source(body: bytes, camera_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        camera_id=camera_id,
+        placeholder=SimpleNamespace(body=body),
+        get_current_frame=lambda copy_frame=False: None,
+        logger=logging.getLogger(f"test.multi_camera.{camera_id}"),
+    )
+
+
+def _isolate_video_routes(monkeypatch, fake_app: _FakeRouteApp) -> None:
+    monkeypatch.setattr(camera_module, "app", fake_app)
+    monkeypatch.setattr(camera_module, "_VIDEO_ROUTES_REGISTERED", False, raising=False)
+    monkeypatch.setattr(camera_module, "_VIDEO_ROUTE_APP", None, raising=False)
+    monkeypatch.setattr(camera_module, "_ACTIVE_VIDEO_CAMERA", None, raising=False)
+    monkeypatch.setattr(camera_module, "_VIDEO_CAMERAS", {}, raising=False)
+
+
+def test_additional_cameras_derive_configs_from_primary_webcam() -> None:
+    webcam = _create_default_config().webcam
+    webcam.additional_cameras = [{"camera_id": "door", "camera_index": 2, "fps": 10}]
+
+    primary, door = webcam.get_camera_configs()
+
+    assert webcam.validate() == []
+    assert primary is webcam
+    assert (door.camera_id, door.camera_index, door.fps) == ("door", 2, 10)
+    assert door.default_resolution == webcam.default_resolution
+    assert door.additional_cameras == []
+
+
+def test_additional_cameras_reject_duplicate_ids_and_unknown_keys() -> None:
+    webcam = _create_default_config().webcam
+    webcam.additional_cameras = [{"camera_id": "main", "camera_index": 1}]
+    assert any("not unique" in error for error in webcam.validate())
+
+    webcam.additional_cameras = [{"camera_id": "door", "camera_index": 1, "uvc": {}}]
+    assert any("unsupported keys" in error for error in webcam.validate())
+
+    webcam.additional_cameras = []
+    webcam.camera_id = "front door"
+    assert webcam.validate()
+
+
+def test_config_import_accepts_additional_cameras() -> None:
+    current = _create_default_config()
+    imported = {
+        "webcam": {
+            "camera_id": "hall",
+            "additional_cameras": [{"camera_id": "yard", "camera_index": "1", "capture_mode": "MJPEG_PASSTHROUGH"}],
+        }
+    }
+
+    analysis = analyze_imported_config_text(yaml.safe_dump(imported), current_config=current)
+    entries = {entry.path: entry for entry in analysis.entries}
+
+    assert entries["webcam.camera_id"].status == "ready"
+    assert entries["webcam.additional_cameras"].status == "ready"
+    assert analysis.ready_updates["webcam.additional_cameras"] == [
+        {"camera_id": "yard", "camera_index": 1, "capture_mode": "mjpeg_passthrough"}
+    ]
+
+
+def test_per_camera_routes_resolve_registered_camera(monkeypatch) -> None:
+    fake_app = _FakeRouteApp()
+    _isolate_video_routes(monkeypatch, fake_app)
+    primary = _video_source(b"primary", "main")
+    door = _video_source(b"door", "door")
+
+    camera_module._activate_video_camera(primary)
+    camera_module._register_video_camera(door)
+
+    routes = {route.path: route.endpoint for route in fake_app.routes}
+    assert bytes(asyncio.run(routes["/video/frame"]()).body) == b"primary"
+    assert bytes(asyncio.run(routes["/video/frame/{camera_id}"]("main")).body) == b"primary"
+    assert bytes(asyncio.run(routes["/video/frame/{camera_id}"]("door")).body) == b"door"
+    assert asyncio.run(routes["/video/frame/{camera_id}"]("garage")).status_code == 404
+    assert routes["/video_feed/{camera_id}"]("garage").status_code == 404
+    assert camera_module._get_active_video_camera() is primary
+
+    camera_module._unregister_video_camera(door)
+    assert asyncio.run(routes["/video/frame/{camera_id}"]("door")).status_code == 404
+
+
+def test_camera_uses_explicit_webcam_config_and_cleanup_unregisters(monkeypatch) -> None:
+    fake_app = _FakeRouteApp()
+    _isolate_video_routes(monkeypatch, fake_app)
+    config = _create_default_config()
+    config.webcam.additional_cameras = [{"camera_id": "door", "camera_index": 3}]
+    door_config = config.webcam.get_camera_configs()[1]
+
+    camera = Camera(config, initialize=False, webcam_config=door_config)
+    try:
+        assert camera.camera_id == "door"
+        assert camera.webcam_config.camera_index == 3
+        camera_module._register_video_camera(camera)
+        assert camera_module._resolve_video_camera("door") is camera
+    finally:
+        camera.cleanup()
+    assert camera_module._resolve_video_camera("door") is None
+
+
+def test_instances_select_camera_and_controller_by_id(monkeypatch) -> None:
+    primary = SimpleNamespace(camera_id="main")
+    door = SimpleNamespace(camera_id="door")
+    primary_measurement = object()
+    door_measurement = object()
+
+    monkeypatch.setattr(instances, "_camera", primary)
+    monkeypatch.setattr(instances, "_measurement", primary_measurement)
+    monkeypatch.setattr(instances, "_additional_cameras", {"door": door})
+    monkeypatch.setattr(instances, "_additional_measurements", {"door": door_measurement})
+
+    assert instances.get_camera_ids() == ["main", "door"]
+    assert instances.get_camera_by_id("door") is door
+    assert instances.get_camera_by_id(None) is primary
+    assert instances.get_camera_by_id("unknown") is primary
+    assert instances.get_measurement_for_camera(door) is door_measurement
+    assert instances.get_measurement_for_camera(primary) is primary_measurement
+
+
+def test_parallel_camera_sessions_keep_separate_alert_state() -> None:
+    cfg = _create_default_config()
+    cfg.email.recipients = ["recipient@example.com"]
+    cfg.email.smtp_server = "localhost"
+    cfg.email.smtp_port = 25
+    email_system = EMailSystem(cfg.email, cfg.measurement, cfg)
+    controllers = {
+        "main": MeasurementController(cfg.measurement, email_system, MagicMock(camera_id="main")),
+        "door": MeasurementController(cfg.measurement, email_system.for_camera("door"), MagicMock(camera_id="door")),
+    }
+    try:
+        for controller in controllers.values():
+            assert controller.start_session()
+
+        main, door = controllers["main"], controllers["door"]
+        assert main.session_id != door.session_id
+        assert main.session_id.endswith("_main") and door.session_id.endswith("_door")
+        assert main.email_system.can_send_alert(session_id=main.session_id)
+        assert door.email_system.can_send_alert(session_id=door.session_id)
+
+        door.stop_session(reason="manual")
+        assert main.email_system.can_send_alert(session_id=main.session_id)
+    finally:
+        for controller in controllers.values():
+            controller.cleanup()
+        email_system.cleanup()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import numpy as np
+
+from src.cam import camera as camera_module
+from src.cam.camera import Camera
+from src.cam.streaming import PreviewBroadcaster, build_multipart_chunk
+from src.config import _create_default_config
+
+
+def test_broadcaster_wraps_each_frame_once_and_shares_the_buffer() -> None:
+    broadcaster = PreviewBroadcaster()
+
+    async def _scenario() -> tuple[tuple[int, bytes | None], tuple[int, bytes | None]]:
+        first = await broadcaster.wait_for_chunk(0, timeout=0.1)
+        second = await broadcaster.wait_for_chunk(0, timeout=0.1)
+        return first, second
+
+    sequence = broadcaster.publish(b"jpeg-1")
+    first, second = asyncio.run(_scenario())
+
+    assert sequence == 1
+    assert first[0] == second[0] == 1
+    assert first[1] == build_multipart_chunk(b"jpeg-1")
+    assert first[1] is second[1]
+
+
+def test_slow_subscriber_skips_to_newest_frame() -> None:
+    broadcaster = PreviewBroadcaster()
+    for index in range(5):
+        broadcaster.publish(f"jpeg-{index}".encode())
+
+    sequence, chunk = asyncio.run(broadcaster.wait_for_chunk(1, timeout=0.1))
+
+    assert sequence == 5
+    assert chunk == build_multipart_chunk(b"jpeg-4")
+
+
+def test_waiting_subscriber_is_woken_from_another_thread() -> None:
+    broadcaster = PreviewBroadcaster()
+
+    async def _scenario() -> tuple[int, bytes | None]:
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, lambda: threading.Thread(target=broadcaster.publish, args=(b"late",)).start())
+        return await broadcaster.wait_for_chunk(0, timeout=2.0)
+
+    sequence, chunk = asyncio.run(_scenario())
+
+    assert sequence == 1
+    assert chunk == build_multipart_chunk(b"late")
+
+
+def test_wait_returns_unchanged_state_on_timeout() -> None:
+    broadcaster = PreviewBroadcaster()
+    broadcaster.publish(b"only")
+
+    sequence, chunk = asyncio.run(broadcaster.wait_for_chunk(1, timeout=0.01))
+
+    assert sequence == 1
+    assert chunk == build_multipart_chunk(b"only")
+
+
+def test_video_stream_serves_published_preview_without_reencoding(monkeypatch) -> None:
+    camera = Camera(_create_default_config(), initialize=False)
+    frame = np.zeros((72, 128, 3), dtype=np.uint8)
+    monkeypatch.setattr(camera_module, "_ACTIVE_VIDEO_CAMERA", camera, raising=False)
+
+    async def _scenario() -> bytes:
+        stream = camera_module._stream_active_video_frames()
+        first_chunk_task = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.01)
+        assert camera.get_preview_consumer_count() == 1
+        assert camera.get_preview_broadcaster().get_subscriber_count() == 1
+        camera._publish_current_frame(frame)
+        jpeg_bytes = camera._maybe_publish_preview_frame(frame)
+        chunk = await asyncio.wait_for(first_chunk_task, timeout=2.0)
+        await stream.aclose()
+        assert jpeg_bytes is not None
+        assert chunk == build_multipart_chunk(jpeg_bytes)
+        return chunk
+
+    try:
+        asyncio.run(_scenario())
+        assert camera.get_preview_consumer_count() == 0
+        assert camera.get_preview_broadcaster().get_subscriber_count() == 0
+    finally:
+        camera.cleanup()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import csv
+import json
+
+import pytest
+
+from src.cam.reanalysis import (
+    SourceInfo,
+    main,
+    param_label,
+    parse_param_set,
+    plan_tasks,
+    probe_source,
+    run_reanalysis,
+)
+
+
+def test_param_sets_are_typed_from_the_config_fields() -> None:
+    params = parse_param_set("sensitivity=0.2, min_contour_area=800,static_gate_enabled=off")
+
+    assert params == {"sensitivity": 0.2, "min_contour_area": 800, "static_gate_enabled": False}
+    assert param_label(params) == "min_contour_area-800_sensitivity-0.2_static_gate_enabled-False"
+    with pytest.raises(ValueError):
+        parse_param_set("unknown=1")
+    with pytest.raises(ValueError):
+        parse_param_set("min_contour_area=large")
+
+
+def test_plan_crosses_segments_with_parameter_sets() -> None:
+    source = SourceInfo("clip.mp4", "file", 100, 25.0)
+
+    tasks = plan_tasks([source], [{}, {"sensitivity": 0.5}], segments=3, warmup=10)
+
+    assert len(tasks) == 6
+    assert [(task.start, task.stop) for task in tasks[:3]] == [(0, 33), (33, 66), (66, 100)]
+    assert {task.label for task in tasks} == {"default", "sensitivity-0.5"}
+
+
+def test_segmented_run_reports_every_frame_once_and_finds_motion(tmp_path, motion_config, write_footage) -> None:
+    footage = tmp_path / "footage"
+    write_footage(footage)
+    source = probe_source(str(footage), fallback_fps=10.0)
+
+    results = run_reanalysis(plan_tasks([source], [{}], segments=2, warmup=40), motion_config(frame_skip=1), workers=1)
+
+    assert len(results) == 1
+    rows = results[0].rows
+    assert [row[0] for row in rows] == list(range(80))
+    assert rows[10][1] == 1.0
+    assert not any(row[2] for row in rows[35:50])
+    assert any(row[2] for row in rows[50:])
+
+
+def test_cli_writes_one_timeline_per_parameter_set(tmp_path, write_footage) -> None:
+    footage = tmp_path / "footage"
+    write_footage(footage, frames=40, motion_from=35)
+    output = tmp_path / "out"
+
+    exit_code = main([
+        str(footage),
+        "--config", str(tmp_path / "missing.yaml"),
+        "--set", "frame_skip=1",
+        "--set", "frame_skip=2",
+        "--workers", "1",
+        "--format", "json",
+        "--output-dir", str(output),
+    ])
+
+    assert exit_code == 0
+    every_frame = json.loads((output / "footage.frame_skip-1.motion.json").read_text())
+    every_other = json.loads((output / "footage.frame_skip-2.motion.json").read_text())
+    assert every_frame["summary"]["analysed_frames"] == 40
+    assert every_other["summary"]["analysed_frames"] == 20
+    assert every_other["frame_skip"] == 2
+
+
+def test_cli_keeps_timelines_of_equally_named_sources_apart(tmp_path, write_footage) -> None:
+    (tmp_path / "day1").mkdir()
+    (tmp_path / "day2").mkdir()
+    write_footage(tmp_path / "day1" / "cam", frames=10, motion_from=10)
+    write_footage(tmp_path / "day2" / "cam", frames=20, motion_from=20)
+    output = tmp_path / "out"
+
+    exit_code = main([
+        str(tmp_path / "day1" / "cam"),
+        str(tmp_path / "day2" / "cam"),
+        "--config", str(tmp_path / "missing.yaml"),
+        "--set", "frame_skip=1",
+        "--workers", "1",
+        "--format", "json",
+        "--output-dir", str(output),
+    ])
+
+    assert exit_code == 0
+    timelines = [json.loads(path.read_text()) for path in sorted(output.glob("cam-*.motion.json"))]
+    assert sorted(timeline["summary"]["analysed_frames"] for timeline in timelines) == [10, 20]
+
+
+def test_csv_timeline_has_one_row_per_analysed_frame(tmp_path, write_footage) -> None:
+    footage = tmp_path / "footage"
+    write_footage(footage, frames=20, motion_from=20)
+
+    assert main([str(footage), "--workers", "1", "--output-dir", str(tmp_path), "--config", str(tmp_path / "x.yaml")]) == 0
+
+    with open(tmp_path / "footage.default.motion.csv", newline="", encoding="utf-8") as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0][:4] == ["frame", "time_s", "motion", "contour_area"]
+    assert len(rows) == 21
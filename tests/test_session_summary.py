@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from src.alert_history import get_history_file, load_history_entries
+from src.config import _create_default_config
+from src.gui.default_elements.measurementcard import _format_session_summary
+from src.measurement import MeasurementController
+from src.session_summary import SESSION_SUMMARY_ENTRY_TYPE, SessionSummary
+
+
+def test_summary_aggregates_duty_cycle_still_periods_and_area() -> None:
+    summary = SessionSummary("s1", datetime(2026, 1, 1, 12, 0, 0), 100.0, detector_baseline={"processed": 10, "dropped": 2})
+    # 0-4 s ruhig, 4-6 s Bewegung, 6-10 s ruhig
+    for timestamp, motion, area in [(101.0, False, 0.0), (104.0, True, 300.0), (105.0, True, 500.0), (106.0, False, 0.0)]:
+        summary.add_result(timestamp, motion, area)
+    summary.add_alert()
+    summary.add_alert_email()
+
+    record = summary.finish(
+        ended_at=datetime(2026, 1, 1, 12, 0, 10),
+        ended_ts=110.0,
+        reason="timeout",
+        detector_stats={"processed": 60, "dropped": 7},
+    )
+
+    assert record["type"] == SESSION_SUMMARY_ENTRY_TYPE
+    assert record["duration_s"] == 10.0
+    assert record["motion_duty_cycle"] == 0.2
+    assert record["longest_still_s"] == 4.0
+    assert record["mean_contour_area"] == 400.0
+    assert (record["alerts"], record["alert_emails_sent"]) == (1, 1)
+    assert (record["detector_fps"], record["detector_dropped"]) == (5.0, 5)
+    assert record["reason"] == "timeout"
+
+
+def test_stop_writes_summary_record_and_exposes_it_in_status(tmp_path) -> None:
+    cfg = _create_default_config()
+    cfg.measurement.history_path = str(tmp_path)
+    controller = MeasurementController(cfg.measurement, email_system=None, camera=None)
+    try:
+        assert controller.start_session("session-1")
+        controller.on_motion_detected(SimpleNamespace(motion_detected=True, contour_area=120.0, timestamp=time.time()))
+        controller.on_motion_detected(SimpleNamespace(motion_detected=False, contour_area=0.0, timestamp=time.time()))
+        assert controller.stop_session(reason="manual")
+
+        status = controller.get_session_status()
+    finally:
+        controller.cleanup()
+
+    summary = status["last_session_summary"]
+    assert summary["session_id"] == "session-1"
+    assert summary["frames_analysed"] == 2
+    assert summary["mean_contour_area"] == 120.0
+    stored = load_history_entries(history_file=get_history_file(cfg.measurement), entry_type=SESSION_SUMMARY_ENTRY_TYPE)
+    assert [entry["session_id"] for entry in stored] == ["session-1"]
+    assert "motion" in _format_session_summary(summary)
+    assert _format_session_summary(None) == "-"
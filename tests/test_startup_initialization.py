@@ -29,6 +29,9 @@ from src.config import (
 from src.gui import init as gui_init
 from src.gui import instances
 
+# init_application migriert die Alert-History; Default-Pfad nicht im Repo anfassen
+pytestmark = pytest.mark.usefixtures("isolated_history_dir")
+
 
 class _DummyLogger:
     def info(self, *args, **kwargs):
@@ -1409,7 +1412,7 @@ def test_camera_video_frame_route_uses_latest_active_camera(monkeypatch) -> None
     camera_two.initialize_routes()
 
     video_frame_route = next(route for route in fake_app.routes if route.path == "/video/frame")
-    response = video_frame_route.endpoint()
+    response = asyncio.run(video_frame_route.endpoint())
 
     assert bytes(response.body) == b"camera-two"
     assert response.media_type == "image/png"
@@ -1450,7 +1453,7 @@ def test_camera_video_routes_return_placeholder_without_active_camera(monkeypatc
     video_frame_route = next(route for route in fake_app.routes if route.path == "/video/frame")
     video_feed_route = next(route for route in fake_app.routes if route.path == "/video_feed")
 
-    frame_response = video_frame_route.endpoint()
+    frame_response = asyncio.run(video_frame_route.endpoint())
     stream_response = video_feed_route.endpoint()
     first_chunk = asyncio.run(_read_first_stream_chunk(stream_response))
 
@@ -1472,12 +1475,30 @@ def test_camera_initialize_routes_registers_routes_for_new_app_without_flag_rese
     monkeypatch.setattr(camera_module, "_ACTIVE_VIDEO_CAMERA", None, raising=False)
 
     camera.initialize_routes()
-    assert [route.path for route in first_app.routes] == ["/video_feed", "/video/frame"]
+    assert [route.path for route in first_app.routes] == [
+        "/video_feed",
+        "/video/frame",
+        "/video_feed/{camera_id}",
+        "/video/frame/{camera_id}",
+        "/api/latency",
+        "/api/latency/{camera_id}",
+        "/api/motion/heatmap",
+        "/api/motion/heatmap/{camera_id}",
+    ]
 
     monkeypatch.setattr(camera_module, "app", second_app)
     camera.initialize_routes()
 
-    assert [route.path for route in second_app.routes] == ["/video_feed", "/video/frame"]
+    assert [route.path for route in second_app.routes] == [
+        "/video_feed",
+        "/video/frame",
+        "/video_feed/{camera_id}",
+        "/video/frame/{camera_id}",
+        "/api/latency",
+        "/api/latency/{camera_id}",
+        "/api/motion/heatmap",
+        "/api/motion/heatmap/{camera_id}",
+    ]
     assert camera_module._VIDEO_ROUTE_APP is second_app
 
 
@@ -1498,7 +1519,16 @@ def test_restore_video_runtime_accepts_non_camera_video_source_stub(monkeypatch)
     response = camera_module._build_video_frame_response(camera_module._get_active_video_camera())
 
     assert camera_module._get_active_video_camera() is video_source
-    assert [route.path for route in fake_app.routes] == ["/video_feed", "/video/frame"]
+    assert [route.path for route in fake_app.routes] == [
+        "/video_feed",
+        "/video/frame",
+        "/video_feed/{camera_id}",
+        "/video/frame/{camera_id}",
+        "/api/latency",
+        "/api/latency/{camera_id}",
+        "/api/motion/heatmap",
+        "/api/motion/heatmap/{camera_id}",
+    ]
     assert bytes(response.body) == b"stub-camera"
 
 
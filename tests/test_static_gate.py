@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+from src.cam.camera import Camera
+from src.cam.motion import MotionDetector
+from src.config import _create_default_config
+
+
+@pytest.fixture
+def frame(make_frame):
+    return lambda blob=None: make_frame(240, 320, blobs=[(*blob, 20, 20)] if blob else ())
+
+
+@pytest.fixture
+def learned(frame, learn_background, count_subtractor_calls):
+    """Detector past its learning phase with a call counter on the background subtractor."""
+
+    def build(detector: MotionDetector):
+        learn_background(detector, frame())
+        return count_subtractor_calls(detector)
+
+    return build
+
+
+def test_static_frames_skip_the_pipeline_with_periodic_refreshes(motion_config, frame, learned) -> None:
+    detector = MotionDetector(motion_config(static_gate_refresh_frames=4))
+    counter = learned(detector)
+
+    results = [detector.detect_motion(frame()) for _ in range(10)]
+
+    assert not any(result.motion_detected for result in results)
+    # 4 skips, 1 refresh, 4 skips, 1 refresh
+    assert counter.calls == 2
+    stats = detector.get_static_gate_stats()
+    assert stats["refreshes"] == 2
+    assert stats["skipped"] == 8
+    assert 0 < stats["hit_rate"] < 1
+
+
+def test_small_change_passes_the_gate_and_is_detected(motion_config, frame, learned) -> None:
+    detector = MotionDetector(motion_config(min_contour_area=50))
+    counter = learned(detector)
+    detector.detect_motion(frame())
+    calls_before = counter.calls
+
+    result = detector.detect_motion(frame(blob=(150, 110)))
+
+    assert counter.calls == calls_before + 1
+    assert result.motion_detected
+    # While foreground remains, identical frames are analysed in full
+    detector.detect_motion(frame(blob=(150, 110)))
+    assert counter.calls == calls_before + 2
+
+
+def test_gate_never_skips_while_learning_or_when_disabled(
+    motion_config,
+    frame,
+    learn_background,
+    count_subtractor_calls,
+) -> None:
+    detector = MotionDetector(motion_config(static_gate_enabled=False))
+    counter = count_subtractor_calls(detector)
+    learn_background(detector, frame(), extra_frames=5)
+
+    assert counter.calls == detector.learning_frames_required + 5
+    assert detector.get_static_gate_stats()["checked"] == 0
+    assert detector.get_static_gate_stats()["hit_rate"] is None
+
+
+def test_camera_metrics_report_gate_hit_rate() -> None:
+    camera = Camera(_create_default_config(), initialize=False)
+
+    try:
+        assert camera.get_motion_metrics()["static_gate"] is None
+        camera._ensure_motion_detector()
+        assert camera.get_motion_metrics()["static_gate"]["enabled"] is True
+    finally:
+        camera.cleanup()
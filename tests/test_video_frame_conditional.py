@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import numpy as np
+
+from src.cam import camera as camera_module
+from src.cam.camera import Camera
+from src.cam.streaming import FrameSequenceNotifier
+from src.config import _create_default_config
+
+
+def _camera_with_frame() -> Camera:
+    camera = Camera(_create_default_config(), initialize=False)
+    camera._publish_current_frame(np.zeros((72, 128, 3), dtype=np.uint8))
+    return camera
+
+
+def test_frame_response_carries_sequence_etag_and_revalidates_with_304(monkeypatch) -> None:
+    camera = _camera_with_frame()
+
+    try:
+        first = asyncio.run(camera_module._serve_video_frame(camera))
+        etag = first.headers["ETag"]
+
+        assert first.status_code == 200
+        assert first.media_type == "image/jpeg"
+        assert first.headers["Cache-Control"] == "no-cache"
+        assert first.headers["X-Frame-Sequence"] == "1"
+
+        def _fail_encode(*_args, **_kwargs):
+            raise AssertionError("unchanged frames must not be re-encoded")
+
+        monkeypatch.setattr(camera, "build_sequenced_preview_jpeg", _fail_encode)
+        cached = asyncio.run(camera_module._serve_video_frame(camera, if_none_match=f"W/{etag}"))
+        assert cached.status_code == 304
+        assert cached.body == b""
+        assert cached.headers["ETag"] == etag
+    finally:
+        camera.cleanup()
+
+
+def test_new_frame_changes_etag_and_reuses_published_preview() -> None:
+    camera = _camera_with_frame()
+
+    try:
+        first = asyncio.run(camera_module._serve_video_frame(camera))
+        camera._publish_current_frame(np.full((72, 128, 3), 255, dtype=np.uint8))
+        second = asyncio.run(camera_module._serve_video_frame(camera, if_none_match=first.headers["ETag"]))
+
+        assert second.status_code == 200
+        assert second.headers["ETag"] != first.headers["ETag"]
+        assert second.headers["X-Frame-Sequence"] == "2"
+        # The response JPEG is the published preview for exactly this sequence
+        assert camera.get_current_jpeg_frame() == bytes(second.body)
+        assert camera._preview_frame_sequence == 2
+    finally:
+        camera.cleanup()
+
+
+def test_rung_etags_are_distinct_per_ladder_width() -> None:
+    camera = _camera_with_frame()
+
+    try:
+        default = asyncio.run(camera_module._serve_video_frame(camera))
+        small = asyncio.run(camera_module._serve_video_frame(camera, width=300))
+        same_rung = asyncio.run(camera_module._serve_video_frame(camera, width=200, if_none_match=small.headers["ETag"]))
+
+        assert small.headers["ETag"] != default.headers["ETag"]
+        assert same_rung.status_code == 304
+    finally:
+        camera.cleanup()
+
+
+def test_long_poll_returns_once_a_newer_frame_is_published() -> None:
+    camera = _camera_with_frame()
+
+    async def _scenario():
+        loop = asyncio.get_running_loop()
+        loop.call_later(
+            0.05,
+            lambda: threading.Thread(
+                target=camera._publish_current_frame,
+                args=(np.full((72, 128, 3), 128, dtype=np.uint8),),
+            ).start(),
+        )
+        return await camera_module._serve_video_frame(camera, after=1)
+
+    try:
+        response = asyncio.run(_scenario())
+
+        assert response.status_code == 200
+        assert response.headers["X-Frame-Sequence"] == "2"
+    finally:
+        camera.cleanup()
+
+
+def test_long_poll_times_out_with_no_content(monkeypatch) -> None:
+    camera = _camera_with_frame()
+    monkeypatch.setattr(camera_module, "_VIDEO_FRAME_LONG_POLL_SECONDS", 0.05)
+
+    async def _wait(camera_arg, after_sequence):
+        await camera_arg.get_frame_notifier().wait_for_sequence(after_sequence, timeout=0.05)
+
+    monkeypatch.setattr(camera_module, "_wait_for_video_frame_after", _wait)
+    try:
+        response = asyncio.run(camera_module._serve_video_frame(camera, after=1))
+
+        assert response.status_code == 204
+        assert response.headers["X-Frame-Sequence"] == "1"
+    finally:
+        camera.cleanup()
+
+
+def test_placeholder_frames_are_not_cacheable() -> None:
+    response = asyncio.run(camera_module._serve_video_frame(None))
+
+    assert response.media_type == "image/png"
+    assert response.headers["Cache-Control"] == "no-store"
+    assert "ETag" not in response.headers
+
+
+def test_sequence_notifier_answers_restarted_counters_immediately() -> None:
+    notifier = FrameSequenceNotifier()
+    notifier.notify(3)
+
+    assert asyncio.run(notifier.wait_for_sequence(10, timeout=1.0)) == 3
+    assert asyncio.run(notifier.wait_for_sequence(3, timeout=0.01)) == 3
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from src.cam.camera import Camera
+from src.cam.sources import ImageDirectorySource, SyntheticVideoSource, create_video_source
+from src.config import _create_default_config, analyze_imported_config_text
+
+
+def test_synthetic_source_is_deterministic_and_moves() -> None:
+    first = SyntheticVideoSource(160, 120, realtime=False, objects=2, noise=4, seed=3)
+    second = SyntheticVideoSource(160, 120, realtime=False, objects=2, noise=4, seed=3)
+
+    frames = [first.read()[1] for _ in range(3)]
+    replay = [second.read()[1] for _ in range(3)]
+
+    assert frames[0].shape == (120, 160, 3) and frames[0].dtype == np.uint8
+    assert all(np.array_equal(a, b) for a, b in zip(frames, replay))
+    assert cv2.absdiff(frames[0], frames[2]).max() > 100
+    assert first.get(cv2.CAP_PROP_FRAME_WIDTH) == 160.0
+    assert first.set(cv2.CAP_PROP_FRAME_WIDTH, 640) is False
+
+
+def test_synthetic_source_renders_into_the_callers_buffer() -> None:
+    source = SyntheticVideoSource(64, 48, realtime=False, objects=0, noise=0)
+    buffer = np.zeros((48, 64, 3), dtype=np.uint8)
+
+    ret, frame = source.read(buffer)
+
+    assert ret and frame is buffer
+    assert buffer.any()
+
+
+def test_image_directory_loops_in_name_order_at_the_first_images_size(tmp_path) -> None:
+    cv2.imwrite(str(tmp_path / "b.png"), np.full((30, 40, 3), 200, dtype=np.uint8))
+    cv2.imwrite(str(tmp_path / "a.png"), np.full((20, 20, 3), 50, dtype=np.uint8))
+    (tmp_path / "notes.txt").write_text("ignored")
+    source = ImageDirectorySource(str(tmp_path), fps=10, realtime=False)
+
+    values = [int(source.read()[1][0, 0, 0]) for _ in range(3)]
+
+    assert values == [50, 200, 50]
+    assert source.get(cv2.CAP_PROP_FRAME_WIDTH) == 20.0
+    source.release()
+    assert not source.isOpened()
+    assert source.read() == (False, None)
+
+
+def test_empty_image_directory_is_rejected(tmp_path) -> None:
+    with pytest.raises(RuntimeError):
+        ImageDirectorySource(str(tmp_path), fps=10)
+
+
+def test_realtime_pacing_follows_fps_while_max_speed_does_not_wait() -> None:
+    paced = SyntheticVideoSource(32, 32, fps=50, realtime=True, objects=0, noise=0)
+    started = time.monotonic()
+    for _ in range(6):
+        paced.read()
+    assert time.monotonic() - started >= 0.09
+
+    unpaced = SyntheticVideoSource(32, 32, fps=1, realtime=False, objects=0, noise=0)
+    started = time.monotonic()
+    for _ in range(6):
+        unpaced.read()
+    assert time.monotonic() - started < 0.5
+
+
+def test_camera_captures_from_synthetic_source_through_the_frame_ring() -> None:
+    config = _create_default_config()
+    config.webcam.source = "synthetic"
+    config.webcam.source_realtime = False
+    config.webcam.default_resolution = {"width": 160, "height": 120}
+    camera = Camera(config, initialize=False)
+
+    try:
+        camera._initialize_camera()
+        assert isinstance(camera.video_capture, SyntheticVideoSource)
+
+        slot = camera._reserve_frame_slot()
+        ret, frame = camera._read_frame(camera.video_capture, slot)
+        assert ret and frame.shape == (120, 160, 3)
+        camera._publish_frame_handle(camera._commit_frame(slot, frame))
+        assert camera.get_current_frame(copy_frame=False).shape == (120, 160, 3)
+    finally:
+        camera.cleanup()
+
+
+def test_device_source_keeps_the_opencv_camera_path() -> None:
+    assert create_video_source(_create_default_config().webcam) is None
+
+
+def test_source_keys_are_validated_and_importable() -> None:
+    config = _create_default_config()
+    config.webcam.source = "images"
+    assert any("source_path" in error for error in config.webcam.validate())
+
+    config.webcam.source = "tape"
+    assert any("source must be one of" in error for error in config.webcam.validate())
+
+    preview = analyze_imported_config_text(
+        "webcam:\n  source: synthetic\n  source_realtime: false\n  synthetic_objects: 99\n",
+        current_config=_create_default_config(),
+    )
+    statuses = {entry.path: entry.status for entry in preview.entries}
+    assert statuses["webcam.source"] == "ready"
+    assert statuses["webcam.source_realtime"] == "ready"
+    assert statuses["webcam.synthetic_objects"] == "invalid"
+    assert preview.ready_updates["webcam.source"] == "synthetic"
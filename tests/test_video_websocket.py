@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import numpy as np
+from fastapi import WebSocketDisconnect
+
+from src.cam import camera as camera_module
+from src.cam.camera import Camera
+from src.cam.streaming import AckWindow, PreviewBroadcaster, PreviewFrameMeta, build_ws_frame_message, parse_ws_frame_message
+from src.config import _create_default_config
+
+
+class _FakeWebSocket:
+    def __init__(self) -> None:
+        self.accepted = False
+        self.close_codes: list[int] = []
+        self.sent: list[bytes] = []
+        self.incoming: asyncio.Queue[str | None] = asyncio.Queue()
+
+    async def accept(self) -> None:
+        self.accepted = True
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.sent.append(data)
+
+    async def receive_text(self) -> str:
+        message = await self.incoming.get()
+        if message is None:
+            raise WebSocketDisconnect(code=1000)
+        return message
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_codes.append(code)
+
+
+async def _wait_until(predicate, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        assert loop.time() < deadline, "condition not reached in time"
+        await asyncio.sleep(0.01)
+
+
+def test_frame_message_header_round_trips_metadata() -> None:
+    meta = PreviewFrameMeta(sequence=2**32 + 5, captured_at=100.25, width=640, height=360, motion=True)
+
+    message = build_ws_frame_message(b"\xff\xd8jpeg", meta, sent_at=100.5)
+    header, jpeg = parse_ws_frame_message(message)
+
+    assert jpeg == b"\xff\xd8jpeg"
+    assert len(message) == 32 + len(jpeg)
+    assert header == {
+        "version": 1,
+        "motion": True,
+        "sequence": 5,
+        "captured_at": 100.25,
+        "sent_at": 100.5,
+        "width": 640,
+        "height": 360,
+    }
+
+
+def test_ack_window_blocks_until_client_acknowledges() -> None:
+    async def _scenario() -> tuple[bool, bool]:
+        window = AckWindow(1)
+        window.on_sent()
+        blocked = await window.wait_for_capacity(0.01)
+        asyncio.get_running_loop().call_later(0.01, window.on_ack)
+        released = await window.wait_for_capacity(1.0)
+        return blocked, released
+
+    assert asyncio.run(_scenario()) == (False, True)
+
+
+def test_broadcaster_keeps_raw_jpeg_and_metadata_next_to_the_chunk() -> None:
+    broadcaster = PreviewBroadcaster()
+    meta = PreviewFrameMeta(sequence=7, captured_at=1.0, width=4, height=3)
+    broadcaster.publish(b"jpeg", meta=meta)
+
+    assert asyncio.run(broadcaster.wait_for_frame(0, timeout=0.1)) == (1, b"jpeg", meta)
+    broadcaster.clear()
+    assert broadcaster.get_latest_frame() == (1, None, None)
+
+
+def test_websocket_pushes_newest_frame_only_when_the_window_has_room(monkeypatch) -> None:
+    camera = Camera(_create_default_config(), initialize=False)
+    monkeypatch.setattr(camera_module, "_ACTIVE_VIDEO_CAMERA", camera)
+    camera.last_motion_result = SimpleNamespace(motion_detected=True)
+
+    def _capture(value: int) -> None:
+        camera._publish_current_frame(np.full((72, 128, 3), value, dtype=np.uint8))
+        camera._maybe_publish_preview_frame(camera.get_current_frame(copy_frame=False), force=True)
+
+    async def _scenario() -> tuple[_FakeWebSocket, int, int]:
+        websocket = _FakeWebSocket()
+        _capture(10)
+        server = asyncio.create_task(camera_module._serve_video_websocket(websocket, window=1))
+        await _wait_until(lambda: len(websocket.sent) == 1)
+        consumers_while_open = camera.get_preview_consumer_count()
+
+        _capture(20)
+        _capture(30)
+        await asyncio.sleep(0.05)
+        unacknowledged = len(websocket.sent)
+
+        websocket.incoming.put_nowait(json.dumps({"ack": 1}))
+        await _wait_until(lambda: len(websocket.sent) == 2)
+        websocket.incoming.put_nowait(None)
+        await asyncio.wait_for(server, timeout=2.0)
+        return websocket, consumers_while_open, unacknowledged
+
+    try:
+        websocket, consumers_while_open, unacknowledged = asyncio.run(_scenario())
+
+        assert websocket.accepted
+        assert consumers_while_open == 1
+        assert unacknowledged == 1
+        first, _ = parse_ws_frame_message(websocket.sent[0])
+        second, _ = parse_ws_frame_message(websocket.sent[1])
+        assert (first["sequence"], second["sequence"]) == (1, 3)
+        assert second["motion"] is True
+        assert (second["width"], second["height"]) == (128, 72)
+        assert camera.get_preview_consumer_count() == 0
+    finally:
+        camera.cleanup()
+
+
+def test_websocket_rejects_unknown_camera_before_accepting(monkeypatch) -> None:
+    monkeypatch.setattr(camera_module, "_ACTIVE_VIDEO_CAMERA", None)
+    monkeypatch.setattr(camera_module, "_VIDEO_CAMERAS", {})
+
+    async def _scenario() -> _FakeWebSocket:
+        websocket = _FakeWebSocket()
+        await camera_module._serve_video_websocket(websocket, "garage")
+        return websocket
+
+    websocket = asyncio.run(_scenario())
+
+    assert websocket.accepted is False
+    assert websocket.close_codes == [1008]
+
+
+def test_dashboard_script_prefers_websocket_push_with_mjpeg_fallback() -> None:
+    from src.gui.default_elements import camfeed
+
+    script = camfeed._build_camfeed_refresh_script('/video_feed/door')
+
+    assert "'/video_ws/door'" in script
+    assert "var url = '/video_feed/door';" in script
+    assert "if (startSocket(root, img, force)) return;" in script
+    assert "JSON.stringify({ ack: sequence })" in script
+    assert camfeed._DEFAULT_CAMFEED_AGE_ID in script